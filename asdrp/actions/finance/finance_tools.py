@@ -3,12 +3,21 @@
 #
 # Financial data tools using yfinance library
 #
+# yfinance is synchronous, so every call runs on a dedicated bounded thread
+# pool rather than the event loop's shared default executor. Ticker objects
+# and fetched datasets are cached per symbol (see market_data_cache.py),
+# independent datasets are fetched concurrently, and multi-symbol price
+# requests go through a single yf.download call.
+#
 #############################################################################
 
 from dotenv import load_dotenv, find_dotenv
 load_dotenv(find_dotenv())
 
 import asyncio
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import partial
 from typing import Any, Dict, List, Optional, Union
@@ -22,11 +31,38 @@ except ImportError:
     pd = None
 
 from asdrp.actions.tools_meta import ToolsMeta
+from asdrp.actions.finance.market_data_cache import MarketDataCache
 from asdrp.util.dict_utils import DictUtils
 
 # Timeout for API calls
 TIMEOUT_SECONDS = 30
 
+# Worker threads for blocking yfinance calls (shared by all FinanceTools calls)
+MAX_WORKERS = 8
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide yfinance thread pool (created on first use)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="yfinance")
+        return _executor
+
+
+def _split_symbols(symbols: str) -> List[str]:
+    """Split a space/comma separated symbol string into unique symbols."""
+    return list(dict.fromkeys(s for s in re.split(r"[\s,]+", symbols.strip()) if s))
+
+
+def _frame_to_rows(frame: Any) -> Dict[str, Dict[str, Optional[float]]]:
+    """Convert a price DataFrame to {date: {column: value}} for JSON serialization."""
+    return {str(idx): {k: (float(v) if pd.notna(v) else None) for k, v in row.items()}
+            for idx, row in frame.to_dict(orient='index').items()}
+
 
 class FinanceTools(metaclass=ToolsMeta):
     """
@@ -58,6 +94,9 @@ class FinanceTools(metaclass=ToolsMeta):
     # List of method names & wrapped function tools to expose as tools
     spec_functions: List[str]
     tool_list: List[Any]
+
+    # Ticker/dataset cache (created by _setup_class)
+    _cache: MarketDataCache
     
     @classmethod
     def _setup_class(cls) -> None:
@@ -75,6 +114,7 @@ class FinanceTools(metaclass=ToolsMeta):
             raise ImportError(
                 "yfinance library is required. Install it with: pip install yfinance"
             )
+        cls._cache = MarketDataCache()
     
     @classmethod
     def _get_excluded_methods(cls) -> set[str]:
@@ -87,6 +127,76 @@ class FinanceTools(metaclass=ToolsMeta):
             in the tool_list.
         """
         return set()
+
+    @classmethod
+    async def _run(cls, func: Any, *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking yfinance call on the dedicated thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), partial(func, *args, **kwargs))
+
+    @classmethod
+    async def _ticker(cls, symbol: str) -> Any:
+        """Return a yf.Ticker for the symbol, reusing a recently built one."""
+        ticker = cls._cache.get_ticker(symbol)
+        if ticker is None:
+            ticker = await cls._run(yf.Ticker, symbol)
+            cls._cache.set_ticker(symbol, ticker)
+        return ticker
+
+    @classmethod
+    async def _properties(cls, symbol: str, names: List[str]) -> List[Any]:
+        """
+        Get Ticker properties (e.g. 'info', 'financials') for a symbol.
+
+        Cached values are served directly; the rest are fetched concurrently.
+
+        Returns:
+            Property values in the order of names.
+        """
+        values: Dict[str, Any] = {}
+        missing = []
+        for name in names:
+            found, value = cls._cache.get(symbol, name)
+            if found:
+                values[name] = value
+            else:
+                missing.append(name)
+
+        if missing:
+            ticker = await cls._ticker(symbol)
+            fetched = await asyncio.gather(*(cls._run(getattr, ticker, name) for name in missing))
+            for name, value in zip(missing, fetched):
+                cls._cache.set(symbol, name, value)
+                values[name] = value
+        return [values[name] for name in names]
+
+    @classmethod
+    async def _property(cls, symbol: str, name: str) -> Any:
+        """Get a single Ticker property (see _properties)."""
+        return (await cls._properties(symbol, [name]))[0]
+
+    @classmethod
+    async def _dataset(cls, symbol: str, dataset: str, params: Dict[str, Any], fetch: Any) -> Any:
+        """Get a parameterized dataset, calling fetch(ticker) on a cache miss."""
+        key = tuple(sorted(params.items()))
+        found, value = cls._cache.get(symbol, dataset, key)
+        if found:
+            return value
+        ticker = await cls._ticker(symbol)
+        value = await cls._run(fetch, ticker)
+        cls._cache.set(symbol, dataset, value, key)
+        return value
+
+    @classmethod
+    async def _download(cls, symbols: List[str], params: Dict[str, Any]) -> Any:
+        """Download price data for several symbols with one yf.download call."""
+        key = tuple(sorted(params.items()))
+        found, data = cls._cache.get(" ".join(symbols), "download", key)
+        if found:
+            return data
+        data = await cls._run(yf.download, symbols, **params)
+        cls._cache.set(" ".join(symbols), "download", data, key)
+        return data
     
     @classmethod
     async def get_ticker_info(cls, symbol: str) -> Dict[str, Any]:
@@ -108,6 +218,8 @@ class FinanceTools(metaclass=ToolsMeta):
                 - Key statistics
                 - Business summary
                 - And many more fields
+                For multiple symbols, a dictionary of this information keyed by
+                symbol (fetched concurrently).
             
         Raises:
             ValueError: If symbol is empty or None.
@@ -117,10 +229,14 @@ class FinanceTools(metaclass=ToolsMeta):
             raise ValueError("Symbol cannot be empty or None.")
         
         try:
-            loop = asyncio.get_running_loop()
-            ticker = await loop.run_in_executor(None, yf.Ticker, symbol.strip())
-            info = await loop.run_in_executor(None, lambda: ticker.info)
-            return info if info else {}
+            symbols = _split_symbols(symbol)
+            if len(symbols) > 1:
+                infos = await asyncio.gather(*(cls._property(s, "info") for s in symbols))
+                return {s: dict(info) if info else {} for s, info in zip(symbols, infos)}
+
+            info = await cls._property(symbol.strip(), "info")
+            # Copy so callers cannot modify the cached dataset
+            return dict(info) if info else {}
         except Exception as e:
             raise Exception(f"Failed to get ticker info for '{symbol}': {e}")
     
@@ -144,7 +260,8 @@ class FinanceTools(metaclass=ToolsMeta):
         and optionally dividends and splits.
         
         Args:
-            symbol (str): The ticker symbol (e.g., 'AAPL').
+            symbol (str): The ticker symbol (e.g., 'AAPL'). Multiple symbols
+                separated by spaces or commas are downloaded in one request.
             period (Optional[str]): Valid periods: 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max.
                 Default: "1mo"
             interval (Optional[str]): Valid intervals: 1m, 2m, 5m, 15m, 30m, 60m, 90m, 1h, 1d, 5d, 1wk, 1mo, 3mo.
@@ -164,6 +281,8 @@ class FinanceTools(metaclass=ToolsMeta):
                 - 'symbol': The ticker symbol
                 - 'period': The period used
                 - 'interval': The interval used
+                For multiple symbols, 'data' maps each symbol to its rows and
+                'symbols' lists the symbols instead of 'symbol'.
         
         Raises:
             ValueError: If symbol is empty or invalid parameters provided.
@@ -183,9 +302,6 @@ class FinanceTools(metaclass=ToolsMeta):
             raise ValueError(f"Interval must be one of {valid_intervals}, got '{interval}'.")
         
         try:
-            loop = asyncio.get_running_loop()
-            ticker = await loop.run_in_executor(None, yf.Ticker, symbol.strip())
-            
             # Build parameters for history call
             history_params = DictUtils.build_params(
                 period=period,
@@ -198,18 +314,20 @@ class FinanceTools(metaclass=ToolsMeta):
                 repair=repair
             )
             
+            symbols = _split_symbols(symbol)
+            if len(symbols) > 1:
+                return await cls._historical_data_multi(symbols, history_params, period, interval, start, end)
+
             # Get historical data
-            history_func = partial(ticker.history, **history_params)
-            hist_data = await loop.run_in_executor(None, history_func)
+            hist_data = await cls._dataset(
+                symbol.strip(), "history", history_params,
+                lambda ticker: ticker.history(**history_params)
+            )
             
             # Convert DataFrame to dict for JSON serialization
             if hist_data is not None and not hist_data.empty:
-                # Convert DataFrame to dict with proper formatting
-                data_dict = hist_data.to_dict(orient='index')
-                # Convert index (dates) to strings
                 result = {
-                    'data': {str(idx): {k: (float(v) if pd.notna(v) else None) for k, v in row.items()} 
-                            for idx, row in data_dict.items()},
+                    'data': _frame_to_rows(hist_data),
                     'symbol': symbol.strip(),
                     'period': period,
                     'interval': interval,
@@ -229,6 +347,36 @@ class FinanceTools(metaclass=ToolsMeta):
             return result
         except Exception as e:
             raise Exception(f"Failed to get historical data for '{symbol}': {e}")
+
+    @classmethod
+    async def _historical_data_multi(
+        cls,
+        symbols: List[str],
+        history_params: Dict[str, Any],
+        period: Optional[str],
+        interval: Optional[str],
+        start: Optional[str],
+        end: Optional[str]
+    ) -> Dict[str, Any]:
+        """Historical data for several symbols from a single yf.download call."""
+        data = await cls._download(symbols, dict(history_params, group_by="ticker", progress=False))
+
+        per_symbol: Dict[str, Any] = {}
+        for sym in symbols:
+            frame = None
+            if data is not None and not data.empty and sym in data.columns.get_level_values(0):
+                # Symbols trading on different calendars leave empty rows
+                frame = data[sym].dropna(how="all")
+            per_symbol[sym] = _frame_to_rows(frame) if frame is not None else {}
+
+        return {
+            'data': per_symbol,
+            'symbols': symbols,
+            'period': period,
+            'interval': interval,
+            'start': start,
+            'end': end
+        }
     
     @classmethod
     async def get_financials(cls, symbol: str) -> Dict[str, Any]:
@@ -252,13 +400,10 @@ class FinanceTools(metaclass=ToolsMeta):
             raise ValueError("Symbol cannot be empty or None.")
         
         try:
-            loop = asyncio.get_running_loop()
-            ticker = await loop.run_in_executor(None, yf.Ticker, symbol.strip())
-            
-            # Get all financial statements
-            financials = await loop.run_in_executor(None, lambda: ticker.financials)
-            balance_sheet = await loop.run_in_executor(None, lambda: ticker.balance_sheet)
-            cashflow = await loop.run_in_executor(None, lambda: ticker.cashflow)
+            # Get all financial statements (fetched concurrently)
+            financials, balance_sheet, cashflow = await cls._properties(
+                symbol.strip(), ["financials", "balance_sheet", "cashflow"]
+            )
             
             result = {
                 'symbol': symbol.strip(),
@@ -290,9 +435,7 @@ class FinanceTools(metaclass=ToolsMeta):
             raise ValueError("Symbol cannot be empty or None.")
         
         try:
-            loop = asyncio.get_running_loop()
-            ticker = await loop.run_in_executor(None, yf.Ticker, symbol.strip())
-            financials = await loop.run_in_executor(None, lambda: ticker.financials)
+            financials = await cls._property(symbol.strip(), "financials")
             
             if financials is not None and not financials.empty:
                 return {
@@ -323,9 +466,7 @@ class FinanceTools(metaclass=ToolsMeta):
             raise ValueError("Symbol cannot be empty or None.")
         
         try:
-            loop = asyncio.get_running_loop()
-            ticker = await loop.run_in_executor(None, yf.Ticker, symbol.strip())
-            balance_sheet = await loop.run_in_executor(None, lambda: ticker.balance_sheet)
+            balance_sheet = await cls._property(symbol.strip(), "balance_sheet")
             
             if balance_sheet is not None and not balance_sheet.empty:
                 return {
@@ -356,9 +497,7 @@ class FinanceTools(metaclass=ToolsMeta):
             raise ValueError("Symbol cannot be empty or None.")
         
         try:
-            loop = asyncio.get_running_loop()
-            ticker = await loop.run_in_executor(None, yf.Ticker, symbol.strip())
-            cashflow = await loop.run_in_executor(None, lambda: ticker.cashflow)
+            cashflow = await cls._property(symbol.strip(), "cashflow")
             
             if cashflow is not None and not cashflow.empty:
                 return {
@@ -389,9 +528,7 @@ class FinanceTools(metaclass=ToolsMeta):
             raise ValueError("Symbol cannot be empty or None.")
         
         try:
-            loop = asyncio.get_running_loop()
-            ticker = await loop.run_in_executor(None, yf.Ticker, symbol.strip())
-            dividends = await loop.run_in_executor(None, lambda: ticker.dividends)
+            dividends = await cls._property(symbol.strip(), "dividends")
             
             if dividends is not None and not dividends.empty:
                 return {
@@ -423,9 +560,7 @@ class FinanceTools(metaclass=ToolsMeta):
             raise ValueError("Symbol cannot be empty or None.")
         
         try:
-            loop = asyncio.get_running_loop()
-            ticker = await loop.run_in_executor(None, yf.Ticker, symbol.strip())
-            splits = await loop.run_in_executor(None, lambda: ticker.splits)
+            splits = await cls._property(symbol.strip(), "splits")
             
             if splits is not None and not splits.empty:
                 return {
@@ -457,9 +592,7 @@ class FinanceTools(metaclass=ToolsMeta):
             raise ValueError("Symbol cannot be empty or None.")
         
         try:
-            loop = asyncio.get_running_loop()
-            ticker = await loop.run_in_executor(None, yf.Ticker, symbol.strip())
-            actions = await loop.run_in_executor(None, lambda: ticker.actions)
+            actions = await cls._property(symbol.strip(), "actions")
             
             if actions is not None and not actions.empty:
                 return {
@@ -492,9 +625,7 @@ class FinanceTools(metaclass=ToolsMeta):
             raise ValueError("Symbol cannot be empty or None.")
         
         try:
-            loop = asyncio.get_running_loop()
-            ticker = await loop.run_in_executor(None, yf.Ticker, symbol.strip())
-            recommendations = await loop.run_in_executor(None, lambda: ticker.recommendations)
+            recommendations = await cls._property(symbol.strip(), "recommendations")
             
             if recommendations is not None and not recommendations.empty:
                 return {
@@ -525,9 +656,7 @@ class FinanceTools(metaclass=ToolsMeta):
             raise ValueError("Symbol cannot be empty or None.")
         
         try:
-            loop = asyncio.get_running_loop()
-            ticker = await loop.run_in_executor(None, yf.Ticker, symbol.strip())
-            calendar = await loop.run_in_executor(None, lambda: ticker.calendar)
+            calendar = await cls._property(symbol.strip(), "calendar")
             
             if calendar is not None and not calendar.empty:
                 return {
@@ -573,11 +702,9 @@ class FinanceTools(metaclass=ToolsMeta):
             raise ValueError("Symbol cannot be empty or None.")
         
         try:
-            loop = asyncio.get_running_loop()
-            ticker = await loop.run_in_executor(None, yf.Ticker, symbol.strip())
-            news = await loop.run_in_executor(None, lambda: ticker.news)
+            news = await cls._property(symbol.strip(), "news")
             
-            return news if news else []
+            return list(news) if news else []
         except Exception as e:
             raise Exception(f"Failed to get news for '{symbol}': {e}")
     
@@ -604,9 +731,7 @@ class FinanceTools(metaclass=ToolsMeta):
             raise ValueError("Symbol cannot be empty or None.")
         
         try:
-            loop = asyncio.get_running_loop()
-            ticker = await loop.run_in_executor(None, yf.Ticker, symbol.strip())
-            options = await loop.run_in_executor(None, lambda: ticker.options)
+            options = await cls._property(symbol.strip(), "options")
             
             result = {
                 'symbol': symbol.strip(),
@@ -618,9 +743,9 @@ class FinanceTools(metaclass=ToolsMeta):
                 if expiration not in options:
                     raise ValueError(f"Expiration '{expiration}' not found. Available: {list(options)}")
                 
-                opt_chain = await loop.run_in_executor(
-                    None,
-                    lambda: ticker.option_chain(expiration)
+                opt_chain = await cls._dataset(
+                    symbol.strip(), "option_chain", {"expiration": expiration},
+                    lambda ticker: ticker.option_chain(expiration)
                 )
                 
                 result['expiration'] = expiration
@@ -692,8 +817,6 @@ class FinanceTools(metaclass=ToolsMeta):
             raise ValueError(f"Interval must be one of {valid_intervals}, got '{interval}'.")
         
         try:
-            loop = asyncio.get_running_loop()
-            
             # Build parameters for download call
             download_params = DictUtils.build_params(
                 period=period,
@@ -708,9 +831,8 @@ class FinanceTools(metaclass=ToolsMeta):
                 progress=progress
             )
             
-            # Download data
-            download_func = partial(yf.download, symbols, **download_params)
-            data = await loop.run_in_executor(None, download_func)
+            # Download data (one request for all symbols)
+            data = await cls._download(symbols, download_params)
             
             # Convert DataFrame to dict
             if data is not None and not data.empty:
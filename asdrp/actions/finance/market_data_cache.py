@@ -0,0 +1,131 @@
+#############################################################################
+# market_data_cache.py
+#
+# In-process cache of yfinance ticker objects and fetched datasets
+#
+# Agents often ask several questions about the same symbol in one
+# conversation (info, then history, then statements). Every dataset is a
+# separate Yahoo Finance scrape, so results are kept for a lifetime that
+# matches how fast the data changes: quotes for seconds, statements for
+# hours.
+#
+# yf.Ticker objects memoize some datasets (info, statements) internally,
+# so cached tickers are only reused for a short window; after that a fresh
+# Ticker is built and the dataset TTLs below decide what is refetched.
+#
+#############################################################################
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Lifetime of each dataset in seconds
+DATASET_TTL_SECONDS: Dict[str, float] = {
+    "info": 60,
+    "history": 60,
+    "download": 60,
+    "news": 300,
+    "options": 300,
+    "option_chain": 60,
+    "recommendations": 3600,
+    "calendar": 3600,
+    "dividends": 6 * 3600,
+    "splits": 6 * 3600,
+    "actions": 6 * 3600,
+    "financials": 6 * 3600,
+    "balance_sheet": 6 * 3600,
+    "cashflow": 6 * 3600,
+}
+
+# Lifetime of a cached yf.Ticker (bounded by its internal memoization)
+TICKER_TTL_SECONDS = 60
+
+DEFAULT_MAX_ENTRIES = 2000
+
+CacheKey = Tuple[str, str, Hashable]
+
+
+class MarketDataCache:
+    """
+    Thread-safe in-memory cache of ticker objects and datasets.
+
+    Datasets are keyed by (symbol, dataset, params), with symbols compared
+    case-insensitively, and expire after the
+    dataset's TTL in DATASET_TTL_SECONDS. Values are stored as fetched
+    (DataFrames, dicts, lists); callers convert them to fresh objects.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of datasets kept (least recently used
+                entries are evicted first).
+        """
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._datasets: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._tickers: Dict[str, Tuple[float, Any]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get_ticker(self, symbol: str) -> Optional[Any]:
+        """Return a recently built yf.Ticker for a symbol, or None."""
+        with self._lock:
+            entry = self._tickers.get(symbol.upper())
+            if entry is None or time.monotonic() >= entry[0]:
+                self._tickers.pop(symbol.upper(), None)
+                return None
+            return entry[1]
+
+    def set_ticker(self, symbol: str, ticker: Any) -> None:
+        """Store a yf.Ticker for reuse within TICKER_TTL_SECONDS."""
+        with self._lock:
+            self._tickers[symbol.upper()] = (time.monotonic() + TICKER_TTL_SECONDS, ticker)
+
+    def get(self, symbol: str, dataset: str, params: Hashable = ()) -> Tuple[bool, Any]:
+        """
+        Look up a dataset.
+
+        Returns:
+            Tuple of (found, value); value may legitimately be None or empty.
+        """
+        key = (symbol.upper(), dataset, params)
+        with self._lock:
+            entry = self._datasets.get(key)
+            if entry is None or time.monotonic() >= entry[0]:
+                self._datasets.pop(key, None)
+                self._misses += 1
+                return False, None
+            self._datasets.move_to_end(key)
+            self._hits += 1
+            return True, entry[1]
+
+    def set(self, symbol: str, dataset: str, value: Any, params: Hashable = ()) -> None:
+        """Store a dataset for its configured TTL."""
+        ttl = DATASET_TTL_SECONDS.get(dataset, TICKER_TTL_SECONDS)
+        key = (symbol.upper(), dataset, params)
+        with self._lock:
+            self._datasets[key] = (time.monotonic() + ttl, value)
+            self._datasets.move_to_end(key)
+            while len(self._datasets) > self.max_entries:
+                self._datasets.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached tickers and datasets."""
+        with self._lock:
+            self._datasets.clear()
+            self._tickers.clear()
+
+    def get_metrics(self) -> dict:
+        """Hit/miss counters for this process."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total > 0 else 0.0,
+                "size": len(self._datasets),
+            }
@@ -14,6 +14,7 @@ from typing import Any, List, Optional, Tuple
 from geopy.geocoders import ArcGIS
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
 
+from asdrp.actions.geo.geocode_cache import get_geocode_cache
 from asdrp.actions.tools_meta import ToolsMeta
 
 # Timeout for geocoding operations
@@ -86,7 +87,8 @@ class GeoTools(metaclass=ToolsMeta):
             
         Returns:
             Tuple[float, float]: A tuple containing (latitude, longitude).
-                Returns (-1.0, -1.0) if geocoding fails.
+                Returns (-1.0, -1.0) if geocoding fails. Successful results are
+                served from the shared geocode cache when available.
                 
         Raises:
             GeocoderTimedOut: If the geocoding service times out.
@@ -96,6 +98,11 @@ class GeoTools(metaclass=ToolsMeta):
         if not address or not address.strip():
             raise ValueError("Address cannot be empty or None.")
         
+        cache = get_geocode_cache()
+        cached = cache.get(address) if cache else None
+        if cached:
+            return cached
+        
         try:
             # Use run_in_executor to run synchronous geocoding in a thread pool
             loop = asyncio.get_running_loop()
@@ -106,7 +113,10 @@ class GeoTools(metaclass=ToolsMeta):
             )
             
             if location:
-                return (location.latitude, location.longitude)
+                coordinates = (location.latitude, location.longitude)
+                if cache:
+                    cache.set(address, coordinates)
+                return coordinates
             else:
                 return (-1.0, -1.0)
                 
@@ -0,0 +1,144 @@
+#############################################################################
+# geocode_cache.py
+#
+# Persistent address -> coordinate cache shared by GeoTools and MapTools
+#
+# Venue addresses repeat across conversations, and each geocoding call is a
+# remote request that can take seconds. Successful lookups are stored in a
+# small SQLite table with a TTL so every geocoding path in the process (and
+# across restarts) can skip the network for addresses it has seen.
+#
+# Configuration (environment):
+#   GEOCODE_CACHE_PATH         SQLite file path, or ":memory:" to disable
+#                              persistence (default: data/geo/geocode_cache.db)
+#   GEOCODE_CACHE_TTL_SECONDS  Entry lifetime in seconds (default: 30 days)
+#
+#############################################################################
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_DB_PATH = Path(__file__).resolve().parents[3] / "data" / "geo" / "geocode_cache.db"
+
+
+def normalize_address(address: str) -> str:
+    """Normalize an address for cache lookup (case and whitespace insensitive)."""
+    return " ".join(address.lower().split()).strip(" ,.")
+
+
+class GeocodeCache:
+    """
+    Thread-safe SQLite cache of address -> (latitude, longitude).
+
+    Only successful lookups are stored; "not found" results are left to the
+    geocoding service so transient failures are not remembered.
+    """
+
+    def __init__(self, db_path: str | Path | None = None, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: SQLite file path. None or ":memory:" keeps the cache in memory.
+            ttl_seconds: Lifetime of each entry in seconds.
+        """
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        target = str(db_path) if db_path else ":memory:"
+        if target != ":memory:":
+            Path(target).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(target, check_same_thread=False)
+        if target != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS geocode_cache (
+                address TEXT PRIMARY KEY,
+                latitude REAL NOT NULL,
+                longitude REAL NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, address: str) -> Optional[Tuple[float, float]]:
+        """Return cached (latitude, longitude) for an address, or None."""
+        key = normalize_address(address)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT latitude, longitude, created_at FROM geocode_cache WHERE address = ?",
+                (key,),
+            ).fetchone()
+            if row is None or time.time() - row[2] > self.ttl_seconds:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return (row[0], row[1])
+
+    def set(self, address: str, coordinates: Tuple[float, float]) -> None:
+        """Store coordinates for an address."""
+        lat, lng = coordinates
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO geocode_cache (address, latitude, longitude, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (normalize_address(address), float(lat), float(lng), time.time()),
+            )
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete expired entries; returns the number removed."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM geocode_cache WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def get_metrics(self) -> dict:
+        """Hit/miss counters for this process."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total > 0 else 0.0,
+            }
+
+
+_shared_cache: Optional[GeocodeCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_geocode_cache() -> Optional[GeocodeCache]:
+    """
+    Get the process-wide geocode cache, creating it on first use.
+
+    Returns None if the cache cannot be opened; callers then geocode uncached.
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                db_path = os.getenv("GEOCODE_CACHE_PATH") or DEFAULT_DB_PATH
+                ttl = float(os.getenv("GEOCODE_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS))
+                try:
+                    _shared_cache = GeocodeCache(db_path, ttl_seconds=ttl)
+                except Exception as e:
+                    logger.warning(f"Geocode cache unavailable ({db_path}): {e}")
+                    return None
+    return _shared_cache
@@ -35,6 +35,7 @@ except ImportError:
     googlemaps = None
     service_account = None
 
+from asdrp.actions.geo.geocode_cache import get_geocode_cache
 from asdrp.actions.tools_meta import ToolsMeta
 from asdrp.util.dict_utils import DictUtils
 
@@ -155,7 +156,8 @@ class MapTools(metaclass=ToolsMeta):
             
         Returns:
             Tuple[float, float]: A tuple containing (latitude, longitude).
-                Returns (-1.0, -1.0) if geocoding fails.
+                Returns (-1.0, -1.0) if geocoding fails. Successful results are
+                served from the shared geocode cache when available.
                 
         Raises:
             ValueError: If the address string is empty or None.
@@ -168,6 +170,11 @@ class MapTools(metaclass=ToolsMeta):
         if not address or not address.strip():
             raise ValueError("Address cannot be empty or None.")
         
+        cache = get_geocode_cache()
+        cached = cache.get(address) if cache else None
+        if cached:
+            return cached
+        
         try:
             # Use run_in_executor to run synchronous geocoding in a thread pool
             loop = asyncio.get_running_loop()
@@ -183,7 +190,10 @@ class MapTools(metaclass=ToolsMeta):
                 _elapsed = time.time() - _start
                 _log_debug("map_tools.py:get_coordinates_by_address:end", "Tool completed", {"elapsed_ms": int(_elapsed * 1000), "lat": location['lat'], "lng": location['lng']}, "B")
                 # #endregion
-                return (location['lat'], location['lng'])
+                coordinates = (location['lat'], location['lng'])
+                if cache:
+                    cache.set(address, coordinates)
+                return coordinates
             else:
                 # #region agent log
                 _elapsed = time.time() - _start
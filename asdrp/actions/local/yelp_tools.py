@@ -3,69 +3,142 @@
 #
 # Yelp tools
 #
+# All calls go through one pooled httpx.AsyncClient, so a tool call never
+# blocks the event loop and TLS connections to the Yelp API are reused.
+# Successful responses are cached in memory with a per-endpoint TTL
+# (business data changes slowly; search results are kept briefly).
+#
 #############################################################################
 
 from dotenv import load_dotenv, find_dotenv
 load_dotenv(find_dotenv())
 
+import asyncio
+import copy
 import os
-import requests
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
 
 from asdrp.actions.tools_meta import ToolsMeta
 
 # Timeout for API calls
 TIMEOUT_SECONDS = 30
 
+# Connection pool shared by all Yelp calls in the process
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
+
+# Concurrent requests per batch call
+BATCH_CONCURRENCY = 5
+
+# Response cache lifetime per endpoint (seconds)
+CACHE_TTL_SECONDS = {
+    "search": 300,
+    "phone": 3600,
+    "match": 86400,
+    "details": 3600,
+    "engagement": 900,
+    "reviews": 3600,
+    "review_highlights": 3600,
+}
+CACHE_MAX_ENTRIES = 1000
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class _ResponseCache:
+    """In-memory LRU cache of successful Yelp responses with per-entry TTL."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Dict]]" = OrderedDict()
+
+    def get(self, key: CacheKey) -> Optional[Dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        # Callers get their own copy; tool results may be modified downstream
+        return copy.deepcopy(value)
+
+    def set(self, key: CacheKey, value: Dict, ttl_seconds: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
 class YelpTools(metaclass=ToolsMeta):
     """
     Tools for querying the Yelp API (business search, details, reviews, etc.).
-    
+
     This class uses the ToolsMeta metaclass which automatically:
     - Discovers all public @classmethod decorated methods
     - Creates `spec_functions` list containing method names
     - Creates `tool_list` containing wrapped function tools ready for agent frameworks
-    
-    Yelp-specific initialization (API key and headers) is handled via the 
+
+    Yelp-specific initialization (API key and headers) is handled via the
     `_setup_class()` hook method.
-    
+
     Environment Variables:
     ---------------------
     YELP_API_KEY: Required. Yelp Fusion API key.
-    
+
     Usage:
     ------
     ```python
     from asdrp.actions.local.yelp_tools import YelpTools
-    
+
     # Use the automatically generated tool_list
     from agents import Agent
     agent = Agent(tools=YelpTools.tool_list)
-    
+
     # Or call methods directly
-    results = YelpTools.search_businesses("pizza", 37.7749, -122.4194)
+    results = await YelpTools.search_businesses("pizza", 37.7749, -122.4194)
+
+    # Batch lookups (not exposed as tools)
+    details = await YelpTools.get_business_details_batch(["id1", "id2"])
     ```
     """
     # Class variables for API configuration (set by _setup_class)
-    BASE_URL = "https://api.yelp.com/v3"    
+    BASE_URL = "https://api.yelp.com/v3"
     api_key: str
     headers: Dict[str, str]
 
+    # Pooled HTTP client (created lazily per event loop) and response cache
+    _client: Optional[httpx.AsyncClient] = None
+    _client_loop: Optional[asyncio.AbstractEventLoop] = None
+    _transport: Optional[httpx.AsyncBaseTransport] = None  # For testing/DI
+    _cache: _ResponseCache
+
     # ------------- Automatically populated by ToolsMeta -------------
     # List of method names & wrapped function tools to expose as tools
     spec_functions: List[str]
     tool_list: List[Any]
-    
+
     @classmethod
     def _setup_class(cls) -> None:
         """
         Set up Yelp-specific class variables (API key and headers).
-        
+
         This method is called automatically by ToolsMeta during class creation.
         It reads the YELP_API_KEY from environment variables and sets up the
         authorization headers needed for API requests.
-        
+
         Raises:
             ValueError: If YELP_API_KEY is not set in environment variables.
         """
@@ -74,88 +147,185 @@ class YelpTools(metaclass=ToolsMeta):
             raise ValueError("YELP_API_KEY is not set.")
         cls.api_key = api_key
         cls.headers = {"Authorization": f"Bearer {cls.api_key}"}
-    
+        cls._cache = _ResponseCache()
+
     @classmethod
     def _get_excluded_methods(cls) -> set[str]:
         """
         Exclude Yelp-specific class variables from tool discovery.
-        
+
         Returns:
             Set of attribute names to exclude from being discovered as tools.
-            This ensures that internal configuration attributes (api_key, headers, 
-            BASE_URL) are not included in the tool_list.
+            This ensures that internal configuration attributes (api_key, headers,
+            BASE_URL) and the batch/lifecycle helpers are not included in the
+            tool_list, which keeps the tool surface unchanged.
+        """
+        return {
+            'BASE_URL', 'api_key', 'headers',
+            'get_business_details_batch', 'get_business_reviews_batch', 'aclose',
+        }
+
+    @classmethod
+    async def _get_client(cls) -> httpx.AsyncClient:
+        """Return the pooled client for the running event loop (created on first use)."""
+        loop = asyncio.get_running_loop()
+        if cls._client is None or cls._client.is_closed or cls._client_loop is not loop:
+            stale, stale_loop = cls._client, cls._client_loop
+            # Connections belong to the loop that opened them
+            cls._client = httpx.AsyncClient(
+                base_url=cls.BASE_URL,
+                headers=cls.headers,
+                timeout=TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                transport=cls._transport,
+            )
+            cls._client_loop = loop
+            if stale is not None and not stale.is_closed:
+                await cls._close_stale_client(stale, stale_loop)
+        return cls._client
+
+    @staticmethod
+    async def _close_stale_client(
+        client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        """Close the client of a previous event loop, releasing its connections."""
+        if loop is not None and loop.is_running():
+            # Still running in another thread: close it there
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        # The loop has stopped; closing its connections is best effort
+        with suppress(Exception):
+            await client.aclose()
+
+    @classmethod
+    async def _get(cls, kind: str, path: str, params: Optional[Dict[str, Any]] = None) -> Dict:
+        """
+        GET a Yelp endpoint, serving successful responses from the cache.
+
+        Error responses (non-2xx) are returned as-is but not cached.
+
+        Args:
+            kind: Endpoint kind (selects the cache TTL)
+            path: Path relative to BASE_URL
+            params: Query parameters (None values are dropped)
         """
-        return {'BASE_URL', 'api_key', 'headers'}
-    
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        key: CacheKey = (path, tuple(sorted((k, str(v)) for k, v in params.items())))
+        cached = cls._cache.get(key)
+        if cached is not None:
+            return cached
+
+        client = await cls._get_client()
+        response = await client.get(path, params=params)
+        data = response.json()
+        if response.is_success:
+            cls._cache.set(key, data, CACHE_TTL_SECONDS[kind])
+        return data
+
+    @classmethod
+    async def _batch(cls, fetch: Any, business_ids: List[str]) -> Dict[str, Dict]:
+        """Run fetch(business_id) for unique IDs with bounded concurrency."""
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        unique_ids = list(dict.fromkeys(business_ids))
+
+        async def run(business_id: str) -> Dict:
+            async with semaphore:
+                try:
+                    return await fetch(business_id)
+                except httpx.HTTPError as e:
+                    return {"error": {"code": type(e).__name__, "description": str(e)}}
+
+        results = await asyncio.gather(*(run(business_id) for business_id in unique_ids))
+        return dict(zip(unique_ids, results))
+
     @classmethod
-    def search_businesses(
+    async def search_businesses(
         cls, term: str, latitude: float, longitude: float,
         categories: Optional[str] = None, price: Optional[str] = None, limit: int = 20
     ) -> Dict:
         """Search for businesses by keyword, location (lat/long), category, and price level."""
-        endpoint = f"{cls.BASE_URL}/businesses/search"
         params = {
             "term": term, "latitude": latitude, "longitude": longitude,
             "categories": categories, "price": price, "limit": limit
         }
-        response = requests.get(endpoint, headers=cls.headers, params=params, timeout=TIMEOUT_SECONDS)
-        return response.json()
-    
+        return await cls._get("search", "/businesses/search", params)
+
     @classmethod
-    def search_by_phone(cls, phone: str) -> Dict:
+    async def search_by_phone(cls, phone: str) -> Dict:
         """Search for a business by phone number."""
-        endpoint = f"{cls.BASE_URL}/businesses/search/phone"
-        params = {"phone": phone}
-        response = requests.get(endpoint, headers=cls.headers, params=params, timeout=TIMEOUT_SECONDS)
-        return response.json()
-    
+        return await cls._get("phone", "/businesses/search/phone", {"phone": phone})
+
     @classmethod
-    def match_business(cls, name: str, address1: str, city: str, state: str, country: str) -> Dict:
+    async def match_business(cls, name: str, address1: str, city: str, state: str, country: str) -> Dict:
         """Find a business match by exact name and address."""
-        endpoint = f"{cls.BASE_URL}/businesses/matches"
         params = {"name": name, "address1": address1, "city": city, "state": state, "country": country}
-        response = requests.get(endpoint, headers=cls.headers, params=params, timeout=TIMEOUT_SECONDS)
-        return response.json()
-    
+        return await cls._get("match", "/businesses/matches", params)
+
     @classmethod
-    def get_business_details(cls, business_id: str) -> Dict:
+    async def get_business_details(cls, business_id: str) -> Dict:
         """Get detailed information for a business (hours, rating, etc.) by Yelp business ID."""
-        endpoint = f"{cls.BASE_URL}/businesses/{business_id}"
-        response = requests.get(endpoint, headers=cls.headers, timeout=TIMEOUT_SECONDS)
-        return response.json()
-    
+        return await cls._get("details", f"/businesses/{business_id}")
+
     @classmethod
-    def get_business_engagement(cls, business_ids: List[str]) -> Dict:
+    async def get_business_engagement(cls, business_ids: List[str]) -> Dict:
         """Get engagement metrics (view counts, etc.) for multiple businesses by ID."""
-        endpoint = f"{cls.BASE_URL}/businesses/engagement"
         params = {"business_ids": ",".join(business_ids)}
-        response = requests.get(endpoint, headers=cls.headers, params=params, timeout=TIMEOUT_SECONDS)
-        return response.json()
-    
+        return await cls._get("engagement", "/businesses/engagement", params)
+
     @classmethod
-    def get_business_reviews(cls, business_id: str) -> Dict:
+    async def get_business_reviews(cls, business_id: str) -> Dict:
         """Get up to three review excerpts for a given business."""
-        endpoint = f"{cls.BASE_URL}/businesses/{business_id}/reviews"
-        response = requests.get(endpoint, headers=cls.headers, timeout=TIMEOUT_SECONDS)
-        return response.json()
-    
+        return await cls._get("reviews", f"/businesses/{business_id}/reviews")
+
     @classmethod
-    def get_review_highlights(cls, business_id: str) -> Dict:
+    async def get_review_highlights(cls, business_id: str) -> Dict:
         """Get summarized review highlights for a given business."""
-        endpoint = f"{cls.BASE_URL}/businesses/{business_id}/review_highlights"
-        response = requests.get(endpoint, headers=cls.headers, timeout=TIMEOUT_SECONDS)
-        return response.json()
+        return await cls._get("review_highlights", f"/businesses/{business_id}/review_highlights")
+
+    @classmethod
+    async def get_business_details_batch(cls, business_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Get details for many businesses concurrently.
+
+        Returns:
+            Mapping of business ID to its details (or an error payload)
+        """
+        return await cls._batch(cls.get_business_details, business_ids)
+
+    @classmethod
+    async def get_business_reviews_batch(cls, business_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Get review excerpts for many businesses concurrently.
+
+        Returns:
+            Mapping of business ID to its reviews (or an error payload)
+        """
+        return await cls._batch(cls.get_business_reviews, business_ids)
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the pooled HTTP client (e.g. on application shutdown)."""
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
+            cls._client_loop = None
 
 if __name__ == "__main__":
     # Smoke test for YelpTools methods
     # API key is automatically loaded from environment in metaclass
 
-    print("Testing search_businesses:")
-    # Coordinates for San Francisco city center
-    sf_latitude, sf_longitude = 37.7749, -122.4194
-    result = YelpTools.search_businesses("coffee", sf_latitude, sf_longitude)
-    businesses = result.get("businesses", [])
-    print(f"Found {len(businesses)} coffee businesses in San Francisco")
-    for index, business in enumerate(businesses):
-        print(f"business {index}: {business['name']}")
+    async def main() -> None:
+        print("Testing search_businesses:")
+        # Coordinates for San Francisco city center
+        sf_latitude, sf_longitude = 37.7749, -122.4194
+        result = await YelpTools.search_businesses("coffee", sf_latitude, sf_longitude)
+        businesses = result.get("businesses", [])
+        print(f"Found {len(businesses)} coffee businesses in San Francisco")
+        for index, business in enumerate(businesses):
+            print(f"business {index}: {business['name']}")
+        await YelpTools.aclose()
 
+    asyncio.run(main())
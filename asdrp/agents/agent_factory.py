@@ -7,7 +7,8 @@
 # - AgentFactory: A factory class following the Factory pattern
 # - Centralized agent creation logic
 # - Agent registry management
-# - Session memory initialization and caching
+# - Agent instance caching keyed by (name, instructions, model config)
+# - Session memory initialization and bounded (LRU/TTL) session caching
 # - Error handling and validation
 # - Convenience functions: get_agent(), get_agent_with_session()
 #
@@ -31,10 +32,16 @@
 #
 #############################################################################
 
+from collections import OrderedDict
 from typing import Dict, Callable, Any, Optional, Tuple
 from pathlib import Path
 from asdrp.agents.protocol import AgentProtocol, AgentException
 from asdrp.agents.config_loader import AgentConfigLoader, AgentConfig, SessionMemoryConfig
+from asdrp.agents.session_pool import (
+    SessionPool,
+    SharedConnectionRegistry,
+    SharedSQLiteSession,
+)
 
 # Import session memory types from openai-agents SDK
 try:
@@ -81,14 +88,29 @@ class AgentFactory:
     _registry : Dict[str, Callable[[str], AgentProtocol]]
         Internal registry mapping agent names to their creation functions.
         This is populated lazily to avoid circular dependencies.
-    _session_cache : Dict[str, Any]
-        Cache of session objects keyed by session identifier.
+    _session_cache : SessionPool
+        LRU/TTL-bounded cache of session objects keyed by session identifier.
+        Evicted sessions are closed.
+    _session_connections : SharedConnectionRegistry
+        Shared WAL-mode connection per session database file.
+    _agent_cache : OrderedDict[Tuple[Any, ...], AgentProtocol]
+        LRU cache of shared agent instances keyed by agent name, factory,
+        instructions and model/MCP configuration. Holds no per-session state.
     """
     
     _instance: 'AgentFactory | None' = None
     _registry: Dict[str, Callable[[str], AgentProtocol]] | None = None
     _config_loader: Optional[AgentConfigLoader] = None
-    _session_cache: Dict[str, Any] | None = None
+    _session_cache: SessionPool | None = None
+    _session_connections: SharedConnectionRegistry | None = None
+    _agent_cache: 'OrderedDict[Tuple[Any, ...], AgentProtocol] | None' = None
+
+    # Upper bound on cached agent instances (distinct name/instructions/config combinations)
+    AGENT_CACHE_MAX_SIZE = 128
+
+    # Upper bound on cached sessions and idle time before a session is dropped
+    SESSION_CACHE_MAX_SIZE = 256
+    SESSION_CACHE_TTL_SECONDS = 3600.0
     
     def __init__(self, config_path: str | Path | None = None):
         """
@@ -104,7 +126,12 @@ class AgentFactory:
         self._registry = None
         self._config_loader = None
         self._config_path = config_path
-        self._session_cache: Dict[str, Any] = {}
+        self._session_cache = SessionPool(
+            max_size=self.SESSION_CACHE_MAX_SIZE,
+            ttl_seconds=self.SESSION_CACHE_TTL_SECONDS,
+        )
+        self._session_connections = SharedConnectionRegistry()
+        self._agent_cache: 'OrderedDict[Tuple[Any, ...], AgentProtocol]' = OrderedDict()
     
     @classmethod
     def instance(cls) -> 'AgentFactory':
@@ -143,7 +170,9 @@ class AgentFactory:
         Create a session object based on configuration.
         
         This method creates and caches session objects for agents. Sessions
-        are cached by their session_id to allow reuse across multiple calls.
+        are cached by their session_id to allow reuse across multiple calls,
+        in a bounded pool that closes sessions on eviction. File-based
+        sessions for the same database share one connection.
         
         Args:
             session_config: Session memory configuration from agent config.
@@ -167,8 +196,9 @@ class AgentFactory:
         
         # Check cache first
         cache_key = f"{session_config.type}:{session_id}:{session_config.database_path or ':memory:'}"
-        if cache_key in self._session_cache:
-            return self._session_cache[cache_key]
+        cached = self._session_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         try:
             if session_config.type == "sqlite":
@@ -179,17 +209,17 @@ class AgentFactory:
                     db_path = Path(session_config.database_path)
                     db_path.parent.mkdir(parents=True, exist_ok=True)
                     
-                    session = SQLiteSession(
+                    session = SharedSQLiteSession(
                         session_id=session_id,
-                        db_path=str(db_path)
+                        db_path=db_path,
+                        registry=self._session_connections,
                     )
                 else:
                     # In-memory SQLite session
                     session = SQLiteSession(session_id=session_id)
                 
                 # Cache the session
-                self._session_cache[cache_key] = session
-                return session
+                return self._session_cache.put(cache_key, session)
             else:
                 raise AgentException(
                     f"Unsupported session type: '{session_config.type}'",
@@ -311,7 +341,10 @@ class AgentFactory:
         Notes:
         ------
         - Agent names are case-insensitive and whitespace is trimmed
-        - Agent instances are created fresh on each call (not cached)
+        - Agent instances are cached per (name, instructions, model config) and
+          shared across callers; treat them as read-only. Sessions are never
+          part of the cached agent and are attached per request.
+        - Call clear_agent_cache() after configuration changes
         - Each agent type has its own set of tools configured automatically
         """
         # Normalize agent name to lowercase for case-insensitive matching
@@ -358,10 +391,21 @@ class AgentFactory:
                     agent_name=name
                 )
         
-        # Get the factory function and create the agent
-        try:
-            factory_func = registry[normalized_name]
+        factory_func = registry[normalized_name]
+        cache_key = (
+            normalized_name,
+            factory_func,
+            instructions,
+            repr(agent_config.model),
+            repr(agent_config.mcp_server),
+        )
+        cached = self._agent_cache.get(cache_key)
+        if cached is not None:
+            self._agent_cache.move_to_end(cache_key)
+            return cached
 
+        # Create the agent
+        try:
             # Check if the factory function accepts mcp_server_config parameter
             # For MCP-based agents, pass the MCP configuration
             import inspect
@@ -382,6 +426,9 @@ class AgentFactory:
                     agent_name=name
                 )
 
+            self._agent_cache[cache_key] = agent
+            if len(self._agent_cache) > self.AGENT_CACHE_MAX_SIZE:
+                self._agent_cache.popitem(last=False)
             return agent
             
         except AgentException:
@@ -565,29 +612,42 @@ class AgentFactory:
         Clear all cached session objects.
         
         Useful for testing or when you want to force new session creation.
-        This method also attempts to close any SQLiteSession connections
-        before clearing the cache to prevent resource leaks.
-        """
-        # Close all sessions before clearing cache to prevent resource leaks
-        if self._session_cache:
-            for session in list(self._session_cache.values()):  # Use list() to avoid modification during iteration
-                if session is not None and SESSION_MEMORY_AVAILABLE:
-                    # SQLiteSession may have a close() method or connection attribute
-                    # Try to close it gracefully
-                    try:
-                        if hasattr(session, 'close'):
-                            session.close()
-                        elif hasattr(session, '_connection') and session._connection:
-                            session._connection.close()
-                        # Also try to close any underlying database connection
-                        elif hasattr(session, 'db') and hasattr(session.db, 'close'):
-                            session.db.close()
-                    except Exception:
-                        # Ignore errors during cleanup - connection may already be closed
-                        pass
-        
-        if self._session_cache:
-            self._session_cache.clear()
+        Cached sessions and the shared per-database connections are closed
+        to prevent resource leaks.
+        """
+        self._session_cache.clear()
+        self._session_connections.close_all()
+
+    def session_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get session cache metrics for sizing the pool.
+
+        Returns:
+            Dictionary with size, max_size, ttl_seconds, hits, misses,
+            hit_rate, evictions, expirations and shared_connections.
+        """
+        stats = self._session_cache.stats()
+        stats["shared_connections"] = len(self._session_connections)
+        return stats
+
+    def clear_agent_cache(self, agent_name: str | None = None) -> None:
+        """
+        Drop cached agent instances so the next get_agent() call rebuilds them.
+
+        Call this after configuration changes (e.g. AgentService.reload_config).
+        Session objects are unaffected; use clear_session_cache() for those.
+
+        Args:
+            agent_name: Optional agent name. If provided, only that agent's
+                cached instances are dropped; otherwise the whole cache is cleared.
+        """
+        if agent_name is None:
+            self._agent_cache.clear()
+            return
+
+        normalized_name = agent_name.lower().strip()
+        for key in [k for k in self._agent_cache if k[0] == normalized_name]:
+            del self._agent_cache[key]
     
     def register_agent(self, name: str, factory_func: Callable[[str], AgentProtocol]) -> None:
         """
@@ -628,6 +688,7 @@ class AgentFactory:
         normalized_name = name.lower().strip()
         registry = self._get_registry()
         registry[normalized_name] = factory_func
+        self.clear_agent_cache(normalized_name)
 
 
     def get_agent_config(self, agent_name: str) -> AgentConfig:
@@ -645,6 +706,19 @@ class AgentFactory:
         """
         return self._get_config_loader().get_agent_config(agent_name)
     
+    def preload(self) -> list[str]:
+        """
+        Import the creation functions of all enabled agents now.
+
+        The registry is otherwise built on the first get_agent() call; calling
+        this at startup (e.g. in a worker thread) moves the module imports out
+        of the first request.
+
+        Returns:
+            Names of the agents that could be loaded.
+        """
+        return list(self._get_registry())
+
     def list_available_agents(self) -> list[str]:
         """
         List all available agent names from configuration.
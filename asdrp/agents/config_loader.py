@@ -134,6 +134,10 @@ class MCPServerConfig:
         Host for HTTP/SSE transports (ignored for stdio).
     port : int | None
         Port for HTTP/SSE transports (ignored for stdio).
+    pool_size : int
+        Maximum number of long-lived stdio connections kept for this server.
+    pool_max_idle_seconds : float
+        Idle time after which a pooled connection is closed and recycled.
     """
     enabled: bool = False
     command: list[str] | None = None
@@ -142,6 +146,8 @@ class MCPServerConfig:
     transport: str = "stdio"
     host: str | None = None
     port: int | None = None
+    pool_size: int = 4
+    pool_max_idle_seconds: float = 300.0
 
     def __post_init__(self):
         """Validate MCP server configuration values."""
@@ -159,6 +165,14 @@ class MCPServerConfig:
                 f"MCP host and port are required for {self.transport} transport"
             )
 
+        if self.pool_size < 1:
+            raise ValueError(f"MCP pool_size must be >= 1, got {self.pool_size}")
+
+        if self.pool_max_idle_seconds <= 0:
+            raise ValueError(
+                f"MCP pool_max_idle_seconds must be > 0, got {self.pool_max_idle_seconds}"
+            )
+
 
 @dataclass
 class AgentConfig:
@@ -357,7 +371,9 @@ class AgentConfigLoader:
                 env=env_dict,  # Pass through from YAML (None = inherit all from parent)
                 transport=mcp_data.get('transport', 'stdio'),
                 host=mcp_data.get('host'),
-                port=mcp_data.get('port')
+                port=mcp_data.get('port'),
+                pool_size=mcp_data.get('pool_size', 4),
+                pool_max_idle_seconds=mcp_data.get('pool_max_idle_seconds', 300.0)
             )
 
         # Build AgentConfig
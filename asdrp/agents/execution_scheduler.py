@@ -0,0 +1,282 @@
+#############################################################################
+# execution_scheduler.py
+#
+# Process-wide admission control for agent executions
+#
+# Every orchestrator fans a request out into several Runner.run calls (MoE
+# experts, SmartRouter subqueries) on top of the direct chat endpoint, and
+# nothing bounded the total. A burst of requests turned into hundreds of
+# simultaneous runs, MCP subprocesses and provider calls, so tail latency was
+# set by provider 429s and a saturated event loop. The scheduler bounds it:
+# - a global limit on concurrent agent runs, plus per-agent limits
+# - a bounded wait queue; callers wait at most queue_timeout for a slot
+# - round-robin hand-off across sessions, so one chatty session cannot
+#   starve the others
+# - load shedding with AdmissionError when the queue is full or the wait
+#   deadline passes
+#
+# Configuration (environment):
+#   OPENAGENTS_MAX_CONCURRENT_RUNS       Global limit (default: 32)
+#   OPENAGENTS_MAX_CONCURRENT_PER_AGENT  Default per-agent limit (default: 8)
+#   OPENAGENTS_SCHEDULER_QUEUE_SIZE      Max queued runs (default: 256)
+#   OPENAGENTS_SCHEDULER_QUEUE_TIMEOUT   Max seconds to wait for a slot (default: 10)
+#
+# Usage:
+#   >>> scheduler = get_execution_scheduler()
+#   >>> async with scheduler.slot("geo", session_id="conv-1"):
+#   ...     result = await Runner.run(agent, input=query)
+#
+#############################################################################
+
+import asyncio
+import logging
+import os
+import threading
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from asdrp.agents.protocol import AgentException
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENT = 32
+DEFAULT_PER_AGENT_LIMIT = 8
+DEFAULT_MAX_QUEUE = 256
+DEFAULT_QUEUE_TIMEOUT = 10.0
+
+_ANONYMOUS_SESSION = "__anonymous__"
+
+
+class AdmissionError(AgentException):
+    """
+    Raised when the scheduler sheds an agent run instead of queueing it.
+
+    Either the wait queue is full or no slot freed up before the deadline.
+    Callers should surface this as a retryable overload (HTTP 503), not as
+    an agent failure.
+    """
+
+    def __init__(self, message: str, agent_name: str | None = None, retry_after: float = 1.0):
+        super().__init__(message, agent_name=agent_name)
+        self.retry_after = retry_after
+
+
+class _Waiter:
+    __slots__ = ("agent_id", "future")
+
+    def __init__(self, agent_id: str, future: asyncio.Future):
+        self.agent_id = agent_id
+        self.future = future
+
+
+class ExecutionScheduler:
+    """
+    Concurrency limiter for agent runs with fair queueing across sessions.
+
+    The scheduler is meant to be shared by every code path that calls
+    Runner.run (see get_execution_scheduler()). It is not thread-safe and
+    must be used from one event loop at a time.
+
+    Attributes:
+        max_concurrent: Maximum number of runs in flight across all agents
+        per_agent_limit: Default maximum number of runs in flight per agent
+        per_agent_limits: Per-agent overrides of per_agent_limit
+        max_queue: Maximum number of runs waiting for a slot
+        queue_timeout: Default maximum wait for a slot, in seconds
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        per_agent_limit: int = DEFAULT_PER_AGENT_LIMIT,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        queue_timeout: float = DEFAULT_QUEUE_TIMEOUT,
+        per_agent_limits: Optional[Dict[str, int]] = None,
+    ):
+        if max_concurrent < 1 or per_agent_limit < 1:
+            raise ValueError("Concurrency limits must be >= 1")
+        self.max_concurrent = max_concurrent
+        self.per_agent_limit = per_agent_limit
+        self.per_agent_limits = dict(per_agent_limits or {})
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+
+        self._active = 0
+        self._active_per_agent: Dict[str, int] = {}
+        # session -> FIFO of waiters; dict order is the round-robin order
+        self._waiters: OrderedDict[str, Deque[_Waiter]] = OrderedDict()
+        self._queued = 0
+
+        # Metrics
+        self._admitted = 0
+        self._queued_total = 0
+        self._rejected = 0
+        self._timed_out = 0
+
+    def _limit_for(self, agent_id: str) -> int:
+        return self.per_agent_limits.get(agent_id, self.per_agent_limit)
+
+    def _can_run(self, agent_id: str) -> bool:
+        return (
+            self._active < self.max_concurrent
+            and self._active_per_agent.get(agent_id, 0) < self._limit_for(agent_id)
+        )
+
+    def _start(self, agent_id: str) -> None:
+        self._active += 1
+        self._active_per_agent[agent_id] = self._active_per_agent.get(agent_id, 0) + 1
+        self._admitted += 1
+
+    def _release(self, agent_id: str) -> None:
+        self._active -= 1
+        remaining = self._active_per_agent.get(agent_id, 1) - 1
+        if remaining > 0:
+            self._active_per_agent[agent_id] = remaining
+        else:
+            self._active_per_agent.pop(agent_id, None)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Hand free slots to waiting runs, one session at a time (round-robin)."""
+        granted = True
+        while granted and self._waiters:
+            granted = False
+            for session_key in list(self._waiters):
+                queue = self._waiters[session_key]
+                for waiter in queue:
+                    if not waiter.future.done() and self._can_run(waiter.agent_id):
+                        queue.remove(waiter)
+                        self._queued -= 1
+                        self._start(waiter.agent_id)
+                        waiter.future.set_result(None)
+                        granted = True
+                        break
+                if not queue:
+                    del self._waiters[session_key]
+                elif granted:
+                    # Served sessions go to the back of the line
+                    self._waiters.move_to_end(session_key)
+                if granted:
+                    break
+
+    def _remove_waiter(self, session_key: str, waiter: _Waiter) -> None:
+        queue = self._waiters.get(session_key)
+        if queue is not None and waiter in queue:
+            queue.remove(waiter)
+            self._queued -= 1
+            if not queue:
+                del self._waiters[session_key]
+
+    async def acquire(
+        self,
+        agent_id: str,
+        session_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Wait for a run slot for agent_id.
+
+        Args:
+            agent_id: Agent the slot is for (per-agent limits apply)
+            session_id: Session the run belongs to (fair-sharing key)
+            timeout: Maximum wait in seconds (default: queue_timeout)
+
+        Raises:
+            AdmissionError: If the queue is full or the wait deadline passes
+        """
+        if self._can_run(agent_id):
+            self._start(agent_id)
+            return
+
+        if self._queued >= self.max_queue:
+            self._rejected += 1
+            raise AdmissionError(
+                f"Server is at capacity ({self._active} runs in flight, "
+                f"{self._queued} queued); please retry shortly",
+                agent_name=agent_id,
+            )
+
+        session_key = session_id or _ANONYMOUS_SESSION
+        waiter = _Waiter(agent_id, asyncio.get_running_loop().create_future())
+        self._waiters.setdefault(session_key, deque()).append(waiter)
+        self._queued += 1
+        self._queued_total += 1
+
+        wait_timeout = self.queue_timeout if timeout is None else timeout
+        try:
+            await asyncio.wait({waiter.future}, timeout=wait_timeout)
+        except BaseException:
+            # Cancelled while waiting: give back a slot granted in the meantime
+            if waiter.future.done() and not waiter.future.cancelled():
+                self._release(agent_id)
+            else:
+                waiter.future.cancel()
+                self._remove_waiter(session_key, waiter)
+            raise
+
+        if not waiter.future.done():
+            waiter.future.cancel()
+            self._remove_waiter(session_key, waiter)
+            self._timed_out += 1
+            raise AdmissionError(
+                f"Timed out after {wait_timeout}s waiting for a free slot for "
+                f"agent '{agent_id}'; please retry shortly",
+                agent_name=agent_id,
+                retry_after=wait_timeout,
+            )
+
+    def release(self, agent_id: str) -> None:
+        """Give back a slot obtained with acquire()."""
+        self._release(agent_id)
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        agent_id: str,
+        session_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[None]:
+        """Context manager holding a run slot for the duration of the block."""
+        await self.acquire(agent_id, session_id=session_id, timeout=timeout)
+        try:
+            yield
+        finally:
+            self._release(agent_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of occupancy and admission counters."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "per_agent_limit": self.per_agent_limit,
+            "max_queue": self.max_queue,
+            "queue_timeout": self.queue_timeout,
+            "active": self._active,
+            "active_per_agent": dict(self._active_per_agent),
+            "queued": self._queued,
+            "queued_sessions": len(self._waiters),
+            "admitted": self._admitted,
+            "queued_total": self._queued_total,
+            "rejected": self._rejected,
+            "timed_out": self._timed_out,
+        }
+
+
+_shared_scheduler: Optional[ExecutionScheduler] = None
+_shared_scheduler_lock = threading.Lock()
+
+
+def get_execution_scheduler() -> ExecutionScheduler:
+    """Get the process-wide execution scheduler, creating it on first use."""
+    global _shared_scheduler
+    if _shared_scheduler is None:
+        with _shared_scheduler_lock:
+            if _shared_scheduler is None:
+                _shared_scheduler = ExecutionScheduler(
+                    max_concurrent=int(os.getenv("OPENAGENTS_MAX_CONCURRENT_RUNS", DEFAULT_MAX_CONCURRENT)),
+                    per_agent_limit=int(os.getenv("OPENAGENTS_MAX_CONCURRENT_PER_AGENT", DEFAULT_PER_AGENT_LIMIT)),
+                    max_queue=int(os.getenv("OPENAGENTS_SCHEDULER_QUEUE_SIZE", DEFAULT_MAX_QUEUE)),
+                    queue_timeout=float(os.getenv("OPENAGENTS_SCHEDULER_QUEUE_TIMEOUT", DEFAULT_QUEUE_TIMEOUT)),
+                )
+    return _shared_scheduler
@@ -0,0 +1,448 @@
+#############################################################################
+# llm_gateway.py
+#
+# Process-wide gateway for orchestrator-internal model calls
+#
+# The orchestrators make several small model calls per request (embeddings
+# for fast-path and expert selection, result synthesis, SmartRouter
+# interpretation/decomposition/judging). Each call site used to build its own
+# AsyncOpenAI client (and connection pool) or a fresh agents.Agent per call,
+# paying TLS handshakes and object churn on every request. The gateway
+# centralizes them:
+# - one keep-alive connection pool per event loop (HTTP/2 when the optional
+#   `h2` package is installed)
+# - coalescing of identical in-flight requests (one upstream call, shared result)
+# - retries with jittered exponential backoff on 429 / 5xx / connection errors
+# - per-caller timing, token and cost metrics (see stats())
+# - memoized agents.Agent instances for SDK-based internal calls, running on
+#   the pooled client
+#
+# Call sites either use the gateway directly or through bind(), which returns
+# an AsyncOpenAI-shaped facade (client.chat.completions.create(...),
+# client.embeddings.create(...)).
+#
+# Usage:
+#   >>> client = get_llm_gateway().bind("moe.mixer", api_key=api_key)
+#   >>> response = await client.chat.completions.create(model=..., messages=...)
+#   >>> get_llm_gateway().stats()["moe.mixer"]["avg_latency_ms"]
+#
+#############################################################################
+
+import asyncio
+import importlib.util
+import json
+import logging
+import random
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# USD per 1M tokens (input, output) for models used by the orchestrators
+MODEL_PRICING: Dict[str, Tuple[float, float]] = {
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "text-embedding-3-small": (0.02, 0.0),
+    "text-embedding-3-large": (0.13, 0.0),
+}
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _as_int(value: Any) -> int:
+    """Token counts from real responses are ints; mocks and missing fields count as 0."""
+    return value if isinstance(value, int) else 0
+
+
+def estimate_cost(model: Optional[str], prompt_tokens: int, completion_tokens: int) -> float:
+    """Estimated USD cost of a call; 0.0 for models without a price entry."""
+    pricing = MODEL_PRICING.get(model or "")
+    if pricing is None:
+        return 0.0
+    return (prompt_tokens * pricing[0] + completion_tokens * pricing[1]) / 1_000_000
+
+
+class _CallStats:
+    __slots__ = (
+        "calls", "errors", "retries", "coalesced", "latency_ms",
+        "prompt_tokens", "completion_tokens", "cost_usd",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.coalesced = 0
+        self.latency_ms = 0.0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cost_usd = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "coalesced": self.coalesced,
+            "avg_latency_ms": self.latency_ms / self.calls if self.calls else 0.0,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+        }
+
+
+class CallRecord:
+    """Usage of one tracked call; filled in by the caller inside track()."""
+
+    __slots__ = ("prompt_tokens", "completion_tokens")
+
+    def __init__(self):
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def record_usage(self, usage: Any) -> None:
+        """Record token usage from an OpenAI or openai-agents usage object."""
+        if usage is None:
+            return
+        self.prompt_tokens += _as_int(getattr(usage, "prompt_tokens", None)) or _as_int(
+            getattr(usage, "input_tokens", None)
+        )
+        self.completion_tokens += _as_int(getattr(usage, "completion_tokens", None)) or _as_int(
+            getattr(usage, "output_tokens", None)
+        )
+
+    def record_run_result(self, result: Any) -> None:
+        """Record token usage from an openai-agents RunResult."""
+        self.record_usage(getattr(getattr(result, "context_wrapper", None), "usage", None))
+
+
+class LLMGateway:
+    """
+    Pooled, coalescing, retrying front door for internal model calls.
+
+    Clients are cached per event loop (httpx pools cannot be shared across
+    loops) and per API key. Coalescing only applies to non-streaming calls.
+
+    Attributes:
+        max_retries: Retries after the first attempt for retryable errors
+        backoff_base: Base delay in seconds for exponential backoff
+        backoff_max: Maximum backoff delay in seconds
+    """
+
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+    def __init__(self, max_retries: int = 2, backoff_base: float = 0.5, backoff_max: float = 8.0):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Any, Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._in_flight: Dict[Any, asyncio.Future] = {}
+        self._agents: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Any, Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._unbound_agents: Dict[Any, Any] = {}
+        self._stats: Dict[str, _CallStats] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Clients
+    # ------------------------------------------------------------------
+
+    def client(self, api_key: Optional[str] = None) -> Any:
+        """Return the pooled AsyncOpenAI client for the running event loop."""
+        import openai
+
+        loop = asyncio.get_running_loop()
+        factory = openai.AsyncOpenAI
+        key = (api_key, factory)
+        with self._lock:
+            clients = self._clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None:
+                client = self._create_client(factory, api_key)
+                clients[key] = client
+            return client
+
+    def _create_client(self, factory: Callable[..., Any], api_key: Optional[str]) -> Any:
+        import httpx
+        import openai
+
+        http_client = openai.DefaultAsyncHttpxClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=self.MAX_CONNECTIONS,
+                max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=self.KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
+        # Retries are handled here (with jitter and metrics), not by the SDK
+        return factory(api_key=api_key, http_client=http_client, max_retries=0)
+
+    def bind(self, caller: str, api_key: Optional[str] = None) -> "_BoundClient":
+        """Return an AsyncOpenAI-shaped facade whose calls go through the gateway."""
+        return _BoundClient(self, caller, api_key)
+
+    # ------------------------------------------------------------------
+    # Calls
+    # ------------------------------------------------------------------
+
+    async def chat_completion(self, caller: str, api_key: Optional[str] = None, **kwargs) -> Any:
+        """chat.completions.create through the gateway (non-streaming, coalesced)."""
+        return await self._coalesced(
+            caller, "chat", api_key, kwargs,
+            lambda: self.client(api_key).chat.completions.create(**kwargs),
+        )
+
+    async def embeddings(self, caller: str, api_key: Optional[str] = None, **kwargs) -> Any:
+        """embeddings.create through the gateway (coalesced)."""
+        return await self._coalesced(
+            caller, "embeddings", api_key, kwargs,
+            lambda: self.client(api_key).embeddings.create(**kwargs),
+        )
+
+    async def chat_completion_stream(
+        self, caller: str, api_key: Optional[str] = None, **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        Streaming chat.completions.create through the gateway.
+
+        Opening the stream is retried; once chunks flow, errors propagate.
+        Usage is recorded from the final chunk when stream_options include it.
+        """
+        record = CallRecord()
+        async with self.track(caller, kwargs.get("model"), record):
+            stream = await self._with_retry(
+                caller, lambda: self.client(api_key).chat.completions.create(**kwargs)
+            )
+            async for chunk in stream:
+                record.record_usage(getattr(chunk, "usage", None))
+                yield chunk
+
+    async def _coalesced(
+        self,
+        caller: str,
+        kind: str,
+        api_key: Optional[str],
+        kwargs: Dict[str, Any],
+        call: Callable[[], Any],
+    ) -> Any:
+        try:
+            payload = json.dumps(kwargs, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            payload = None
+
+        if payload is None:
+            return await self._metered(caller, kwargs.get("model"), call)
+
+        key = (asyncio.get_running_loop(), kind, api_key, payload)
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._stats_for(caller).coalesced += 1
+            return await asyncio.shield(task)
+
+        task = asyncio.ensure_future(self._metered(caller, kwargs.get("model"), call))
+        self._in_flight[key] = task
+
+        def _done(finished: asyncio.Future) -> None:
+            self._in_flight.pop(key, None)
+            # Mark the error as retrieved even if every waiter was cancelled
+            if not finished.cancelled():
+                finished.exception()
+
+        task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    async def _metered(self, caller: str, model: Optional[str], call: Callable[[], Any]) -> Any:
+        record = CallRecord()
+        async with self.track(caller, model, record):
+            response = await self._with_retry(caller, call)
+            record.record_usage(getattr(response, "usage", None))
+            return response
+
+    async def _with_retry(self, caller: str, call: Callable[[], Any]) -> Any:
+        retryable = self._retryable_errors()
+        attempt = 0
+        while True:
+            try:
+                return await call()
+            except retryable as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+                attempt += 1
+                self._stats_for(caller).retries += 1
+                logger.warning(
+                    f"LLM call from {caller} failed ({type(e).__name__}); "
+                    f"retry {attempt}/{self.max_retries} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    def _retryable_errors() -> Tuple[type, ...]:
+        import openai
+
+        return (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
+    # ------------------------------------------------------------------
+    # Agents SDK calls
+    # ------------------------------------------------------------------
+
+    def get_agent(
+        self,
+        name: str,
+        instructions: str,
+        model: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Any:
+        """
+        Return a memoized agents.Agent for an internal model call.
+
+        Agents are plain configuration and safe to share across concurrent
+        runs, so one instance per (name, instructions, model settings) is
+        reused instead of building a new one on every call. Inside an event
+        loop the agent's model runs on the gateway's pooled client for that
+        loop (with the SDK's own retries, since Runner calls bypass the
+        gateway's); built outside a loop it uses the SDK's default client.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        key = (name, instructions, model, temperature, max_tokens)
+        with self._lock:
+            agents = self._unbound_agents if loop is None else self._agents.setdefault(loop, {})
+            agent = agents.get(key)
+        if agent is not None:
+            return agent
+
+        from agents import Agent, ModelSettings, OpenAIResponsesModel
+
+        agent = Agent(
+            name=name,
+            instructions=instructions,
+            model=model if loop is None else OpenAIResponsesModel(
+                model=model,
+                openai_client=self.client().with_options(max_retries=self.max_retries),
+            ),
+            model_settings=ModelSettings(temperature=temperature, max_tokens=max_tokens),
+        )
+        with self._lock:
+            return agents.setdefault(key, agent)
+
+    @asynccontextmanager
+    async def track(
+        self,
+        caller: str,
+        model: Optional[str] = None,
+        record: Optional[CallRecord] = None,
+    ) -> AsyncIterator[CallRecord]:
+        """
+        Record timing, tokens and cost of a call made outside the gateway.
+
+        Used for openai-agents Runner calls:
+
+            >>> async with gateway.track("smartrouter.interpreter", model) as call:
+            ...     result = await Runner.run(agent, input=query)
+            ...     call.record_run_result(result)
+        """
+        record = record or CallRecord()
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield record
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            stats = self._stats_for(caller)
+            with self._lock:
+                stats.calls += 1
+                stats.errors += 1 if failed else 0
+                stats.latency_ms += (time.perf_counter() - start) * 1000
+                stats.prompt_tokens += record.prompt_tokens
+                stats.completion_tokens += record.completion_tokens
+                stats.cost_usd += estimate_cost(model, record.prompt_tokens, record.completion_tokens)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def _stats_for(self, caller: str) -> _CallStats:
+        with self._lock:
+            stats = self._stats.get(caller)
+            if stats is None:
+                stats = self._stats[caller] = _CallStats()
+            return stats
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-caller call counts, latency, tokens and estimated cost."""
+        with self._lock:
+            return {caller: stats.as_dict() for caller, stats in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        """Clear all metrics."""
+        with self._lock:
+            self._stats.clear()
+
+
+class _BoundCompletions:
+    def __init__(self, bound: "_BoundClient"):
+        self._bound = bound
+
+    async def create(self, **kwargs) -> Any:
+        gateway, caller, api_key = self._bound.gateway, self._bound.caller, self._bound.api_key
+        if kwargs.get("stream"):
+            return gateway.chat_completion_stream(caller, api_key=api_key, **kwargs)
+        return await gateway.chat_completion(caller, api_key=api_key, **kwargs)
+
+
+class _BoundChat:
+    def __init__(self, bound: "_BoundClient"):
+        self.completions = _BoundCompletions(bound)
+
+
+class _BoundEmbeddings:
+    def __init__(self, bound: "_BoundClient"):
+        self._bound = bound
+
+    async def create(self, **kwargs) -> Any:
+        bound = self._bound
+        return await bound.gateway.embeddings(bound.caller, api_key=bound.api_key, **kwargs)
+
+
+class _BoundClient:
+    """AsyncOpenAI-shaped facade over an LLMGateway for one caller."""
+
+    def __init__(self, gateway: LLMGateway, caller: str, api_key: Optional[str]):
+        self.gateway = gateway
+        self.caller = caller
+        self.api_key = api_key
+        self.chat = _BoundChat(self)
+        self.embeddings = _BoundEmbeddings(self)
+
+
+_shared_gateway: Optional[LLMGateway] = None
+_shared_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Get the process-wide LLM gateway, creating it on first use."""
+    global _shared_gateway
+    if _shared_gateway is None:
+        with _shared_gateway_lock:
+            if _shared_gateway is None:
+                _shared_gateway = LLMGateway()
+    return _shared_gateway
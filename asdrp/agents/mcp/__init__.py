@@ -7,6 +7,7 @@ external tools and resources through the Model Context Protocol standard.
 Key Components:
 ---------------
 - MCPServerManager: Lifecycle management for MCP server processes
+- MCPServerPool / PooledMCPServer: Long-lived MCP connections reused across runs
 - yelp_mcp_agent: YelpMCPAgent implementation using Yelp MCP server
 
 Usage:
@@ -16,6 +17,10 @@ Usage:
 >>> await manager.start_server("yelp-mcp", config)
 """
 
+from asdrp.agents.mcp.mcp_connection_pool import (
+    MCPServerPool,
+    PooledMCPServer,
+)
 from asdrp.agents.mcp.mcp_server_manager import (
     MCPServerManager,
     get_mcp_manager,
@@ -23,5 +28,7 @@ from asdrp.agents.mcp.mcp_server_manager import (
 
 __all__ = [
     "MCPServerManager",
+    "MCPServerPool",
+    "PooledMCPServer",
     "get_mcp_manager",
 ]
@@ -0,0 +1,348 @@
+#############################################################################
+# mcp_connection_pool.py
+#
+# Pooled, long-lived MCP server connections
+#
+# Spawning an stdio MCP server (process start, interpreter import, MCP
+# handshake) costs hundreds of milliseconds to seconds. This module keeps
+# already-initialized connections alive between agent runs:
+# - MCPServerPool: bounded pool of connected servers for one server config,
+#   with health checks on borrow and max-idle recycling
+# - PooledMCPServer: MCPServer implementation that borrows a connection from
+#   a pool on connect() and returns it on cleanup(), so existing
+#   `async with mcp_server:` call sites transparently reuse sessions
+#
+# Design Principles:
+# - Task Ownership: each connection is opened and closed by its own owner
+#   task, because MCP stdio clients must be torn down in the task that
+#   entered them
+# - Per-Run Isolation: the borrowed connection is tracked in a ContextVar,
+#   so one agent instance can serve concurrent runs safely
+#
+# Usage:
+#   >>> pool = MCPServerPool("YelpMCP", lambda: MCPServerStdio(...), max_size=4)
+#   >>> async with PooledMCPServer(pool) as server:
+#   ...     tools = await server.list_tools()
+#   >>> await pool.close()
+#
+#############################################################################
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from agents.mcp import MCPServer
+
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledConnection:
+    """
+    A single connected MCP server owned by a dedicated background task.
+
+    The owner task enters the server's async context, signals readiness and
+    then parks until the connection is closed, so connect and cleanup always
+    run in the same task regardless of which request borrowed it.
+    """
+
+    def __init__(self, server: Any):
+        self.server = server
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._error: Optional[BaseException] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def open(self, timeout: float) -> None:
+        """Start the owner task and wait until the MCP handshake completes."""
+        self._task = asyncio.create_task(self._run())
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            await self.close()
+            raise TimeoutError(f"MCP server connection timed out after {timeout}s")
+        if self._error is not None:
+            raise self._error
+
+    async def _run(self) -> None:
+        try:
+            async with self.server:
+                self._ready.set()
+                await self._closing.wait()
+        except Exception as e:
+            self._error = e
+            logger.warning(f"MCP pooled connection terminated: {e}")
+        finally:
+            self._ready.set()
+
+    @property
+    def alive(self) -> bool:
+        """True while the owner task is running and the session is open."""
+        return (
+            self._task is not None
+            and not self._task.done()
+            and getattr(self.server, "session", None) is not None
+        )
+
+    async def is_healthy(self, timeout: float) -> bool:
+        """Check liveness and round-trip a ping over the MCP session."""
+        if not self.alive:
+            return False
+        session = getattr(self.server, "session", None)
+        send_ping = getattr(session, "send_ping", None)
+        if send_ping is None:
+            return True
+        try:
+            await asyncio.wait_for(send_ping(), timeout=timeout)
+            return True
+        except Exception as e:
+            logger.info(f"MCP pooled connection failed health check: {e}")
+            return False
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """Signal the owner task to exit the server context and wait for it."""
+        self._closing.set()
+        if self._task is None or self._task.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout=timeout)
+        except Exception:
+            self._task.cancel()
+
+
+class MCPServerPool:
+    """
+    Bounded pool of long-lived, already-initialized MCP server connections.
+
+    Connections are created lazily through `server_factory` (which must return
+    an unconnected MCP server, e.g. MCPServerStdio) and reused across borrows.
+    At most `max_size` connections exist at once; further borrowers wait for a
+    connection to be returned. Idle connections older than `max_idle_seconds`
+    are recycled, and every borrow verifies the session with a ping.
+
+    The pool binds to the event loop it is first used on. If it is used from a
+    different loop later (e.g. a new test loop), connections from the old loop
+    are abandoned and the pool starts fresh.
+
+    Attributes:
+    -----------
+    name : str
+        Readable name used in logs and as the PooledMCPServer name.
+    max_size : int
+        Maximum number of concurrent connections.
+    max_idle_seconds : float
+        Idle time after which a connection is closed instead of reused.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        server_factory: Callable[[], Any],
+        max_size: int = 4,
+        max_idle_seconds: float = 300.0,
+        connect_timeout: float = 60.0,
+        health_check_timeout: float = 5.0,
+    ):
+        if max_size < 1:
+            raise ValueError(f"MCP pool max_size must be >= 1, got {max_size}")
+        self.name = name
+        self.max_size = max_size
+        self.max_idle_seconds = max_idle_seconds
+        self._server_factory = server_factory
+        self._connect_timeout = connect_timeout
+        self._health_check_timeout = health_check_timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._idle: List[_PooledConnection] = []
+        self._in_use = 0
+        self._closed = False
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._loop is not None:
+                logger.info(f"MCP pool '{self.name}' rebinding to a new event loop")
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_size)
+            self._idle = []
+            self._in_use = 0
+
+    async def acquire(self) -> _PooledConnection:
+        """
+        Borrow a healthy connection, opening a new one if none is idle.
+
+        Raises:
+            RuntimeError: If the pool has been closed.
+            Exception: Whatever the server raises when a new connection fails.
+        """
+        if self._closed:
+            raise RuntimeError(f"MCP pool '{self.name}' is closed")
+        self._bind_loop()
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                conn = self._idle.pop()
+                if time.monotonic() - conn.last_used > self.max_idle_seconds:
+                    await conn.close()
+                    continue
+                if await conn.is_healthy(self._health_check_timeout):
+                    self._in_use += 1
+                    return conn
+                await conn.close()
+
+            conn = _PooledConnection(self._server_factory())
+            start = time.monotonic()
+            await conn.open(self._connect_timeout)
+            logger.info(
+                f"MCP pool '{self.name}' opened connection in "
+                f"{(time.monotonic() - start) * 1000:.0f}ms"
+            )
+            self._in_use += 1
+            return conn
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, conn: _PooledConnection, discard: bool = False) -> None:
+        """Return a borrowed connection; closed or discarded ones are torn down."""
+        if self._loop is not asyncio.get_running_loop():
+            # Borrowed under a loop the pool has since left; nothing to return to
+            await conn.close()
+            return
+
+        self._in_use -= 1
+        try:
+            if discard or self._closed or not conn.alive:
+                await conn.close()
+            else:
+                conn.last_used = time.monotonic()
+                self._idle.append(conn)
+        finally:
+            self._slots.release()
+        await self.prune_idle()
+
+    async def prune_idle(self) -> int:
+        """Close idle connections past max_idle_seconds. Returns the count closed."""
+        now = time.monotonic()
+        stale = [c for c in self._idle if now - c.last_used > self.max_idle_seconds]
+        if not stale:
+            return 0
+        self._idle = [c for c in self._idle if c not in stale]
+        await asyncio.gather(*(c.close() for c in stale), return_exceptions=True)
+        return len(stale)
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[Any]:
+        """Borrow a connected server for the duration of the block."""
+        conn = await self.acquire()
+        try:
+            yield conn.server
+        except BaseException:
+            await self.release(conn, discard=not conn.alive)
+            raise
+        else:
+            await self.release(conn)
+
+    async def warm(self) -> None:
+        """Open one connection and leave it idle, so the first caller skips the server start."""
+        if self._idle or self._in_use:
+            return
+        async with self.connection():
+            pass
+
+    async def close(self) -> None:
+        """Close idle connections; borrowed ones are closed when returned."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        if idle and self._loop is asyncio.get_running_loop():
+            await asyncio.gather(*(c.close() for c in idle), return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool occupancy for diagnostics."""
+        return {
+            "name": self.name,
+            "max_size": self.max_size,
+            "idle": len(self._idle),
+            "in_use": self._in_use,
+            "closed": self._closed,
+        }
+
+
+class PooledMCPServer(MCPServer):
+    """
+    MCPServer that runs against a connection borrowed from an MCPServerPool.
+
+    connect() borrows a connection and cleanup() returns it, so agents can
+    list this in `mcp_servers` and callers keep using `async with server:`.
+    The borrowed connection is tracked per asyncio context, so concurrent runs
+    of the same agent each get their own session. Calls made outside a
+    connect()/cleanup() block borrow a connection just for that call.
+    """
+
+    def __init__(self, pool: MCPServerPool, use_structured_content: bool = False):
+        super().__init__(use_structured_content=use_structured_content)
+        self.pool = pool
+        self._borrowed: ContextVar[Optional[Tuple[_PooledConnection, int]]] = ContextVar(
+            f"mcp_pool_{pool.name}_{id(self)}", default=None
+        )
+
+    @property
+    def name(self) -> str:
+        return self.pool.name
+
+    async def connect(self):
+        current = self._borrowed.get()
+        if current is not None:
+            conn, depth = current
+            self._borrowed.set((conn, depth + 1))
+            return
+        conn = await self.pool.acquire()
+        self._borrowed.set((conn, 1))
+
+    async def cleanup(self):
+        current = self._borrowed.get()
+        if current is None:
+            return
+        conn, depth = current
+        if depth > 1:
+            self._borrowed.set((conn, depth - 1))
+            return
+        self._borrowed.set(None)
+        await self.pool.release(conn)
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.cleanup()
+
+    @asynccontextmanager
+    async def _server(self) -> AsyncIterator[Any]:
+        current = self._borrowed.get()
+        if current is not None:
+            yield current[0].server
+        else:
+            async with self.pool.connection() as server:
+                yield server
+
+    async def list_tools(self, run_context=None, agent=None):
+        async with self._server() as server:
+            return await server.list_tools(run_context, agent)
+
+    async def call_tool(self, tool_name: str, arguments: Optional[Dict[str, Any]]):
+        async with self._server() as server:
+            return await server.call_tool(tool_name, arguments)
+
+    async def list_prompts(self):
+        async with self._server() as server:
+            return await server.list_prompts()
+
+    async def get_prompt(self, name: str, arguments: Optional[Dict[str, Any]] = None):
+        async with self._server() as server:
+            return await server.get_prompt(name, arguments)
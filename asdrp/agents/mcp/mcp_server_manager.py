@@ -9,6 +9,7 @@
 # - Process lifecycle management
 # - Resource cleanup and error handling
 # - Server connection information
+# - Pools of long-lived stdio MCP connections shared across agent runs
 #
 # Design Principles:
 # - Single Responsibility: Only manages MCP server lifecycle
@@ -25,13 +26,15 @@
 #############################################################################
 
 import asyncio
+import hashlib
 import logging
 import os
 import subprocess
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Callable, Dict, Mapping, Optional, Any, Sequence
 
 from asdrp.agents.config_loader import MCPServerConfig
+from asdrp.agents.mcp.mcp_connection_pool import MCPServerPool
 from asdrp.agents.protocol import AgentException
 
 
@@ -61,11 +64,14 @@ class MCPServerManager:
         Registry of running server processes by name.
     _server_configs : Dict[str, MCPServerConfig]
         Configuration for each registered server.
+    _pools : Dict[str, MCPServerPool]
+        Connection pools for stdio servers, keyed by pool key.
     """
 
     _instance: Optional["MCPServerManager"] = None
     _servers: Dict[str, subprocess.Popen] = {}
     _server_configs: Dict[str, MCPServerConfig] = {}
+    _pools: Dict[str, MCPServerPool] = {}
 
     def __init__(self):
         """
@@ -76,6 +82,7 @@ class MCPServerManager:
         """
         self._servers: Dict[str, subprocess.Popen] = {}
         self._server_configs: Dict[str, MCPServerConfig] = {}
+        self._pools: Dict[str, MCPServerPool] = {}
 
     @classmethod
     def instance(cls) -> "MCPServerManager":
@@ -364,6 +371,8 @@ class MCPServerManager:
         >>> # At application shutdown:
         >>> await manager.shutdown_all()
         """
+        await self.close_pools()
+
         if not self._servers:
             logger.info("No MCP servers to shutdown")
             return
@@ -407,6 +416,129 @@ class MCPServerManager:
 
         return result
 
+    @staticmethod
+    def pool_key(
+        name: str,
+        command: Sequence[str],
+        cwd: Optional[str] = None,
+        env: Optional[Mapping[str, str]] = None,
+    ) -> str:
+        """
+        Build a stable pool key for an MCP server configuration.
+
+        Servers launched with the same command, working directory and
+        environment are interchangeable and share one pool. The environment
+        is folded into a digest so credentials never appear in the key.
+
+        Examples:
+        ---------
+        >>> MCPServerManager.pool_key("YelpMCP", ["uv", "run", "mcp-yelp-agent"], "/app/yelp-mcp")
+        'YelpMCP:/app/yelp-mcp:uv run mcp-yelp-agent:...'
+        """
+        env_digest = hashlib.sha256(
+            repr(sorted((env or {}).items())).encode("utf-8")
+        ).hexdigest()[:12]
+        return f"{name}:{cwd or ''}:{' '.join(command)}:{env_digest}"
+
+    def get_pool(
+        self,
+        pool_key: str,
+        server_factory: Callable[[], Any],
+        name: Optional[str] = None,
+        max_size: int = 4,
+        max_idle_seconds: float = 300.0,
+    ) -> MCPServerPool:
+        """
+        Get or create the connection pool for an MCP server configuration.
+
+        The first call for a key creates the pool; later calls return the same
+        pool (and its warm connections) and ignore the factory and sizing
+        arguments.
+
+        Args:
+            pool_key: Key from pool_key() identifying the server configuration.
+            server_factory: Returns a new, unconnected MCP server (e.g. MCPServerStdio).
+            name: Readable pool name. Defaults to the pool key.
+            max_size: Maximum number of concurrent connections.
+            max_idle_seconds: Idle time after which connections are recycled.
+
+        Returns:
+            MCPServerPool shared by every agent using this configuration.
+
+        Examples:
+        ---------
+        >>> manager = MCPServerManager.instance()
+        >>> pool = manager.get_pool(key, lambda: MCPServerStdio(name="YelpMCP", params=params))
+        >>> async with PooledMCPServer(pool) as server:
+        ...     tools = await server.list_tools()
+        """
+        pool = self._pools.get(pool_key)
+        if pool is None:
+            pool = MCPServerPool(
+                name or pool_key,
+                server_factory,
+                max_size=max_size,
+                max_idle_seconds=max_idle_seconds,
+            )
+            self._pools[pool_key] = pool
+            logger.info(
+                f"Created MCP connection pool '{pool.name}' "
+                f"(max_size={max_size}, max_idle={max_idle_seconds}s)"
+            )
+        return pool
+
+    async def close_pools(self) -> None:
+        """
+        Close all MCP connection pools and their idle connections.
+
+        Examples:
+        ---------
+        >>> manager = MCPServerManager.instance()
+        >>> await manager.close_pools()
+        """
+        pools, self._pools = list(self._pools.values()), {}
+        if not pools:
+            return
+        logger.info(f"Closing {len(pools)} MCP connection pool(s)...")
+        await asyncio.gather(*(pool.close() for pool in pools), return_exceptions=True)
+
+    async def warm_pools(self) -> Dict[str, Optional[str]]:
+        """
+        Open one idle connection in every MCP connection pool.
+
+        Called at application startup (after agents have registered their
+        pools) so the first request does not pay for the server subprocess
+        start and MCP handshake.
+
+        Returns:
+            Dictionary mapping pool keys to None (warm) or an error message.
+
+        Examples:
+        ---------
+        >>> manager = MCPServerManager.instance()
+        >>> await manager.warm_pools()
+        {'YelpMCP:...': None}
+        """
+        pools = list(self._pools.items())
+        results = await asyncio.gather(*(pool.warm() for _, pool in pools), return_exceptions=True)
+        warmed = {}
+        for (key, pool), result in zip(pools, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Could not warm MCP pool '{pool.name}': {result}")
+                warmed[key] = str(result) or type(result).__name__
+            else:
+                warmed[key] = None
+        return warmed
+
+    def list_pools(self) -> Dict[str, Dict[str, Any]]:
+        """
+        List MCP connection pools and their occupancy.
+
+        Returns:
+            Dictionary mapping pool keys to pool stats.
+        """
+        return {key: pool.stats() for key, pool in self._pools.items()}
+
 
 # Module-level convenience functions
 _manager_instance: Optional[MCPServerManager] = None
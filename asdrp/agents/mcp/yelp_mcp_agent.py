@@ -162,9 +162,16 @@ Be helpful, accurate, and always credit Yelp for the data.
 """
 
 
+# (command, work_dir) pairs that already passed _validate_mcp_command
+_VALIDATED_MCP_COMMANDS: set[tuple[str, str]] = set()
+
+
 def _validate_mcp_command(command: str, work_dir: Path) -> None:
     """
     Validate MCP server command before attempting to create the server.
+
+    Successful validations are remembered per (command, work_dir), so the
+    `uv run --help` probe runs once per process rather than per agent creation.
     
     Args:
         command: The MCP server command to validate
@@ -175,6 +182,10 @@ def _validate_mcp_command(command: str, work_dir: Path) -> None:
     """
     import shutil
     import subprocess
+
+    cache_key = (command, str(work_dir))
+    if cache_key in _VALIDATED_MCP_COMMANDS:
+        return
     
     # Check if command exists in PATH
     if not shutil.which(command):
@@ -213,6 +224,8 @@ def _validate_mcp_command(command: str, work_dir: Path) -> None:
                 agent_name="yelp_mcp"
             )
 
+    _VALIDATED_MCP_COMMANDS.add(cache_key)
+
 
 def _diagnose_mcp_error(error: Exception, command: str, work_dir: Path, env: dict) -> str:
     """
@@ -550,19 +563,39 @@ def create_yelp_mcp_agent(
         #   * Response parsing/formatting: ~5-10s
         # - This prevents premature timeouts on legitimate long-running queries
         # Note: The server will be connected via async context manager in agent_service.py
+        #
+        # Connections are pooled by MCPServerManager: the agent gets a PooledMCPServer
+        # whose `async with` borrows an already-initialized session instead of
+        # spawning a new subprocess and repeating the MCP handshake per request.
         
         try:
             # Perform pre-flight validation of MCP server command (skip in test environments)
             if not os.getenv("PYTEST_CURRENT_TEST"):
                 _validate_mcp_command(command_base, work_dir)
-            
-            mcp_server = MCPServerStdio(
+
+            server_kwargs: Dict[str, Any] = {
+                "name": "YelpMCP",
+                "params": mcp_params,
+                "client_session_timeout_seconds": 60.0,  # Increased: 60s for reliable complex queries
+                "cache_tools_list": True,  # Cache tools list to reduce latency per OpenAI docs
+                "max_retry_attempts": 3,  # Enhanced: 3 retries for better reliability
+            }
+
+            # Build one server up front so invalid parameters fail here, where the
+            # diagnostics and non-MCP fallback live, rather than on first borrow
+            MCPServerStdio(**server_kwargs)
+
+            from asdrp.agents.mcp.mcp_connection_pool import PooledMCPServer
+            from asdrp.agents.mcp.mcp_server_manager import MCPServerManager, get_mcp_manager
+
+            pool = get_mcp_manager().get_pool(
+                MCPServerManager.pool_key("YelpMCP", command_list, str(work_dir), env),
+                lambda: MCPServerStdio(**server_kwargs),
                 name="YelpMCP",
-                params=mcp_params,
-                client_session_timeout_seconds=60.0,  # Increased: 60s for reliable complex queries
-                cache_tools_list=True,  # Cache tools list to reduce latency per OpenAI docs
-                max_retry_attempts=3,  # Enhanced: 3 retries for better reliability
+                max_size=mcp_server_config.pool_size,
+                max_idle_seconds=mcp_server_config.pool_max_idle_seconds,
             )
+            mcp_server = PooledMCPServer(pool)
             
             print(f"[YelpMCPAgent] ✓ MCP server configured successfully", file=sys.stderr)
             
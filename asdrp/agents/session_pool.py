@@ -0,0 +1,253 @@
+#############################################################################
+# session_pool.py
+#
+# Bounded session cache with shared SQLite connections
+#
+# Orchestrators mint a new session per conversation (and one per expert for
+# persistent memory), so an unbounded session cache grows for the lifetime of
+# the server and every file-based SQLiteSession opens its own connection per
+# worker thread. This module bounds both:
+# - SessionPool: LRU/TTL-bounded cache of session objects that closes
+#   sessions on eviction and exposes hit/miss/eviction metrics
+# - SharedSQLiteSession: SQLiteSession that runs on one WAL-mode connection
+#   per database file, shared by every session targeting that file and
+#   serialized by a single writer lock
+#
+# Usage:
+#   >>> pool = SessionPool(max_size=256, ttl_seconds=3600)
+#   >>> session = pool.get(key) or pool.put(key, SharedSQLiteSession(...))
+#   >>> pool.stats()
+#
+#############################################################################
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from agents import SQLiteSession
+    SESSION_MEMORY_AVAILABLE = True
+except ImportError:
+    SESSION_MEMORY_AVAILABLE = False
+    SQLiteSession = None
+
+
+logger = logging.getLogger(__name__)
+
+
+def close_session(session: Any) -> None:
+    """
+    Close a session object, ignoring sessions that are already closed.
+
+    SQLiteSession exposes close(); older objects may only carry a raw
+    connection attribute.
+    """
+    if session is None:
+        return
+    try:
+        if hasattr(session, 'close'):
+            session.close()
+        elif hasattr(session, '_connection') and session._connection:
+            session._connection.close()
+        elif hasattr(session, 'db') and hasattr(session.db, 'close'):
+            session.db.close()
+    except Exception:
+        # Connection may already be closed
+        pass
+
+
+class SharedConnectionRegistry:
+    """
+    One WAL-mode SQLite connection and writer lock per database file.
+
+    Connections stay open until close_all(), since sessions that were evicted
+    from a SessionPool may still be in use by an in-flight run. The number of
+    connections is bounded by the number of distinct database files.
+    """
+
+    def __init__(self):
+        self._connections: Dict[str, Tuple[sqlite3.Connection, threading.RLock]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(db_path: str | Path) -> str:
+        return str(Path(db_path).resolve())
+
+    def acquire(self, db_path: str | Path) -> Tuple[sqlite3.Connection, threading.RLock]:
+        """Return the shared (connection, writer lock) pair for a database file."""
+        key = self._key(db_path)
+        with self._lock:
+            entry = self._connections.get(key)
+            if entry is None:
+                conn = sqlite3.connect(key, check_same_thread=False, timeout=30.0)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                entry = (conn, threading.RLock())
+                self._connections[key] = entry
+                logger.debug(f"Opened shared session connection: {key}")
+            return entry
+
+    def close_all(self) -> None:
+        """Close every shared connection."""
+        with self._lock:
+            entries = list(self._connections.values())
+            self._connections.clear()
+        for conn, lock in entries:
+            with lock:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+
+    def __len__(self) -> int:
+        return len(self._connections)
+
+
+if SESSION_MEMORY_AVAILABLE:
+
+    class SharedSQLiteSession(SQLiteSession):
+        """
+        File-based SQLiteSession backed by a connection shared per database file.
+
+        SQLiteSession serializes access to its single connection only in
+        in-memory mode; file-based sessions otherwise open a connection per
+        worker thread. This subclass routes the file through the shared,
+        lock-guarded connection path so all sessions for the same file use
+        one connection and one writer.
+        """
+
+        def __init__(
+            self,
+            session_id: str,
+            db_path: str | Path,
+            registry: SharedConnectionRegistry,
+        ):
+            # Base init creates the schema on a short-lived connection
+            super().__init__(session_id=session_id, db_path=str(db_path))
+            conn, lock = registry.acquire(db_path)
+            self._shared_connection = conn
+            self._lock = lock
+            self._is_memory_db = True
+
+        def _get_connection(self) -> sqlite3.Connection:
+            return self._shared_connection
+
+        def close(self) -> None:
+            """No-op: the shared connection is owned by the registry."""
+
+else:
+    SharedSQLiteSession = None
+
+
+class _SessionEntry:
+    __slots__ = ("session", "last_used")
+
+    def __init__(self, session: Any):
+        self.session = session
+        self.last_used = time.monotonic()
+
+
+class SessionPool:
+    """
+    Thread-safe LRU cache of session objects with idle-time expiry.
+
+    Sessions evicted for size or expired after ttl_seconds without use are
+    closed. Metrics are available through stats().
+
+    Attributes:
+        max_size: Maximum number of cached sessions
+        ttl_seconds: Idle time after which a session is dropped (None = never)
+    """
+
+    def __init__(self, max_size: int = 256, ttl_seconds: Optional[float] = 3600.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, _SessionEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def _is_expired(self, entry: _SessionEntry, now: float) -> bool:
+        return self.ttl_seconds is not None and now - entry.last_used > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached session for key, or None if absent or expired."""
+        expired = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            now = time.monotonic()
+            if self._is_expired(entry, now):
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                expired = entry.session
+            else:
+                entry.last_used = now
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.session
+        close_session(expired)
+        return None
+
+    def put(self, key: str, session: Any) -> Any:
+        """Cache a session, evicting expired and least recently used entries."""
+        to_close = []
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None and previous.session is not session:
+                to_close.append(previous.session)
+            self._entries[key] = _SessionEntry(session)
+
+            now = time.monotonic()
+            for stale_key in [k for k, e in self._entries.items() if self._is_expired(e, now)]:
+                to_close.append(self._entries.pop(stale_key).session)
+                self._expirations += 1
+
+            while len(self._entries) > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                to_close.append(evicted.session)
+                self._evictions += 1
+
+        for stale in to_close:
+            close_session(stale)
+        return session
+
+    def clear(self) -> None:
+        """Close and drop every cached session."""
+        with self._lock:
+            sessions = [e.session for e in self._entries.values()]
+            self._entries.clear()
+        for session in sessions:
+            close_session(session)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of cache occupancy and hit/eviction counters."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total > 0 else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
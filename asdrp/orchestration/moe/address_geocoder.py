@@ -7,8 +7,10 @@ Design Principles:
 - Single Responsibility: Only handles address extraction and geocoding
 - Fail-Safe: Never crashes, always returns partial results on errors
 - Defensive: Handles malformed addresses, API failures gracefully
+- Bounded Latency: Geocodes a batch concurrently under one total deadline
 """
 
+import asyncio
 import re
 from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
@@ -60,9 +62,28 @@ class AddressGeocoder:
         re.IGNORECASE
     )
 
-    def __init__(self):
-        """Initialize geocoder (lazy-load Google Maps client)."""
+    # Concurrent geocoding requests per batch
+    DEFAULT_MAX_CONCURRENCY = 6
+
+    # Total deadline for one geocode_addresses() batch (seconds)
+    DEFAULT_BATCH_TIMEOUT = 8.0
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        batch_timeout: float = DEFAULT_BATCH_TIMEOUT,
+    ):
+        """
+        Initialize geocoder (lazy-load geocoding client).
+
+        Args:
+            max_concurrency: Maximum concurrent geocoding requests per batch
+            batch_timeout: Total deadline in seconds for one batch; addresses
+                not geocoded by then are skipped
+        """
         self._geocoding_client = None
+        self._max_concurrency = max(1, max_concurrency)
+        self._batch_timeout = batch_timeout
 
     def _get_geocoding_client(self):
         """Lazy-load Google Maps Geocoding API client."""
@@ -174,8 +195,10 @@ class AddressGeocoder:
             List of marker dicts: [{"lat": float, "lng": float, "title": str}, ...]
 
         Note:
+            - Geocodes up to max_concurrency addresses at a time, with a
+              single batch deadline; markers keep the input order
             - Handles geocoding failures gracefully (skips failed addresses)
-            - Returns partial results if some addresses fail
+            - Returns partial results if some addresses fail or time out
             - Never raises exceptions
         """
         if not venue_addresses:
@@ -186,29 +209,78 @@ class AddressGeocoder:
             logger.warning("Geocoding unavailable - skipping coordinate lookup")
             return []
 
-        markers: List[Dict[str, Any]] = []
-
-        for name, address in venue_addresses[:max_results]:
-            try:
-                # Use GeoTools.get_coordinates_by_address (it's async)
-                result = await geocoder.get_coordinates_by_address(address)
-
-                if result and 'latitude' in result and 'longitude' in result:
-                    markers.append({
-                        "lat": result['latitude'],
-                        "lng": result['longitude'],
-                        "title": name[:80]  # Truncate long names
-                    })
-                    logger.debug(f"Geocoded: {name} → ({result['latitude']}, {result['longitude']})")
-                else:
+        batch = venue_addresses[:max_results]
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _geocode(address: str) -> Optional[Tuple[float, float]]:
+            async with semaphore:
+                try:
+                    # GeoTools.get_coordinates_by_address is async and backed by
+                    # the shared geocode cache
+                    result = await geocoder.get_coordinates_by_address(address)
+                except Exception as e:
+                    logger.warning(f"Failed to geocode '{address}': {e}")
+                    return None
+                coordinates = self._coerce_coordinates(result)
+                if coordinates is None:
                     logger.warning(f"Geocoding returned no coordinates for: {address}")
+                return coordinates
+
+        # One request per distinct address, all sharing a single deadline
+        tasks: Dict[str, asyncio.Task] = {}
+        for _, address in batch:
+            key = address.strip().lower()
+            if key not in tasks:
+                tasks[key] = asyncio.create_task(_geocode(address))
+
+        _, pending = await asyncio.wait(tasks.values(), timeout=self._batch_timeout)
+        if pending:
+            logger.warning(
+                f"Geocoding deadline ({self._batch_timeout}s) reached - "
+                f"skipping {len(pending)}/{len(tasks)} addresses"
+            )
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
-            except Exception as e:
-                logger.warning(f"Failed to geocode '{address}': {e}")
+        markers: List[Dict[str, Any]] = []
+        for name, address in batch:
+            task = tasks[address.strip().lower()]
+            if task.cancelled() or task.result() is None:
                 continue
+            lat, lng = task.result()
+            markers.append({
+                "lat": lat,
+                "lng": lng,
+                "title": name[:80]  # Truncate long names
+            })
+            logger.debug(f"Geocoded: {name} → ({lat}, {lng})")
 
         return markers
 
+    @staticmethod
+    def _coerce_coordinates(result: Any) -> Optional[Tuple[float, float]]:
+        """
+        Normalize a geocoding result to (lat, lng).
+
+        Accepts the (latitude, longitude) tuple returned by GeoTools/MapTools
+        as well as dicts with 'latitude'/'longitude' keys. The (-1.0, -1.0)
+        "not found" sentinel and malformed results map to None.
+        """
+        if not result:
+            return None
+        try:
+            if isinstance(result, dict):
+                lat, lng = result['latitude'], result['longitude']
+            else:
+                lat, lng = result
+            lat, lng = float(lat), float(lng)
+        except (KeyError, TypeError, ValueError):
+            return None
+        if (lat, lng) == (-1.0, -1.0):
+            return None
+        return (lat, lng)
+
     async def extract_and_geocode(
         self,
         text: str,
@@ -2,20 +2,61 @@
 Semantic Cache for MoE Orchestrator.
 
 Provides caching of query-result pairs using embedding similarity.
+
+Lookup strategy:
+1. Exact match on the normalized query hash (no embedding needed)
+2. Cosine top-1 search over the stored query embeddings (vectorized NumPy)
+
+The embedding provider is shared with SemanticSelector, so the query embedding
+computed here is served from CachedEmbeddingProvider when the selector asks
+for it (no extra embedding API call per request).
+
+Storage:
+- One long-lived SQLite connection for reads and one owned by a writer
+  thread, in WAL mode (readers never wait for the writer)
+- Writes are queued to the writer thread, which commits everything queued
+  at once in one transaction (concurrent stores share one commit)
+- A maintained row counter replaces COUNT(*) on every store; the writer
+  also sweeps expired rows and the oldest rows beyond max_entries
+  periodically, instead of only when an expired row happens to be read
+
+Freshness:
+- Entries are fresh for `ttl` seconds, then stale for `stale_ttl` more
+  seconds, during which they are still returned (marked "stale") so the
+  orchestrator can answer immediately and refresh them in the background
+- Every returned entry carries its age and ttl
 """
 
-from typing import Optional, Any, Dict
+from concurrent.futures import Future
+from typing import Optional, Any, Dict, List, Tuple
 import hashlib
 import json
+import queue
 import sqlite3
+import threading
+import time
 from pathlib import Path
 from dataclasses import dataclass, asdict
 import asyncio
+import numpy as np
 from loguru import logger
 
 from asdrp.orchestration.moe.interfaces import ICache
 from asdrp.orchestration.moe.config_loader import MoEConfig
 from asdrp.orchestration.moe.exceptions import CacheException
+from asdrp.orchestration.moe.embedding_providers import (
+    IEmbeddingProvider,
+    QueryEmbeddingContext
+)
+
+# Default seconds between background sweeps (TTL expiry, max_entries, recount)
+DEFAULT_SWEEP_INTERVAL = 60.0
+
+# Max writes committed in one transaction
+WRITE_BATCH_SIZE = 256
+
+# Writer queue operations (_DELETE takes (query_hash, timestamp) pairs)
+_PUT, _DELETE, _CLEAR, _STOP = "put", "delete", "clear", "stop"
 
 
 @dataclass
@@ -32,19 +73,54 @@ class SemanticCache(ICache):
     """
     Semantic cache using embedding similarity.
 
-    For now, implements exact string matching for simplicity.
-    Future: Add embedding-based similarity search.
+    Each row stores the query embedding next to the cached response. Lookups
+    first try an exact hash match, then a cosine top-1 search over an in-memory
+    matrix of normalized embeddings, so paraphrased repeats
+    ("pizza near me in SF" / "pizza places near me, SF") are served from cache.
+
+    Semantic matching is enabled when an embedding provider is given and the
+    cache type is not "exact". Without a provider the cache degrades to exact
+    matching only.
+
+    Similarity is raw cosine similarity in [-1, 1], compared against the
+    `similarity_threshold` of moe.embedding_thresholds for the active
+    provider, else the `similarity_threshold` policy key (default 0.9).
+
+    Entries past their ttl but within `stale_ttl` (default 0: disabled) are
+    returned with "stale": True instead of being treated as misses.
     """
 
-    def __init__(self, config: MoEConfig):
+    def __init__(
+        self,
+        config: MoEConfig,
+        embedding_provider: Optional[IEmbeddingProvider] = None
+    ):
         """
         Initialize cache with configuration.
 
         Args:
             config: MoE configuration
+            embedding_provider: Optional embedding provider for semantic lookup.
+                Pass the provider held by SemanticSelector so query embeddings
+                are computed once and shared via its cache.
         """
         self._config = config
         self._enabled = config.cache.enabled
+        self._provider = embedding_provider
+        self._semantic = (
+            embedding_provider is not None and config.cache.type != "exact"
+        )
+
+        # In-memory embedding index (rows are L2-normalized float32 vectors).
+        # Loaded lazily from SQLite on first semantic lookup, then kept in sync
+        # on store/remove/clear. Guarded by a lock since SQLite work runs in
+        # worker threads.
+        self._index_lock = threading.Lock()
+        self._index_loaded = False
+        self._index_matrix: Optional[np.ndarray] = None
+        self._index_expires: Optional[np.ndarray] = None
+        self._index_hashes: List[str] = []
+        self._index_pos: Dict[str, int] = {}
 
         if not self._enabled:
             return
@@ -53,25 +129,58 @@ class SemanticCache(ICache):
         storage = config.cache.storage
         db_path = storage.get("path", ":memory:")
 
-        # Create parent directory if needed
-        if db_path != ":memory:":
-            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-
-        # Initialize SQLite database
-        self._db_path = db_path
-        self._init_database()
-
         # Get policy config
         policy = config.cache.policy
-        self._similarity_threshold = policy.get("similarity_threshold", 0.9)
+        self._similarity_threshold = config.embedding_threshold(
+            "similarity_threshold", policy.get("similarity_threshold", 0.9)
+        )
         self._ttl = policy.get("ttl", 3600)  # 1 hour default
+        self._stale_ttl = policy.get("stale_ttl", 0)
         self._max_entries = policy.get("max_entries", 10000)
+        self._sweep_interval = policy.get("sweep_interval", DEFAULT_SWEEP_INTERVAL)
+
+        # SQLite is opened on the first get/store, so constructing a cache
+        # (e.g. with an orchestrator) leaves the database file untouched
+        self._db_path = db_path
+        self._db_ready = False
+        self._db_init_lock = threading.Lock()
+        # A ":memory:" database exists per connection, so reads share the writer's
+        if db_path == ":memory:":
+            self._read_lock = self._write_lock = threading.Lock()
+        else:
+            self._read_lock = threading.Lock()
+            self._write_lock = threading.Lock()
+
+        # Writer thread (started on first write) and its queue of operations
+        self._write_queue: "queue.Queue[Tuple[str, Any, Optional[Future]]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_start_lock = threading.Lock()
+        self._next_sweep = time.monotonic() + self._sweep_interval
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a long-lived connection usable from any thread (callers lock)."""
+        conn = sqlite3.connect(self._db_path, check_same_thread=False, timeout=10.0)
+        if self._db_path != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _ensure_database(self) -> None:
+        """Open the database on first use (safe to call from any thread)."""
+        if self._db_ready:
+            return
+        with self._db_init_lock:
+            if not self._db_ready:
+                self._init_database()
+                self._db_ready = True
 
     def _init_database(self):
-        """Initialize SQLite database schema."""
+        """Open the read and write connections and initialize the schema."""
         try:
-            conn = sqlite3.connect(self._db_path)
-            cursor = conn.cursor()
+            if self._db_path != ":memory:":
+                Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._write_conn = self._connect()
+            cursor = self._write_conn.cursor()
 
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS cache_entries (
@@ -80,22 +189,37 @@ class SemanticCache(ICache):
                     response TEXT NOT NULL,
                     experts_used TEXT NOT NULL,
                     timestamp REAL NOT NULL,
-                    ttl INTEGER NOT NULL
+                    ttl INTEGER NOT NULL,
+                    embedding BLOB
                 )
             """)
 
+            # Migrate databases created before embeddings were stored
+            cursor.execute("PRAGMA table_info(cache_entries)")
+            columns = {row[1] for row in cursor.fetchall()}
+            if "embedding" not in columns:
+                cursor.execute("ALTER TABLE cache_entries ADD COLUMN embedding BLOB")
+
             # Index for timestamp-based expiration
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_timestamp
                 ON cache_entries(timestamp)
             """)
 
-            conn.commit()
-            conn.close()
+            self._write_conn.commit()
+
+            # Maintained row counter (recounted by the periodic sweep, since
+            # other processes may share the file)
+            self._count = cursor.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
 
         except Exception as e:
             raise CacheException(f"Failed to initialize cache database: {e}")
 
+        if self._db_path == ":memory:":
+            self._read_conn = self._write_conn
+        else:
+            self._read_conn = self._connect()
+
     def _get_query_hash(self, query: str) -> str:
         """
         Get hash of query for exact matching.
@@ -116,54 +240,84 @@ class SemanticCache(ICache):
         normalized = f"{CACHE_VERSION}:{query.lower().strip()}"
         return hashlib.sha256(normalized.encode()).hexdigest()
 
-    async def get(self, query: str) -> Optional[Any]:
+    async def get(
+        self,
+        query: str,
+        embedding_context: Optional[QueryEmbeddingContext] = None
+    ) -> Optional[Any]:
         """
         Get cached result for query.
 
         Args:
             query: Query string
+            embedding_context: Optional per-request query embedding to reuse
 
         Returns:
-            Cached result if found and not expired, None otherwise
+            Cached result if found and not expired, None otherwise. Results
+            carry freshness metadata: "cached_at", "age_s", "ttl" and
+            "stale" (past ttl, within stale_ttl)
         """
         if not self._enabled:
             return None
 
         try:
             # Run database operation in thread pool to avoid blocking
-            return await asyncio.to_thread(self._get_sync, query)
+            cached = await asyncio.to_thread(self._get_sync, query)
+            if cached is not None or not self._semantic:
+                return cached
+
+            embedding = await self._embed(query, embedding_context)
+            if embedding is None:
+                return None
+            return await asyncio.to_thread(self._get_similar_sync, embedding)
         except Exception as e:
             # Log error but don't fail the request
             logger.warning(f"Cache get error: {e}")
             return None
 
-    def _get_sync(self, query: str) -> Optional[Dict[str, Any]]:
-        """Synchronous cache get."""
-        import time
-
-        query_hash = self._get_query_hash(query)
-
-        conn = sqlite3.connect(self._db_path)
-        cursor = conn.cursor()
+    async def _embed(
+        self,
+        query: str,
+        embedding_context: Optional[QueryEmbeddingContext] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Embed query, preferring the request's embedding context.
 
-        cursor.execute("""
-            SELECT response, experts_used, timestamp, ttl
-            FROM cache_entries
-            WHERE query_hash = ?
-        """, (query_hash,))
+        Returns None on failure so the cache degrades to exact matching.
+        """
+        try:
+            if embedding_context is not None and embedding_context.matches(query):
+                return await embedding_context.get_embedding()
+            return await self._provider.generate_embedding(query)
+        except Exception as e:
+            logger.warning(f"Cache embedding error: {e}")
+            return None
 
-        row = cursor.fetchone()
-        conn.close()
+    def _get_sync(self, query: str) -> Optional[Dict[str, Any]]:
+        """Synchronous cache get (exact match)."""
+        return self._get_by_hash_sync(self._get_query_hash(query))
+
+    def _get_by_hash_sync(self, query_hash: str) -> Optional[Dict[str, Any]]:
+        """Fetch a fresh or stale (not yet expired) row by hash."""
+        self._ensure_database()
+        with self._read_lock:
+            row = self._read_conn.execute("""
+                SELECT response, experts_used, timestamp, ttl
+                FROM cache_entries
+                WHERE query_hash = ?
+            """, (query_hash,)).fetchone()
 
         if row is None:
             return None
 
         response, experts_used_json, timestamp, ttl = row
 
-        # Check if expired
-        if time.time() - timestamp > ttl:
-            # Remove expired entry
-            self._remove_sync(query_hash)
+        # Check if expired (past ttl and the stale window)
+        age = time.time() - timestamp
+        if age > ttl + self._stale_ttl:
+            # Remove expired entry (in the background; the sweeper would too).
+            # Keyed by its timestamp so a newer store of the query is kept.
+            self._submit(_DELETE, [(query_hash, timestamp)])
             return None
 
         # Parse experts_used
@@ -172,32 +326,151 @@ class SemanticCache(ICache):
         return {
             "response": response,
             "experts_used": experts_used,
-            "cached": True
+            "cached": True,
+            "cached_at": timestamp,
+            "age_s": age,
+            "ttl": ttl,
+            "stale": age > ttl
         }
 
-    async def store(self, query: str, result: Any) -> None:
+    def _get_similar_sync(self, embedding: np.ndarray) -> Optional[Dict[str, Any]]:
+        """Synchronous semantic lookup: cosine top-1 over the embedding index."""
+        query_vec = self._normalize(embedding)
+        if query_vec is None:
+            return None
+
+        with self._index_lock:
+            self._ensure_index_loaded()
+            count = len(self._index_hashes)
+            if count == 0 or self._index_matrix.shape[1] != query_vec.shape[0]:
+                return None
+
+            scores = self._index_matrix[:count] @ query_vec
+            # Expired rows never match (stale rows still do)
+            scores[self._index_expires[:count] + self._stale_ttl < time.time()] = -np.inf
+
+            best = int(np.argmax(scores))
+            best_score = float(scores[best])
+            best_hash = self._index_hashes[best]
+
+        if best_score < self._similarity_threshold:
+            return None
+
+        cached = self._get_by_hash_sync(best_hash)
+        if cached is not None:
+            cached["similarity"] = best_score
+            logger.debug(f"[SemanticCache] Semantic hit (similarity={best_score:.3f})")
+        return cached
+
+    @staticmethod
+    def _normalize(embedding: Any) -> Optional[np.ndarray]:
+        """Return a 1-D L2-normalized float32 copy, or None for unusable input."""
+        vec = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(vec))
+        if vec.size == 0 or norm == 0.0 or not np.isfinite(norm):
+            return None
+        return vec / norm
+
+    def _ensure_index_loaded(self) -> None:
+        """Load stored embeddings into memory (caller holds the index lock)."""
+        if self._index_loaded:
+            return
+
+        self._ensure_database()
+        with self._read_lock:
+            rows = self._read_conn.execute("""
+                SELECT query_hash, timestamp, ttl, embedding
+                FROM cache_entries
+                WHERE embedding IS NOT NULL
+            """).fetchall()
+
+        for query_hash, timestamp, ttl, blob in rows:
+            vec = self._normalize(np.frombuffer(blob, dtype=np.float32))
+            if vec is not None:
+                self._index_put(query_hash, vec, timestamp + ttl)
+
+        self._index_loaded = True
+        logger.debug(f"[SemanticCache] Loaded {len(self._index_hashes)} embeddings")
+
+    def _index_put(self, query_hash: str, vec: np.ndarray, expires_at: float) -> None:
+        """Insert or update an index row (caller holds the index lock)."""
+        dim = vec.shape[0]
+        if self._index_matrix is None or self._index_matrix.shape[1] != dim:
+            # First row, or the provider changed dimensionality: start over
+            self._index_matrix = np.empty((64, dim), dtype=np.float32)
+            self._index_expires = np.empty(64, dtype=np.float64)
+            self._index_hashes = []
+            self._index_pos = {}
+
+        pos = self._index_pos.get(query_hash)
+        if pos is None:
+            pos = len(self._index_hashes)
+            if pos == self._index_matrix.shape[0]:
+                # Grow capacity geometrically to keep inserts amortized O(dim)
+                self._index_matrix = np.concatenate(
+                    [self._index_matrix, np.empty_like(self._index_matrix)]
+                )
+                self._index_expires = np.concatenate(
+                    [self._index_expires, np.empty_like(self._index_expires)]
+                )
+            self._index_hashes.append(query_hash)
+            self._index_pos[query_hash] = pos
+
+        self._index_matrix[pos] = vec
+        self._index_expires[pos] = expires_at
+
+    def _index_remove(self, query_hash: str) -> None:
+        """Remove an index row by swapping in the last row (caller holds the lock)."""
+        pos = self._index_pos.pop(query_hash, None)
+        if pos is None:
+            return
+
+        last = len(self._index_hashes) - 1
+        if pos != last:
+            moved_hash = self._index_hashes[last]
+            self._index_matrix[pos] = self._index_matrix[last]
+            self._index_expires[pos] = self._index_expires[last]
+            self._index_hashes[pos] = moved_hash
+            self._index_pos[moved_hash] = pos
+        self._index_hashes.pop()
+
+    async def store(
+        self,
+        query: str,
+        result: Any,
+        embedding_context: Optional[QueryEmbeddingContext] = None
+    ) -> None:
         """
         Store query-result pair in cache.
 
+        Returns once the entry is committed; stores issued concurrently are
+        committed together by the writer thread.
+
         Args:
             query: Query string
             result: Result to cache (must have response attribute)
+            embedding_context: Optional per-request query embedding to reuse
         """
         if not self._enabled:
             return
 
         try:
-            # Run database operation in thread pool
-            await asyncio.to_thread(self._store_sync, query, result)
+            # Reuses the embedding computed for get() (via context or the shared cache)
+            embedding = await self._embed(query, embedding_context) if self._semantic else None
+
+            await asyncio.wrap_future(self._submit(_PUT, self._make_row(query, result, embedding)))
         except Exception as e:
             # Log error but don't fail the request
             logger.warning(f"Cache store error: {e}")
 
-    def _store_sync(self, query: str, result: Any) -> None:
-        """Synchronous cache store."""
-        import time
-
-        query_hash = self._get_query_hash(query)
+    def _make_row(
+        self,
+        query: str,
+        result: Any,
+        embedding: Optional[np.ndarray] = None
+    ) -> Tuple:
+        """Build the cache_entries row for a query-result pair."""
+        vec = self._normalize(embedding) if embedding is not None else None
 
         # Extract response and experts_used
         if hasattr(result, 'response'):
@@ -207,58 +480,191 @@ class SemanticCache(ICache):
             response = str(result)
             experts_used = []
 
-        timestamp = time.time()
-
-        conn = sqlite3.connect(self._db_path)
-        cursor = conn.cursor()
-
-        # Insert or replace
-        cursor.execute("""
-            INSERT OR REPLACE INTO cache_entries
-            (query_hash, query, response, experts_used, timestamp, ttl)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            query_hash,
+        return (
+            self._get_query_hash(query),
             query,
             response,
             json.dumps(experts_used),
-            timestamp,
-            self._ttl
-        ))
-
-        conn.commit()
-
-        # Enforce max_entries limit
-        cursor.execute("""
-            SELECT COUNT(*) FROM cache_entries
-        """)
-        row = cursor.fetchone()
-        count = row[0] if row else 0
-
-        if count > self._max_entries:
-            # Remove oldest entries
-            entries_to_remove = count - self._max_entries
-            cursor.execute("""
-                DELETE FROM cache_entries
-                WHERE query_hash IN (
-                    SELECT query_hash FROM cache_entries
-                    ORDER BY timestamp ASC
-                    LIMIT ?
+            time.time(),
+            self._ttl,
+            vec.tobytes() if vec is not None else None
+        )
+
+    def _submit(self, op: str, payload: Any = None) -> Future:
+        """Queue a write for the writer thread; the future resolves once committed."""
+        future: Future = Future()
+        self._ensure_writer()
+        self._write_queue.put((op, payload, future))
+        return future
+
+    def _ensure_writer(self) -> None:
+        """Start the writer thread on first use."""
+        if self._writer is not None and self._writer.is_alive():
+            return
+        with self._writer_start_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._writer_loop, name="moe-cache-writer", daemon=True
                 )
-            """, (entries_to_remove,))
-            conn.commit()
+                self._writer.start()
 
-        conn.close()
+    def _writer_loop(self) -> None:
+        """
+        Apply queued writes in batches and sweep periodically.
 
-    def _remove_sync(self, query_hash: str) -> None:
-        """Remove entry by hash."""
-        conn = sqlite3.connect(self._db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
+        Everything queued when the writer wakes up (up to WRITE_BATCH_SIZE
+        operations) is applied in one transaction.
+        """
+        while True:
+            timeout = max(0.0, self._next_sweep - time.monotonic())
+            try:
+                batch = [self._write_queue.get(timeout=timeout)]
+            except queue.Empty:
+                batch = []
+            while batch and len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(op == _STOP for op, _, _ in batch)
+            writes = [item for item in batch if item[0] != _STOP]
+            if writes:
+                self._apply_batch(writes)
+            if time.monotonic() >= self._next_sweep:
+                self._run_sweep()
+            if stop:
+                for op, _, future in batch:
+                    if op == _STOP:
+                        future.set_result(None)
+                return
+
+    def _apply_batch(self, batch: List[Tuple[str, Any, Future]]) -> None:
+        """Apply a batch of writes in one transaction and resolve their futures."""
+        try:
+            self._ensure_database()
+        except CacheException as e:
+            for _, _, future in batch:
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+
+        count = self._count
+        try:
+            with self._write_lock:
+                indexed: List[Tuple[str, np.ndarray, float]] = []
+                removed: List[str] = []
+                cleared = False
+                cursor = self._write_conn.cursor()
+
+                for op, payload, _ in batch:
+                    if op == _PUT:
+                        query_hash, timestamp, ttl, blob = payload[0], payload[4], payload[5], payload[6]
+                        exists = cursor.execute(
+                            "SELECT 1 FROM cache_entries WHERE query_hash = ?", (query_hash,)
+                        ).fetchone()
+                        cursor.execute("""
+                            INSERT OR REPLACE INTO cache_entries
+                            (query_hash, query, response, experts_used, timestamp, ttl, embedding)
+                            VALUES (?, ?, ?, ?, ?, ?, ?)
+                        """, payload)
+                        if not exists:
+                            self._count += 1
+                        if blob is not None:
+                            indexed.append((query_hash, np.frombuffer(blob, dtype=np.float32), timestamp + ttl))
+                    elif op == _DELETE:
+                        for query_hash, timestamp in payload:
+                            cursor.execute(
+                                "DELETE FROM cache_entries WHERE query_hash = ? AND timestamp = ?",
+                                (query_hash, timestamp)
+                            )
+                            if cursor.rowcount:
+                                self._count = max(0, self._count - 1)
+                                removed.append(query_hash)
+                    elif op == _CLEAR:
+                        cursor.execute("DELETE FROM cache_entries")
+                        self._count = 0
+                        cleared = True
+                        indexed, removed = [], []
+
+                # Enforce max_entries without counting the table
+                if self._count > self._max_entries:
+                    removed.extend(self._evict_oldest(cursor, self._count - self._max_entries))
+
+                self._write_conn.commit()
+
+            with self._index_lock:
+                if cleared:
+                    self._reset_index()
+                for query_hash in removed:
+                    self._index_remove(query_hash)
+                if self._index_loaded:
+                    for query_hash, vec, expires_at in indexed:
+                        self._index_put(query_hash, vec, expires_at)
+
+        except Exception as e:
+            with self._write_lock:
+                self._write_conn.rollback()
+                self._count = count
+            for _, _, future in batch:
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+
+        for _, _, future in batch:
+            if future is not None and not future.done():
+                future.set_result(None)
+
+    def _evict_oldest(self, cursor: sqlite3.Cursor, excess: int) -> List[str]:
+        """Delete the `excess` oldest rows (write lock held); returns their hashes."""
+        evicted = [r[0] for r in cursor.execute("""
+            SELECT query_hash FROM cache_entries
+            ORDER BY timestamp ASC
+            LIMIT ?
+        """, (excess,)).fetchall()]
+        cursor.executemany("""
             DELETE FROM cache_entries WHERE query_hash = ?
-        """, (query_hash,))
-        conn.commit()
-        conn.close()
+        """, [(h,) for h in evicted])
+        self._count = max(0, self._count - len(evicted))
+        return evicted
+
+    def _run_sweep(self) -> int:
+        """
+        Remove expired rows and rows beyond max_entries, and recount.
+
+        Runs on the writer thread every sweep_interval seconds.
+
+        Returns:
+            Number of rows removed
+        """
+        self._next_sweep = time.monotonic() + self._sweep_interval
+        try:
+            self._ensure_database()
+            with self._write_lock:
+                cursor = self._write_conn.cursor()
+                expired = [r[0] for r in cursor.execute(
+                    "SELECT query_hash FROM cache_entries WHERE timestamp + ttl < ?",
+                    (time.time() - self._stale_ttl,)
+                ).fetchall()]
+                cursor.executemany(
+                    "DELETE FROM cache_entries WHERE query_hash = ?", [(h,) for h in expired]
+                )
+                # Exact count here corrects drift from other processes' writes
+                self._count = cursor.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+                removed = expired
+                if self._count > self._max_entries:
+                    removed = expired + self._evict_oldest(cursor, self._count - self._max_entries)
+                self._write_conn.commit()
+        except Exception as e:
+            logger.warning(f"[SemanticCache] Sweep failed: {e}")
+            return 0
+
+        with self._index_lock:
+            for query_hash in removed:
+                self._index_remove(query_hash)
+        if removed:
+            logger.debug(f"[SemanticCache] Swept {len(removed)} entries ({self._count} remain)")
+        return len(removed)
 
     async def clear(self) -> None:
         """Clear all cache entries."""
@@ -266,14 +672,30 @@ class SemanticCache(ICache):
             return
 
         try:
-            await asyncio.to_thread(self._clear_sync)
+            await asyncio.wrap_future(self._submit(_CLEAR))
         except Exception as e:
             raise CacheException(f"Failed to clear cache: {e}")
 
-    def _clear_sync(self) -> None:
-        """Synchronous cache clear."""
-        conn = sqlite3.connect(self._db_path)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM cache_entries")
-        conn.commit()
-        conn.close()
+    def _reset_index(self) -> None:
+        """Empty the embedding index (caller holds the index lock)."""
+        self._index_matrix = None
+        self._index_expires = None
+        self._index_hashes = []
+        self._index_pos = {}
+
+    def close(self) -> None:
+        """Commit pending writes, stop the writer thread and close the database."""
+        if not self._enabled:
+            return
+        if self._writer is not None and self._writer.is_alive():
+            stopped: Future = Future()
+            self._write_queue.put((_STOP, None, stopped))
+            stopped.result()
+            self._writer.join()
+        if not self._db_ready:
+            return
+        with self._write_lock:
+            self._write_conn.close()
+        if self._read_conn is not self._write_conn:
+            with self._read_lock:
+                self._read_conn.close()
@@ -15,6 +15,10 @@ from asdrp.agents.config_loader import ModelConfig
 from asdrp.orchestration.moe.exceptions import ConfigException
 
 
+# Embedding providers selectable with moe.embedding_provider
+EMBEDDING_PROVIDERS = {"openai", "local"}
+
+
 @dataclass
 class ExpertGroupConfig:
     """Configuration for expert group."""
@@ -69,6 +73,12 @@ class MoEConfig:
             if k < 1:
                 raise ValueError(f"top_k_experts must be >= 1, got {k}")
 
+        provider = self.moe.get("embedding_provider", "openai")
+        if provider not in EMBEDDING_PROVIDERS:
+            raise ValueError(
+                f"embedding_provider must be one of {sorted(EMBEDDING_PROVIDERS)}, got {provider!r}"
+            )
+
         # Validate models
         required_models = ["selection", "mixing"]
         for model_name in required_models:
@@ -79,6 +89,21 @@ class MoEConfig:
         if not self.experts:
             raise ValueError("At least one expert group must be defined")
 
+    @property
+    def embedding_provider(self) -> str:
+        """Embedding provider used for semantic routing ("openai" or "local")."""
+        return self.moe.get("embedding_provider", "openai")
+
+    def embedding_threshold(self, name: str, default: float) -> float:
+        """
+        Similarity threshold calibrated for the active embedding provider.
+
+        Looks up moe.embedding_thresholds.<provider>.<name>, then moe.<name>,
+        then returns default (e.g. a cache.policy setting).
+        """
+        overrides = (self.moe.get("embedding_thresholds") or {}).get(self.embedding_provider) or {}
+        return overrides.get(name, self.moe.get(name, default))
+
 
 class MoEConfigLoader:
     """
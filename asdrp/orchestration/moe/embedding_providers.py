@@ -2,7 +2,7 @@
 Embedding Providers - Abstraction for generating text embeddings.
 
 This module provides a pluggable architecture for generating embeddings,
-enabling multiple strategies (OpenAI API, local models, cached) to be
+enabling multiple strategies (OpenAI API, local hashed n-grams, cached) to be
 composed using dependency injection and decorator patterns.
 
 Design Principles:
@@ -10,15 +10,24 @@ Design Principles:
 - Dependency Inversion: Consumers depend on interface, not implementations
 - Open/Closed: Easy to add new providers without modifying existing code
 - Decorator Pattern: CachedEmbeddingProvider wraps any provider with caching
+- Persistence: an optional EmbeddingStore shares embeddings across processes
+- Per-request sharing: QueryEmbeddingContext embeds a query at most once
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import List, Dict, Optional
 from functools import lru_cache
+import asyncio
 import hashlib
+import re
+import unicodedata
+import zlib
 import numpy as np
 from loguru import logger
 
+from asdrp.orchestration.moe.embedding_store import EmbeddingStore
+
 
 class IEmbeddingProvider(ABC):
     """
@@ -90,9 +99,10 @@ class OpenAIEmbeddingProvider(IEmbeddingProvider):
             api_key: OpenAI API key
             model: Embedding model to use (default: text-embedding-3-small)
         """
-        from openai import AsyncOpenAI
+        from asdrp.agents.llm_gateway import get_llm_gateway
 
-        self._client = AsyncOpenAI(api_key=api_key)
+        # Calls go through the shared gateway (pooled connections, retries, metrics)
+        self._client = get_llm_gateway().bind("moe.embeddings", api_key=api_key)
         self._model = model
         self._dimension = 1536  # text-embedding-3-small dimension
 
@@ -144,23 +154,110 @@ class OpenAIEmbeddingProvider(IEmbeddingProvider):
         return self._dimension
 
 
+class LocalEmbeddingProvider(IEmbeddingProvider):
+    """
+    Offline provider using hashed word and character n-gram features.
+
+    Each word and its character 3-5 grams are hashed (CRC32, stable across
+    processes) into a fixed-size signed vector, which is L2-normalized.
+    Texts sharing words or word pieces ("restaurant" / "restaurants",
+    "geocoding" / "reverse_geocoding") are close; synonyms without shared
+    pieces are not, so similarity scales are lower than OpenAI's and the
+    routing thresholds are calibrated per provider (see moe.embedding_thresholds
+    in config/moe.yaml).
+
+    Characteristics:
+    - No network, no model download, CPU-only
+    - Latency: <1ms per query, deterministic
+    - Best for: Offline deployments, or when the embeddings API is slow
+      or rate-limited
+
+    Usage:
+        >>> provider = LocalEmbeddingProvider()
+        >>> embedding = await provider.generate_embedding("pizza near me")
+    """
+
+    _TOKEN_PATTERN = re.compile(r"[^\W_]+")
+    _CHAR_NGRAM_SIZES = (3, 4, 5)
+    _CHAR_NGRAM_WEIGHT = 0.5
+
+    def __init__(self, dimension: int = 1024):
+        """
+        Initialize local embedding provider.
+
+        Args:
+            dimension: Number of hash buckets (embedding dimension)
+        """
+        if dimension <= 0:
+            raise ValueError(f"dimension must be positive, got {dimension}")
+        self._dimension = dimension
+        self._model = f"hashed-ngrams-{dimension}"
+
+    def _features(self, text: str) -> List[tuple[str, float]]:
+        """Weighted word and character n-gram features of a text."""
+        features = []
+        for token in self._TOKEN_PATTERN.findall(unicodedata.normalize("NFKC", text).lower()):
+            features.append(("w:" + token, 1.0))
+            padded = f"<{token}>"
+            for n in self._CHAR_NGRAM_SIZES:
+                for i in range(len(padded) - n + 1):
+                    features.append(("c:" + padded[i:i + n], self._CHAR_NGRAM_WEIGHT))
+        return features
+
+    def encode(self, text: str) -> np.ndarray:
+        """Embed text synchronously (unit-length float32 vector)."""
+        vector = np.zeros(self._dimension, dtype=np.float32)
+        features = self._features(text)
+        if not features:
+            return vector
+
+        hashes = np.fromiter(
+            (zlib.crc32(feature.encode("utf-8")) for feature, _ in features),
+            dtype=np.uint32,
+            count=len(features),
+        )
+        weights = np.fromiter((weight for _, weight in features), dtype=np.float32, count=len(features))
+        # Low bits pick the bucket, the top bit the sign (limits collision bias)
+        signs = np.where(hashes >> 31, np.float32(1.0), np.float32(-1.0))
+        np.add.at(vector, hashes % self._dimension, signs * weights)
+
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    async def generate_embedding(self, text: str) -> np.ndarray:
+        """Generate embedding locally (no I/O, so computed inline)."""
+        return self.encode(text)
+
+    async def generate_batch_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        """Generate embeddings for multiple texts locally."""
+        return [self.encode(text) for text in texts]
+
+    @property
+    def embedding_dimension(self) -> int:
+        return self._dimension
+
+
 class CachedEmbeddingProvider(IEmbeddingProvider):
     """
     Decorator that adds LRU caching to any embedding provider.
 
     Wraps another embedding provider and caches results in memory
-    using content-addressed hashing (SHA256 of input text).
+    using content-addressed hashing (SHA256 of input text). An optional
+    EmbeddingStore adds a second, on-disk tier shared across processes and
+    restarts; memory misses are looked up there before calling the provider.
 
     Performance:
-    - Cache hit: <1ms (in-memory dict lookup)
-    - Cache miss: Delegates to wrapped provider
+    - Memory hit: <1ms (in-memory dict lookup)
+    - Store hit: ~1ms (SQLite lookup, no API call)
+    - Cache miss: Delegates to wrapped provider (and writes to the store)
 
     This implements the Decorator pattern, adding caching behavior
     without modifying the underlying provider.
 
     Usage:
         >>> base_provider = OpenAIEmbeddingProvider(api_key="...")
-        >>> cached = CachedEmbeddingProvider(base_provider, max_size=10000)
+        >>> store = get_embedding_store("data/orchestration/moe/cache/embeddings.db")
+        >>> cached = CachedEmbeddingProvider(base_provider, max_size=10000, store=store)
         >>> embedding = await cached.generate_embedding("pizza")  # API call
         >>> embedding = await cached.generate_embedding("pizza")  # <1ms cache hit
     """
@@ -169,25 +266,29 @@ class CachedEmbeddingProvider(IEmbeddingProvider):
         self,
         provider: IEmbeddingProvider,
         max_size: int = 10000,
-        enable_logging: bool = True
+        enable_logging: bool = True,
+        store: Optional[EmbeddingStore] = None
     ):
         """
         Initialize cached embedding provider.
 
         Args:
             provider: Underlying embedding provider to wrap
-            max_size: Maximum cache entries (LRU eviction)
+            max_size: Maximum in-memory cache entries (LRU eviction)
             enable_logging: Log cache hits/misses for debugging
+            store: Optional persistent store shared across processes
         """
         self._provider = provider
-        self._cache: Dict[str, np.ndarray] = {}
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
         self._max_size = max_size
         self._enable_logging = enable_logging
+        self._store = store
 
         # Statistics for monitoring
         self._stats = {
             "hits": 0,
             "misses": 0,
+            "store_hits": 0,
             "total_requests": 0
         }
 
@@ -200,13 +301,58 @@ class CachedEmbeddingProvider(IEmbeddingProvider):
         """
         return hashlib.sha256(text.encode('utf-8')).hexdigest()
 
+    def _model_id(self) -> str:
+        """Identify the wrapped model so stored embeddings are never mixed across models."""
+        model = getattr(self._provider, "_model", None)
+        return f"{type(self._provider).__name__}:{model or ''}"
+
+    def _cache_get(self, cache_key: str) -> Optional[np.ndarray]:
+        """Return a memory-cached embedding and mark it most recently used."""
+        embedding = self._cache.get(cache_key)
+        if embedding is not None:
+            self._cache.move_to_end(cache_key)
+        return embedding
+
+    def _cache_put(self, cache_key: str, embedding: np.ndarray) -> None:
+        """Add an embedding to memory, evicting the least recently used entry."""
+        self._cache[cache_key] = embedding
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+
+    async def _store_get(self, cache_keys: List[str]) -> Dict[str, np.ndarray]:
+        """Look up keys in the persistent store (store errors count as misses)."""
+        if self._store is None or not cache_keys:
+            return {}
+        try:
+            return await asyncio.to_thread(self._store.get_many, self._model_id(), cache_keys)
+        except Exception as e:
+            logger.warning(f"[EmbeddingCache] Embedding store read failed: {e}")
+            return {}
+
+    async def _store_put(self, embeddings: Dict[str, np.ndarray]) -> None:
+        """Write new embeddings to the persistent store (errors are logged)."""
+        if self._store is None or not embeddings:
+            return
+        try:
+            await asyncio.to_thread(self._store.put_many, self._model_id(), embeddings)
+        except Exception as e:
+            logger.warning(f"[EmbeddingCache] Embedding store write failed: {e}")
+
     async def generate_embedding(self, text: str) -> np.ndarray:
         """Generate embedding with LRU caching."""
         self._stats["total_requests"] += 1
         cache_key = self._get_cache_key(text)
 
         # Check cache
-        if cache_key in self._cache:
+        cached = self._cache_get(cache_key)
+        if cached is None:
+            cached = (await self._store_get([cache_key])).get(cache_key)
+            if cached is not None:
+                self._stats["store_hits"] += 1
+                self._cache_put(cache_key, cached)
+
+        if cached is not None:
             self._stats["hits"] += 1
 
             if self._enable_logging and self._stats["total_requests"] % 10 == 0:
@@ -216,7 +362,7 @@ class CachedEmbeddingProvider(IEmbeddingProvider):
                     f"({self._stats['hits']}/{self._stats['total_requests']})"
                 )
 
-            return self._cache[cache_key]
+            return cached
 
         # Cache miss - generate and cache
         self._stats["misses"] += 1
@@ -225,64 +371,65 @@ class CachedEmbeddingProvider(IEmbeddingProvider):
             logger.debug(f"[EmbeddingCache] Cache miss for: {text[:50]}...")
 
         embedding = await self._provider.generate_embedding(text)
-
-        # Add to cache with LRU eviction
-        if len(self._cache) >= self._max_size:
-            # Remove oldest entry (Python 3.7+ dicts maintain insertion order)
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
-
-        self._cache[cache_key] = embedding
+        self._cache_put(cache_key, embedding)
+        await self._store_put({cache_key: embedding})
         return embedding
 
     async def generate_batch_embeddings(self, texts: List[str]) -> List[np.ndarray]:
         """
         Generate batch embeddings with per-item caching.
 
-        Checks cache for each text individually, only calling provider
-        for cache misses. This maximizes cache efficiency.
+        Checks memory, then the persistent store (one lookup for the whole
+        batch), only calling provider for the remaining misses. This
+        maximizes cache efficiency.
         """
-        results = []
-        uncached_texts = []
+        results: List[Optional[np.ndarray]] = []
+        keys = [self._get_cache_key(text) for text in texts]
         uncached_indices = []
 
-        # Check cache for all texts
-        for i, text in enumerate(texts):
-            cache_key = self._get_cache_key(text)
-
-            if cache_key in self._cache:
-                results.append(self._cache[cache_key])
-                self._stats["hits"] += 1
-            else:
-                # Will need to generate this one
-                results.append(None)  # Placeholder
-                uncached_texts.append(text)
+        # Check memory cache for all texts
+        for i, cache_key in enumerate(keys):
+            cached = self._cache_get(cache_key)
+            results.append(cached)
+            if cached is None:
                 uncached_indices.append(i)
-                self._stats["misses"] += 1
+
+        # Check persistent store for memory misses
+        stored = await self._store_get([keys[i] for i in uncached_indices])
+        if stored:
+            remaining = []
+            for i in uncached_indices:
+                embedding = stored.get(keys[i])
+                if embedding is None:
+                    remaining.append(i)
+                    continue
+                self._cache_put(keys[i], embedding)
+                results[i] = embedding
+            self._stats["store_hits"] += len(uncached_indices) - len(remaining)
+            uncached_indices = remaining
 
         self._stats["total_requests"] += len(texts)
+        self._stats["misses"] += len(uncached_indices)
+        self._stats["hits"] += len(texts) - len(uncached_indices)
 
         # Generate embeddings for uncached texts
-        if uncached_texts:
+        if uncached_indices:
             if self._enable_logging:
                 logger.info(
-                    f"[EmbeddingCache] Batch: {len(uncached_texts)}/{len(texts)} "
+                    f"[EmbeddingCache] Batch: {len(uncached_indices)}/{len(texts)} "
                     f"cache misses"
                 )
 
+            uncached_texts = [texts[i] for i in uncached_indices]
             new_embeddings = await self._provider.generate_batch_embeddings(uncached_texts)
 
             # Insert into results and cache
-            for text, embedding, idx in zip(uncached_texts, new_embeddings, uncached_indices):
-                cache_key = self._get_cache_key(text)
-
-                # LRU eviction if needed
-                if len(self._cache) >= self._max_size:
-                    oldest_key = next(iter(self._cache))
-                    del self._cache[oldest_key]
-
-                self._cache[cache_key] = embedding
+            fresh: Dict[str, np.ndarray] = {}
+            for embedding, idx in zip(new_embeddings, uncached_indices):
+                self._cache_put(keys[idx], embedding)
+                fresh[keys[idx]] = embedding
                 results[idx] = embedding
+            await self._store_put(fresh)
 
         return results
 
@@ -295,7 +442,8 @@ class CachedEmbeddingProvider(IEmbeddingProvider):
         Get cache statistics for monitoring.
 
         Returns:
-            Dict with hits, misses, total requests, hit rate, cache size
+            Dict with hits (of which store_hits came from the persistent
+            store), misses, total requests, hit rate, cache size
         """
         hit_rate = (
             self._stats["hits"] / self._stats["total_requests"]
@@ -306,6 +454,7 @@ class CachedEmbeddingProvider(IEmbeddingProvider):
         return {
             "hits": self._stats["hits"],
             "misses": self._stats["misses"],
+            "store_hits": self._stats["store_hits"],
             "total_requests": self._stats["total_requests"],
             "hit_rate": hit_rate,
             "cache_size": len(self._cache),
@@ -313,28 +462,61 @@ class CachedEmbeddingProvider(IEmbeddingProvider):
         }
 
     def clear_cache(self):
-        """Clear all cached embeddings."""
+        """Clear all in-memory cached embeddings (the persistent store is kept)."""
         self._cache.clear()
         logger.info("[EmbeddingCache] Cache cleared")
 
 
-# Future extension point: Local embedding model provider
-# class LocalEmbeddingProvider(IEmbeddingProvider):
-#     """
-#     Provider using local sentence-transformers model.
-#
-#     Characteristics:
-#     - Fast inference: 20-50ms on CPU, 5-10ms on GPU
-#     - No API costs
-#     - Smaller dimension (384-768)
-#     - Best for: High-throughput, latency-sensitive deployments
-#
-#     Implementation note:
-#     Requires sentence-transformers package:
-#         pip install sentence-transformers
-#
-#     Model recommendations:
-#     - all-MiniLM-L6-v2: 384 dim, 120MB, very fast
-#     - all-mpnet-base-v2: 768 dim, 420MB, better quality
-#     """
-#     pass
+class QueryEmbeddingContext:
+    """
+    Per-request holder for the query embedding.
+
+    Created once by MoEOrchestrator.route_query and handed to the fast path,
+    the selector and the cache so the query is embedded at most once per
+    request. The embedding is computed lazily on first use, so requests that
+    take the lexical fast path never pay for it.
+
+    Failures are memoized as well: if the provider raises, every consumer
+    sees the same exception instead of retrying the network call.
+
+    Usage:
+        >>> ctx = QueryEmbeddingContext("pizza near me", provider)
+        >>> embedding = await ctx.get_embedding()  # provider call
+        >>> embedding = await ctx.get_embedding()  # memoized
+    """
+
+    def __init__(self, query: str, provider: IEmbeddingProvider):
+        """
+        Initialize context.
+
+        Args:
+            query: Query text this context embeds
+            provider: Embedding provider (typically the selector's cached provider)
+        """
+        self.query = query
+        self.provider = provider
+        self._embedding: Optional[np.ndarray] = None
+        self._error: Optional[Exception] = None
+        self._lock = asyncio.Lock()
+
+    def matches(self, query: str) -> bool:
+        """Return True if this context was created for `query`."""
+        return query == self.query
+
+    async def get_embedding(self) -> np.ndarray:
+        """
+        Return the query embedding, computing it on first call.
+
+        Raises:
+            Exception: The provider error (memoized for subsequent calls)
+        """
+        async with self._lock:
+            if self._embedding is None and self._error is None:
+                try:
+                    self._embedding = await self.provider.generate_embedding(self.query)
+                except Exception as e:
+                    self._error = e
+
+        if self._error is not None:
+            raise self._error
+        return self._embedding
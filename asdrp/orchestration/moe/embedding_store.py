@@ -0,0 +1,246 @@
+"""
+Embedding Store - Persistent, cross-process embedding cache.
+
+CachedEmbeddingProvider keeps recent embeddings in process memory; this
+store sits behind it so embeddings survive restarts and are shared by every
+worker (and LiveKit job process) on the host. After the first deploy the
+expert and fast-path pattern embeddings, and any query embedded before, are
+read from disk instead of the embeddings API.
+
+Storage:
+- One SQLite table keyed by (model, SHA256 of the text), so providers with
+  different models never read each other's vectors
+- Vectors are contiguous float32 BLOBs, decoded without copying
+  (np.frombuffer); the database file is memory-mapped, so concurrent
+  readers share the OS page cache
+- WAL journal: readers never block each other or the writer
+
+Eviction is least-recently-used across processes: reads refresh an entry's
+last_used time (at most once per touch_interval, to keep the read path
+read-mostly) and writes evict the oldest entries beyond max_entries, as
+estimated by a running count that is corrected every recount_interval.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+import sqlite3
+import threading
+import time
+
+import numpy as np
+from loguru import logger
+
+DEFAULT_MAX_ENTRIES = 100_000
+
+# Minimum age (seconds) of last_used before a read refreshes it
+DEFAULT_TOUCH_INTERVAL = 60.0
+
+# Seconds between exact counts of the table; in between, writes and evictions
+# update a running count (which drifts with replaced keys and other processes)
+DEFAULT_RECOUNT_INTERVAL = 300.0
+
+# Size of the memory-mapped region of the database file
+MMAP_SIZE_BYTES = 256 * 1024 * 1024
+
+# Keys per IN (...) query (below SQLite's host parameter limit)
+_CHUNK_SIZE = 500
+
+
+def _chunks(items: List[str], size: int = _CHUNK_SIZE) -> Iterable[List[str]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class EmbeddingStore:
+    """
+    Embeddings keyed by (model, text hash), stored in a SQLite database.
+
+    Thread-safe; several processes may open the same file. ":memory:"
+    stores live for the lifetime of the object (used in tests).
+
+    Usage:
+        >>> store = EmbeddingStore("data/orchestration/moe/cache/embeddings.db")
+        >>> store.put_many("OpenAIEmbeddingProvider:text-embedding-3-small", {key: vector})
+        >>> store.get_many("OpenAIEmbeddingProvider:text-embedding-3-small", [key])
+        {key: array([...], dtype=float32)}
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = ":memory:",
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        touch_interval: float = DEFAULT_TOUCH_INTERVAL,
+        recount_interval: float = DEFAULT_RECOUNT_INTERVAL,
+    ):
+        """
+        Open (and create if needed) an embedding store.
+
+        Args:
+            db_path: SQLite database file (parent directories are created)
+            max_entries: Maximum number of embeddings kept (all models)
+            touch_interval: Minimum seconds between last_used refreshes of
+                an entry on read
+            recount_interval: Minimum seconds between exact counts of the
+                table on write
+        """
+        target = str(db_path)
+        self.db_path = target
+        self.max_entries = max_entries
+        self.touch_interval = touch_interval
+        self.recount_interval = recount_interval
+        self._lock = threading.Lock()
+
+        if target != ":memory:":
+            Path(target).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(target, check_same_thread=False, timeout=10.0)
+        if target != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(f"PRAGMA mmap_size={MMAP_SIZE_BYTES}")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                key TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (model, key)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used)"
+        )
+        self._conn.commit()
+
+        # Running estimate of the table size (see DEFAULT_RECOUNT_INTERVAL)
+        self._recount()
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def _recount(self) -> None:
+        """Reset the running count to the exact table size."""
+        self._approx_count = self._count()
+        self._next_recount = time.monotonic() + self.recount_interval
+
+    def get_many(self, model: str, keys: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up embeddings of a model by cache key.
+
+        Args:
+            model: Model identifier (see CachedEmbeddingProvider)
+            keys: Text hashes to look up
+
+        Returns:
+            Mapping of found keys to read-only float32 vectors
+        """
+        if not keys:
+            return {}
+
+        found: Dict[str, np.ndarray] = {}
+        stale: List[str] = []
+        now = time.time()
+        with self._lock:
+            for chunk in _chunks(list(dict.fromkeys(keys))):
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector, last_used FROM embeddings "
+                    f"WHERE model = ? AND key IN ({placeholders})",
+                    (model, *chunk),
+                ).fetchall()
+                for key, blob, last_used in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+                    if now - last_used >= self.touch_interval:
+                        stale.append(key)
+
+            if stale:
+                for chunk in _chunks(stale):
+                    placeholders = ",".join("?" * len(chunk))
+                    self._conn.execute(
+                        f"UPDATE embeddings SET last_used = ? "
+                        f"WHERE model = ? AND key IN ({placeholders})",
+                        (now, model, *chunk),
+                    )
+                self._conn.commit()
+        return found
+
+    def put_many(self, model: str, embeddings: Dict[str, np.ndarray]) -> None:
+        """
+        Store embeddings of a model, evicting least recently used entries
+        beyond max_entries.
+
+        Args:
+            model: Model identifier (see CachedEmbeddingProvider)
+            embeddings: Mapping of cache key to vector
+        """
+        if not embeddings:
+            return
+
+        now = time.time()
+        rows = [
+            (model, key, np.ascontiguousarray(vector, dtype=np.float32).tobytes(), now)
+            for key, vector in embeddings.items()
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, key, vector, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._approx_count += len(rows)
+            if time.monotonic() >= self._next_recount:
+                self._recount()
+            if self._approx_count > self.max_entries:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries beyond max_entries (lock held)."""
+        excess = self._approx_count - self.max_entries
+        cursor = self._conn.execute(
+            "DELETE FROM embeddings WHERE rowid IN "
+            "(SELECT rowid FROM embeddings ORDER BY last_used LIMIT ?)",
+            (excess,),
+        )
+        self._approx_count -= cursor.rowcount
+        logger.debug(f"[EmbeddingStore] Evicted {cursor.rowcount} least recently used embeddings")
+
+    def count(self, model: Optional[str] = None) -> int:
+        """Number of stored embeddings (of one model, or all)."""
+        with self._lock:
+            if model is None:
+                return self._count()
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM embeddings WHERE model = ?", (model,)
+            ).fetchone()[0]
+
+    def clear(self) -> None:
+        """Delete all stored embeddings."""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+            self._recount()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_stores: Dict[str, EmbeddingStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_embedding_store(
+    db_path: str | Path,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+) -> EmbeddingStore:
+    """Get the embedding store for a database file (shared per file in a process)."""
+    key = str(Path(db_path).resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = EmbeddingStore(key, max_entries=max_entries)
+            _stores[key] = store
+        return store
@@ -4,11 +4,12 @@ Expert Executor - Tier 2 of MoE Pipeline.
 Executes selected experts in parallel.
 """
 
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, AsyncIterator
 import asyncio
 from dataclasses import dataclass
 import time
 
+from asdrp.agents.execution_scheduler import AdmissionError, ExecutionScheduler, get_execution_scheduler
 from asdrp.agents.protocol import AgentProtocol
 from asdrp.orchestration.moe.interfaces import IExpertExecutor
 from asdrp.orchestration.moe.config_loader import MoEConfig
@@ -29,51 +30,73 @@ class ExpertResult:
     # These allow UIs to show true per-expert completion times even when other experts are still running.
     started_at: Optional[float] = None
     ended_at: Optional[float] = None
+    # True if the expert was cancelled by the executor (overall timeout or
+    # quorum reached) rather than finishing or failing on its own.
+    cut_off: bool = False
+    # True if the ExecutionScheduler rejected the run (load shedding), so the
+    # expert never ran.
+    shed: bool = False
 
 
 class ParallelExecutor(IExpertExecutor):
     """
-    Execute experts in parallel using asyncio.gather.
+    Execute experts in parallel using asyncio.wait.
 
     Features:
-    - Concurrent execution (up to max_concurrent)
+    - Concurrent execution (up to max_concurrent per request, and within the
+      process-wide ExecutionScheduler limits across requests)
     - Per-expert timeouts
+    - Partial results on overall timeout (only stragglers are cancelled)
+    - Optional good-enough quorum (moe.quorum_extra_experts)
     - Graceful error handling
     - Follows SmartRouter parallel execution pattern
     """
 
-    def __init__(self, config: MoEConfig):
+    def __init__(self, config: MoEConfig, scheduler: Optional[ExecutionScheduler] = None):
         """
         Initialize executor with configuration.
 
         Args:
             config: MoE configuration
+            scheduler: Admission scheduler for agent runs (default: the
+                process-wide scheduler)
         """
         self._config = config
+        self._scheduler = scheduler
         self._max_concurrent = config.moe.get("max_concurrent", 10)
         # Increased default timeout to 25s to match Yelp API timeout
         # This prevents premature timeouts for MCP agents like YelpMCPAgent
         # and gives Map agent enough time to complete geocoding operations
         self._timeout_per_expert = config.moe.get("timeout_per_expert", 25.0)
+        # Good-enough quorum: stop waiting once the top-confidence expert plus
+        # this many others have succeeded (None = wait for every expert)
+        self._quorum_extra_experts = config.moe.get("quorum_extra_experts")
 
     async def execute_parallel(
         self,
         agents_with_sessions: List[Tuple[str, AgentProtocol, Any]],
         query: str,
         context: Optional[Dict[str, Any]] = None,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        primary_expert_id: Optional[str] = None
     ) -> List[ExpertResult]:
         """
         Execute agents in parallel.
 
+        Results of experts that finished are always kept. Only experts still
+        running when the overall timeout expires (or once the quorum is met,
+        see execute_as_completed) are cancelled and returned as failed
+        results with cut_off=True.
+
         Args:
             agents_with_sessions: List of (expert_id, agent, session)
             query: Query to process
             context: Optional context
             timeout: Overall timeout
+            primary_expert_id: Top-scored expert the quorum waits for
 
         Returns:
-            List of ExpertResult
+            List of ExpertResult, in the order of agents_with_sessions
 
         Raises:
             ExecutionException: If execution fails critically
@@ -81,46 +104,127 @@ class ParallelExecutor(IExpertExecutor):
         if not agents_with_sessions:
             raise ExecutionException("No agents provided for execution")
 
-        # Create tasks
-        tasks = [
-            self._execute_single(expert_id, agent, session, query, context)
+        results_by_id = {}
+        async for result in self.execute_as_completed(
+            agents_with_sessions, query, context, timeout=timeout,
+            primary_expert_id=primary_expert_id
+        ):
+            results_by_id[result.expert_id] = result
+
+        return [results_by_id[expert_id] for expert_id, _, _ in agents_with_sessions]
+
+    async def execute_as_completed(
+        self,
+        agents_with_sessions: List[Tuple[str, AgentProtocol, Any]],
+        query: str,
+        context: Optional[Dict[str, Any]] = None,
+        timeout: float = 30.0,
+        primary_expert_id: Optional[str] = None
+    ) -> AsyncIterator[ExpertResult]:
+        """
+        Execute agents in parallel, yielding each result as soon as it completes.
+
+        Streaming counterpart of execute_parallel: results arrive in completion
+        order (not input order). Experts still running when the overall timeout
+        expires are cancelled and yielded as cut-off timeout errors.
+
+        If moe.quorum_extra_experts is configured, execution also stops early
+        once primary_expert_id (the selector's top-scored expert) plus that
+        many other experts have succeeded; the remaining experts are cancelled
+        and yielded as cut-off results so the mixer can note what is missing.
+        Without a primary expert execution never stops early.
+
+        Args:
+            agents_with_sessions: List of (expert_id, agent, session)
+            query: Query to process
+            context: Optional context
+            timeout: Overall timeout
+            primary_expert_id: Top-scored expert the quorum waits for
+
+        Yields:
+            ExpertResult per expert, in completion order
+
+        Raises:
+            ExecutionException: If no agents are provided
+        """
+        if not agents_with_sessions:
+            raise ExecutionException("No agents provided for execution")
+
+        limiter = asyncio.Semaphore(self._max_concurrent)
+
+        async def _limited(expert_id, agent, session):
+            async with limiter:
+                return await self._execute_single(expert_id, agent, session, query, context)
+
+        tasks = {
+            asyncio.ensure_future(_limited(expert_id, agent, session)): expert_id
             for expert_id, agent, session in agents_with_sessions
-        ]
+        }
+        pending = set(tasks)
+        loop = asyncio.get_event_loop()
+        start_monotonic = loop.time()
+        started_at = time.time()
+        deadline = start_monotonic + timeout
+
+        primary_id = primary_expert_id
+        primary_succeeded = False
+        other_successes = 0
+        quorum_met = False
 
-        # Execute with overall timeout
         try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*tasks, return_exceptions=True),
-                timeout=timeout
-            )
-        except asyncio.TimeoutError:
-            # Return partial results with timeout errors
-            results = [
-                ExpertResult(
-                    expert_id=expert_id,
-                    output="",
-                    success=False,
-                    latency_ms=timeout * 1000,
-                    error="Overall timeout exceeded"
+            while pending and not quorum_met:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=remaining,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    expert_id = tasks[task]
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        result = ExpertResult(
+                            expert_id=expert_id,
+                            output="",
+                            success=False,
+                            latency_ms=0.0,
+                            error=str(e)
+                        )
+                    if result.success:
+                        if expert_id == primary_id:
+                            primary_succeeded = True
+                        else:
+                            other_successes += 1
+                    yield result
+
+                quorum_met = (
+                    self._quorum_extra_experts is not None
+                    and bool(pending)
+                    and primary_succeeded
+                    and other_successes >= self._quorum_extra_experts
                 )
-                for expert_id, _, _ in agents_with_sessions
-            ]
-
-        # Convert exceptions to error results
-        final_results = []
-        for (expert_id, _, _), result in zip(agents_with_sessions, results):
-            if isinstance(result, Exception):
-                final_results.append(ExpertResult(
-                    expert_id=expert_id,
-                    output="",
-                    success=False,
-                    latency_ms=0.0,
-                    error=str(result)
-                ))
-            else:
-                final_results.append(result)
 
-        return final_results
+            if pending:
+                reason = "quorum" if quorum_met else "timeout"
+                cut_off_ids = sorted(tasks[task] for task in pending)
+                logger.info(f"[MoE Executor] Cutting off {cut_off_ids} ({reason})")
+            for task in pending:
+                task.cancel()
+                yield self._build_cut_off_result(
+                    expert_id=tasks[task],
+                    quorum_met=quorum_met,
+                    timeout=timeout,
+                    latency_ms=(loop.time() - start_monotonic) * 1000,
+                    started_at=started_at
+                )
+        finally:
+            # Also runs if the consumer stops iterating early
+            for task in pending:
+                task.cancel()
 
     async def _execute_single(
         self,
@@ -147,13 +251,17 @@ class ParallelExecutor(IExpertExecutor):
         started_at = time.time()
 
         try:
-            result = await self._run_agent_with_mcp_support(
-                expert_id=expert_id,
-                agent=agent,
-                query=query,
-                context=context,
-                session=session
-            )
+            scheduler = self._scheduler or get_execution_scheduler()
+            async with scheduler.slot(
+                expert_id, session_id=getattr(session, "session_id", None)
+            ):
+                result = await self._run_agent_with_mcp_support(
+                    expert_id=expert_id,
+                    agent=agent,
+                    query=query,
+                    context=context,
+                    session=session
+                )
 
             ended_at = time.time()
             latency_ms = (asyncio.get_event_loop().time() - start_monotonic) * 1000
@@ -367,7 +475,9 @@ class ParallelExecutor(IExpertExecutor):
             logger.debug(f"[MoE Executor] Running {expert_id} with connected MCP servers")
 
             # Use AsyncExitStack to manage MCP server contexts
-            # This ensures servers are connected before Runner.run() and cleaned up after
+            # This ensures servers are connected before Runner.run() and cleaned up after.
+            # For pooled servers (PooledMCPServer) entering borrows a warm session and
+            # exiting returns it, so no subprocess is spawned per query.
             async with AsyncExitStack() as stack:
                 # Connect all MCP servers before running the agent
                 # This is critical - MCP tools are only available after connection
@@ -551,4 +661,38 @@ class ParallelExecutor(IExpertExecutor):
             error=f"Execution error: {str(error)}",
             started_at=started_at,
             ended_at=ended_at,
+            shed=isinstance(error, AdmissionError),
+        )
+
+    @staticmethod
+    def _build_cut_off_result(
+        expert_id: str,
+        quorum_met: bool,
+        timeout: float,
+        latency_ms: float,
+        started_at: float
+    ) -> ExpertResult:
+        """
+        Build ExpertResult for an expert cancelled by the executor.
+
+        Args:
+            expert_id: Expert ID
+            quorum_met: True if cut off because the quorum was reached
+            timeout: Overall timeout in seconds
+            latency_ms: Time waited for the expert in milliseconds
+            started_at: Start timestamp
+
+        Returns:
+            ExpertResult with cut_off=True
+        """
+        return ExpertResult(
+            expert_id=expert_id,
+            output="",
+            success=False,
+            latency_ms=latency_ms if quorum_met else timeout * 1000,
+            error="Cut off after quorum was reached" if quorum_met else "Overall timeout exceeded",
+            metadata={"cut_off_reason": "quorum" if quorum_met else "timeout"},
+            started_at=started_at,
+            ended_at=time.time(),
+            cut_off=True,
         )
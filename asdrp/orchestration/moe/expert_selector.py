@@ -4,7 +4,7 @@ Expert Selector - Tier 1 of MoE Pipeline.
 Selects relevant expert agents based on query analysis.
 """
 
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Optional, Any
 
 from asdrp.orchestration.moe.interfaces import IExpertSelector
 from asdrp.orchestration.moe.config_loader import MoEConfig
@@ -61,7 +61,8 @@ class CapabilityBasedSelector(IExpertSelector):
         self,
         query: str,
         k: int = 3,
-        threshold: float = 0.3
+        threshold: float = 0.3,
+        embedding_context: Optional[Any] = None
     ) -> List[str]:
         """
         Select experts based on capability matching.
@@ -70,6 +71,7 @@ class CapabilityBasedSelector(IExpertSelector):
             query: User query
             k: Max experts to select
             threshold: Min match score
+            embedding_context: Ignored (keyword matching needs no embedding)
 
         Returns:
             List of agent IDs (e.g., ["yelp", "geo", "map"])
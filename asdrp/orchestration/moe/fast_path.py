@@ -16,16 +16,24 @@ Example latency:
 from dotenv import load_dotenv, find_dotenv
 load_dotenv(find_dotenv())
 
-from typing import Optional, Dict
+from typing import Optional, Dict, List, TYPE_CHECKING
+import asyncio
 import os
-from openai import AsyncOpenAI
 from loguru import logger
 
+from asdrp.agents.llm_gateway import get_llm_gateway
+
 try:
     import numpy as np  # type: ignore
 except Exception:  # pragma: no cover
     np = None  # type: ignore
 
+if TYPE_CHECKING:
+    from asdrp.orchestration.moe.embedding_providers import (
+        IEmbeddingProvider,
+        QueryEmbeddingContext,
+    )
+
 
 class FastPathDetector:
     """
@@ -35,9 +43,18 @@ class FastPathDetector:
     and checks if incoming queries are semantically similar.
 
     If similarity > threshold, bypass MoE and route directly to the target agent.
+
+    When an embedding provider is injected (the selector's cached provider),
+    pattern centroids and query embeddings go through it, so the query is
+    embedded once per request and shared with the selector and cache.
+    Otherwise embeddings are requested through the shared LLM gateway.
     """
 
-    def __init__(self, similarity_threshold: float = 0.75):
+    def __init__(
+        self,
+        similarity_threshold: float = 0.75,
+        embedding_provider: Optional["IEmbeddingProvider"] = None
+    ):
         """
         Initialize fast-path detector.
 
@@ -46,14 +63,25 @@ class FastPathDetector:
                                  0.75 = very similar (recommended)
                                  0.85 = extremely similar (strict)
                                  0.65 = somewhat similar (loose)
+            embedding_provider: Optional shared embedding provider. If not
+                provided, embeddings go through the shared LLM gateway
+                when OPENAI_API_KEY is set.
         """
         self.similarity_threshold = similarity_threshold
+        self._provider = embedding_provider
 
         # API key is only required for the embeddings-based path.
         # We keep a lexical-only fast-path that works even when OPENAI_API_KEY is absent.
         api_key = os.getenv("OPENAI_API_KEY")
-        self._client = AsyncOpenAI(api_key=api_key) if api_key else None
+        self._client = (
+            get_llm_gateway().bind("moe.fast_path", api_key=api_key)
+            if api_key and embedding_provider is None
+            else None
+        )
         self._pattern_embeddings: Optional[Dict[str, Dict]] = None
+        self._pattern_names: List[str] = []
+        self._pattern_matrix = None  # Unit-length centroids (numpy only)
+        self._init_lock = asyncio.Lock()
 
         if np is None:
             logger.warning("FastPathDetector numpy unavailable; using pure-Python cosine similarity (slower).")
@@ -66,11 +94,21 @@ class FastPathDetector:
         - Examples: Representative queries for this pattern
         - Target agent: Agent to route to if matched
         - Description: What this pattern represents
+
+        Concurrent callers wait for one initialization; patterns are
+        published only once all centroids are computed.
         """
         if self._pattern_embeddings is not None:
             return  # Already initialized
 
-        if self._client is None:
+        async with self._init_lock:
+            if self._pattern_embeddings is not None:
+                return
+            await self._compute_patterns()
+
+    async def _compute_patterns(self):
+        """Embed the pattern examples and publish their centroids."""
+        if not self._embeddings_enabled():
             # Embeddings-based fast-path is disabled without an API key.
             # Lexical fast-path can still operate.
             self._pattern_embeddings = {}
@@ -115,27 +153,19 @@ class FastPathDetector:
 
         logger.info("Initializing fast-path pattern embeddings...")
 
-        self._pattern_embeddings = {}
+        pattern_embeddings: Dict[str, Dict] = {}
 
         for pattern_name, pattern_config in patterns.items():
             # Compute embeddings for all examples
-            example_embeddings = []
-
-            for example in pattern_config["examples"]:
-                response = await self._client.embeddings.create(
-                    model="text-embedding-3-small",
-                    input=example
-                )
+            example_embeddings = await self._embed_examples(pattern_config["examples"])
+            if example_embeddings is None:
                 # Defensive: if the SDK returns an unexpected shape (data missing),
                 # disable embeddings fast-path and fall back to lexical-only.
-                if not getattr(response, "data", None):
-                    logger.warning("[FastPath] Embeddings response missing data; disabling embeddings fast-path.")
-                    self._pattern_embeddings = {}
-                    self._client = None
-                    return
-                raw = response.data[0].embedding
-                embedding = np.array(raw) if np is not None else list(raw)
-                example_embeddings.append(embedding)
+                logger.warning("[FastPath] Embeddings response missing data; disabling embeddings fast-path.")
+                self._pattern_embeddings = {}
+                self._client = None
+                self._provider = None
+                return
 
             # Compute centroid (average embedding)
             if np is not None:
@@ -149,7 +179,7 @@ class FastPathDetector:
                         sums[i] += float(v[i])
                 centroid = [s / n for s in sums]
 
-            self._pattern_embeddings[pattern_name] = {
+            pattern_embeddings[pattern_name] = {
                 "centroid": centroid,
                 "target_agent": pattern_config["target_agent"],
                 "description": pattern_config["description"],
@@ -161,14 +191,90 @@ class FastPathDetector:
                 f"({len(example_embeddings)} examples) → {pattern_config['target_agent']}"
             )
 
+        if np is not None and pattern_embeddings:
+            # Unit-length centroids, one row per pattern, scored with one mat-vec
+            matrix = np.stack([np.asarray(p["centroid"], dtype=np.float32) for p in pattern_embeddings.values()])
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            self._pattern_matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+            self._pattern_names = list(pattern_embeddings)
+
+        self._pattern_embeddings = pattern_embeddings
         logger.info(f"Fast-path patterns initialized: {list(self._pattern_embeddings.keys())}")
 
-    async def detect_fast_path(self, query: str) -> Optional[str]:
+    async def warm_up(self) -> None:
+        """Compute pattern embeddings ahead of the first query."""
+        await self._initialize_patterns()
+
+    def _embeddings_enabled(self) -> bool:
+        """Return True if an embedding source (shared provider or client) is available."""
+        return self._provider is not None or self._client is not None
+
+    async def _embed_examples(self, examples: List[str]) -> Optional[List]:
+        """
+        Embed pattern examples.
+
+        Uses one batched call through the shared provider (served from its cache
+        after the first detector), otherwise one call per example on the client.
+
+        Returns:
+            List of embeddings, or None if the response was malformed
+        """
+        if self._provider is not None:
+            embeddings = await self._provider.generate_batch_embeddings(examples)
+            if not embeddings or len(embeddings) != len(examples):
+                return None
+            return [np.asarray(e) if np is not None else list(e) for e in embeddings]
+
+        embeddings = []
+        for example in examples:
+            response = await self._client.embeddings.create(
+                model="text-embedding-3-small",
+                input=example
+            )
+            if not getattr(response, "data", None):
+                return None
+            raw = response.data[0].embedding
+            embeddings.append(np.array(raw) if np is not None else list(raw))
+        return embeddings
+
+    async def _embed_query(
+        self,
+        query: str,
+        embedding_context: Optional["QueryEmbeddingContext"]
+    ):
+        """
+        Embed the query, reusing the request's embedding context when possible.
+
+        Returns:
+            Embedding vector, or None if the response was malformed
+        """
+        if embedding_context is not None and embedding_context.matches(query):
+            return await embedding_context.get_embedding()
+
+        if self._provider is not None:
+            return await self._provider.generate_embedding(query)
+
+        response = await self._client.embeddings.create(
+            model="text-embedding-3-small",
+            input=query
+        )
+        if not getattr(response, "data", None):
+            return None
+        raw = response.data[0].embedding
+        return np.array(raw) if np is not None else list(raw)
+
+    async def detect_fast_path(
+        self,
+        query: str,
+        embedding_context: Optional["QueryEmbeddingContext"] = None
+    ) -> Optional[str]:
         """
         Check if query matches a fast-path pattern.
 
         Args:
             query: User query
+            embedding_context: Optional per-request query embedding; the
+                embedding is only computed if the lexical check misses
 
         Returns:
             Agent ID to route to (e.g., "chitchat"), or None if no match
@@ -184,7 +290,7 @@ class FastPathDetector:
                 return "chitchat"
 
         # If embeddings are unavailable, stop here.
-        if self._client is None:
+        if not self._embeddings_enabled():
             return None
 
         # Initialize patterns if needed
@@ -192,34 +298,15 @@ class FastPathDetector:
 
         # Generate query embedding (defensive against unexpected SDK payloads)
         try:
-            response = await self._client.embeddings.create(
-                model="text-embedding-3-small",
-                input=query
-            )
-            if not getattr(response, "data", None):
+            query_embedding = await self._embed_query(query, embedding_context)
+            if query_embedding is None:
                 logger.warning("[FastPath] Embeddings response missing data; skipping embeddings fast-path.")
                 return None
-            raw = response.data[0].embedding
-            query_embedding = np.array(raw) if np is not None else list(raw)
         except Exception as e:
             logger.warning(f"[FastPath] Embeddings fast-path failed ({e}); skipping embeddings fast-path.")
             return None
 
-        # Check similarity with each pattern
-        best_match = None
-        best_similarity = 0.0
-
-        for pattern_name, pattern_data in self._pattern_embeddings.items():
-            centroid = pattern_data["centroid"]
-            similarity = self._cosine_similarity(query_embedding, centroid)
-
-            logger.debug(
-                f"[FastPath] Pattern '{pattern_name}' similarity: {similarity:.3f}"
-            )
-
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = pattern_data
+        best_match, best_similarity = self._best_pattern(query_embedding)
 
         # Check if best match exceeds threshold
         if best_similarity >= self.similarity_threshold:
@@ -235,6 +322,41 @@ class FastPathDetector:
             )
             return None
 
+    def _best_pattern(self, query_embedding):
+        """
+        Find the pattern whose centroid is most similar to the query.
+
+        Returns:
+            (pattern data, similarity in [0, 1]); (None, 0.0) if no pattern
+            has positive similarity
+        """
+        if self._pattern_matrix is not None:
+            query = np.asarray(query_embedding, dtype=np.float32)
+            norm = float(np.linalg.norm(query))
+            if norm == 0 or not self._pattern_names:
+                return None, 0.0
+            # One mat-vec against the unit-length centroids
+            similarities = np.clip(self._pattern_matrix @ query / norm, 0.0, 1.0)
+            logger.debug(
+                f"[FastPath] Pattern similarities: "
+                f"{dict(zip(self._pattern_names, similarities.round(3).tolist()))}"
+            )
+            best = int(np.argmax(similarities))
+            if similarities[best] <= 0:
+                return None, 0.0
+            return self._pattern_embeddings[self._pattern_names[best]], float(similarities[best])
+
+        # Pure-Python fallback (numpy unavailable)
+        best_match = None
+        best_similarity = 0.0
+        for pattern_name, pattern_data in self._pattern_embeddings.items():
+            similarity = self._cosine_similarity(query_embedding, pattern_data["centroid"])
+            logger.debug(f"[FastPath] Pattern '{pattern_name}' similarity: {similarity:.3f}")
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_match = pattern_data
+        return best_match, best_similarity
+
     @staticmethod
     def _is_lexical_chitchat(normalized_query: str) -> bool:
         """
@@ -4,7 +4,10 @@ MoE Orchestrator Interfaces.
 Protocol definitions for MoE components following the Protocol pattern.
 """
 
-from typing import Protocol, runtime_checkable, Optional, List, Tuple, Dict, Any
+from typing import Protocol, runtime_checkable, Optional, List, Tuple, Dict, Any, AsyncIterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from asdrp.orchestration.moe.embedding_providers import QueryEmbeddingContext
 
 
 @runtime_checkable
@@ -22,7 +25,8 @@ class IExpertSelector(Protocol):
         self,
         query: str,
         k: int = 3,
-        threshold: float = 0.3
+        threshold: float = 0.3,
+        embedding_context: Optional["QueryEmbeddingContext"] = None
     ) -> List[str]:
         """
         Select top-k expert agent IDs for query.
@@ -31,6 +35,7 @@ class IExpertSelector(Protocol):
             query: User query
             k: Max experts to select
             threshold: Min confidence threshold
+            embedding_context: Optional per-request query embedding to reuse
 
         Returns:
             List of agent IDs (e.g., ["yelp", "geo", "map"])
@@ -45,7 +50,6 @@ class IExpertExecutor(Protocol):
 
     Implementations:
     - ParallelExecutor: asyncio.gather-based concurrent execution
-    - StreamingExecutor: Stream results as they complete (future)
     - DAGExecutor: Dependency-aware execution (future)
     """
 
@@ -54,19 +58,47 @@ class IExpertExecutor(Protocol):
         agents_with_sessions: List[Tuple[str, Any, Any]],
         query: str,
         context: Optional[Dict[str, Any]] = None,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        primary_expert_id: Optional[str] = None
     ) -> List[Any]:  # List[ExpertResult]
         """
         Execute agents in parallel.
 
+        Results of experts that finished before the timeout are kept; experts
+        still running are cancelled and reported as failed with cut_off=True.
+
         Args:
             agents_with_sessions: List of (expert_id, agent, session)
             query: Query to process
             context: Optional context
             timeout: Overall timeout
+            primary_expert_id: Top-scored expert the quorum waits for
 
         Returns:
-            List of ExpertResult
+            List of ExpertResult, in input order
+        """
+        ...
+
+    def execute_as_completed(
+        self,
+        agents_with_sessions: List[Tuple[str, Any, Any]],
+        query: str,
+        context: Optional[Dict[str, Any]] = None,
+        timeout: float = 30.0,
+        primary_expert_id: Optional[str] = None
+    ) -> AsyncIterator[Any]:  # AsyncIterator[ExpertResult]
+        """
+        Execute agents in parallel, yielding each result as it completes.
+
+        Args:
+            agents_with_sessions: List of (expert_id, agent, session)
+            query: Query to process
+            context: Optional context
+            timeout: Overall timeout
+            primary_expert_id: Top-scored expert the quorum waits for
+
+        Yields:
+            ExpertResult in completion order
         """
         ...
 
@@ -101,6 +133,25 @@ class IResultMixer(Protocol):
         """
         ...
 
+    def mix_stream(
+        self,
+        expert_results: List[Any],
+        expert_ids: List[str],
+        query: str
+    ) -> AsyncIterator[Any]:  # AsyncIterator[str | MixedResult]
+        """
+        Mix expert results, streaming the synthesized response.
+
+        Args:
+            expert_results: Results from experts
+            expert_ids: Expert IDs
+            query: Original query
+
+        Yields:
+            str text deltas, then the final MixedResult
+        """
+        ...
+
 
 @runtime_checkable
 class ICache(Protocol):
@@ -113,10 +164,19 @@ class ICache(Protocol):
     - HybridCache: Exact + semantic (future)
     """
 
-    async def get(self, query: str) -> Optional[Any]:
+    async def get(
+        self,
+        query: str,
+        embedding_context: Optional["QueryEmbeddingContext"] = None
+    ) -> Optional[Any]:
         """Get cached result for query."""
         ...
 
-    async def store(self, query: str, result: Any) -> None:
+    async def store(
+        self,
+        query: str,
+        result: Any,
+        embedding_context: Optional["QueryEmbeddingContext"] = None
+    ) -> None:
         """Store query-result pair."""
         ...
@@ -7,13 +7,15 @@ Coordinates the three-tier MoE pipeline:
 3. Result Mixing
 """
 
-from typing import Optional, List, Any
+from typing import Optional, List, Any, AsyncIterator, Awaitable, Callable, Dict, Tuple, TYPE_CHECKING
 import asyncio
+import json
 import uuid
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field, replace
 from loguru import logger
 
 from asdrp.agents.agent_factory import AgentFactory
+from asdrp.agents.execution_scheduler import AdmissionError, get_execution_scheduler
 from asdrp.agents.protocol import AgentProtocol
 from asdrp.orchestration.moe.interfaces import (
     IExpertSelector,
@@ -25,6 +27,9 @@ from asdrp.orchestration.moe.config_loader import MoEConfigLoader, MoEConfig
 from asdrp.orchestration.moe.exceptions import MoEException
 from asdrp.orchestration.moe.fast_path import FastPathDetector
 
+if TYPE_CHECKING:
+    from asdrp.orchestration.moe.embedding_providers import IEmbeddingProvider
+
 
 @dataclass
 class ExpertExecutionDetail:
@@ -61,6 +66,7 @@ class MoETrace:
 
     # Expert details
     selected_experts: Optional[List[str]] = None
+    primary_expert: Optional[str] = None  # Selector's top-scored expert (anchors the quorum)
     expert_details: Optional[List[ExpertExecutionDetail]] = None
 
     # Results
@@ -73,6 +79,13 @@ class MoETrace:
     fallback: bool = False
     error: Optional[str] = None
 
+    # Cache freshness
+    cache_status: Optional[str] = None  # "hit", "stale", "miss", "coalesced" or "refresh"
+    cache_age_s: Optional[float] = None  # Age of the cache entry served
+    cache_ttl_s: Optional[float] = None  # Seconds the cache entry served is fresh for
+    revalidating: bool = False  # Stale entry served while a background refresh recomputes it
+    coalesced_with: Optional[str] = None  # Request whose in-flight computation was shared
+
 
 @dataclass
 class MoEResult:
@@ -82,6 +95,26 @@ class MoEResult:
     trace: MoETrace
 
 
+@dataclass
+class MoEStreamEvent:
+    """
+    Incremental event from MoEOrchestrator.route_query_stream.
+
+    Types:
+    - "selection": experts chosen (data: experts, fallback)
+    - "expert_started": expert began executing (data: expert_id, agent_name)
+    - "expert_completed": expert finished (data: expert_id, success, latency_ms, error)
+    - "token": text delta of the final answer (content)
+    - "answer": synthesis finished (content: full answer; data: selected_experts,
+      expert_details), before the result is cached
+    - "done": orchestration finished (result holds the full MoEResult)
+    """
+    type: str
+    content: str = ""
+    data: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[MoEResult] = None
+
+
 class MoEOrchestrator:
     """
     Mixture of Experts Orchestrator.
@@ -116,7 +149,8 @@ class MoEOrchestrator:
         result_mixer: IResultMixer,
         config: MoEConfig,
         cache: Optional[ICache] = None,
-        fast_path_detector: Optional[FastPathDetector] = None
+        fast_path_detector: Optional[FastPathDetector] = None,
+        embedding_provider: Optional["IEmbeddingProvider"] = None
     ):
         """
         Initialize MoE Orchestrator with dependency injection.
@@ -129,6 +163,8 @@ class MoEOrchestrator:
             config: MoE configuration
             cache: Optional semantic cache
             fast_path_detector: Optional fast-path bypass for simple queries
+            embedding_provider: Optional provider used to embed each query once
+                per request and share it across fast path, selector and cache
         """
         self._factory = agent_factory
         self._selector = expert_selector
@@ -137,6 +173,37 @@ class MoEOrchestrator:
         self._config = config
         self._cache = cache
         self._fast_path = fast_path_detector
+        self._embedding_provider = embedding_provider
+
+        # In-flight pipeline runs (cache misses and background refreshes) by
+        # query, so concurrent identical queries share one computation
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def warm_up(self) -> Dict[str, Any]:
+        """
+        Initialize embeddings ahead of the first request.
+
+        Computes expert and fast-path pattern embeddings concurrently. With a
+        persistent embedding store (cache.storage.embeddings_path) they are
+        read from disk after the first deploy instead of the embeddings API.
+
+        Returns:
+            Warm-up stats: embeddings read from the persistent store and
+            embeddings computed by the provider
+        """
+        provider = self._embedding_provider
+        before = provider.get_cache_stats() if hasattr(provider, "get_cache_stats") else None
+
+        components = [c for c in (self._selector, self._fast_path) if hasattr(c, "warm_up")]
+        await asyncio.gather(*(component.warm_up() for component in components))
+
+        if before is None:
+            return {}
+        after = provider.get_cache_stats()
+        return {
+            "embeddings_from_store": after["store_hits"] - before["store_hits"],
+            "embeddings_computed": after["misses"] - before["misses"],
+        }
 
     @staticmethod
     def _prioritize_agents_for_map_intent(query: str, agent_ids: List[str], max_k: int) -> List[str]:
@@ -240,12 +307,16 @@ class MoEOrchestrator:
         Route query through MoE pipeline.
 
         Flow:
-        1. Check cache (~1ms)
+        1. Check cache (~1ms); a stale entry is returned immediately and
+           refreshed in the background
         2. Select experts (~10-50ms)
         3. Execute in parallel (~500-1500ms)
         4. Mix results (~100-300ms)
         5. Store in cache
 
+        Steps 2-5 run once for concurrent identical cache misses: later
+        requests await the in-flight computation and share its answer.
+
         Args:
             query: User's natural language query
             session_id: Session ID for multi-turn conversations
@@ -253,6 +324,11 @@ class MoEOrchestrator:
 
         Returns:
             MoEResult with response and trace
+
+        Raises:
+            AdmissionError: If the execution scheduler shed every expert run
+                (or the fast-path/fallback run), so the caller can report a
+                retryable overload
         """
         import time
         from asdrp.orchestration.moe.performance_monitor import get_performance_monitor
@@ -272,10 +348,19 @@ class MoEOrchestrator:
         # Initialize trace
         trace = MoETrace(request_id=request_id, query=query)
 
+        # Per-request embedding context: the query is embedded at most once (lazily)
+        # and shared by the fast path, selector and cache.
+        embedding_kwargs = {}
+        if self._embedding_provider is not None:
+            from asdrp.orchestration.moe.embedding_providers import QueryEmbeddingContext
+            embedding_kwargs["embedding_context"] = QueryEmbeddingContext(
+                query, self._embedding_provider
+            )
+
         try:
             # 1. Fast-path check (bypass full pipeline for simple queries)
             if self._fast_path:
-                fast_path_agent = await self._fast_path.detect_fast_path(query)
+                fast_path_agent = await self._fast_path.detect_fast_path(query, **embedding_kwargs)
                 if fast_path_agent:
                     logger.info(f"[MoE] Fast-path bypass → {fast_path_agent}")
                     result = await self._execute_fast_path(
@@ -289,277 +374,707 @@ class MoEOrchestrator:
                     perf_monitor.finish_request(perf_context, cache_hit=False)
                     return result
 
-            # 2. Check cache
-            cache_hit = False
-            if self._cache and self._config.cache.enabled:
-                cached = await self._cache.get(query)
+            # 2. Check cache (stale entries are served and refreshed in the background)
+            cache_enabled = bool(self._cache and self._config.cache.enabled)
+            if cache_enabled:
+                cached = await self._cache.get(query, **embedding_kwargs)
                 if cached:
-                    cache_hit = True
                     result = self._build_cached_result(cached, start_time, request_id, trace)
+                    if cached.get("stale"):
+                        self._revalidate(query, context, embedding_kwargs, trace)
                     perf_monitor.finish_request(perf_context, cache_hit=True)
                     return result
-
-            # 2. Select experts
-            perf_monitor.record_selection_start(perf_context)
-            trace.selection_start = time.time()
-            max_k = self._config.moe.get("top_k_experts", 3)
-            from asdrp.orchestration.moe.exceptions import ExpertSelectionException
-            try:
-                selected_expert_ids = await self._selector.select(
-                    query,
-                    k=max_k,
-                    threshold=self._config.moe.get("confidence_threshold", 0.3)
+                trace.cache_status = "miss"
+
+            # 3. Run the pipeline (concurrent identical cache misses share one run)
+            if cache_enabled:
+                shared, coalesced = await self._single_flight(
+                    self._inflight_key(query, context),
+                    lambda: self._run_pipeline(
+                        query, session_id, context, start_time, trace,
+                        perf_monitor, perf_context, embedding_kwargs
+                    )
                 )
-            except ExpertSelectionException as e:
-                # Fail open: semantic selection can fail due to transient embedding/SDK issues.
-                # Fall back to deterministic capability selection for this request.
-                trace.fallback = True
-                trace.error = str(e)
-                logger.warning(
-                    f"[MoE] Selector failed ({e}); falling back to CapabilityBasedSelector for this request"
+                if coalesced:
+                    await self._record_joined_turn(query, session_id, shared)
+                    result = self._build_coalesced_result(shared, start_time, request_id)
+                else:
+                    result = shared
+            else:
+                result = await self._run_pipeline(
+                    query, session_id, context, start_time, trace,
+                    perf_monitor, perf_context, embedding_kwargs
                 )
-                from asdrp.orchestration.moe.expert_selector import CapabilityBasedSelector
-                selected_expert_ids = await CapabilityBasedSelector(self._config).select(
-                    query,
-                    k=max_k,
-                    threshold=self._config.moe.get("confidence_threshold", 0.3)
+
+            perf_monitor.finish_request(perf_context, cache_hit=False)
+            return result
+
+        except AdmissionError:
+            # Load was shed: report the overload (HTTP 503) instead of falling back
+            perf_monitor.finish_request(perf_context, cache_hit=False)
+            raise
+        except Exception as e:
+            # Fallback to default agent
+            result = await self._handle_fallback(query, session_id, e, trace, start_time)
+            perf_monitor.finish_request(perf_context, cache_hit=False)
+            return result
+
+    async def _run_pipeline(
+        self,
+        query: str,
+        session_id: str,
+        context: Optional[dict],
+        start_time: float,
+        trace: MoETrace,
+        perf_monitor: Any,
+        perf_context: Any,
+        embedding_kwargs: dict
+    ) -> MoEResult:
+        """
+        Select, execute and mix experts for a query, then cache the answer.
+
+        Expert failures fall back to the default agent; other errors propagate
+        to the caller.
+        """
+        import time
+
+        # 1. Select experts
+        selected_expert_ids = await self._select_experts(
+            query, trace, perf_monitor, perf_context, embedding_kwargs
+        )
+
+        # 2. Get agents from factory with sessions
+        agents_with_sessions = await self._load_agents(selected_expert_ids, session_id, trace)
+
+        if not agents_with_sessions:
+            # Fallback if no agents could be loaded
+            return await self._handle_fallback(
+                query, session_id, Exception("No agents could be loaded"), trace, start_time
+            )
+
+        # 3. Execute in parallel
+        perf_monitor.record_execution_start(perf_context)
+        trace.execution_start = time.time()
+
+        self._mark_experts_executing(trace)
+
+        expert_results = await self._executor.execute_parallel(
+            agents_with_sessions,
+            query,
+            context,
+            timeout=self._config.moe.get("overall_timeout", 30.0),
+            primary_expert_id=trace.primary_expert
+        )
+        if not isinstance(expert_results, list):
+            return await self._handle_fallback(
+                query,
+                session_id,
+                Exception(f"Executor returned invalid type: {type(expert_results).__name__}"),
+                trace,
+                start_time
+            )
+        trace.execution_end = time.time()
+        trace.expert_results = expert_results
+        perf_monitor.record_execution_end(perf_context, expert_results)
+        self._raise_if_all_shed(expert_results)
+
+        # If all experts failed (common when API keys/tools are missing), fail open to the
+        # configured fallback agent instead of returning an unhelpful apology.
+        if not self._log_partial_success(expert_results, query):
+            logger.warning("[MoE] All selected experts failed - implementing fallback")
+            return await self._handle_fallback(
+                query, session_id, Exception("All selected experts failed"), trace, start_time
+            )
+
+        # Update expert details with results
+        for i, (expert_id, _, _) in enumerate(agents_with_sessions):
+            if i < len(expert_results):
+                self._record_expert_result(trace, expert_id, expert_results[i])
+
+        # 4. Mix results
+        perf_monitor.record_mixing_start(perf_context)
+        trace.mixing_start = time.time()
+        final_result = await self._mixer.mix(
+            expert_results,
+            selected_expert_ids,
+            query
+        )
+        trace.mixing_end = time.time()
+        perf_monitor.record_mixing_end(perf_context, final_result)
+        # Extract content from MixedResult for trace (full content for visualization)
+        if final_result and hasattr(final_result, 'content') and final_result.content:
+            trace.final_response = str(final_result.content)
+        else:
+            trace.final_response = None
+
+        # 5. Build result with trace
+        result = self._build_result(
+            final_result,
+            selected_expert_ids,
+            expert_results,
+            start_time,
+            trace.request_id,
+            trace
+        )
+
+        # 6. Cache (answers missing cut-off experts are not cached)
+        if self._cache and self._config.cache.enabled and not self._has_cut_off(expert_results):
+            await self._cache.store(query, result, **embedding_kwargs)
+
+        return result
+
+    @staticmethod
+    def _inflight_key(query: str, context: Optional[dict]) -> str:
+        """
+        Key identifying identical queries (normalized like the cache key).
+
+        Shared across sessions, like the cache: a joiner gets the answer a
+        cache hit would serve it a moment later.
+        """
+        normalized = query.lower().strip()
+        if not context:
+            return normalized
+        return f"{normalized}\n{json.dumps(context, sort_keys=True, default=str)}"
+
+    async def _record_joined_turn(self, query: str, session_id: str, shared: MoEResult) -> None:
+        """
+        Add an answer computed for another request to the joiner's expert
+        sessions, as if its experts had run, so its next turn has the context.
+        """
+        async def record(expert_id: str) -> None:
+            _, session = await self._factory.get_agent_with_persistent_session(expert_id, session_id)
+            if session is not None:
+                await session.add_items([
+                    {"role": "user", "content": query},
+                    {"role": "assistant", "content": shared.response},
+                ])
+
+        outcomes = await asyncio.gather(
+            *(record(expert_id) for expert_id in shared.experts_used), return_exceptions=True
+        )
+        for expert_id, outcome in zip(shared.experts_used, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(f"[MoE] Could not record coalesced turn for {expert_id}: {outcome}")
+
+    def _get_inflight(self, key: str) -> Optional[asyncio.Task]:
+        """In-flight computation for a key, if one is running on this event loop."""
+        task = self._inflight.get(key)
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            return None
+        return task
+
+    def _start_inflight(self, key: str, coro: Awaitable[MoEResult]) -> asyncio.Task:
+        """Run a computation as a task that identical queries can join."""
+        task = asyncio.ensure_future(coro)
+        self._inflight[key] = task
+
+        def _release(done: asyncio.Task) -> None:
+            if self._inflight.get(key) is done:
+                del self._inflight[key]
+            # Retrieve the exception so unawaited failures (e.g. background
+            # refreshes) are logged here rather than by the event loop
+            if not done.cancelled() and done.exception() is not None:
+                logger.warning(f"[MoE] In-flight computation failed: {done.exception()}")
+
+        task.add_done_callback(_release)
+        return task
+
+    async def _single_flight(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[MoEResult]]
+    ) -> Tuple[MoEResult, bool]:
+        """
+        Run compute() unless an identical computation is already in flight.
+
+        The computation is shielded: if the caller that started it is
+        cancelled, it still completes for the callers awaiting it (and is
+        cached).
+
+        Args:
+            key: Identity of the computation (see _inflight_key)
+            compute: Zero-argument callable returning the coroutine to run
+
+        Returns:
+            (result, coalesced) where coalesced is True if the result was
+            computed for another request
+        """
+        task = self._get_inflight(key)
+        if task is not None:
+            logger.debug(f"[MoE] Coalescing with in-flight computation for '{key[:60]}'")
+            return await asyncio.shield(task), True
+        task = self._start_inflight(key, compute())
+        return await asyncio.shield(task), False
+
+    def _revalidate(
+        self,
+        query: str,
+        context: Optional[dict],
+        embedding_kwargs: dict,
+        trace: MoETrace
+    ) -> None:
+        """Refresh a stale cache entry in the background (once per query)."""
+        trace.revalidating = True
+        key = self._inflight_key(query, context)
+        if self._get_inflight(key) is None:
+            logger.debug(f"[MoE] Serving stale cache entry, refreshing '{query[:60]}'")
+            self._start_inflight(key, self._refresh(query, context, embedding_kwargs))
+
+    async def _refresh(
+        self,
+        query: str,
+        context: Optional[dict],
+        embedding_kwargs: dict
+    ) -> MoEResult:
+        """Recompute and re-cache the answer to a query (background refresh)."""
+        from asdrp.orchestration.moe.performance_monitor import get_performance_monitor
+
+        perf_monitor = get_performance_monitor()
+        perf_context = perf_monitor.start_request()
+        trace = MoETrace(request_id=self._generate_request_id(), query=query, cache_status="refresh")
+        try:
+            # Own session: the refresh must not add turns to a user's conversation
+            return await self._run_pipeline(
+                query,
+                f"moe-{uuid.uuid4().hex}",
+                context,
+                asyncio.get_running_loop().time(),
+                trace,
+                perf_monitor,
+                perf_context,
+                embedding_kwargs
+            )
+        finally:
+            perf_monitor.finish_request(perf_context, cache_hit=False)
+
+    async def _select_experts(
+        self,
+        query: str,
+        trace: MoETrace,
+        perf_monitor: Any,
+        perf_context: Any,
+        embedding_kwargs: dict
+    ) -> List[str]:
+        """
+        Select experts for a query and record the selection stage in the trace.
+
+        Applies capability-based fallback on selector failure, map-intent
+        prioritization and circuit-breaker filtering.
+
+        Raises:
+            Exception: On unexpected selector errors or malformed selector output
+                (callers route these to the fallback agent)
+        """
+        import time
+
+        perf_monitor.record_selection_start(perf_context)
+        trace.selection_start = time.time()
+        max_k = self._config.moe.get("top_k_experts", 3)
+        from asdrp.orchestration.moe.embedding_providers import IEmbeddingProvider
+        from asdrp.orchestration.moe.exceptions import ExpertSelectionException
+        threshold = self._config.moe.get("confidence_threshold", 0.3)
+        if isinstance(getattr(self._selector, "embedding_provider", None), IEmbeddingProvider):
+            # Similarity scales differ per embedding provider
+            threshold = self._config.embedding_threshold("confidence_threshold", threshold)
+        try:
+            selected_expert_ids = await self._selector.select(
+                query,
+                k=max_k,
+                threshold=threshold,
+                **embedding_kwargs
+            )
+        except ExpertSelectionException as e:
+            # Fail open: semantic selection can fail due to transient embedding/SDK issues.
+            # Fall back to deterministic capability selection for this request.
+            trace.fallback = True
+            trace.error = str(e)
+            logger.warning(
+                f"[MoE] Selector failed ({e}); falling back to CapabilityBasedSelector for this request"
+            )
+            from asdrp.orchestration.moe.expert_selector import CapabilityBasedSelector
+            selected_expert_ids = await CapabilityBasedSelector(self._config).select(
+                query,
+                k=max_k,
+                threshold=self._config.moe.get("confidence_threshold", 0.3)
+            )
+
+        # Defensive: selectors must return list[str]. If a selector returns None (or any
+        # malformed value), fail open to fallback agent instead of crashing later with
+        # confusing "NoneType is not subscriptable/iterable" errors.
+        if not isinstance(selected_expert_ids, list):
+            raise Exception(f"Selector returned invalid type: {type(selected_expert_ids).__name__}")
+        # Selectors rank by score; later reordering must not move the quorum's anchor
+        trace.primary_expert = selected_expert_ids[0] if selected_expert_ids else None
+
+        # Map/pins queries are expected to return an interactive map payload.
+        # Ensure MapAgent isn't dropped due to k-limit truncation (common when combined with Yelp agents).
+        pre_prioritization = selected_expert_ids[:]
+        selected_expert_ids = self._prioritize_agents_for_map_intent(query, selected_expert_ids, max_k)
+
+        if pre_prioritization != selected_expert_ids:
+            logger.info(
+                f"[MoE] Map intent prioritization changed agent list:\n"
+                f"  Before: {pre_prioritization}\n"
+                f"  After:  {selected_expert_ids}"
+            )
+
+        # Performance optimization: filter experts based on circuit breaker status
+        optimized_expert_ids = perf_monitor.optimize_expert_selection(selected_expert_ids, max_k)
+        if optimized_expert_ids != selected_expert_ids:
+            logger.info(f"[MoE] Performance optimization changed expert selection: {selected_expert_ids} → {optimized_expert_ids}")
+            selected_expert_ids = optimized_expert_ids
+
+        logger.info(f"[MoE] Final selected agents: {selected_expert_ids}")
+
+        trace.selection_end = time.time()
+        trace.selected_experts = selected_expert_ids
+        perf_monitor.record_selection_end(perf_context, selected_expert_ids)
+
+        # Create expert details with initial "pending" status
+        trace.expert_details = [
+            ExpertExecutionDetail(
+                expert_id=expert_id,
+                agent_name=expert_id,  # Will be updated later
+                confidence=0.8,  # Placeholder, selector doesn't return confidence yet
+                status="pending"
+            )
+            for expert_id in selected_expert_ids
+        ]
+        return selected_expert_ids
+
+    async def _load_agents(
+        self,
+        selected_expert_ids: List[str],
+        session_id: str,
+        trace: MoETrace
+    ) -> List[tuple]:
+        """
+        Load selected experts with persistent sessions from the factory.
+
+        Agents that fail to load are marked failed in the trace. If yelp_mcp
+        fails, yelp is added as a business agent fallback.
+
+        Returns:
+            List of (expert_id, agent, session) tuples (possibly empty)
+        """
+        agents_with_sessions = []
+        failed_agents = []
+
+        for expert_id in selected_expert_ids:
+            try:
+                agent, session = await self._factory.get_agent_with_persistent_session(
+                    expert_id, session_id
                 )
+
+                # For MCP-enabled agents, verify MCP servers are accessible
+                # This helps catch configuration issues early
+                if expert_id in ("yelp_mcp", "yelp-mcp"):
+                    mcp_servers = getattr(agent, "mcp_servers", None)
+                    if not mcp_servers:
+                        # Try alternative access methods
+                        mcp_servers = getattr(agent, "_mcp_servers", None)
+                    if not mcp_servers and hasattr(agent, "__dict__"):
+                        for attr_name, attr_value in agent.__dict__.items():
+                            if "mcp" in attr_name.lower() and isinstance(attr_value, (list, tuple)):
+                                mcp_servers = attr_value
+                                break
+
+                    if mcp_servers:
+                        logger.debug(f"[MoE] Verified {expert_id} has {len(mcp_servers)} MCP server(s)")
+                    else:
+                        logger.warning(
+                            f"[MoE] WARNING: {expert_id} should have MCP servers but none detected. "
+                            f"Agent type: {type(agent).__name__}. "
+                            f"This may cause 'Server not initialized' errors."
+                        )
+
+                agents_with_sessions.append((expert_id, agent, session))
+
+                # Update agent name in trace
+                for detail in trace.expert_details:
+                    if detail.expert_id == expert_id:
+                        detail.agent_name = getattr(agent, 'name', expert_id)
+                        break
             except Exception as e:
-                # Unexpected selector errors should use the configured fallback agent.
-                result = await self._handle_fallback(query, session_id, e, trace, start_time)
-                perf_monitor.finish_request(perf_context, cache_hit=False)
-                return result
-
-            # Defensive: selectors must return list[str]. If a selector returns None (or any
-            # malformed value), fail open to fallback agent instead of crashing later with
-            # confusing "NoneType is not subscriptable/iterable" errors.
-            if not isinstance(selected_expert_ids, list):
-                result = await self._handle_fallback(
-                    query,
-                    session_id,
-                    Exception(f"Selector returned invalid type: {type(selected_expert_ids).__name__}"),
-                    trace,
-                    start_time
-                )
-                perf_monitor.finish_request(perf_context, cache_hit=False)
-                return result
-
-            # Map/pins queries are expected to return an interactive map payload.
-            # Ensure MapAgent isn't dropped due to k-limit truncation (common when combined with Yelp agents).
-            pre_prioritization = selected_expert_ids[:]
-            selected_expert_ids = self._prioritize_agents_for_map_intent(query, selected_expert_ids, max_k)
-
-            if pre_prioritization != selected_expert_ids:
-                logger.info(
-                    f"[MoE] Map intent prioritization changed agent list:\n"
-                    f"  Before: {pre_prioritization}\n"
-                    f"  After:  {selected_expert_ids}"
-                )
+                logger.warning(f"Failed to get agent {expert_id}: {e}")
+                failed_agents.append(expert_id)
+
+                # Mark as failed in trace
+                for detail in trace.expert_details:
+                    if detail.expert_id == expert_id:
+                        detail.status = "failed"
+                        detail.error = str(e)
+                        break
+                continue
+
+        # Implement business agent fallback: if yelp_mcp fails, ensure yelp is available
+        if "yelp_mcp" in failed_agents and "yelp" not in [a[0] for a in agents_with_sessions]:
+            logger.info("[MoE] Implementing business agent fallback: yelp_mcp failed, adding yelp")
+            try:
+                agent, session = await self._factory.get_agent_with_persistent_session("yelp", session_id)
+                agents_with_sessions.append(("yelp", agent, session))
+                logger.info("[MoE] ✅ Business agent fallback successful: yelp added")
+            except Exception as e:
+                logger.warning(f"[MoE] Business agent fallback failed: {e}")
 
-            # Performance optimization: filter experts based on circuit breaker status
-            optimized_expert_ids = perf_monitor.optimize_expert_selection(selected_expert_ids, max_k)
-            if optimized_expert_ids != selected_expert_ids:
-                logger.info(f"[MoE] Performance optimization changed expert selection: {selected_expert_ids} → {optimized_expert_ids}")
-                selected_expert_ids = optimized_expert_ids
+        return agents_with_sessions
 
-            logger.info(f"[MoE] Final selected agents: {selected_expert_ids}")
+    @staticmethod
+    def _mark_experts_executing(trace: MoETrace) -> None:
+        """Move pending experts in the trace to "executing"."""
+        for detail in trace.expert_details or []:
+            if detail.status == "pending":
+                detail.status = "executing"
+                # Do not stamp a shared start_time for all experts; the executor records
+                # accurate per-expert started_at/ended_at timestamps.
+                detail.start_time = None
 
-            trace.selection_end = time.time()
-            trace.selected_experts = selected_expert_ids
-            perf_monitor.record_selection_end(perf_context, selected_expert_ids)
+    @staticmethod
+    def _log_partial_success(expert_results: List[Any], query: str) -> bool:
+        """
+        Log partial expert success and report whether any expert succeeded.
 
-            # Create expert details with initial "pending" status
-            trace.expert_details = [
-                ExpertExecutionDetail(
-                    expert_id=expert_id,
-                    agent_name=expert_id,  # Will be updated later
-                    confidence=0.8,  # Placeholder, selector doesn't return confidence yet
-                    status="pending"
-                )
-                for expert_id in selected_expert_ids
-            ]
+        Malformed results are treated as success so the pipeline continues to mixing.
+        """
+        try:
+            successful_experts = [r for r in expert_results if getattr(r, "success", False)]
+            if not successful_experts:
+                return False
+
+            # Partial success handling: log which experts succeeded/failed
+            failed_experts = [r for r in expert_results if not getattr(r, "success", False)]
+            if failed_experts:
+                failed_ids = [getattr(r, "expert_id", "unknown") for r in failed_experts]
+                successful_ids = [getattr(r, "expert_id", "unknown") for r in successful_experts]
+                logger.info(f"[MoE] Partial success: {len(successful_experts)} succeeded ({successful_ids}), {len(failed_experts)} failed ({failed_ids})")
+
+                # Special handling for business+map queries where map fails
+                business_agents = ["yelp", "yelp_mcp"]
+                map_agents = ["map", "geo"]
+
+                successful_business = any(r for r in successful_experts if getattr(r, "expert_id", "") in business_agents)
+                failed_map = any(r for r in failed_experts if getattr(r, "expert_id", "") in map_agents)
+
+                if successful_business and failed_map and ("map" in query.lower() or "pins" in query.lower()):
+                    logger.info("[MoE] Business data available but map failed - will rely on geocoding fallback")
+        except Exception:
+            # If expert_results is malformed for any reason, continue to mixing.
+            pass
+        return True
 
-            # 3. Get agents from factory with sessions
-            agents_with_sessions = []
-            failed_agents = []
-            
-            for expert_id in selected_expert_ids:
-                try:
-                    agent, session = await self._factory.get_agent_with_persistent_session(
-                        expert_id, session_id
+    @staticmethod
+    def _raise_if_all_shed(expert_results: List[Any]) -> None:
+        """Raise AdmissionError if the scheduler shed every expert run."""
+        if expert_results and all(getattr(r, "shed", False) is True for r in expert_results):
+            logger.warning("[MoE] All selected experts were shed by the execution scheduler")
+            raise AdmissionError("Server is at capacity; please retry shortly")
+
+    @staticmethod
+    def _has_cut_off(expert_results: List[Any]) -> bool:
+        """True if the executor cancelled any expert (overall timeout or quorum)."""
+        return any(getattr(r, "cut_off", False) is True for r in expert_results)
+
+    @staticmethod
+    def _record_expert_result(trace: MoETrace, expert_id: str, result: Any) -> None:
+        """Copy an expert's execution result into its trace detail."""
+        for detail in trace.expert_details or []:
+            if detail.expert_id == expert_id:
+                # Prefer precise timestamps captured by the executor.
+                started_at = getattr(result, "started_at", None) if result else None
+                ended_at = getattr(result, "ended_at", None) if result else None
+                detail.start_time = started_at
+                detail.end_time = ended_at
+                detail.latency_ms = getattr(result, "latency_ms", 0.0) if result else 0.0
+                detail.status = "completed" if getattr(result, "success", False) else "failed"
+                detail.error = getattr(result, "error", None) if result else "Unknown error"
+                # Store FULL output for visualization (no truncation - users need to see complete expert responses)
+                # Extract output from ExpertResult - preserve empty strings as they may be valid responses
+                if result:
+                    output = getattr(result, "output", None)
+                    # Convert None to empty string, but preserve actual empty strings
+                    if output is None:
+                        detail.response = ""
+                    else:
+                        detail.response = str(output)  # Ensure it's a string
+                else:
+                    detail.response = ""
+                # Extract tools if available
+                if hasattr(result, 'tools_used'):
+                    detail.tools_used = result.tools_used
+                break
+
+    async def route_query_stream(
+        self,
+        query: str,
+        session_id: Optional[str] = None,
+        context: Optional[dict] = None
+    ) -> AsyncIterator[MoEStreamEvent]:
+        """
+        Route query through MoE pipeline, streaming progress and answer tokens.
+
+        Same pipeline as route_query(), but yields events as it goes: the
+        expert selection, each expert's start and completion (in completion
+        order), then the synthesized answer token by token. The final "done"
+        event carries the complete MoEResult, which is authoritative if a
+        client's concatenated tokens differ from it (e.g. after a fallback).
+
+        A query identical to one already computing via route_query() (or a
+        background refresh) awaits that computation and yields its answer as
+        a single token; streamed runs themselves are not shared.
+
+        Args:
+            query: User's natural language query
+            session_id: Session ID for multi-turn conversations
+            context: Optional context (location, preferences)
+
+        Yields:
+            MoEStreamEvent instances, ending with a "done" event
+        """
+        import time
+        from asdrp.orchestration.moe.performance_monitor import get_performance_monitor
+
+        perf_monitor = get_performance_monitor()
+        perf_context = perf_monitor.start_request()
+
+        if session_id is None:
+            session_id = f"moe-{uuid.uuid4().hex}"
+
+        start_time = asyncio.get_event_loop().time()
+        request_id = self._generate_request_id()
+        trace = MoETrace(request_id=request_id, query=query)
+
+        embedding_kwargs = {}
+        if self._embedding_provider is not None:
+            from asdrp.orchestration.moe.embedding_providers import QueryEmbeddingContext
+            embedding_kwargs["embedding_context"] = QueryEmbeddingContext(
+                query, self._embedding_provider
+            )
+
+        streamed = False
+        try:
+            # 1. Fast-path check
+            if self._fast_path:
+                fast_path_agent = await self._fast_path.detect_fast_path(query, **embedding_kwargs)
+                if fast_path_agent:
+                    logger.info(f"[MoE] Fast-path bypass → {fast_path_agent}")
+                    result = await self._execute_fast_path(
+                        fast_path_agent, query, session_id, start_time, request_id, trace
                     )
-                    
-                    # For MCP-enabled agents, verify MCP servers are accessible
-                    # This helps catch configuration issues early
-                    if expert_id in ("yelp_mcp", "yelp-mcp"):
-                        mcp_servers = getattr(agent, "mcp_servers", None)
-                        if not mcp_servers:
-                            # Try alternative access methods
-                            mcp_servers = getattr(agent, "_mcp_servers", None)
-                        if not mcp_servers and hasattr(agent, "__dict__"):
-                            for attr_name, attr_value in agent.__dict__.items():
-                                if "mcp" in attr_name.lower() and isinstance(attr_value, (list, tuple)):
-                                    mcp_servers = attr_value
-                                    break
-                        
-                        if mcp_servers:
-                            logger.debug(f"[MoE] Verified {expert_id} has {len(mcp_servers)} MCP server(s)")
-                        else:
-                            logger.warning(
-                                f"[MoE] WARNING: {expert_id} should have MCP servers but none detected. "
-                                f"Agent type: {type(agent).__name__}. "
-                                f"This may cause 'Server not initialized' errors."
-                            )
-                    
-                    agents_with_sessions.append((expert_id, agent, session))
-
-                    # Update agent name in trace
-                    for detail in trace.expert_details:
-                        if detail.expert_id == expert_id:
-                            detail.agent_name = getattr(agent, 'name', expert_id)
-                            break
-                except Exception as e:
-                    logger.warning(f"Failed to get agent {expert_id}: {e}")
-                    failed_agents.append(expert_id)
-
-                    # Mark as failed in trace
-                    for detail in trace.expert_details:
-                        if detail.expert_id == expert_id:
-                            detail.status = "failed"
-                            detail.error = str(e)
-                            break
-                    continue
-
-            # Implement business agent fallback: if yelp_mcp fails, ensure yelp is available
-            if "yelp_mcp" in failed_agents and "yelp" not in [a[0] for a in agents_with_sessions]:
-                logger.info("[MoE] Implementing business agent fallback: yelp_mcp failed, adding yelp")
-                try:
-                    agent, session = await self._factory.get_agent_with_persistent_session("yelp", session_id)
-                    agents_with_sessions.append(("yelp", agent, session))
-                    logger.info("[MoE] ✅ Business agent fallback successful: yelp added")
-                except Exception as e:
-                    logger.warning(f"[MoE] Business agent fallback failed: {e}")
+                    perf_monitor.finish_request(perf_context, cache_hit=False)
+                    yield MoEStreamEvent(type="token", content=result.response)
+                    yield MoEStreamEvent(type="done", result=result)
+                    return
+
+            # 2. Check cache (stale entries are served and refreshed in the background)
+            if self._cache and self._config.cache.enabled:
+                cached = await self._cache.get(query, **embedding_kwargs)
+                if cached:
+                    result = self._build_cached_result(cached, start_time, request_id, trace)
+                    if cached.get("stale"):
+                        self._revalidate(query, context, embedding_kwargs, trace)
+                    perf_monitor.finish_request(perf_context, cache_hit=True)
+                    yield MoEStreamEvent(type="token", content=result.response)
+                    yield MoEStreamEvent(type="done", result=result)
+                    return
+                trace.cache_status = "miss"
+
+                # Join an identical computation already in flight. A stream
+                # never starts one: its tokens go to its own caller only.
+                inflight = self._get_inflight(self._inflight_key(query, context))
+                if inflight is not None:
+                    shared = await asyncio.shield(inflight)
+                    await self._record_joined_turn(query, session_id, shared)
+                    result = self._build_coalesced_result(shared, start_time, request_id)
+                    perf_monitor.finish_request(perf_context, cache_hit=False)
+                    yield MoEStreamEvent(type="token", content=result.response)
+                    yield MoEStreamEvent(type="done", result=result)
+                    return
 
+            # 3. Select experts
+            selected_expert_ids = await self._select_experts(
+                query, trace, perf_monitor, perf_context, embedding_kwargs
+            )
+            yield MoEStreamEvent(
+                type="selection",
+                data={"experts": list(selected_expert_ids), "fallback": trace.fallback}
+            )
+
+            # 4. Load agents
+            agents_with_sessions = await self._load_agents(selected_expert_ids, session_id, trace)
             if not agents_with_sessions:
-                # Fallback if no agents could be loaded
-                result = await self._handle_fallback(
-                    query, session_id, Exception("No agents could be loaded"), trace, start_time
-                )
-                perf_monitor.finish_request(perf_context, cache_hit=False)
-                return result
+                raise Exception("No agents could be loaded")
 
-            # 4. Execute in parallel
+            # 5. Execute in parallel, reporting experts as they finish
             perf_monitor.record_execution_start(perf_context)
             trace.execution_start = time.time()
+            self._mark_experts_executing(trace)
 
-            # Update status to executing
-            for detail in trace.expert_details:
-                if detail.status == "pending":
-                    detail.status = "executing"
-                    # Do not stamp a shared start_time for all experts; the executor records
-                    # accurate per-expert started_at/ended_at timestamps.
-                    detail.start_time = None
+            for expert_id, agent, _ in agents_with_sessions:
+                yield MoEStreamEvent(
+                    type="expert_started",
+                    data={"expert_id": expert_id, "agent_name": getattr(agent, "name", expert_id)}
+                )
 
-            expert_results = await self._executor.execute_parallel(
+            results_by_id = {}
+            async for expert_result in self._executor.execute_as_completed(
                 agents_with_sessions,
                 query,
                 context,
-                timeout=self._config.moe.get("overall_timeout", 30.0)
-            )
-            if not isinstance(expert_results, list):
-                result = await self._handle_fallback(
-                    query,
-                    session_id,
-                    Exception(f"Executor returned invalid type: {type(expert_results).__name__}"),
-                    trace,
-                    start_time
+                timeout=self._config.moe.get("overall_timeout", 30.0),
+                primary_expert_id=trace.primary_expert
+            ):
+                results_by_id[expert_result.expert_id] = expert_result
+                self._record_expert_result(trace, expert_result.expert_id, expert_result)
+                yield MoEStreamEvent(
+                    type="expert_completed",
+                    data={
+                        "expert_id": expert_result.expert_id,
+                        "success": expert_result.success,
+                        "latency_ms": expert_result.latency_ms,
+                        "error": expert_result.error,
+                    }
                 )
-                perf_monitor.finish_request(perf_context, cache_hit=False)
-                return result
+
+            # Mix in selection order, not completion order
+            expert_results = [
+                results_by_id[expert_id]
+                for expert_id, _, _ in agents_with_sessions
+                if expert_id in results_by_id
+            ]
             trace.execution_end = time.time()
             trace.expert_results = expert_results
             perf_monitor.record_execution_end(perf_context, expert_results)
+            self._raise_if_all_shed(expert_results)
 
-            # If all experts failed (common when API keys/tools are missing), fail open to the
-            # configured fallback agent instead of returning an unhelpful apology.
-            successful_experts = []
-            try:
-                successful_experts = [r for r in expert_results if getattr(r, "success", False)]
-                if not successful_experts:
-                    logger.warning("[MoE] All selected experts failed - implementing fallback")
-                    result = await self._handle_fallback(
-                        query, session_id, Exception("All selected experts failed"), trace, start_time
-                    )
-                    perf_monitor.finish_request(perf_context, cache_hit=False)
-                    return result
-                else:
-                    # Partial success handling: log which experts succeeded/failed
-                    failed_experts = [r for r in expert_results if not getattr(r, "success", False)]
-                    if failed_experts:
-                        failed_ids = [getattr(r, "expert_id", "unknown") for r in failed_experts]
-                        successful_ids = [getattr(r, "expert_id", "unknown") for r in successful_experts]
-                        logger.info(f"[MoE] Partial success: {len(successful_experts)} succeeded ({successful_ids}), {len(failed_experts)} failed ({failed_ids})")
-                        
-                        # Special handling for business+map queries where map fails
-                        business_agents = ["yelp", "yelp_mcp"]
-                        map_agents = ["map", "geo"]
-                        
-                        successful_business = any(r for r in successful_experts if getattr(r, "expert_id", "") in business_agents)
-                        failed_map = any(r for r in failed_experts if getattr(r, "expert_id", "") in map_agents)
-                        
-                        if successful_business and failed_map and ("map" in query.lower() or "pins" in query.lower()):
-                            logger.info("[MoE] Business data available but map failed - will rely on geocoding fallback")
-            except Exception:
-                # If expert_results is malformed for any reason, continue to mixing.
-                pass
-
-            # Update expert details with results
-            for i, (expert_id, _, _) in enumerate(agents_with_sessions):
-                if i < len(expert_results):
-                    result = expert_results[i]
-                    for detail in trace.expert_details:
-                        if detail.expert_id == expert_id:
-                            # Prefer precise timestamps captured by the executor.
-                            started_at = getattr(result, "started_at", None) if result else None
-                            ended_at = getattr(result, "ended_at", None) if result else None
-                            detail.start_time = started_at
-                            detail.end_time = ended_at
-                            detail.latency_ms = getattr(result, "latency_ms", 0.0) if result else 0.0
-                            detail.status = "completed" if getattr(result, "success", False) else "failed"
-                            detail.error = getattr(result, "error", None) if result else "Unknown error"
-                            # Store FULL output for visualization (no truncation - users need to see complete expert responses)
-                            # Extract output from ExpertResult - preserve empty strings as they may be valid responses
-                            if result:
-                                output = getattr(result, "output", None)
-                                # Convert None to empty string, but preserve actual empty strings
-                                if output is None:
-                                    detail.response = ""
-                                else:
-                                    detail.response = str(output)  # Ensure it's a string
-                            else:
-                                detail.response = ""
-                            # Extract tools if available
-                            if hasattr(result, 'tools_used'):
-                                detail.tools_used = result.tools_used
-                            break
-
-            # 5. Mix results
+            if not self._log_partial_success(expert_results, query):
+                logger.warning("[MoE] All selected experts failed - implementing fallback")
+                raise Exception("All selected experts failed")
+
+            # 6. Mix results, streaming synthesis tokens
             perf_monitor.record_mixing_start(perf_context)
             trace.mixing_start = time.time()
-            final_result = await self._mixer.mix(
-                expert_results,
-                selected_expert_ids,
-                query
-            )
+            final_result = None
+            async for item in self._mixer.mix_stream(expert_results, selected_expert_ids, query):
+                if isinstance(item, str):
+                    if item:
+                        streamed = True
+                        yield MoEStreamEvent(type="token", content=item)
+                else:
+                    final_result = item
             trace.mixing_end = time.time()
             perf_monitor.record_mixing_end(perf_context, final_result)
-            # Extract content from MixedResult for trace (full content for visualization)
-            if final_result and hasattr(final_result, 'content') and final_result.content:
+            if final_result and getattr(final_result, "content", None):
                 trace.final_response = str(final_result.content)
-            else:
-                trace.final_response = None
+                yield MoEStreamEvent(
+                    type="answer",
+                    content=trace.final_response,
+                    data={
+                        "selected_experts": selected_expert_ids,
+                        "expert_details": [asdict(d) for d in trace.expert_details or []],
+                    }
+                )
 
-            # 6. Build result with trace
+            # 7. Build result, cache, finish
             result = self._build_result(
                 final_result,
                 selected_expert_ids,
@@ -569,20 +1084,21 @@ class MoEOrchestrator:
                 trace
             )
 
-            # 7. Cache
-            if self._cache and self._config.cache.enabled:
-                await self._cache.store(query, result)
-
-            # 8. Finish performance monitoring
-            perf_monitor.finish_request(perf_context, cache_hit=cache_hit)
+            if self._cache and self._config.cache.enabled and not self._has_cut_off(expert_results):
+                await self._cache.store(query, result, **embedding_kwargs)
 
-            return result
+            perf_monitor.finish_request(perf_context, cache_hit=False)
+            yield MoEStreamEvent(type="done", result=result)
 
+        except AdmissionError:
+            perf_monitor.finish_request(perf_context, cache_hit=False)
+            raise
         except Exception as e:
-            # Fallback to default agent
             result = await self._handle_fallback(query, session_id, e, trace, start_time)
             perf_monitor.finish_request(perf_context, cache_hit=False)
-            return result
+            if not streamed:
+                yield MoEStreamEvent(type="token", content=result.response)
+            yield MoEStreamEvent(type="done", result=result)
 
     async def _execute_fast_path(
         self,
@@ -632,11 +1148,12 @@ class MoEOrchestrator:
 
             # Execute directly (no parallelism needed)
             from agents import Runner
-            result = await Runner.run(
-                starting_agent=agent,
-                input=query,
-                session=session
-            )
+            async with get_execution_scheduler().slot(agent_id, session_id=session_id):
+                result = await Runner.run(
+                    starting_agent=agent,
+                    input=query,
+                    session=session
+                )
 
             # Update trace
             trace.expert_details[0].status = "completed"
@@ -661,6 +1178,8 @@ class MoEOrchestrator:
                 trace=trace
             )
 
+        except AdmissionError:
+            raise
         except Exception as e:
             logger.error(f"Fast-path execution failed: {e}")
             # Fall back to regular pipeline
@@ -710,11 +1229,12 @@ class MoEOrchestrator:
             )
 
             from agents import Runner
-            result = await Runner.run(
-                starting_agent=agent,
-                input=query,
-                session=session
-            )
+            async with get_execution_scheduler().slot(fallback_agent_id, session_id=session_id):
+                result = await Runner.run(
+                    starting_agent=agent,
+                    input=query,
+                    session=session
+                )
 
             # Update latency to include fallback execution time
             if start_time is not None:
@@ -738,6 +1258,9 @@ class MoEOrchestrator:
                 experts_used=[fallback_agent_id],
                 trace=trace
             )
+        except AdmissionError:
+            # No slot for the fallback agent either: report the overload
+            raise
         except Exception as fallback_error:
             # Last resort - return error message
             fallback_message = self._config.error_handling.get(
@@ -809,6 +1332,9 @@ class MoEOrchestrator:
         trace.latency_ms = latency_ms
         trace.cache_hit = True
         trace.fallback = False
+        trace.cache_status = "stale" if cached.get("stale") else "hit"
+        trace.cache_age_s = cached.get("age_s")
+        trace.cache_ttl_s = cached.get("ttl")
 
         # Cache entries currently persist only (response, experts_used).
         # To keep the frontend MoE visualization useful on cache hits, we populate
@@ -850,6 +1376,26 @@ class MoEOrchestrator:
             trace=trace
         )
 
+    def _build_coalesced_result(
+        self,
+        shared: MoEResult,
+        start_time: float,
+        request_id: str
+    ) -> MoEResult:
+        """Build MoEResult for a request that joined another's computation."""
+        trace = replace(
+            shared.trace,
+            request_id=request_id,
+            latency_ms=(asyncio.get_event_loop().time() - start_time) * 1000,
+            cache_status="coalesced",
+            coalesced_with=shared.trace.request_id
+        )
+        return MoEResult(
+            response=shared.response,
+            experts_used=list(shared.experts_used),
+            trace=trace
+        )
+
     @classmethod
     def create_default(
         cls,
@@ -898,15 +1444,25 @@ class MoEOrchestrator:
 
         executor = ParallelExecutor(config)
         mixer = WeightedMixer(config)
-        cache = SemanticCache(config) if config.cache.enabled else None
+
+        # Share the selector's (cached) embedding provider with the fast path and
+        # semantic cache so each query is embedded once per request.
+        embedding_provider = getattr(selector, "embedding_provider", None)
+
+        cache = None
+        if config.cache.enabled:
+            cache = SemanticCache(config, embedding_provider=embedding_provider)
 
         # Enable fast-path for chitchat/simple queries (if configured)
         fast_path_enabled = config.moe.get("fast_path_enabled", True)
         fast_path = None
         if fast_path_enabled:
             try:
-                fast_path_threshold = config.moe.get("fast_path_threshold", 0.75)
-                fast_path = FastPathDetector(similarity_threshold=fast_path_threshold)
+                fast_path_threshold = config.embedding_threshold("fast_path_threshold", 0.75)
+                fast_path = FastPathDetector(
+                    similarity_threshold=fast_path_threshold,
+                    embedding_provider=embedding_provider
+                )
                 logger.info(f"Fast-path enabled (threshold={fast_path_threshold})")
             except Exception as e:
                 logger.warning(f"Fast-path initialization failed: {e}. Continuing without fast-path.")
@@ -918,7 +1474,8 @@ class MoEOrchestrator:
             result_mixer=mixer,
             config=config,
             cache=cache,
-            fast_path_detector=fast_path
+            fast_path_detector=fast_path,
+            embedding_provider=embedding_provider
         )
 
     @staticmethod
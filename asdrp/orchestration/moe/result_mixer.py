@@ -7,11 +7,12 @@ Synthesizes expert outputs into coherent response.
 from dotenv import load_dotenv, find_dotenv
 load_dotenv(find_dotenv())
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Optional, Union
 from dataclasses import dataclass
 import os
 import re
 
+from asdrp.agents.llm_gateway import get_llm_gateway
 from asdrp.orchestration.moe.interfaces import IResultMixer
 from asdrp.orchestration.moe.config_loader import MoEConfig
 from asdrp.orchestration.moe.expert_executor import ExpertResult
@@ -72,6 +73,7 @@ class WeightedMixer(IResultMixer):
         try:
             # Filter successful results
             successful = [r for r in expert_results if r.success]
+            cut_off_ids = self._cut_off_expert_ids(expert_results)
 
             if not successful:
                 return MixedResult(
@@ -95,84 +97,247 @@ class WeightedMixer(IResultMixer):
                     content=content,
                     weights={result.expert_id: 1.0},
                     quality_score=self._estimate_quality(content, successful),
-                    metadata=result.metadata
+                    metadata=self._with_cut_off(result.metadata, cut_off_ids)
                 )
 
             # Get weights from config
             weights = self._get_weights(successful)
 
             # Mix using LLM synthesis
-            mixed = await self._llm_synthesis(successful, weights, query)
+            mixed = await self._llm_synthesis(successful, weights, query, cut_off_ids=cut_off_ids)
+            mixed.content = await self._postprocess_synthesis(mixed.content, query, successful)
+            mixed.metadata = self._with_cut_off(mixed.metadata, cut_off_ids)
 
-            # Enhanced JSON block preservation with post-synthesis validation
-            original_blocks = []
-            for result in successful:
-                original_blocks.extend(self._extract_interactive_json_blocks(result.output))
-            
-            # Deterministically preserve any interactive visualization blocks produced by experts.
-            # Rationale: even with strong prompting, LLM synthesis can omit code blocks; the UI
-            # depends on these blocks (e.g., interactive maps) to render rich components.
-            mixed.content = self._append_missing_interactive_blocks(
-                mixed.content,
-                [r.output for r in successful]
-            )
-            
-            # Post-synthesis validation: Ensure all original JSON blocks are preserved
-            mixed.content = self._validate_and_restore_json_blocks(
-                mixed.content, 
-                original_blocks,
-                query
-            )
+            return mixed
 
-            # Enhanced defense-in-depth: If this is a route/directions query and no map was generated,
-            # try to auto-inject one from route information in the response
-            from loguru import logger
-            if not self._has_interactive_map(mixed.content):
-                logger.info("[ResultMixer] No interactive map in synthesized response, attempting auto-injection")
-                mixed.content = self._auto_inject_missing_maps(mixed.content, query, successful)
-
-                # FINAL FALLBACK: Geocode addresses from response text and inject places map
-                # This handles cases where Yelp/other agents return addresses without coordinates
-                if not self._has_interactive_map(mixed.content):
-                    logger.info("[ResultMixer] Fallback to geocoding-based map injection")
-                    mixed.content = await self._auto_inject_map_via_geocoding(mixed.content, query, successful)
-                else:
-                    logger.info("[ResultMixer] Map successfully auto-injected from coordinates")
-            else:
-                logger.info("[ResultMixer] Interactive map already present in synthesized response")
-                
-                # Even if map is present, check if it has valid coordinates
-                # If not, try to enhance it with geocoded coordinates
-                json_blocks = self._extract_interactive_json_blocks(mixed.content)
-                if json_blocks:
-                    for block in json_blocks:
-                        try:
-                            import json
-                            json_obj = json.loads(block.replace("```json\n", "").replace("\n```", ""))
-                            config = json_obj.get("config", {})
-                            markers = config.get("markers", [])
-                            
-                            # Check if markers have null coordinates
-                            has_null_coords = any(
-                                m.get("lat") is None or m.get("lng") is None 
-                                for m in markers if isinstance(m, dict)
-                            )
-                            
-                            if has_null_coords:
-                                logger.warning("[ResultMixer] Map present but has null coordinates - attempting geocoding enhancement")
-                                enhanced_content = await self._auto_inject_map_via_geocoding(mixed.content, query, successful)
-                                if enhanced_content != mixed.content:
-                                    mixed.content = enhanced_content
-                                    logger.info("[ResultMixer] Successfully enhanced map with geocoded coordinates")
-                        except Exception as e:
-                            logger.debug(f"[ResultMixer] Error checking map coordinates: {e}")
-                            continue
+        except Exception as e:
+            raise MixingException(f"Result mixing failed: {e}")
 
-            return mixed
+    async def mix_stream(
+        self,
+        expert_results: List[ExpertResult],
+        expert_ids: List[str],
+        query: str
+    ) -> AsyncIterator[Union[str, MixedResult]]:
+        """
+        Streaming variant of mix().
+
+        Yields text deltas as synthesis tokens arrive, then the final
+        MixedResult as the last item. Post-processing (JSON block restoration,
+        map auto-injection) runs once the synthesis stream ends and is emitted
+        as a tail delta. Interactive ```json blocks are held back until their
+        closing fence arrives so clients never render half a map payload.
+
+        The final MixedResult content is authoritative; concatenated deltas
+        match it except in the rare case where post-processing rewrites
+        already-streamed text.
+
+        Args:
+            expert_results: Results from experts
+            expert_ids: Expert IDs
+            query: Original query
+
+        Yields:
+            str deltas, then one MixedResult
+
+        Raises:
+            MixingException: If mixing fails
+        """
+        try:
+            successful = [r for r in expert_results if r.success]
+            cut_off_ids = self._cut_off_expert_ids(expert_results)
+
+            if not successful:
+                result = MixedResult(
+                    content="I apologize, but I don't have enough information to answer that question accurately.",
+                    weights={},
+                    quality_score=0.0,
+                    metadata={"error": "No successful expert results"}
+                )
+                yield result.content
+                yield result
+                return
+
+            if len(successful) == 1:
+                result = successful[0]
+                content = result.output or ""
+                if content:
+                    yield content
+
+                final = self._auto_inject_missing_maps(content, query, successful)
+                final = await self._auto_inject_map_via_geocoding(final, query, successful)
+                tail = self._stream_tail(content, final)
+                if tail:
+                    yield tail
+
+                yield MixedResult(
+                    content=final,
+                    weights={result.expert_id: 1.0},
+                    quality_score=self._estimate_quality(final, successful),
+                    metadata=self._with_cut_off(result.metadata, cut_off_ids)
+                )
+                return
+
+            weights = self._get_weights(successful)
+
+            parts: List[str] = []
+            metadata: Dict[str, Any] = {}
+            async for delta in self._llm_synthesis_stream(
+                successful, weights, query, metadata, cut_off_ids=cut_off_ids
+            ):
+                parts.append(delta)
+                yield delta
+
+            content = "".join(parts)
+            final = await self._postprocess_synthesis(content, query, successful)
+            tail = self._stream_tail(content, final)
+            if tail:
+                yield tail
+
+            yield MixedResult(
+                content=final,
+                weights=weights,
+                quality_score=self._estimate_quality(final, successful),
+                metadata=self._with_cut_off(metadata, cut_off_ids)
+            )
 
         except Exception as e:
             raise MixingException(f"Result mixing failed: {e}")
 
+    @staticmethod
+    def _cut_off_expert_ids(expert_results: List[ExpertResult]) -> List[str]:
+        """IDs of experts the executor cancelled (overall timeout or quorum)."""
+        return [r.expert_id for r in expert_results if getattr(r, "cut_off", False)]
+
+    @staticmethod
+    def _with_cut_off(metadata: Dict[str, Any] | None, cut_off_ids: List[str]) -> Dict[str, Any] | None:
+        """Record cut-off experts in result metadata (unchanged if there are none)."""
+        if not cut_off_ids:
+            return metadata
+        return {**(metadata or {}), "cut_off_experts": list(cut_off_ids)}
+
+    @staticmethod
+    def _stream_tail(streamed: str, final: str) -> str:
+        """
+        Return the text post-processing appended after `streamed`.
+
+        Post-processing strips trailing whitespace before appending, so the
+        comparison is made against the right-stripped stream. Returns "" if
+        the final text does not extend the streamed prefix.
+        """
+        if final.startswith(streamed):
+            return final[len(streamed):]
+        stripped = streamed.rstrip()
+        if final.startswith(stripped):
+            return final[len(stripped):]
+        from loguru import logger
+        logger.warning("[ResultMixer] Post-processing rewrote streamed text; final result is authoritative")
+        return ""
+
+    @staticmethod
+    def _streamable_length(text: str) -> int:
+        """
+        Length of the prefix of `text` that can be streamed safely.
+
+        Holds back an unclosed ```json block (and a fence whose info string is
+        still incomplete) plus trailing backticks that may start a fence.
+        """
+        fences = [m.start() for m in re.finditer("```", text)]
+        if len(fences) % 2 == 1:
+            start = fences[-1]
+            info_end = text.find("\n", start + 3)
+            if info_end == -1 or text[start + 3:info_end].strip().lower() == "json":
+                return start
+
+        trailing = len(text) - len(text.rstrip("`"))
+        return len(text) - (trailing % 3)
+
+    async def _postprocess_synthesis(
+        self,
+        content: str,
+        query: str,
+        successful: List[ExpertResult]
+    ) -> str:
+        """
+        Restore interactive JSON blocks and auto-inject maps after synthesis.
+
+        All steps only append to the synthesized text, so when synthesis was
+        streamed the additions can be emitted as a tail.
+
+        Args:
+            content: Synthesized content
+            query: Original query
+            successful: Successful expert results
+
+        Returns:
+            Post-processed content
+        """
+        # Enhanced JSON block preservation with post-synthesis validation
+        original_blocks = []
+        for result in successful:
+            original_blocks.extend(self._extract_interactive_json_blocks(result.output))
+
+        # Deterministically preserve any interactive visualization blocks produced by experts.
+        # Rationale: even with strong prompting, LLM synthesis can omit code blocks; the UI
+        # depends on these blocks (e.g., interactive maps) to render rich components.
+        content = self._append_missing_interactive_blocks(
+            content,
+            [r.output for r in successful]
+        )
+
+        # Post-synthesis validation: Ensure all original JSON blocks are preserved
+        content = self._validate_and_restore_json_blocks(
+            content, 
+            original_blocks,
+            query
+        )
+
+        # Enhanced defense-in-depth: If this is a route/directions query and no map was generated,
+        # try to auto-inject one from route information in the response
+        from loguru import logger
+        if not self._has_interactive_map(content):
+            logger.info("[ResultMixer] No interactive map in synthesized response, attempting auto-injection")
+            content = self._auto_inject_missing_maps(content, query, successful)
+
+            # FINAL FALLBACK: Geocode addresses from response text and inject places map
+            # This handles cases where Yelp/other agents return addresses without coordinates
+            if not self._has_interactive_map(content):
+                logger.info("[ResultMixer] Fallback to geocoding-based map injection")
+                content = await self._auto_inject_map_via_geocoding(content, query, successful)
+            else:
+                logger.info("[ResultMixer] Map successfully auto-injected from coordinates")
+        else:
+            logger.info("[ResultMixer] Interactive map already present in synthesized response")
+
+            # Even if map is present, check if it has valid coordinates
+            # If not, try to enhance it with geocoded coordinates
+            json_blocks = self._extract_interactive_json_blocks(content)
+            if json_blocks:
+                for block in json_blocks:
+                    try:
+                        import json
+                        json_obj = json.loads(block.replace("```json\n", "").replace("\n```", ""))
+                        config = json_obj.get("config", {})
+                        markers = config.get("markers", [])
+
+                        # Check if markers have null coordinates
+                        has_null_coords = any(
+                            m.get("lat") is None or m.get("lng") is None 
+                            for m in markers if isinstance(m, dict)
+                        )
+
+                        if has_null_coords:
+                            logger.warning("[ResultMixer] Map present but has null coordinates - attempting geocoding enhancement")
+                            enhanced_content = await self._auto_inject_map_via_geocoding(content, query, successful)
+                            if enhanced_content != content:
+                                content = enhanced_content
+                                logger.info("[ResultMixer] Successfully enhanced map with geocoded coordinates")
+                    except Exception as e:
+                        logger.debug(f"[ResultMixer] Error checking map coordinates: {e}")
+                        continue
+
+        return content
+
     # Multiple regex patterns for robust JSON block detection
     _JSON_FENCE_RE = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL | re.IGNORECASE)
     _JSON_FENCE_ALT_RE = re.compile(r"```JSON\s*(.*?)\s*```", re.DOTALL)  # Case-sensitive JSON
@@ -704,7 +869,8 @@ class WeightedMixer(IResultMixer):
         self,
         results: List[ExpertResult],
         weights: Dict[str, float],
-        query: str
+        query: str,
+        cut_off_ids: Optional[List[str]] = None
     ) -> MixedResult:
         """
         Synthesize using LLM.
@@ -715,72 +881,20 @@ class WeightedMixer(IResultMixer):
             results: Expert results
             weights: Normalized weights
             query: Original query
+            cut_off_ids: Experts cancelled before answering (noted in the prompt)
 
         Returns:
             MixedResult with synthesized content
         """
-        from openai import AsyncOpenAI
-
         # Initialize OpenAI client
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise MixingException("OPENAI_API_KEY not set")
 
-        client = AsyncOpenAI(api_key=api_key)
+        client = get_llm_gateway().bind("moe.mixer", api_key=api_key)
         model_config = self._config.models.get("mixing")
 
-        # Format weighted results
-        weighted_results = "\n\n".join([
-            f"[Expert: {r.expert_id} - Confidence: {weights.get(r.expert_id, 0.0):.2f}]\n{r.output}"
-            for r in results
-        ])
-
-        # Get synthesis prompt from config, with fallback to default
-        prompt_template = self._config.moe.get("synthesis_prompt")
-        if not prompt_template:
-            # Fallback to default prompt if not configured
-            # NOTE: This produces DETAILED MARKDOWN for the Chat Interface.
-            # Voice Mode will separately summarize this output for spoken audio.
-            prompt_template = """Synthesize the following expert responses into a comprehensive, well-structured answer.
-
-Expert Responses:
-{weighted_results}
-
-Original Query: {query}
-
-OUTPUT FORMAT - DETAILED MARKDOWN FOR CHAT INTERFACE:
-Produce a rich, detailed response with proper markdown formatting:
-
-STRUCTURE GUIDELINES:
-- Use ## headings for main sections, ### for subsections
-- Use **bold** for business names, key terms, and important points
-- Use bullet points (-) for listing items, features, or options
-- Use numbered lists (1. 2. 3.) for step-by-step instructions or ranked results
-- Include all relevant details: ratings, addresses, phone numbers, hours, prices
-- Format links as [Text](url) for clickable references
-
-CONTENT REQUIREMENTS:
-- Combine ALL relevant information from expert responses
-- Weight responses by their confidence scores (higher weight = more reliable)
-- Resolve contradictions by favoring higher-weighted experts
-- Include specific details: ratings (e.g., "4.5 ⭐"), addresses, contact info
-- Maintain factual accuracy - do not invent information
-- For coordinates/lat-lng, only include inside json blocks (not in prose)
-
-CRITICAL - PRESERVE INTERACTIVE CONTENT:
-- If any expert response contains a ```json code block (especially with "type": "interactive_map"),
-  YOU MUST include that EXACT ```json block in your synthesized response
-- These JSON blocks are essential for rendering interactive maps, graphs, and visualizations
-- DO NOT summarize, paraphrase, or remove ```json blocks - copy them verbatim
-- Place the ```json block at the appropriate location in your response (usually at the end)
-
-Synthesized Response:"""
-
-        # Format prompt with template variables
-        prompt = prompt_template.format(
-            weighted_results=weighted_results,
-            query=query
-        )
+        prompt = self._build_synthesis_prompt(results, weights, query, cut_off_ids)
 
         try:
             response = await client.chat.completions.create(
@@ -828,25 +942,200 @@ Synthesized Response:"""
         except Exception as e:
             # Fail open: return the best available expert output instead of raising,
             # so MoE can still provide meaningful results (and not 400).
-            try:
-                best = None
-                best_w = -1.0
-                for r in results:
-                    w = weights.get(r.expert_id, 0.0)
-                    if r.output and w >= best_w:
-                        best_w = w
-                        best = r.output
-                fallback_content = best or (results[0].output if results and results[0].output else "")
-            except Exception:
-                fallback_content = ""
+            fallback_content = self._best_expert_output(results, weights)
 
             return MixedResult(
-                content=fallback_content or "I’m having trouble synthesizing results right now, but here’s what I found so far.",
+                content=fallback_content or self._SYNTHESIS_FAILED_MESSAGE,
                 weights=weights,
                 quality_score=self._estimate_quality(fallback_content or "", results),
                 metadata={"error": f"synthesis_failed: {e}"},
             )
 
+    async def _llm_synthesis_stream(
+        self,
+        results: List[ExpertResult],
+        weights: Dict[str, float],
+        query: str,
+        metadata: Dict[str, Any],
+        cut_off_ids: Optional[List[str]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Synthesize using LLM with token streaming.
+
+        Streaming counterpart of _llm_synthesis. Deltas are buffered only while
+        an interactive ```json block is open. Fails open like _llm_synthesis:
+        if nothing was streamed, the best expert output is yielded instead; if
+        the stream breaks midway, the partial synthesis is kept.
+
+        Args:
+            results: Expert results
+            weights: Normalized weights
+            query: Original query
+            metadata: Dict populated with synthesis metadata (model, tokens, error)
+            cut_off_ids: Experts cancelled before answering (noted in the prompt)
+
+        Yields:
+            Text deltas
+        """
+        model_config = self._config.models.get("mixing")
+        metadata.update({
+            "model": model_config.name,
+            "synthesis_tokens": 0,
+            "expert_count": len(results),
+            "streamed": True,
+        })
+
+        emitted = ""
+        pending = ""
+        try:
+            api_key = os.getenv("OPENAI_API_KEY")
+            if not api_key:
+                raise MixingException("OPENAI_API_KEY not set")
+
+            client = get_llm_gateway().bind("moe.mixer", api_key=api_key)
+            prompt = self._build_synthesis_prompt(results, weights, query, cut_off_ids)
+
+            stream = await client.chat.completions.create(
+                model=model_config.name,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=model_config.temperature,
+                max_tokens=model_config.max_tokens,
+                stream=True,
+                stream_options={"include_usage": True}
+            )
+
+            async for chunk in stream:
+                usage = getattr(chunk, "usage", None)
+                if usage is not None:
+                    metadata["synthesis_tokens"] = getattr(usage, "total_tokens", 0) or 0
+
+                choices = getattr(chunk, "choices", None) or []
+                if not choices:
+                    continue
+                delta = getattr(getattr(choices[0], "delta", None), "content", None)
+                if not delta:
+                    continue
+
+                pending += delta
+                safe = self._streamable_length(emitted + pending) - len(emitted)
+                if safe > 0:
+                    emitted += pending[:safe]
+                    yield pending[:safe]
+                    pending = pending[safe:]
+
+            if pending:
+                emitted += pending
+                yield pending
+                pending = ""
+
+            if not emitted.strip():
+                raise MixingException("OpenAI synthesis stream produced no content")
+
+        except Exception as e:
+            metadata["error"] = f"synthesis_failed: {e}"
+            if pending:
+                # Keep whatever the model produced before the stream broke
+                yield pending
+            elif not emitted.strip():
+                yield self._best_expert_output(results, weights) or self._SYNTHESIS_FAILED_MESSAGE
+
+    _SYNTHESIS_FAILED_MESSAGE = "I’m having trouble synthesizing results right now, but here’s what I found so far."
+
+    @staticmethod
+    def _best_expert_output(results: List[ExpertResult], weights: Dict[str, float]) -> str:
+        """Return the highest-weighted non-empty expert output (synthesis fallback)."""
+        try:
+            best = None
+            best_w = -1.0
+            for r in results:
+                w = weights.get(r.expert_id, 0.0)
+                if r.output and w >= best_w:
+                    best_w = w
+                    best = r.output
+            return best or (results[0].output if results and results[0].output else "")
+        except Exception:
+            return ""
+
+    def _build_synthesis_prompt(
+        self,
+        results: List[ExpertResult],
+        weights: Dict[str, float],
+        query: str,
+        cut_off_ids: Optional[List[str]] = None
+    ) -> str:
+        """
+        Build the synthesis prompt from the configured template.
+
+        Args:
+            results: Expert results
+            weights: Normalized weights
+            query: Original query
+            cut_off_ids: Experts cancelled before answering, listed after the
+                expert responses so the synthesis does not invent their part
+
+        Returns:
+            Formatted prompt
+        """
+        # Format weighted results
+        weighted_results = "\n\n".join([
+            f"[Expert: {r.expert_id} - Confidence: {weights.get(r.expert_id, 0.0):.2f}]\n{r.output}"
+            for r in results
+        ])
+        if cut_off_ids:
+            weighted_results += (
+                f"\n\n[Note: {', '.join(cut_off_ids)} did not respond in time. "
+                "Do not make up information from their domains; say briefly that "
+                "this part of the answer may be incomplete if it matters to the query.]"
+            )
+
+        # Get synthesis prompt from config, with fallback to default
+        prompt_template = self._config.moe.get("synthesis_prompt")
+        if not prompt_template:
+            # Fallback to default prompt if not configured
+            # NOTE: This produces DETAILED MARKDOWN for the Chat Interface.
+            # Voice Mode will separately summarize this output for spoken audio.
+            prompt_template = """Synthesize the following expert responses into a comprehensive, well-structured answer.
+
+Expert Responses:
+{weighted_results}
+
+Original Query: {query}
+
+OUTPUT FORMAT - DETAILED MARKDOWN FOR CHAT INTERFACE:
+Produce a rich, detailed response with proper markdown formatting:
+
+STRUCTURE GUIDELINES:
+- Use ## headings for main sections, ### for subsections
+- Use **bold** for business names, key terms, and important points
+- Use bullet points (-) for listing items, features, or options
+- Use numbered lists (1. 2. 3.) for step-by-step instructions or ranked results
+- Include all relevant details: ratings, addresses, phone numbers, hours, prices
+- Format links as [Text](url) for clickable references
+
+CONTENT REQUIREMENTS:
+- Combine ALL relevant information from expert responses
+- Weight responses by their confidence scores (higher weight = more reliable)
+- Resolve contradictions by favoring higher-weighted experts
+- Include specific details: ratings (e.g., "4.5 ⭐"), addresses, contact info
+- Maintain factual accuracy - do not invent information
+- For coordinates/lat-lng, only include inside json blocks (not in prose)
+
+CRITICAL - PRESERVE INTERACTIVE CONTENT:
+- If any expert response contains a ```json code block (especially with "type": "interactive_map"),
+  YOU MUST include that EXACT ```json block in your synthesized response
+- These JSON blocks are essential for rendering interactive maps, graphs, and visualizations
+- DO NOT summarize, paraphrase, or remove ```json blocks - copy them verbatim
+- Place the ```json block at the appropriate location in your response (usually at the end)
+
+Synthesized Response:"""
+
+        # Format prompt with template variables
+        prompt = prompt_template.format(
+            weighted_results=weighted_results,
+            query=query
+        )
+        return prompt
+
     def _estimate_quality(self, content: str, results: List[ExpertResult]) -> float:
         """
         Estimate synthesis quality using simple heuristics.
@@ -8,8 +8,10 @@ than keyword-based approaches.
 Architecture:
 - Uses pluggable IEmbeddingProvider for flexibility
 - Defaults to cached OpenAI embeddings for <50ms selection
-- Pre-computes expert embeddings once at initialization
-- O(k) similarity computation where k = number of experts (~6)
+- Pre-computes expert embeddings once at initialization, normalized into
+  one float32 matrix: scoring is one mat-vec per query
+- select_batch embeds N queries in one call and scores them with one
+  matrix product
 
 Performance:
 - First query: ~2000ms (OpenAI API call)
@@ -21,6 +23,7 @@ from dotenv import load_dotenv, find_dotenv
 load_dotenv(find_dotenv())
 
 from typing import List, Dict, Optional
+import asyncio
 import os
 import time
 import numpy as np
@@ -32,7 +35,14 @@ from asdrp.orchestration.moe.exceptions import ExpertSelectionException
 from asdrp.orchestration.moe.embedding_providers import (
     IEmbeddingProvider,
     OpenAIEmbeddingProvider,
-    CachedEmbeddingProvider
+    LocalEmbeddingProvider,
+    CachedEmbeddingProvider,
+    QueryEmbeddingContext
+)
+from asdrp.orchestration.moe.embedding_store import (
+    DEFAULT_MAX_ENTRIES,
+    EmbeddingStore,
+    get_embedding_store
 )
 
 
@@ -54,7 +64,7 @@ class SemanticSelector(IExpertSelector):
     Performance Optimization:
     - Uses CachedEmbeddingProvider for <50ms query embedding generation
     - Pre-computes expert embeddings once during initialization
-    - Cosine similarity computation is O(k) where k = number of experts
+    - Experts are scored with one product against a pre-normalized matrix
 
     Example:
         "San Carlos" → high similarity with location expert
@@ -73,37 +83,73 @@ class SemanticSelector(IExpertSelector):
         Args:
             config: MoE configuration
             embedding_provider: Optional custom embedding provider.
-                If not provided, creates cached OpenAI provider automatically.
+                If not provided, creates the cached provider selected by
+                moe.embedding_provider (OpenAI by default, or local).
 
         Raises:
-            ValueError: If OpenAI API key not set and no provider given
+            ValueError: If the OpenAI provider is selected, its API key is not
+                set and no provider is given
         """
         self._config = config
         self._expert_embeddings: Optional[Dict[str, np.ndarray]] = None
         self._expert_descriptions: Dict[str, str] = {}
+        # Unit-length expert embeddings (one row per expert, float32) for scoring
+        self._expert_names: List[str] = []
+        self._expert_matrix: Optional[np.ndarray] = None
+        self._init_lock = asyncio.Lock()
 
         # Initialize embedding provider with dependency injection
         if embedding_provider is not None:
             # Use injected provider (enables testing and custom implementations)
             self._provider = embedding_provider
             logger.info(f"[SemanticSelector] Using injected embedding provider: {type(embedding_provider).__name__}")
+        elif config.embedding_provider == "local":
+            # Offline hashed n-gram embeddings (no API key, computed in-process)
+            self._provider = CachedEmbeddingProvider(
+                provider=LocalEmbeddingProvider(),
+                max_size=10000,
+                enable_logging=False
+            )
+            logger.info("[SemanticSelector] Using local embedding provider")
         else:
             # Default: Create cached OpenAI provider
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError(
                     "OPENAI_API_KEY environment variable not set. "
-                    "Semantic selector requires OpenAI API access."
+                    "Semantic selector requires OpenAI API access "
+                    "(or moe.embedding_provider: local)."
                 )
 
             base_provider = OpenAIEmbeddingProvider(api_key=api_key)
             self._provider = CachedEmbeddingProvider(
                 provider=base_provider,
                 max_size=10000,  # Cache up to 10K unique queries
-                enable_logging=True
+                enable_logging=True,
+                store=self._get_embedding_store(config)
             )
             logger.info("[SemanticSelector] Using cached OpenAI embedding provider")
 
+    @staticmethod
+    def _get_embedding_store(config: MoEConfig) -> Optional[EmbeddingStore]:
+        """Persistent embedding store from cache.storage.embeddings_path, if configured."""
+        storage = config.cache.storage or {}
+        path = storage.get("embeddings_path")
+        if not path:
+            return None
+        try:
+            return get_embedding_store(
+                path, max_entries=storage.get("embeddings_max_entries", DEFAULT_MAX_ENTRIES)
+            )
+        except Exception as e:
+            logger.warning(f"[SemanticSelector] Embedding store unavailable ({path}): {e}")
+            return None
+
+    @property
+    def embedding_provider(self) -> IEmbeddingProvider:
+        """Embedding provider used for query embeddings (shared with SemanticCache)."""
+        return self._provider
+
     async def _initialize_embeddings(self):
         """
         Pre-compute embeddings for all expert capabilities.
@@ -115,15 +161,25 @@ class SemanticSelector(IExpertSelector):
         - Uses batch API call to generate all expert embeddings in parallel
         - Results cached by provider for future instantiations
         - Total time: ~1000ms (vs ~2000ms per expert sequentially)
+
+        Concurrent callers (e.g. startup warm-up and an early request) wait
+        for one initialization; embeddings are published only once complete.
         """
         if self._expert_embeddings is not None:
             return  # Already initialized
 
+        async with self._init_lock:
+            if self._expert_embeddings is not None:
+                return
+            await self._compute_expert_embeddings()
+
+    async def _compute_expert_embeddings(self):
+        """Embed all expert descriptions in one batch and publish them."""
         start_time = time.time()
         logger.info("[SemanticSelector] Initializing expert embeddings (batched)...")
 
-        self._expert_embeddings = {}
-        self._expert_to_agents = {}
+        expert_embeddings: Dict[str, np.ndarray] = {}
+        expert_to_agents: Dict[str, List[str]] = {}
 
         # Build descriptions for all experts
         expert_names = []
@@ -137,14 +193,19 @@ class SemanticSelector(IExpertSelector):
             expert_names.append(expert_name)
             descriptions.append(description)
             self._expert_descriptions[expert_name] = description
-            self._expert_to_agents[expert_name] = expert_config.agents
+            expert_to_agents[expert_name] = expert_config.agents
 
         # Batch generate embeddings for all experts
         embeddings = await self._provider.generate_batch_embeddings(descriptions)
 
         # Map embeddings to expert names
         for expert_name, embedding in zip(expert_names, embeddings):
-            self._expert_embeddings[expert_name] = embedding
+            expert_embeddings[expert_name] = embedding
+
+        self._expert_to_agents = expert_to_agents
+        self._expert_names = expert_names
+        self._expert_matrix = self._normalize_rows(np.stack(embeddings))
+        self._expert_embeddings = expert_embeddings
 
         elapsed_ms = (time.time() - start_time) * 1000
         logger.info(
@@ -152,11 +213,16 @@ class SemanticSelector(IExpertSelector):
             f"in {elapsed_ms:.0f}ms"
         )
 
+    async def warm_up(self) -> None:
+        """Compute expert embeddings ahead of the first query."""
+        await self._initialize_embeddings()
+
     async def select(
         self,
         query: str,
         k: int = 3,
-        threshold: float = 0.3
+        threshold: float = 0.3,
+        embedding_context: Optional[QueryEmbeddingContext] = None
     ) -> List[str]:
         """
         Select experts using semantic similarity with dynamic selection.
@@ -175,6 +241,8 @@ class SemanticSelector(IExpertSelector):
             query: User query
             k: Max experts to select (upper bound, not fixed)
             threshold: Min similarity score (0-1, cosine similarity)
+            embedding_context: Optional per-request context; when it was created
+                for this query its embedding is reused instead of re-embedding
 
         Returns:
             List of agent IDs (dynamically sized, 1-k agents)
@@ -189,57 +257,17 @@ class SemanticSelector(IExpertSelector):
             # Track selection latency for performance monitoring
             selection_start = time.time()
 
-            # Generate query embedding (cached after first call)
-            query_embedding = await self._provider.generate_embedding(query)
+            # Reuse the request's query embedding when available (cached after first call otherwise)
+            if embedding_context is not None and embedding_context.matches(query):
+                query_embedding = await embedding_context.get_embedding()
+            else:
+                query_embedding = await self._provider.generate_embedding(query)
 
             embedding_time_ms = (time.time() - selection_start) * 1000
             logger.debug(f"[SemanticSelector] Query embedding generated in {embedding_time_ms:.1f}ms")
 
-            # Compute similarity with each expert
-            similarities: Dict[str, float] = {}
-
-            for expert_name, expert_embedding in self._expert_embeddings.items():
-                # Cosine similarity
-                similarity = self._cosine_similarity(query_embedding, expert_embedding)
-                similarities[expert_name] = similarity
-
-            logger.debug(f"[SemanticSelector] Expert similarities: {similarities}")
-
-            # Filter by absolute threshold and sort
-            selected_experts = [
-                (expert_name, sim)
-                for expert_name, sim in similarities.items()
-                if sim >= threshold
-            ]
-            selected_experts.sort(key=lambda x: x[1], reverse=True)
-
-            # Dynamic selection with relevance gap analysis
-            # Don't force selection of k agents if they're not relevant
-            final_experts = self._apply_relevance_gap_filter(
-                selected_experts,
-                max_k=k,
-                relevance_gap_threshold=0.15
-            )
-
-            logger.info(f"[SemanticSelector] Dynamic selection: {len(final_experts)} experts from {len(selected_experts)} candidates")
-
-            # Map experts to agents
-            selected_agents = []
-            for expert_name, sim in final_experts:
-                agents = self._expert_to_agents.get(expert_name, [])
-                selected_agents.extend(agents)
-                logger.debug(f"[SemanticSelector] Expert '{expert_name}' (sim={sim:.3f}) → agents: {agents}")
-
-            # Deduplicate while preserving order
-            seen = set()
-            result = []
-            for agent_id in selected_agents:
-                if agent_id not in seen:
-                    seen.add(agent_id)
-                    result.append(agent_id)
-
-            # Limit to k agents (dynamic upper bound)
-            result = result[:k]
+            scores = self._score_experts(np.asarray(query_embedding)[np.newaxis, :])[0]
+            result = self._select_from_scores(scores, k, threshold)
 
             # Log final selection with performance metrics
             total_time_ms = (time.time() - selection_start) * 1000
@@ -247,11 +275,6 @@ class SemanticSelector(IExpertSelector):
                 f"[SemanticSelector] Selected {len(result)} agents in {total_time_ms:.1f}ms: {result}"
             )
 
-            # Fallback if no experts selected
-            if not result:
-                logger.warning("[SemanticSelector] No experts met threshold, using fallback")
-                result = self._get_fallback_experts(1)  # Single fallback agent
-
             # Log cache statistics periodically for monitoring
             if isinstance(self._provider, CachedEmbeddingProvider):
                 stats = self._provider.get_cache_stats()
@@ -268,6 +291,121 @@ class SemanticSelector(IExpertSelector):
             logger.error(f"Semantic expert selection failed: {e}")
             raise ExpertSelectionException(f"Semantic expert selection failed: {e}")
 
+    async def select_batch(
+        self,
+        queries: List[str],
+        k: int = 3,
+        threshold: float = 0.3
+    ) -> List[List[str]]:
+        """
+        Select experts for many queries at once.
+
+        Embeds all queries in one provider call and scores them against the
+        experts with a single matrix product; each row then goes through the
+        same threshold, relevance-gap and fallback rules as select(). Meant
+        for replays, evaluation runs and benchmarks.
+
+        Args:
+            queries: User queries
+            k: Max experts to select per query
+            threshold: Min similarity score (0-1, cosine similarity)
+
+        Returns:
+            List of agent ID lists, in query order
+
+        Raises:
+            ExpertSelectionException: If selection fails
+        """
+        if not queries:
+            return []
+
+        try:
+            await self._initialize_embeddings()
+
+            start = time.time()
+            embeddings = await self._provider.generate_batch_embeddings(queries)
+            if len(embeddings) != len(queries):
+                raise ValueError(
+                    f"Provider returned {len(embeddings)} embeddings for {len(queries)} queries"
+                )
+            scores = self._score_experts(np.stack(embeddings))
+            results = [self._select_from_scores(row, k, threshold) for row in scores]
+
+            elapsed_ms = (time.time() - start) * 1000
+            logger.info(
+                f"[SemanticSelector] Selected experts for {len(queries)} queries in {elapsed_ms:.1f}ms"
+            )
+            return results
+
+        except Exception as e:
+            logger.error(f"Semantic batch expert selection failed: {e}")
+            raise ExpertSelectionException(f"Semantic batch expert selection failed: {e}")
+
+    def _score_experts(self, query_embeddings: np.ndarray) -> np.ndarray:
+        """
+        Score queries against all experts.
+
+        Args:
+            query_embeddings: One query embedding per row
+
+        Returns:
+            (queries x experts) similarity matrix, cosine mapped from [-1, 1]
+            to [0, 1]; 0.0 where a query or expert embedding is all zeros
+        """
+        queries = self._normalize_rows(query_embeddings)
+        cosine = queries @ self._expert_matrix.T
+        scores = (cosine + 1) / 2
+        # Zero vectors have no direction: score them 0 rather than "unrelated" (0.5)
+        scores[~queries.any(axis=1), :] = 0.0
+        scores[:, ~self._expert_matrix.any(axis=1)] = 0.0
+        return scores
+
+    def _select_from_scores(self, scores: np.ndarray, k: int, threshold: float) -> List[str]:
+        """
+        Turn one query's expert scores into agent IDs.
+
+        Applies the absolute threshold and relevance gap filter, maps experts
+        to their agents (deduplicated, at most k) and falls back to a general
+        agent when no expert qualifies.
+        """
+        similarities = dict(zip(self._expert_names, scores.tolist()))
+        logger.debug(f"[SemanticSelector] Expert similarities: {similarities}")
+
+        # Filter by absolute threshold and sort
+        selected_experts = [
+            (expert_name, sim)
+            for expert_name, sim in similarities.items()
+            if sim >= threshold
+        ]
+        selected_experts.sort(key=lambda x: x[1], reverse=True)
+
+        # Dynamic selection with relevance gap analysis
+        # Don't force selection of k agents if they're not relevant
+        final_experts = self._apply_relevance_gap_filter(
+            selected_experts,
+            max_k=k,
+            relevance_gap_threshold=self._config.embedding_threshold("relevance_gap_threshold", 0.15)
+        )
+
+        logger.debug(f"[SemanticSelector] Dynamic selection: {len(final_experts)} experts from {len(selected_experts)} candidates")
+
+        # Map experts to agents
+        selected_agents = []
+        for expert_name, sim in final_experts:
+            agents = self._expert_to_agents.get(expert_name, [])
+            selected_agents.extend(agents)
+            logger.debug(f"[SemanticSelector] Expert '{expert_name}' (sim={sim:.3f}) → agents: {agents}")
+
+        # Deduplicate while preserving order, limit to k agents (dynamic upper bound)
+        result = list(dict.fromkeys(selected_agents))[:k]
+
+        # Fallback if no experts selected
+        if not result:
+            logger.warning("[SemanticSelector] No experts met threshold, using fallback")
+            result = self._get_fallback_experts(1)  # Single fallback agent
+
+        return result
+
     @staticmethod
     def _apply_relevance_gap_filter(
         sorted_experts: List[tuple[str, float]],
@@ -317,28 +455,11 @@ class SemanticSelector(IExpertSelector):
         return selected
 
     @staticmethod
-    def _cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
-        """
-        Compute cosine similarity between two vectors.
-
-        Args:
-            a: First vector
-            b: Second vector
-
-        Returns:
-            Cosine similarity (0-1 range after normalization)
-        """
-        dot_product = np.dot(a, b)
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
-
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-
-        similarity = dot_product / (norm_a * norm_b)
-
-        # Convert from [-1, 1] to [0, 1] range
-        return (similarity + 1) / 2
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """Scale each row to unit length as float32 (all-zero rows stay zero)."""
+        matrix = np.asarray(matrix, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
 
     def _get_fallback_experts(self, k: int) -> List[str]:
         """
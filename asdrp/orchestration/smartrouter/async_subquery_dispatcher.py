@@ -15,28 +15,86 @@ Responsibilities:
 ----------------
 - Execute subqueries on target agents asynchronously
 - Handle timeouts and retries
+- Run subqueries within the process-wide ExecutionScheduler limits
 - Capture and wrap agent errors
 - Support both single and batch dispatch
+- Schedule batches by subquery dependencies (each subquery starts as soon
+  as its own dependencies finish) and pass dependency outputs as context
 - Maintain execution order and context
 """
 
-from typing import List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any
+from dataclasses import replace
 import asyncio
 import logging
+import time
 from datetime import datetime
 
 from agents import Runner
 
+from asdrp.agents.execution_scheduler import AdmissionError, get_execution_scheduler
 from asdrp.orchestration.smartrouter.interfaces import (
     ISubqueryDispatcher,
     Subquery,
     AgentResponse,
 )
 from asdrp.orchestration.smartrouter.exceptions import DispatchException
-from asdrp.orchestration.smartrouter.config_loader import ErrorHandlingConfig
+from asdrp.orchestration.smartrouter.config_loader import ErrorHandlingConfig, HistoryConfig
+from asdrp.orchestration.smartrouter.history_window import bound_session, current_session_id
 
 logger = logging.getLogger(__name__)
 
+# Maximum characters of a dependency's output passed to its dependents
+MAX_DEPENDENCY_CONTEXT_CHARS = 4000
+
+
+def critical_path(responses: List[AgentResponse]) -> Dict[str, Any]:
+    """
+    Compute the critical path of a dispatch_all() batch.
+
+    Starts at the subquery that finished last and follows the dependency
+    each subquery waited on last, so the path is the chain of subqueries
+    that determined the batch latency.
+
+    Args:
+        responses: Responses returned by dispatch_all()
+
+    Returns:
+        Dictionary with "path" (subquery IDs, first to last), "duration"
+        (seconds from batch start to the last finish) and "timeline" (one
+        entry per subquery with its schedule)
+    """
+    schedules = {
+        r.subquery_id: (r.metadata or {}).get("schedule")
+        for r in responses
+    }
+    schedules = {sq_id: s for sq_id, s in schedules.items() if s}
+    if not schedules:
+        return {"path": [], "duration": 0.0, "timeline": []}
+
+    timeline = [
+        {
+            "subquery_id": r.subquery_id,
+            "agent_id": r.agent_id,
+            "success": r.success,
+            **schedules[r.subquery_id],
+        }
+        for r in responses
+        if r.subquery_id in schedules
+    ]
+
+    last = max(schedules, key=lambda sq_id: schedules[sq_id]["finished_at"])
+    path = [last]
+    while schedules[path[-1]].get("waited_on") in schedules:
+        path.append(schedules[path[-1]]["waited_on"])
+    path.reverse()
+
+    return {
+        "path": path,
+        "duration": schedules[last]["finished_at"],
+        "timeline": timeline,
+    }
+
 
 class AsyncSubqueryDispatcher(ISubqueryDispatcher):
     """
@@ -66,7 +124,8 @@ class AsyncSubqueryDispatcher(ISubqueryDispatcher):
         agent_factory: Any,  # AgentFactory instance
         error_config: ErrorHandlingConfig,
         session_id: Optional[str] = None,
-        session: Optional[Any] = None  # SQLiteSession or None
+        session: Optional[Any] = None,  # SQLiteSession or None
+        history_config: Optional[HistoryConfig] = None
     ):
         """
         Initialize AsyncSubqueryDispatcher.
@@ -76,11 +135,13 @@ class AsyncSubqueryDispatcher(ISubqueryDispatcher):
             error_config: Error handling configuration (timeouts, retries)
             session_id: Optional session ID for stateful agents
             session: Optional session object to use (takes precedence over session_id)
+            history_config: Optional policy bounding the history replayed to agents
         """
         self.agent_factory = agent_factory
         self.error_config = error_config
         self.session_id = session_id
         self.session = session
+        self.history_config = history_config
 
     async def dispatch(
         self,
@@ -178,6 +239,24 @@ class AsyncSubqueryDispatcher(ISubqueryDispatcher):
                     }
                 )
 
+            except AdmissionError as e:
+                # Load was shed: retrying would only add to the queue
+                logger.warning(f"Subquery {subquery.id} rejected: {e.message}")
+                return AgentResponse(
+                    subquery_id=subquery.id,
+                    agent_id=agent_id,
+                    content="",
+                    success=False,
+                    error=e.message,
+                    metadata={
+                        "attempts": attempt + 1,
+                        "error_type": type(e).__name__,
+                        "shed": True,
+                        "retry_after": e.retry_after,
+                        "execution_time": (datetime.now() - start_time).total_seconds(),
+                    }
+                )
+
             except Exception as e:
                 last_error = e
                 logger.warning(
@@ -222,10 +301,17 @@ class AsyncSubqueryDispatcher(ISubqueryDispatcher):
         timeout: Optional[float] = None
     ) -> List[AgentResponse]:
         """
-        Dispatch multiple subqueries concurrently.
+        Dispatch multiple subqueries, honoring their dependencies.
+
+        Each subquery starts as soon as its own dependencies have finished
+        (no waves), with their outputs appended to its text as context.
+        Independent subqueries run concurrently. A subquery whose dependency
+        failed is not executed and fails with a dependency error.
 
-        Executes all subqueries in parallel using asyncio.gather.
-        Returns responses in the same order as input.
+        Responses are returned in the same order as input. Each response's
+        metadata["schedule"] records when the subquery became ready, started
+        and finished (seconds from batch start) and which dependency it
+        waited on last; see critical_path().
 
         Args:
             subqueries: List of (subquery, agent_id) tuples
@@ -235,14 +321,14 @@ class AsyncSubqueryDispatcher(ISubqueryDispatcher):
             List of AgentResponse objects (includes errors)
 
         Raises:
-            DispatchException: If dispatch system fails critically
+            DispatchException: If dependencies are cyclic or dispatch fails critically
 
         Examples:
         ---------
         >>> subqueries = [
-        ...     (subquery1, "geo"),
-        ...     (subquery2, "finance"),
-        ...     (subquery3, "one")
+        ...     (subquery1, "geo"),        # sq1
+        ...     (subquery2, "finance"),    # sq2
+        ...     (subquery3, "one")         # sq3, depends on sq1
         ... ]
         >>> responses = await dispatcher.dispatch_all(subqueries, timeout=30)
         >>> print(f"{len(responses)} responses received")
@@ -252,33 +338,167 @@ class AsyncSubqueryDispatcher(ISubqueryDispatcher):
             logger.debug("No subqueries to dispatch")
             return []
 
-        logger.info(f"Dispatching {len(subqueries)} subqueries concurrently")
+        dependencies = self._batch_dependencies(subqueries)
+        dependent_count = sum(1 for deps in dependencies.values() if deps)
+        logger.info(
+            f"Dispatching {len(subqueries)} subqueries "
+            f"({dependent_count} with dependencies)"
+        )
+
+        batch_start = time.monotonic()
+        tasks: Dict[str, asyncio.Task] = {}
+        by_id = {subquery.id: subquery for subquery, _ in subqueries}
+
+        async def run(subquery: Subquery, agent_id: str) -> AgentResponse:
+            dep_ids = dependencies[subquery.id]
+            dep_responses: List[AgentResponse] = []
+            for dep_id in dep_ids:
+                dep_responses.append(await tasks[dep_id])
+            ready_at = time.monotonic() - batch_start
+
+            # The dependency that finished last is what this subquery waited on
+            waited_on = None
+            if dep_responses:
+                waited_on = max(
+                    dep_responses,
+                    key=lambda r: r.metadata.get("schedule", {}).get("finished_at", 0.0)
+                ).subquery_id
+
+            failed = [r.subquery_id for r in dep_responses if not r.success]
+            if failed:
+                logger.warning(
+                    f"Skipping subquery {subquery.id}: dependencies {failed} failed"
+                )
+                response = AgentResponse(
+                    subquery_id=subquery.id,
+                    agent_id=agent_id,
+                    content="",
+                    success=False,
+                    error=f"Dependencies failed: {', '.join(failed)}",
+                    metadata={"error_type": "DependencyFailed"}
+                )
+                started_at = ready_at
+            else:
+                started_at = time.monotonic() - batch_start
+                response = await self.dispatch(
+                    self._with_dependency_context(subquery, dep_responses, by_id),
+                    agent_id,
+                    timeout
+                )
+
+            if response.metadata is None:
+                response.metadata = {}
+            response.metadata["schedule"] = {
+                "dependencies": list(dep_ids),
+                "waited_on": waited_on,
+                "ready_at": ready_at,
+                "started_at": started_at,
+                "finished_at": time.monotonic() - batch_start,
+            }
+            return response
 
         try:
-            # Create dispatch tasks
-            tasks = [
-                self.dispatch(subquery, agent_id, timeout)
-                for subquery, agent_id in subqueries
-            ]
+            # All tasks exist before any of them runs, so dependents can await them
+            for subquery, agent_id in subqueries:
+                tasks[subquery.id] = asyncio.ensure_future(run(subquery, agent_id))
 
-            # Execute concurrently
-            responses = await asyncio.gather(*tasks, return_exceptions=False)
+            responses = await asyncio.gather(*tasks.values())
 
             # Log summary
             success_count = sum(1 for r in responses if r.success)
             logger.info(
-                f"Batch dispatch completed: {success_count}/{len(responses)} successful"
+                f"Batch dispatch completed: {success_count}/{len(responses)} successful "
+                f"in {time.monotonic() - batch_start:.2f}s"
             )
 
-            return responses
+            return list(responses)
 
         except Exception as e:
+            for task in tasks.values():
+                task.cancel()
             raise DispatchException(
                 f"Batch dispatch failed: {str(e)}",
                 context={"subquery_count": len(subqueries)},
                 original_exception=e
             ) from e
 
+    @staticmethod
+    def _batch_dependencies(subqueries: List[Tuple[Subquery, str]]) -> Dict[str, List[str]]:
+        """
+        Resolve each subquery's dependencies within the batch.
+
+        Dependencies on subqueries outside the batch are ignored.
+
+        Raises:
+            DispatchException: If IDs are duplicated or dependencies are cyclic
+        """
+        ids = [subquery.id for subquery, _ in subqueries]
+        if len(ids) != len(set(ids)):
+            raise DispatchException(
+                "Duplicate subquery IDs in batch",
+                context={"subquery_ids": ids}
+            )
+
+        known = set(ids)
+        dependencies: Dict[str, List[str]] = {}
+        for subquery, _ in subqueries:
+            unknown = [d for d in subquery.dependencies if d not in known]
+            if unknown:
+                logger.warning(
+                    f"Subquery {subquery.id} depends on {unknown} outside this batch; ignoring"
+                )
+            dependencies[subquery.id] = [
+                d for d in dict.fromkeys(subquery.dependencies) if d in known
+            ]
+
+        # Kahn's algorithm: every subquery must become ready eventually
+        remaining = {sq_id: set(deps) for sq_id, deps in dependencies.items()}
+        ready = [sq_id for sq_id, deps in remaining.items() if not deps]
+        resolved = 0
+        while ready:
+            done = ready.pop()
+            resolved += 1
+            for sq_id, deps in remaining.items():
+                if done in deps:
+                    deps.discard(done)
+                    if not deps:
+                        ready.append(sq_id)
+        if resolved != len(ids):
+            cyclic = sorted(sq_id for sq_id, deps in remaining.items() if deps)
+            raise DispatchException(
+                f"Cyclic subquery dependencies: {cyclic}",
+                context={"subquery_ids": cyclic}
+            )
+
+        return dependencies
+
+    @staticmethod
+    def _with_dependency_context(
+        subquery: Subquery,
+        dep_responses: List[AgentResponse],
+        by_id: Dict[str, Subquery],
+    ) -> Subquery:
+        """Return a copy of subquery with its dependencies' outputs appended."""
+        if not dep_responses:
+            return subquery
+
+        lines = [subquery.text, "", "Context from earlier steps:"]
+        for response in dep_responses:
+            dep_text = by_id[response.subquery_id].text
+            content = response.content
+            if len(content) > MAX_DEPENDENCY_CONTEXT_CHARS:
+                content = content[:MAX_DEPENDENCY_CONTEXT_CHARS] + "..."
+            lines.append(f"- {dep_text}\n  {content}")
+
+        return replace(
+            subquery,
+            text="\n".join(lines),
+            metadata={
+                **subquery.metadata,
+                "dependency_context": [r.subquery_id for r in dep_responses],
+            }
+        )
+
     async def _execute_subquery(
         self,
         subquery: Subquery,
@@ -298,6 +518,9 @@ class AsyncSubqueryDispatcher(ISubqueryDispatcher):
             Exception: Any agent execution error (caught by dispatch method)
         """
         try:
+            # Conversation of the request being routed, if bound
+            request_session_id = current_session_id(self.session_id)
+
             # Use SmartRouter's session if available, otherwise use agent factory session
             if self.session is not None:
                 # SmartRouter has its own session - use it for all agents
@@ -307,27 +530,30 @@ class AsyncSubqueryDispatcher(ISubqueryDispatcher):
                     f"Using SmartRouter session for agent '{agent_id}' "
                     "in subquery dispatcher"
                 )
-            elif self.session_id:
+            elif request_session_id:
                 agent, session = await self.agent_factory.get_agent_with_session(
                     agent_id,
-                    session_id=self.session_id  # ✅ Shared session for cross-agent context
+                    session_id=request_session_id  # ✅ Shared session for cross-agent context
                 )
                 logger.debug(
-                    f"Using shared session '{self.session_id}' for agent '{agent_id}' "
+                    f"Using shared session '{request_session_id}' for agent '{agent_id}' "
                     "in subquery dispatcher"
                 )
             else:
                 agent = await self.agent_factory.get_agent(agent_id)
                 session = None
+            session = bound_session(session, self.history_config)
 
             # Execute subquery
             logger.debug(f"Executing subquery {subquery.id} on agent {agent_id}")
 
-            run_result = await Runner.run(
-                starting_agent=agent,
-                input=subquery.text,
-                session=session
-            )
+            session_id = request_session_id or getattr(session, "session_id", None)
+            async with get_execution_scheduler().slot(agent_id, session_id=session_id):
+                run_result = await Runner.run(
+                    starting_agent=agent,
+                    input=subquery.text,
+                    session=session
+                )
 
             # Extract response content
             content = str(run_result.final_output)
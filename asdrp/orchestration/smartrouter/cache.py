@@ -15,6 +15,8 @@ Design Principles:
 Performance Impact:
 -------------------
 - CapabilityCache: ~50-100ms reduction per query (routing phase)
+- PlanCache: one or two LLM calls (interpretation, decomposition) per
+  repeated query
 - ConfigCache: ~20-30ms reduction (config lookups)
 - Agent warm-up: ~200-300ms reduction (first execution only)
 
@@ -26,171 +28,28 @@ Usage:
 """
 
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
+from pathlib import Path
 from threading import Lock
+import json
+import re
+import sqlite3
 import time
 import logging
-from collections import OrderedDict
 
-logger = logging.getLogger(__name__)
-
-
-@dataclass
-class CacheEntry:
-    """
-    Single cache entry with value and metadata.
-
-    Attributes:
-        value: Cached data
-        created_at: Timestamp when entry was created
-        accessed_at: Timestamp of last access
-        access_count: Number of times accessed
-        ttl_seconds: Time-to-live in seconds (None = no expiry)
-    """
-    value: Any
-    created_at: float = field(default_factory=time.time)
-    accessed_at: float = field(default_factory=time.time)
-    access_count: int = 0
-    ttl_seconds: Optional[float] = None
-
-    def is_expired(self) -> bool:
-        """Check if entry has expired based on TTL."""
-        if self.ttl_seconds is None:
-            return False
-        return (time.time() - self.created_at) > self.ttl_seconds
-
-    def access(self) -> Any:
-        """Mark entry as accessed and return value."""
-        self.accessed_at = time.time()
-        self.access_count += 1
-        return self.value
-
-
-class LRUCache:
-    """
-    Thread-safe LRU cache with optional TTL support.
+import numpy as np
 
-    This is a generic cache implementation that can be used for any data type.
-    Uses OrderedDict for O(1) access and LRU eviction.
-
-    Attributes:
-        max_size: Maximum number of entries
-        ttl_seconds: Default time-to-live for entries (None = no expiry)
-
-    Metrics:
-        hits: Number of cache hits
-        misses: Number of cache misses
-        evictions: Number of entries evicted due to size
-        expirations: Number of entries expired due to TTL
-    """
-
-    def __init__(self, max_size: int = 1000, ttl_seconds: Optional[float] = None):
-        """
-        Initialize LRU cache.
-
-        Args:
-            max_size: Maximum number of entries (default: 1000)
-            ttl_seconds: Time-to-live in seconds (None = no expiry)
-        """
-        self.max_size = max_size
-        self.ttl_seconds = ttl_seconds
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self._lock = Lock()
-
-        # Metrics
-        self._hits = 0
-        self._misses = 0
-        self._evictions = 0
-        self._expirations = 0
-
-    def get(self, key: str) -> Optional[Any]:
-        """
-        Get value from cache.
-
-        Args:
-            key: Cache key
-
-        Returns:
-            Cached value or None if not found or expired
-        """
-        with self._lock:
-            if key not in self._cache:
-                self._misses += 1
-                return None
-
-            entry = self._cache[key]
-
-            # Check expiration
-            if entry.is_expired():
-                logger.debug(f"Cache expired: {key}")
-                del self._cache[key]
-                self._expirations += 1
-                self._misses += 1
-                return None
-
-            # Move to end (most recently used)
-            self._cache.move_to_end(key)
-            self._hits += 1
-
-            return entry.access()
-
-    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
-        """
-        Set value in cache.
-
-        Args:
-            key: Cache key
-            value: Value to cache
-            ttl_seconds: Optional TTL override (uses default if None)
-        """
-        with self._lock:
-            # Use provided TTL or default
-            ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
-
-            # Create entry
-            entry = CacheEntry(value=value, ttl_seconds=ttl)
-
-            # Update or add entry
-            if key in self._cache:
-                del self._cache[key]
-
-            self._cache[key] = entry
-            self._cache.move_to_end(key)
-
-            # Evict if over size
-            if len(self._cache) > self.max_size:
-                evicted_key = next(iter(self._cache))
-                del self._cache[evicted_key]
-                self._evictions += 1
-                logger.debug(f"Cache evicted: {evicted_key}")
-
-    def clear(self) -> None:
-        """Clear all cache entries."""
-        with self._lock:
-            self._cache.clear()
-            logger.info("Cache cleared")
-
-    def get_metrics(self) -> Dict[str, int]:
-        """
-        Get cache metrics.
-
-        Returns:
-            Dictionary with hits, misses, hit_rate, size, evictions, expirations
-        """
-        with self._lock:
-            total_requests = self._hits + self._misses
-            hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
+from asdrp.util.lru_cache import CacheEntry, LRUCache
+from asdrp.orchestration.smartrouter.config_loader import PlanCacheConfig
+from asdrp.orchestration.smartrouter.interfaces import (
+    QueryIntent,
+    QueryComplexity,
+    Subquery,
+    RoutingPattern,
+)
 
-            return {
-                "hits": self._hits,
-                "misses": self._misses,
-                "hit_rate": hit_rate,
-                "size": len(self._cache),
-                "max_size": self.max_size,
-                "evictions": self._evictions,
-                "expirations": self._expirations,
-            }
+logger = logging.getLogger(__name__)
 
 
 class CapabilityCache:
@@ -287,6 +146,245 @@ class RoutingCache(LRUCache):
         self.set(capability, agent_id)
 
 
+def normalize_query(query: str) -> str:
+    """Normalize query text for plan lookup (case, whitespace, trailing punctuation)."""
+    return re.sub(r"\s+", " ", query.lower()).strip().rstrip("?!. ")
+
+
+@dataclass
+class CachedPlan:
+    """
+    A cached query plan.
+
+    Attributes:
+        intent: Interpreted query intent
+        subqueries: Decomposition of the query (None if not decomposed yet)
+        exact: True for a lookup by query text, False for an embedding
+               neighbour (only the intent of a neighbour is reusable)
+    """
+    intent: QueryIntent
+    subqueries: Optional[List[Subquery]]
+    exact: bool = True
+
+
+def _serialize_plan(intent: QueryIntent, subqueries: Optional[List[Subquery]]) -> str:
+    # Only the reasoning of the intent metadata is kept; the rest is per-request
+    return json.dumps({
+        "complexity": intent.complexity.value,
+        "domains": intent.domains,
+        "requires_synthesis": intent.requires_synthesis,
+        "reasoning": intent.metadata.get("reasoning", ""),
+        "subqueries": None if subqueries is None else [
+            {**asdict(sq), "routing_pattern": sq.routing_pattern.value}
+            for sq in subqueries
+        ],
+    }, default=str)
+
+
+def _deserialize_plan(query: str, payload: str, exact: bool) -> CachedPlan:
+    data = json.loads(payload)
+    intent = QueryIntent(
+        original_query=query,
+        complexity=QueryComplexity(data["complexity"]),
+        domains=list(data["domains"]),
+        requires_synthesis=data["requires_synthesis"],
+        metadata={"reasoning": data.get("reasoning", ""), "plan_cache_hit": True},
+    )
+    subqueries = None
+    if exact and data.get("subqueries") is not None:
+        subqueries = [
+            Subquery(**{**sq, "routing_pattern": RoutingPattern(sq["routing_pattern"])})
+            for sq in data["subqueries"]
+        ]
+    return CachedPlan(intent=intent, subqueries=subqueries, exact=exact)
+
+
+class PlanCache(LRUCache):
+    """
+    Cache for query plans (QueryIntent + subqueries).
+
+    Plans are keyed by normalized query text. With an embedding attached,
+    a query with no exact entry can also reuse the intent of its nearest
+    cached neighbour (cosine similarity >= similarity_threshold). Subqueries
+    are only reused on an exact match, since a neighbour ("price of AAPL"
+    vs "price of MSFT") shares the classification but not the subquery text.
+
+    Entries are stored as JSON, so every hit returns fresh objects. With a
+    db_path the cache is written through to SQLite and survives restarts.
+
+    Example:
+        cache.set_plan("Weather in Paris and Berlin?", intent, subqueries)
+        plan = cache.get_plan("weather in paris and berlin")
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl_seconds: float = 86400,
+        db_path: Optional[str] = None,
+        similarity_threshold: Optional[float] = None,
+    ):
+        """
+        Initialize plan cache.
+
+        Args:
+            max_size: Maximum number of plans kept in memory (default: 1000)
+            ttl_seconds: Time-to-live in seconds (default: 1 day)
+            db_path: Optional SQLite file for persistence
+            similarity_threshold: Minimum cosine similarity for embedding
+                                  neighbour lookups (None = exact lookups only)
+        """
+        super().__init__(max_size=max_size, ttl_seconds=ttl_seconds)
+        self.similarity_threshold = similarity_threshold
+        self._embeddings: Dict[str, np.ndarray] = {}
+        self._neighbour_hits = 0
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS plan_cache (
+                    key TEXT PRIMARY KEY,
+                    plan TEXT NOT NULL,
+                    embedding TEXT,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+            self._load_recent()
+
+    def _load_recent(self) -> None:
+        """Warm the in-memory cache with the most recent persisted plans."""
+        rows = self._conn.execute(
+            "SELECT key, plan, embedding, created_at FROM plan_cache "
+            "WHERE created_at >= ? ORDER BY created_at DESC LIMIT ?",
+            (time.time() - self.ttl_seconds, self.max_size),
+        ).fetchall()
+        with self._lock:
+            for key, plan, embedding, created_at in reversed(rows):
+                self._cache[key] = CacheEntry(
+                    value=plan, created_at=created_at, ttl_seconds=self.ttl_seconds
+                )
+                if embedding:
+                    self._embeddings[key] = np.asarray(json.loads(embedding), dtype=np.float32)
+        if rows:
+            logger.info(f"PlanCache: loaded {len(rows)} persisted plans")
+
+    def get_plan(
+        self,
+        query: str,
+        embedding: Optional[Any] = None
+    ) -> Optional[CachedPlan]:
+        """
+        Look up the plan for a query.
+
+        Args:
+            query: User query text
+            embedding: Optional query embedding for neighbour lookups
+
+        Returns:
+            CachedPlan, or None if no usable plan is cached
+        """
+        key = normalize_query(query)
+        payload = self.get(key)
+        if payload is not None:
+            return _deserialize_plan(query, payload, exact=True)
+
+        if embedding is None or self.similarity_threshold is None:
+            return None
+
+        neighbour = self._nearest(np.asarray(embedding, dtype=np.float32))
+        if neighbour is None:
+            return None
+        payload = self.get(neighbour)
+        if payload is None:
+            return None
+        with self._lock:
+            self._neighbour_hits += 1
+        logger.debug(f"PlanCache: reusing intent of neighbour '{neighbour[:60]}'")
+        return _deserialize_plan(query, payload, exact=False)
+
+    def _nearest(self, embedding: np.ndarray) -> Optional[str]:
+        with self._lock:
+            keys = [k for k in self._embeddings if k in self._cache]
+            if not keys:
+                return None
+            matrix = np.stack([self._embeddings[k] for k in keys])
+        norms = np.linalg.norm(matrix, axis=1) * (np.linalg.norm(embedding) or 1.0)
+        scores = matrix @ embedding / np.where(norms == 0, 1.0, norms)
+        best = int(np.argmax(scores))
+        return keys[best] if scores[best] >= self.similarity_threshold else None
+
+    def set_plan(
+        self,
+        query: str,
+        intent: QueryIntent,
+        subqueries: Optional[List[Subquery]] = None,
+        embedding: Optional[Any] = None
+    ) -> None:
+        """
+        Store the plan for a query.
+
+        Args:
+            query: User query text
+            intent: Interpreted query intent
+            subqueries: Decomposition ([] for simple queries, None if unknown)
+            embedding: Optional query embedding for neighbour lookups
+        """
+        key = normalize_query(query)
+        payload = _serialize_plan(intent, subqueries)
+        self.set(key, payload)
+
+        vector = None
+        if embedding is not None:
+            vector = np.asarray(embedding, dtype=np.float32)
+        with self._lock:
+            if vector is not None:
+                self._embeddings[key] = vector
+            # Drop embeddings of evicted entries
+            for stale in [k for k in self._embeddings if k not in self._cache]:
+                del self._embeddings[stale]
+
+        if self._conn is not None:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO plan_cache (key, plan, embedding, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (
+                        key,
+                        payload,
+                        json.dumps(vector.tolist()) if vector is not None else None,
+                        time.time(),
+                    ),
+                )
+                self._conn.execute(
+                    "DELETE FROM plan_cache WHERE created_at < ?",
+                    (time.time() - self.ttl_seconds,),
+                )
+                self._conn.commit()
+
+    def clear(self) -> None:
+        """Clear all cached plans (including persisted ones)."""
+        super().clear()
+        with self._lock:
+            self._embeddings.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM plan_cache")
+                self._conn.commit()
+
+    def get_metrics(self) -> Dict[str, int]:
+        """Get cache metrics, including embedding neighbour hits."""
+        metrics = super().get_metrics()
+        with self._lock:
+            metrics["neighbour_hits"] = self._neighbour_hits
+            metrics["persistent"] = self._conn is not None
+        return metrics
+
+
 class PerformanceMetrics:
     """
     Performance metrics tracker for SmartRouter operations.
@@ -370,6 +468,7 @@ class PerformanceMetrics:
 _capability_cache: Optional[CapabilityCache] = None
 _routing_cache: Optional[RoutingCache] = None
 _performance_metrics: Optional[PerformanceMetrics] = None
+_plan_cache: Optional[PlanCache] = None
 
 
 def get_capability_cache() -> CapabilityCache:
@@ -394,3 +493,22 @@ def get_performance_metrics() -> PerformanceMetrics:
     if _performance_metrics is None:
         _performance_metrics = PerformanceMetrics()
     return _performance_metrics
+
+
+def get_plan_cache(config: Optional[PlanCacheConfig] = None) -> PlanCache:
+    """
+    Get global PlanCache instance.
+
+    The first call creates the cache from config (defaults if None); later
+    calls return the same instance, so plans are shared by all routers.
+    """
+    global _plan_cache
+    if _plan_cache is None:
+        config = config or PlanCacheConfig()
+        _plan_cache = PlanCache(
+            max_size=config.max_size,
+            ttl_seconds=config.ttl_seconds,
+            db_path=config.db_path,
+            similarity_threshold=config.similarity_threshold,
+        )
+    return _plan_cache
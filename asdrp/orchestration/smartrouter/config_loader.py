@@ -34,11 +34,17 @@ config/smartrouter.yaml:
   error_handling:
     timeout: 30
     retries: 2
+  planning:
+    mode: separate
+  history:
+    max_turns: 6
+    max_tokens: 4000
+    summarize: true
 """
 
 from typing import Dict, List, Optional, Any
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import yaml
 
 from asdrp.orchestration.smartrouter.exceptions import SmartRouterException
@@ -119,6 +125,68 @@ class ErrorHandlingConfig:
     retries: int
 
 
+@dataclass
+class PlanningConfig:
+    """
+    Configuration for query planning (interpretation + decomposition).
+
+    Attributes:
+        mode: "separate" runs QueryInterpreter and QueryDecomposer as two
+              LLM calls; "combined" uses QueryPlanner to get the intent and
+              the subqueries from one call (uses the decomposition model)
+    """
+    mode: str = "separate"
+
+
+@dataclass
+class PlanCacheConfig:
+    """
+    Configuration for the interpretation/decomposition plan cache.
+
+    Attributes:
+        enabled: Whether to cache query plans
+        max_size: Maximum number of plans kept in memory
+        ttl_seconds: Lifetime of a cached plan (seconds)
+        db_path: Optional SQLite file so plans survive restarts
+        similarity_threshold: Minimum cosine similarity for reusing the
+                              intent of a similar query (None = exact only)
+        embedding_model: Embedding model for similarity lookups
+        include_sessions: Also cache plans of later conversation turns,
+                          not only first turns (plans may then depend on
+                          earlier turns)
+    """
+    enabled: bool = True
+    max_size: int = 1000
+    ttl_seconds: float = 86400
+    db_path: Optional[str] = None
+    similarity_threshold: Optional[float] = None
+    embedding_model: str = "text-embedding-3-small"
+    include_sessions: bool = False
+
+
+@dataclass
+class HistoryConfig:
+    """
+    Configuration for the conversation history replayed into model calls.
+
+    Attributes:
+        enabled: Whether to bound the replayed history at all
+        max_turns: Maximum number of recent turns replayed per call
+        max_tokens: Approximate token budget for the replayed turns
+        summarize: Whether to keep a rolling summary of older turns
+        summary_model: Model used to update the rolling summary
+        summary_max_tokens: Maximum length of the rolling summary (tokens)
+        apply_to_agent_sessions: Also bound the sessions of routed agents
+    """
+    enabled: bool = True
+    max_turns: int = 6
+    max_tokens: int = 4000
+    summarize: bool = True
+    summary_model: str = "gpt-4.1-nano"
+    summary_max_tokens: int = 300
+    apply_to_agent_sessions: bool = False
+
+
 @dataclass
 class SmartRouterConfig:
     """
@@ -131,6 +199,9 @@ class SmartRouterConfig:
         evaluation: Evaluation settings
         error_handling: Error handling settings
         enabled: Whether SmartRouter is enabled
+        history: Conversation history window settings
+        planning: Query planning settings
+        plan_cache: Plan cache settings
     """
     models: ModelConfigs
     decomposition: DecompositionConfig
@@ -138,6 +209,9 @@ class SmartRouterConfig:
     evaluation: EvaluationConfig
     error_handling: ErrorHandlingConfig
     enabled: bool
+    history: HistoryConfig = field(default_factory=HistoryConfig)
+    planning: PlanningConfig = field(default_factory=PlanningConfig)
+    plan_cache: PlanCacheConfig = field(default_factory=PlanCacheConfig)
 
 
 class SmartRouterConfigLoader:
@@ -354,6 +428,48 @@ class SmartRouterConfigLoader:
                 retries=error_dict.get("retries", 2),
             )
 
+            # Parse history window config
+            history_dict = config_dict.get("history", {})
+            history_defaults = HistoryConfig()
+            history = HistoryConfig(
+                enabled=history_dict.get("enabled", history_defaults.enabled),
+                max_turns=history_dict.get("max_turns", history_defaults.max_turns),
+                max_tokens=history_dict.get("max_tokens", history_defaults.max_tokens),
+                summarize=history_dict.get("summarize", history_defaults.summarize),
+                summary_model=history_dict.get("summary_model", history_defaults.summary_model),
+                summary_max_tokens=history_dict.get(
+                    "summary_max_tokens", history_defaults.summary_max_tokens
+                ),
+                apply_to_agent_sessions=history_dict.get(
+                    "apply_to_agent_sessions", history_defaults.apply_to_agent_sessions
+                ),
+            )
+
+            # Parse planning config
+            planning_dict = config_dict.get("planning", {})
+            planning = PlanningConfig(
+                mode=planning_dict.get("mode", PlanningConfig().mode),
+            )
+
+            # Parse plan cache config
+            plan_cache_dict = config_dict.get("plan_cache", {})
+            plan_cache_defaults = PlanCacheConfig()
+            plan_cache = PlanCacheConfig(
+                enabled=plan_cache_dict.get("enabled", plan_cache_defaults.enabled),
+                max_size=plan_cache_dict.get("max_size", plan_cache_defaults.max_size),
+                ttl_seconds=plan_cache_dict.get("ttl_seconds", plan_cache_defaults.ttl_seconds),
+                db_path=plan_cache_dict.get("db_path", plan_cache_defaults.db_path),
+                similarity_threshold=plan_cache_dict.get(
+                    "similarity_threshold", plan_cache_defaults.similarity_threshold
+                ),
+                embedding_model=plan_cache_dict.get(
+                    "embedding_model", plan_cache_defaults.embedding_model
+                ),
+                include_sessions=plan_cache_dict.get(
+                    "include_sessions", plan_cache_defaults.include_sessions
+                ),
+            )
+
             # Get capabilities
             capabilities = config_dict.get("capabilities", {})
 
@@ -367,6 +483,9 @@ class SmartRouterConfigLoader:
                 evaluation=evaluation,
                 error_handling=error_handling,
                 enabled=enabled,
+                history=history,
+                planning=planning,
+                plan_cache=plan_cache,
             )
 
         except KeyError as e:
@@ -454,6 +573,43 @@ class SmartRouterConfigLoader:
                 context={"retries": config.error_handling.retries}
             )
 
+        # Validate history window
+        if config.history.max_turns < 1:
+            raise SmartRouterException(
+                "history max_turns must be >= 1",
+                context={"max_turns": config.history.max_turns}
+            )
+
+        if config.history.max_tokens < 1:
+            raise SmartRouterException(
+                "history max_tokens must be >= 1",
+                context={"max_tokens": config.history.max_tokens}
+            )
+
+        # Validate planning mode
+        if config.planning.mode not in ("separate", "combined"):
+            raise SmartRouterException(
+                "planning mode must be 'separate' or 'combined'",
+                context={"mode": config.planning.mode}
+            )
+
+        # Validate plan cache
+        if config.plan_cache.max_size < 1 or config.plan_cache.ttl_seconds <= 0:
+            raise SmartRouterException(
+                "plan_cache max_size must be >= 1 and ttl_seconds > 0",
+                context={
+                    "max_size": config.plan_cache.max_size,
+                    "ttl_seconds": config.plan_cache.ttl_seconds,
+                }
+            )
+
+        threshold = config.plan_cache.similarity_threshold
+        if threshold is not None and not (0.0 < threshold <= 1.0):
+            raise SmartRouterException(
+                "plan_cache similarity_threshold must be between 0.0 and 1.0",
+                context={"similarity_threshold": threshold}
+            )
+
         # Validate temperature values
         for model_name, model_config in [
             ("interpretation", config.models.interpretation),
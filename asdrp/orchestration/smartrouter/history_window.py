@@ -0,0 +1,501 @@
+"""
+History Window - Bounded Conversation Context for SmartRouter Sessions
+
+SmartRouter's internal components (interpreter, decomposer, synthesizer,
+judge) each keep a persistent SQLiteSession per conversation, and the SDK
+replays the whole session into every call. Prompt size, latency and cost
+therefore grew linearly with conversation length. BoundedSession wraps a
+session and only replays a bounded window of it.
+
+Design Principles:
+-----------------
+- Decorator: Wraps any Session; storage stays in the wrapped session
+- Bounded: Only the last N turns, trimmed to a token budget, are replayed
+- Non-blocking: Older turns are folded into a rolling summary in the
+  background, so summarization never adds latency to a request
+- Persistent: Summaries live next to the session (same SQLite file)
+- Per-request: A long-lived router binds the conversation of the request
+  being routed (request_session); components resolve their session per call
+
+Responsibilities:
+----------------
+- Select the replay window (last max_turns turns within max_tokens)
+- Prepend the rolling summary of turns that fell out of the window
+- Keep the summary up to date as the window moves
+- Resolve component sessions for the conversation bound to the request
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from asdrp.agents.llm_gateway import get_llm_gateway
+from asdrp.agents.session_pool import SessionPool, SharedConnectionRegistry, SharedSQLiteSession
+from asdrp.orchestration.smartrouter.config_loader import HistoryConfig
+
+logger = logging.getLogger(__name__)
+
+COMPONENT_SESSION_DB_PATH = "data/sessions/smartrouter.db"
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+
+SUMMARY_PROMPT = (
+    "You maintain a running summary of a conversation between a user and an "
+    "assistant. Merge the new messages into the current summary. Keep facts, "
+    "names, places, numbers, preferences and open questions the assistant may "
+    "need later; drop pleasantries and formatting. Reply with the updated "
+    "summary only, in at most 150 words."
+)
+
+# Rendered transcript length per item sent to the summarizer
+_MAX_ITEM_CHARS = 1000
+
+# Component sessions kept open for request-bound conversations
+_MAX_REQUEST_SESSIONS = 512
+
+Summarizer = Callable[[Optional[str], List[Any]], Awaitable[str]]
+
+
+def estimate_tokens(item: Any) -> int:
+    """Rough token count of a session item (~4 characters per token)."""
+    try:
+        text = json.dumps(item, default=str, ensure_ascii=False)
+    except (TypeError, ValueError):
+        text = str(item)
+    return len(text) // 4 + 1
+
+
+def _is_user_message(item: Any) -> bool:
+    """Whether an item starts a new turn (a user message)."""
+    if not isinstance(item, dict):
+        return False
+    return item.get("role") == "user" and item.get("type", "message") == "message"
+
+
+def select_window(
+    items: List[Any],
+    max_turns: int,
+    max_tokens: int,
+) -> Tuple[List[Any], List[Any]]:
+    """
+    Split session items into (window, dropped).
+
+    The window holds at most max_turns turns (a turn starts at a user
+    message) and whole turns are dropped from the front while it exceeds
+    max_tokens. The most recent turn is always kept, even if it alone is over
+    the budget.
+
+    Args:
+        items: Session items, oldest first
+        max_turns: Maximum number of turns to keep
+        max_tokens: Approximate token budget for the window
+
+    Returns:
+        Tuple of (window items, dropped items), both oldest first
+    """
+    starts = [i for i, item in enumerate(items) if _is_user_message(item)]
+    if not starts:
+        return list(items), []
+
+    # Items before the first user message belong to the first turn
+    starts[0] = 0
+    starts = starts[-max_turns:]
+
+    sizes = [estimate_tokens(item) for item in items]
+    cut_index = 0
+    while cut_index < len(starts) - 1 and sum(sizes[starts[cut_index]:]) > max_tokens:
+        cut_index += 1
+
+    cut = starts[cut_index]
+    return items[cut:], items[:cut]
+
+
+def _render_item(item: Any) -> str:
+    """Render a session item as one transcript line for the summarizer."""
+    if not isinstance(item, dict):
+        return str(item)[:_MAX_ITEM_CHARS]
+
+    content = item.get("content")
+    if isinstance(content, list):
+        content = " ".join(
+            part.get("text", "") for part in content if isinstance(part, dict)
+        )
+    if content:
+        label = item.get("role", "assistant")
+    elif item.get("type") == "function_call":
+        label = "tool call"
+        content = f"{item.get('name')}({item.get('arguments', '')})"
+    elif item.get("type") == "function_call_output":
+        label = "tool result"
+        content = item.get("output", "")
+    else:
+        label = item.get("type", "item")
+        content = ""
+    return f"{label}: {str(content)[:_MAX_ITEM_CHARS]}"
+
+
+def make_gateway_summarizer(model: str, max_tokens: int) -> Summarizer:
+    """Create a summarizer that calls the model through the shared LLM gateway."""
+
+    async def summarize(previous: Optional[str], items: List[Any]) -> str:
+        transcript = "\n".join(_render_item(item) for item in items)
+        response = await get_llm_gateway().chat_completion(
+            "smartrouter.history",
+            model=model,
+            messages=[
+                {"role": "system", "content": SUMMARY_PROMPT},
+                {
+                    "role": "user",
+                    "content": f"Current summary:\n{previous or '(none)'}\n\nNew messages:\n{transcript}",
+                },
+            ],
+            temperature=0.0,
+            max_tokens=max_tokens,
+        )
+        return (response.choices[0].message.content or "").strip()
+
+    return summarize
+
+
+class SessionSummaryStore:
+    """
+    Rolling summaries keyed by session ID, stored in a SQLite table.
+
+    File-based stores share the database file of the sessions they
+    summarize; ":memory:" stores live for the lifetime of the object.
+    """
+
+    def __init__(self, db_path: str | Path = ":memory:"):
+        target = str(db_path)
+        self._lock = threading.Lock()
+        if target != ":memory:":
+            Path(target).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(target, check_same_thread=False)
+        if target != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS session_summaries (
+                session_id TEXT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                covered_items INTEGER NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, session_id: str) -> Tuple[Optional[str], int]:
+        """Return (summary, number of items it covers) for a session."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary, covered_items FROM session_summaries WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+        return (row[0], row[1]) if row else (None, 0)
+
+    def set(self, session_id: str, summary: str, covered_items: int) -> None:
+        """Store the summary of the first covered_items items of a session."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO session_summaries "
+                "(session_id, summary, covered_items, updated_at) VALUES (?, ?, ?, ?)",
+                (session_id, summary, covered_items, time.time()),
+            )
+            self._conn.commit()
+
+    def delete(self, session_id: str) -> None:
+        """Forget the summary of a session."""
+        with self._lock:
+            self._conn.execute("DELETE FROM session_summaries WHERE session_id = ?", (session_id,))
+            self._conn.commit()
+
+
+_summary_stores: Dict[str, SessionSummaryStore] = {}
+_summary_stores_lock = threading.Lock()
+
+# (store, session_id) pairs with a summary update in flight
+_pending_summaries: Set[Tuple[int, str]] = set()
+
+
+def get_summary_store(db_path: Optional[str | Path]) -> SessionSummaryStore:
+    """Get the summary store for a session database file (shared per file)."""
+    if db_path is None or str(db_path) == ":memory:":
+        return SessionSummaryStore(":memory:")
+    key = str(Path(db_path).resolve())
+    with _summary_stores_lock:
+        store = _summary_stores.get(key)
+        if store is None:
+            store = SessionSummaryStore(key)
+            _summary_stores[key] = store
+        return store
+
+
+class BoundedSession:
+    """
+    Session wrapper that replays a bounded window of the conversation.
+
+    Writes go to the wrapped session unchanged, so the full history is kept;
+    only what get_items() returns (and therefore what is sent to the model)
+    is bounded. Turns that fall out of the window are merged into a rolling
+    summary in the background, and the summary is prepended to the window as
+    a system message once available.
+
+    Usage:
+    ------
+    >>> session = BoundedSession(SQLiteSession("conv-1", "data/sessions/smartrouter.db"),
+    ...                          HistoryConfig(max_turns=4, max_tokens=2000))
+    >>> result = await Runner.run(agent, input=query, session=session)
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        config: HistoryConfig,
+        summarizer: Optional[Summarizer] = None,
+        summary_store: Optional[SessionSummaryStore] = None,
+    ):
+        """
+        Initialize BoundedSession.
+
+        Args:
+            session: Session to wrap (SQLiteSession or any Session)
+            config: History window configuration
+            summarizer: Optional summarizer (for testing/DI)
+                       If None, uses config.summary_model through the LLM gateway
+            summary_store: Optional summary store (for testing/DI)
+                          If None, uses the wrapped session's database file
+        """
+        self._session = session
+        self.config = config
+        self.session_id = session.session_id
+        self._summarizer = summarizer or make_gateway_summarizer(
+            config.summary_model, config.summary_max_tokens
+        )
+        self._store = summary_store or get_summary_store(getattr(session, "db_path", None))
+        self._summary_task: Optional[asyncio.Task] = None
+
+    @property
+    def wrapped(self) -> Any:
+        """The underlying session holding the full history."""
+        return self._session
+
+    def __getattr__(self, name: str) -> Any:
+        # Delegate anything else (db_path, close, ...) to the wrapped session
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._session, name)
+
+    async def get_items(self, limit: Optional[int] = None) -> List[Any]:
+        """Return the bounded window, preceded by the rolling summary if any."""
+        items = await self._session.get_items()
+        window, dropped = select_window(
+            items, self.config.max_turns, self.config.max_tokens
+        )
+
+        if dropped and self.config.summarize:
+            summary, covered = self._store.get(self.session_id)
+            if len(dropped) > covered:
+                self._schedule_summary(summary, covered, dropped)
+            if summary:
+                window = [{"role": "system", "content": SUMMARY_PREFIX + summary}] + window
+
+        if limit is not None:
+            window = window[-limit:] if limit > 0 else []
+        return window
+
+    async def add_items(self, items: List[Any]) -> None:
+        await self._session.add_items(items)
+
+    async def pop_item(self) -> Optional[Any]:
+        return await self._session.pop_item()
+
+    async def clear_session(self) -> None:
+        await self._session.clear_session()
+        self._store.delete(self.session_id)
+
+    def _schedule_summary(self, summary: Optional[str], covered: int, dropped: List[Any]) -> None:
+        key = (id(self._store), self.session_id)
+        if key in _pending_summaries:
+            return
+        _pending_summaries.add(key)
+        self._summary_task = asyncio.get_running_loop().create_task(
+            self._update_summary(key, summary, covered, list(dropped))
+        )
+
+    async def _update_summary(
+        self,
+        key: Tuple[int, str],
+        summary: Optional[str],
+        covered: int,
+        dropped: List[Any],
+    ) -> None:
+        try:
+            new_summary = await self._summarizer(summary, dropped[covered:])
+            if new_summary:
+                self._store.set(self.session_id, new_summary, len(dropped))
+                logger.debug(
+                    f"BoundedSession: summarized {len(dropped)} items of {self.session_id}"
+                )
+        except Exception as e:
+            logger.warning(f"BoundedSession: summary update failed for {self.session_id}: {e}")
+        finally:
+            _pending_summaries.discard(key)
+
+
+def bound_session(session: Any, config: Optional[HistoryConfig]) -> Any:
+    """
+    Wrap a session in a BoundedSession if a history policy is enabled.
+
+    Returns the session unchanged if it is None, already bounded, or if no
+    (enabled) history configuration is given.
+    """
+    if (
+        session is None
+        or not isinstance(config, HistoryConfig)
+        or not config.enabled
+        or isinstance(session, BoundedSession)
+    ):
+        return session
+    return BoundedSession(session, config)
+
+
+def create_component_session(
+    session_id: str,
+    component: str,
+    history_config: Optional[HistoryConfig] = None,
+) -> Any:
+    """
+    Create the persistent session of a SmartRouter component.
+
+    Args:
+        session_id: Conversation session ID
+        component: Component name (used as the session ID suffix)
+        history_config: Optional history window policy
+
+    Returns:
+        SharedSQLiteSession, wrapped in a BoundedSession if the policy is enabled
+    """
+    session = SharedSQLiteSession(
+        session_id=f"{session_id}_{component}",
+        db_path=COMPONENT_SESSION_DB_PATH,  # Persistent file-based storage
+        registry=_component_connections,
+    )
+    return bound_session(session, history_config)
+
+
+# Session ID of the conversation being routed in the current task
+_request_session_id: ContextVar[Optional[str]] = ContextVar(
+    "smartrouter_request_session_id", default=None
+)
+
+# Component sessions of all conversations share one connection per database file
+_component_connections = SharedConnectionRegistry()
+
+# Component sessions of request-bound conversations, closed when evicted
+_request_sessions = SessionPool(max_size=_MAX_REQUEST_SESSIONS, ttl_seconds=None)
+_request_sessions_lock = threading.Lock()
+
+
+@contextmanager
+def request_session(session_id: Optional[str]) -> Iterator[None]:
+    """
+    Bind a conversation to the current task (and tasks it creates).
+
+    A long-lived SmartRouter is shared by all requests; the session of the
+    request being routed is bound here instead of in the components.
+    Binding None keeps whatever is bound already.
+    """
+    if session_id is None:
+        yield
+        return
+    token = _request_session_id.set(session_id)
+    try:
+        yield
+    finally:
+        _request_session_id.reset(token)
+
+
+def current_session_id(default: Optional[str] = None) -> Optional[str]:
+    """Session ID bound to the current request, or default if none is bound."""
+    return _request_session_id.get() or default
+
+
+def session_for_request(
+    component: str,
+    session: Any,
+    history_config: Optional[HistoryConfig] = None,
+) -> Any:
+    """
+    Session a component should use for the current call.
+
+    Returns the component's own session unless a different conversation is
+    bound to the request, in which case the component session of that
+    conversation is returned (created once and reused across requests).
+
+    Args:
+        component: Component name (used as the session ID suffix)
+        session: Session created with the component (may be None)
+        history_config: Optional history window policy
+    """
+    session_id = _request_session_id.get()
+    if session_id is None:
+        return session
+    if session is not None and getattr(session, "session_id", None) == f"{session_id}_{component}":
+        return session
+
+    key = f"{session_id}:{component}:{id(history_config)}"
+    with _request_sessions_lock:
+        cached = _request_sessions.get(key)
+        if cached is None:
+            cached = _request_sessions.put(
+                key, create_component_session(session_id, component, history_config)
+            )
+        return cached
+
+
+async def has_prior_turns(session: Any) -> bool:
+    """
+    Check whether a component session holds earlier turns.
+
+    Args:
+        session: Component session (None means no conversation memory)
+    """
+    if session is None:
+        return False
+    # Ask the full history, not the bounded window (which may add a summary)
+    items = await getattr(session, "wrapped", session).get_items(limit=1)
+    return bool(items)
+
+
+async def record_intent_turn(session: Any, query: str, intent: Any) -> None:
+    """
+    Add a query and the intent it was resolved to as one turn of a session.
+
+    Used for turns answered without calling the component's LLM (e.g. from
+    the plan cache), so later turns still see them as context.
+
+    Args:
+        session: Component session (None means no conversation memory)
+        query: The user's query text
+        intent: QueryIntent the query was resolved to
+    """
+    if session is None:
+        return
+    answer = intent.metadata.get("llm_response") or json.dumps({
+        "complexity": intent.complexity.value,
+        "domains": intent.domains,
+        "requires_synthesis": intent.requires_synthesis,
+        "reasoning": intent.metadata.get("reasoning", ""),
+    })
+    await session.add_items([
+        {"role": "user", "content": query},
+        {"role": "assistant", "content": answer},
+    ])
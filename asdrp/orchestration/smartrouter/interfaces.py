@@ -23,7 +23,7 @@ Components:
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
@@ -201,6 +201,26 @@ class IQueryInterpreter(ABC):
         """
         pass
 
+    async def has_history(self) -> bool:
+        """
+        Check whether the conversation being interpreted has earlier turns.
+
+        The plan cache only serves queries of conversations without them.
+        Interpreters without conversation memory have none.
+        """
+        return False
+
+    async def record_turn(self, query: str, intent: QueryIntent) -> None:
+        """
+        Add a turn resolved without interpret() (e.g. from the plan cache) to
+        the conversation memory. No-op for interpreters without memory.
+
+        Args:
+            query: The user's query text
+            intent: Intent the query was resolved to
+        """
+        return None
+
 
 class IQueryDecomposer(ABC):
     """
@@ -407,6 +427,32 @@ class IResultSynthesizer(ABC):
         """
         pass
 
+    async def synthesize_stream(
+        self,
+        responses: Dict[str, AgentResponse],
+        original_query: str
+    ) -> AsyncIterator[Union[str, SynthesizedResult]]:
+        """
+        Synthesize responses, streaming the answer as it is generated.
+
+        Default implementation delegates to synthesize() and yields the whole
+        answer as a single delta. Implementations backed by a streaming LLM
+        should override this.
+
+        Args:
+            responses: Dictionary of subquery_id -> AgentResponse
+            original_query: The original user query for context
+
+        Yields:
+            str answer deltas, then the final SynthesizedResult
+
+        Raises:
+            SynthesisException: If synthesis fails
+        """
+        result = await self.synthesize(responses, original_query)
+        yield result.answer
+        yield result
+
 
 class IAnswerEvaluator(ABC):
     """
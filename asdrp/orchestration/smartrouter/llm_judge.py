@@ -24,14 +24,18 @@ from typing import Dict, List, Optional, Any
 import json
 import logging
 
-from agents import ModelSettings
+from asdrp.agents.llm_gateway import get_llm_gateway
 
 from asdrp.orchestration.smartrouter.interfaces import (
     IAnswerEvaluator,
     EvaluationResult,
 )
 from asdrp.orchestration.smartrouter.exceptions import EvaluationException
-from asdrp.orchestration.smartrouter.config_loader import ModelConfig, EvaluationConfig
+from asdrp.orchestration.smartrouter.config_loader import ModelConfig, EvaluationConfig, HistoryConfig
+from asdrp.orchestration.smartrouter.history_window import (
+    create_component_session,
+    session_for_request,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -121,7 +125,8 @@ Provide evaluation in this JSON format:
         model_config: ModelConfig,
         eval_config: EvaluationConfig,
         llm_client: Optional[Any] = None,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        history_config: Optional[HistoryConfig] = None
     ):
         """
         Initialize LLMJudge.
@@ -131,20 +136,19 @@ Provide evaluation in this JSON format:
             eval_config: Evaluation configuration (criteria, thresholds)
             llm_client: Optional custom LLM client (for testing/DI)
             session_id: Optional session ID for conversation memory
+            history_config: Optional policy bounding the history replayed per call
         """
         self.model_config = model_config
         self.eval_config = eval_config
         self._llm_client = llm_client
         self.session_id = session_id
 
+        self._history_config = history_config
+
         # Create session ONCE during initialization (OpenAI best practice)
         self._session = None
         if session_id:
-            from agents import SQLiteSession
-            self._session = SQLiteSession(
-                session_id=f"{session_id}_judge",
-                db_path="data/sessions/smartrouter.db"  # Persistent file-based storage
-            )
+            self._session = create_component_session(session_id, "judge", history_config)
             logger.info(f"LLMJudge: Created persistent session {session_id}_judge")
 
     async def evaluate(
@@ -273,25 +277,26 @@ Provide evaluation in this JSON format:
                     max_tokens=self.model_config.max_tokens,
                 )
 
-            # Use openai-agents SDK
-            from agents import Agent, Runner
+            # Use openai-agents SDK (agent memoized by the shared LLM gateway)
+            from agents import Runner
 
-            agent = Agent(
+            gateway = get_llm_gateway()
+            agent = gateway.get_agent(
                 name="LLMJudge",
                 instructions=self.EVALUATION_PROMPT,
                 model=self.model_config.name,
-                model_settings=ModelSettings(
-                    temperature=self.model_config.temperature,
-                    max_tokens=self.model_config.max_tokens,
-                ),
+                temperature=self.model_config.temperature,
+                max_tokens=self.model_config.max_tokens,
             )
 
-            # Use the persistent session created in __init__
-            result = await Runner.run(
-                agent,
-                input=f"Query: {original_query}\n\nAnswer:\n{answer}\n\nCriteria: {', '.join(criteria)}",
-                session=self._session
-            )
+            # Use the persistent session (or that of the request's conversation)
+            async with gateway.track("smartrouter.judge", self.model_config.name) as call:
+                result = await Runner.run(
+                    agent,
+                    input=f"Query: {original_query}\n\nAnswer:\n{answer}\n\nCriteria: {', '.join(criteria)}",
+                    session=session_for_request("judge", self._session, self._history_config)
+                )
+                call.record_run_result(result)
             return str(result.final_output)
 
         except Exception as e:
@@ -25,7 +25,7 @@ import json
 import logging
 import uuid
 
-from agents import ModelSettings
+from asdrp.agents.llm_gateway import get_llm_gateway
 
 from asdrp.orchestration.smartrouter.interfaces import (
     IQueryDecomposer,
@@ -35,7 +35,11 @@ from asdrp.orchestration.smartrouter.interfaces import (
     QueryComplexity,
 )
 from asdrp.orchestration.smartrouter.exceptions import QueryDecompositionException
-from asdrp.orchestration.smartrouter.config_loader import ModelConfig, DecompositionConfig
+from asdrp.orchestration.smartrouter.config_loader import ModelConfig, DecompositionConfig, HistoryConfig
+from asdrp.orchestration.smartrouter.history_window import (
+    create_component_session,
+    session_for_request,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -105,7 +109,8 @@ User Query: """
         model_config: ModelConfig,
         decomp_config: DecompositionConfig,
         llm_client: Optional[Any] = None,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        history_config: Optional[HistoryConfig] = None
     ):
         """
         Initialize QueryDecomposer.
@@ -115,20 +120,19 @@ User Query: """
             decomp_config: Decomposition configuration (limits, thresholds)
             llm_client: Optional custom LLM client (for testing/DI)
             session_id: Optional session ID for conversation memory
+            history_config: Optional policy bounding the history replayed per call
         """
         self.model_config = model_config
         self.decomp_config = decomp_config
         self._llm_client = llm_client
         self.session_id = session_id
 
+        self._history_config = history_config
+
         # Create session ONCE during initialization (OpenAI best practice)
         self._session = None
         if session_id:
-            from agents import SQLiteSession
-            self._session = SQLiteSession(
-                session_id=f"{session_id}_decomposer",
-                db_path="data/sessions/smartrouter.db"  # Persistent file-based storage
-            )
+            self._session = create_component_session(session_id, "decomposer", history_config)
             logger.info(f"QueryDecomposer: Created persistent session {session_id}_decomposer")
 
     async def decompose(self, intent: QueryIntent) -> List[Subquery]:
@@ -223,21 +227,23 @@ User Query: """
                     max_tokens=self.model_config.max_tokens,
                 )
 
-            # Use openai-agents SDK
-            from agents import Agent, Runner
+            # Use openai-agents SDK (agent memoized by the shared LLM gateway)
+            from agents import Runner
 
-            agent = Agent(
+            gateway = get_llm_gateway()
+            agent = gateway.get_agent(
                 name="QueryDecomposer",
                 instructions=self.DECOMPOSITION_PROMPT,
                 model=self.model_config.name,
-                model_settings=ModelSettings(
-                    temperature=self.model_config.temperature,
-                    max_tokens=self.model_config.max_tokens,
-                ),
+                temperature=self.model_config.temperature,
+                max_tokens=self.model_config.max_tokens,
             )
 
-            # Use the persistent session created in __init__
-            result = await Runner.run(agent, input=intent.original_query, session=self._session)
+            # Use the persistent session (or that of the request's conversation)
+            async with gateway.track("smartrouter.decomposer", self.model_config.name) as call:
+                session = session_for_request("decomposer", self._session, self._history_config)
+                result = await Runner.run(agent, input=intent.original_query, session=session)
+                call.record_run_result(result)
             return str(result.final_output)
 
         except Exception as e:
@@ -23,7 +23,7 @@ from typing import Dict, Any, Optional, List
 import json
 import logging
 
-from agents import ModelSettings
+from asdrp.agents.llm_gateway import get_llm_gateway
 
 from asdrp.orchestration.smartrouter.interfaces import (
     IQueryInterpreter,
@@ -31,7 +31,13 @@ from asdrp.orchestration.smartrouter.interfaces import (
     QueryComplexity,
 )
 from asdrp.orchestration.smartrouter.exceptions import SmartRouterException
-from asdrp.orchestration.smartrouter.config_loader import ModelConfig
+from asdrp.orchestration.smartrouter.config_loader import ModelConfig, HistoryConfig
+from asdrp.orchestration.smartrouter.history_window import (
+    create_component_session,
+    has_prior_turns,
+    record_intent_turn,
+    session_for_request,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -137,7 +143,8 @@ User Query: """
         self,
         model_config: ModelConfig,
         llm_client: Optional[Any] = None,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        history_config: Optional[HistoryConfig] = None
     ):
         """
         Initialize QueryInterpreter.
@@ -147,19 +154,18 @@ User Query: """
             llm_client: Optional custom LLM client (for testing/DI)
                        If None, uses openai-agents SDK
             session_id: Optional session ID for conversation memory
+            history_config: Optional policy bounding the history replayed per call
         """
         self.model_config = model_config
         self._llm_client = llm_client
         self.session_id = session_id
 
+        self._history_config = history_config
+
         # Create session ONCE during initialization (OpenAI best practice)
         self._session = None
         if session_id:
-            from agents import SQLiteSession
-            self._session = SQLiteSession(
-                session_id=f"{session_id}_interpreter",
-                db_path="data/sessions/smartrouter.db"  # Persistent file-based storage
-            )
+            self._session = create_component_session(session_id, "interpreter", history_config)
             logger.info(f"QueryInterpreter: Created persistent session {session_id}_interpreter")
 
     async def interpret(self, query: str) -> QueryIntent:
@@ -223,6 +229,38 @@ User Query: """
             )
             return self._fallback_interpretation(query)
 
+    async def has_history(self) -> bool:
+        """
+        Check whether the conversation being interpreted has earlier turns.
+
+        Returns:
+            True if the interpreter session of the conversation holds prior
+            turns (the intent of a new query may then depend on them)
+        """
+        if self._llm_client:
+            # Custom clients are called without conversation memory
+            return False
+        return await has_prior_turns(
+            session_for_request("interpreter", self._session, self._history_config)
+        )
+
+    async def record_turn(self, query: str, intent: QueryIntent) -> None:
+        """
+        Add a turn interpreted without the LLM (e.g. from the plan cache) to
+        the conversation memory, so that later turns see it as context.
+
+        Args:
+            query: The user's query text
+            intent: Intent the query was resolved to
+        """
+        if self._llm_client:
+            return
+        await record_intent_turn(
+            session_for_request("interpreter", self._session, self._history_config),
+            query,
+            intent,
+        )
+
     async def _call_interpretation_llm(self, query: str) -> str:
         """
         Call LLM for query interpretation.
@@ -246,21 +284,23 @@ User Query: """
                     max_tokens=self.model_config.max_tokens,
                 )
 
-            # Use openai-agents SDK
-            from agents import Agent, Runner
+            # Use openai-agents SDK (agent memoized by the shared LLM gateway)
+            from agents import Runner
 
-            agent = Agent(
+            gateway = get_llm_gateway()
+            agent = gateway.get_agent(
                 name="QueryInterpreter",
                 instructions=self.INTERPRETATION_PROMPT,
                 model=self.model_config.name,
-                model_settings=ModelSettings(
-                    temperature=self.model_config.temperature,
-                    max_tokens=self.model_config.max_tokens,
-                ),
+                temperature=self.model_config.temperature,
+                max_tokens=self.model_config.max_tokens,
             )
 
-            # Use the persistent session created in __init__
-            result = await Runner.run(agent, input=query, session=self._session)
+            # Use the persistent session (or that of the request's conversation)
+            async with gateway.track("smartrouter.interpreter", self.model_config.name) as call:
+                session = session_for_request("interpreter", self._session, self._history_config)
+                result = await Runner.run(agent, input=query, session=session)
+                call.record_run_result(result)
             return str(result.final_output)
 
         except Exception as e:
@@ -0,0 +1,338 @@
+"""
+QueryPlanner - Combined Interpretation and Decomposition
+
+Interprets and decomposes a query in a single LLM call. In the default
+("separate") planning mode a complex query costs two model round trips in
+series before any agent runs: QueryInterpreter.interpret and then
+QueryDecomposer.decompose, each with its own prompt over the same query.
+The planner asks for the intent and the subqueries in one JSON response and
+serves both steps from it.
+
+Design Principles:
+-----------------
+- Drop-in: Implements both IQueryInterpreter and IQueryDecomposer, so
+  SmartRouter's pipeline is unchanged
+- Reuse: Parsing, validation and fallbacks come from QueryInterpreter and
+  QueryDecomposer; the planner only owns the combined prompt
+- Robustness: If the planned subqueries are missing or invalid, decompose()
+  falls back to a regular decomposition call
+
+Responsibilities:
+----------------
+- Produce QueryIntent and subqueries from one model call
+- Validate planned subqueries (limits, IDs, acyclic dependencies)
+- Fall back to the separate pipeline when the combined plan is unusable
+"""
+
+from typing import Any, Dict, List, Optional
+import json
+import logging
+
+from asdrp.agents.llm_gateway import get_llm_gateway
+
+from asdrp.orchestration.smartrouter.interfaces import (
+    IQueryInterpreter,
+    IQueryDecomposer,
+    QueryIntent,
+    QueryComplexity,
+    Subquery,
+)
+from asdrp.orchestration.smartrouter.exceptions import (
+    SmartRouterException,
+    QueryDecompositionException,
+)
+from asdrp.orchestration.smartrouter.config_loader import (
+    ModelConfig,
+    DecompositionConfig,
+    HistoryConfig,
+)
+from asdrp.orchestration.smartrouter.history_window import (
+    create_component_session,
+    has_prior_turns,
+    record_intent_turn,
+    session_for_request,
+)
+from asdrp.orchestration.smartrouter.query_interpreter import QueryInterpreter
+from asdrp.orchestration.smartrouter.query_decomposer import QueryDecomposer
+
+logger = logging.getLogger(__name__)
+
+# Intent metadata key holding the subqueries planned together with the intent
+PLANNED_SUBQUERIES_KEY = "planned_subqueries"
+
+
+def _instructions_before_format(prompt: str) -> str:
+    """Strip the output format section from a component prompt."""
+    return prompt.split("Respond ONLY with valid JSON")[0].rstrip() + "\n\n"
+
+
+def _extract_json(llm_response: str) -> str:
+    """Extract the JSON payload from a response (may have markdown code blocks)."""
+    json_str = llm_response.strip()
+    if json_str.startswith("```json"):
+        json_str = json_str.split("```json")[1].split("```")[0].strip()
+    elif json_str.startswith("```"):
+        json_str = json_str.split("```")[1].split("```")[0].strip()
+    return json_str
+
+
+class QueryPlanner(IQueryInterpreter, IQueryDecomposer):
+    """
+    Combined query interpreter and decomposer using one LLM call.
+
+    interpret() runs the combined call and attaches the planned subqueries
+    to the returned intent; decompose() then returns them without another
+    model call. Intents that were not produced by the planner (fast path,
+    heuristic fallback) are decomposed with the regular decomposer.
+
+    Usage:
+    ------
+    >>> planner = QueryPlanner(
+    ...     model_config=ModelConfig(...),
+    ...     decomp_config=DecompositionConfig(...)
+    ... )
+    >>> intent = await planner.interpret("Stock price of AAPL and where is Apple HQ?")
+    >>> subqueries = await planner.decompose(intent)  # no second LLM call
+    >>> print(len(subqueries))
+    2
+    """
+
+    # System prompt: interpretation rules + decomposition rules + combined format
+    PLANNING_PROMPT = (
+        _instructions_before_format(QueryInterpreter.INTERPRETATION_PROMPT)
+        + "For MODERATE and COMPLEX queries, also break the query down into subqueries.\n\n"
+        + _instructions_before_format(QueryDecomposer.DECOMPOSITION_PROMPT).split("\n", 1)[1]
+        + """Respond ONLY with valid JSON in this format:
+{
+  "complexity": "SIMPLE|MODERATE|COMPLEX",
+  "domains": ["domain1", "domain2"],
+  "requires_synthesis": true|false,
+  "reasoning": "Brief explanation of classification",
+  "subqueries": [
+    {
+      "id": "sq1",
+      "text": "Subquery text here",
+      "capability_required": "capability_name",
+      "dependencies": [],
+      "routing_pattern": "delegation|handoff"
+    }
+  ]
+}
+
+If the query is SIMPLE, "subqueries" must be an empty array: []
+
+User Query: """
+    )
+
+    def __init__(
+        self,
+        model_config: ModelConfig,
+        decomp_config: DecompositionConfig,
+        interpreter: Optional[QueryInterpreter] = None,
+        decomposer: Optional[QueryDecomposer] = None,
+        llm_client: Optional[Any] = None,
+        session_id: Optional[str] = None,
+        history_config: Optional[HistoryConfig] = None
+    ):
+        """
+        Initialize QueryPlanner.
+
+        Args:
+            model_config: Configuration for the LLM model of the combined call
+            decomp_config: Decomposition configuration (limits, thresholds)
+            interpreter: Optional interpreter used for parsing and fallbacks
+            decomposer: Optional decomposer used for validation and fallbacks
+            llm_client: Optional custom LLM client (for testing/DI)
+                       If None, uses openai-agents SDK
+            session_id: Optional session ID for conversation memory
+            history_config: Optional policy bounding the history replayed per call
+        """
+        self.model_config = model_config
+        self.decomp_config = decomp_config
+        self._llm_client = llm_client
+        self.session_id = session_id
+        self.interpreter = interpreter or QueryInterpreter(model_config=model_config)
+        self.decomposer = decomposer or QueryDecomposer(
+            model_config=model_config,
+            decomp_config=decomp_config,
+        )
+
+        self._history_config = history_config
+
+        # Create session ONCE during initialization (OpenAI best practice)
+        self._session = None
+        if session_id:
+            self._session = create_component_session(session_id, "planner", history_config)
+            logger.info(f"QueryPlanner: Created persistent session {session_id}_planner")
+
+    async def interpret(self, query: str) -> QueryIntent:
+        """
+        Interpret a query and plan its subqueries in one LLM call.
+
+        Args:
+            query: The user's query text
+
+        Returns:
+            QueryIntent; for MODERATE/COMPLEX queries with a valid plan the
+            subqueries are attached under metadata["planned_subqueries"]
+
+        Raises:
+            SmartRouterException: If the query is empty
+        """
+        if not query or not query.strip():
+            raise SmartRouterException("Query cannot be empty", context={"query": query})
+
+        try:
+            logger.debug(f"Planning query: {query[:100]}...")
+            planning_result = await self._call_planning_llm(query)
+            intent = self.interpreter._parse_interpretation(query, planning_result)
+        except Exception as e:
+            logger.warning(
+                f"LLM planning failed: {str(e)}. Using fallback heuristics.",
+                exc_info=True
+            )
+            return self.interpreter._fallback_interpretation(query)
+
+        if intent.complexity != QueryComplexity.SIMPLE:
+            subqueries = self._parse_planned_subqueries(intent, planning_result)
+            if subqueries is not None:
+                intent.metadata[PLANNED_SUBQUERIES_KEY] = subqueries
+
+        logger.info(
+            f"Query planned: complexity={intent.complexity.value}, "
+            f"domains={intent.domains}, synthesis={intent.requires_synthesis}, "
+            f"subqueries={len(intent.metadata.get(PLANNED_SUBQUERIES_KEY, []))}"
+        )
+        return intent
+
+    async def decompose(self, intent: QueryIntent) -> List[Subquery]:
+        """
+        Return the subqueries planned with the intent.
+
+        Falls back to a regular decomposition call if the intent carries no
+        valid plan.
+
+        Args:
+            intent: Query intent (ideally produced by interpret())
+
+        Returns:
+            List of Subquery objects (empty for simple queries)
+
+        Raises:
+            QueryDecompositionException: If the fallback decomposition fails
+        """
+        if intent.complexity == QueryComplexity.SIMPLE:
+            return []
+
+        planned = intent.metadata.get(PLANNED_SUBQUERIES_KEY)
+        if planned is not None:
+            logger.info(f"Using {len(planned)} planned subqueries: {[sq.id for sq in planned]}")
+            return planned
+
+        logger.info("No planned subqueries on intent, decomposing separately")
+        return await self.decomposer.decompose(intent)
+
+    def validate_dependencies(self, subqueries: List[Subquery]) -> bool:
+        """Validate that subquery dependencies are acyclic."""
+        return self.decomposer.validate_dependencies(subqueries)
+
+    async def has_history(self) -> bool:
+        """Check whether the planner session of the conversation holds earlier turns."""
+        if self._llm_client:
+            # Custom clients are called without conversation memory
+            return False
+        return await has_prior_turns(
+            session_for_request("planner", self._session, self._history_config)
+        )
+
+    async def record_turn(self, query: str, intent: QueryIntent) -> None:
+        """
+        Add a turn planned without the LLM (e.g. from the plan cache) to the
+        planner session, so that later turns see it as context.
+
+        Args:
+            query: The user's query text
+            intent: Intent the query was resolved to
+        """
+        if self._llm_client:
+            return
+        await record_intent_turn(
+            session_for_request("planner", self._session, self._history_config),
+            query,
+            intent,
+        )
+
+    async def _call_planning_llm(self, query: str) -> str:
+        """
+        Call LLM for combined interpretation and decomposition.
+
+        Args:
+            query: User query text
+
+        Returns:
+            LLM response string (expected to be a JSON object)
+        """
+        if self._llm_client:
+            # Custom client (for testing)
+            return await self._llm_client.generate(
+                prompt=f"{self.PLANNING_PROMPT}\n{query}",
+                model=self.model_config.name,
+                temperature=self.model_config.temperature,
+                max_tokens=self.model_config.max_tokens,
+            )
+
+        # Use openai-agents SDK (agent memoized by the shared LLM gateway)
+        from agents import Runner
+
+        gateway = get_llm_gateway()
+        agent = gateway.get_agent(
+            name="QueryPlanner",
+            instructions=self.PLANNING_PROMPT,
+            model=self.model_config.name,
+            temperature=self.model_config.temperature,
+            max_tokens=self.model_config.max_tokens,
+        )
+
+        # Use the persistent session (or that of the request's conversation)
+        async with gateway.track("smartrouter.planner", self.model_config.name) as call:
+            session = session_for_request("planner", self._session, self._history_config)
+            result = await Runner.run(agent, input=query, session=session)
+            call.record_run_result(result)
+        return str(result.final_output)
+
+    def _parse_planned_subqueries(
+        self,
+        intent: QueryIntent,
+        llm_response: str
+    ) -> Optional[List[Subquery]]:
+        """
+        Parse and validate the subqueries of a combined plan.
+
+        Args:
+            intent: Intent parsed from the same response
+            llm_response: LLM response (JSON object with "subqueries")
+
+        Returns:
+            Validated subqueries ([] if the model planned none), or None if
+            the plan is missing or invalid (decompose() then falls back to a
+            separate decomposition call)
+        """
+        try:
+            data: Dict[str, Any] = json.loads(_extract_json(llm_response))
+            planned = data.get("subqueries")
+            if not isinstance(planned, list):
+                return None
+            if not planned:
+                # Same meaning as an empty decomposition: treat as simple
+                return []
+
+            subqueries = self.decomposer._parse_decomposition(intent, json.dumps(planned))
+            if not subqueries:
+                return None
+            self.decomposer._validate_subqueries(subqueries)
+            self.decomposer.validate_dependencies(subqueries)
+            return subqueries
+
+        except (QueryDecompositionException, ValueError, AttributeError) as e:
+            logger.warning(f"Planned subqueries unusable, will decompose separately: {e}")
+            return None
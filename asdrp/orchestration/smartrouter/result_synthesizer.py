@@ -20,11 +20,12 @@ Responsibilities:
 - Format answer clearly (markdown)
 """
 
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any, Union
 import json
 import logging
+import re
 
-from agents import ModelSettings
+from asdrp.agents.llm_gateway import get_llm_gateway
 
 from asdrp.orchestration.smartrouter.interfaces import (
     IResultSynthesizer,
@@ -32,11 +33,90 @@ from asdrp.orchestration.smartrouter.interfaces import (
     SynthesizedResult,
 )
 from asdrp.orchestration.smartrouter.exceptions import SynthesisException
-from asdrp.orchestration.smartrouter.config_loader import ModelConfig
+from asdrp.orchestration.smartrouter.config_loader import ModelConfig, HistoryConfig
+from asdrp.orchestration.smartrouter.history_window import (
+    create_component_session,
+    session_for_request,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class _AnswerFieldStreamer:
+    """
+    Incrementally extracts the "answer" string from a streamed synthesis JSON.
+
+    The synthesis prompt asks for a JSON object; while it streams, only the
+    decoded contents of its "answer" field are user-facing. If the model
+    replies with plain text instead of JSON, the text is passed through as-is.
+    """
+
+    _ANSWER_KEY = re.compile(r'"answer"\s*:\s*"')
+
+    def __init__(self):
+        self.raw = ""
+        self._pos = 0
+        self._state = "seek"  # seek -> answer -> done, or seek -> raw
+
+    def feed(self, delta: str) -> str:
+        """Add raw model output and return newly decodable answer text."""
+        self.raw += delta
+
+        if self._state == "seek":
+            stripped = self.raw.lstrip()
+            if stripped and not stripped.startswith(("{", "`")):
+                self._state = "raw"
+            else:
+                match = self._ANSWER_KEY.search(self.raw)
+                if not match:
+                    return ""
+                self._state = "answer"
+                self._pos = match.end()
+
+        if self._state == "raw":
+            out = self.raw[self._pos:]
+            self._pos = len(self.raw)
+            return out
+
+        if self._state == "answer":
+            return self._decode_answer()
+
+        return ""
+
+    def _decode_answer(self) -> str:
+        """Decode JSON string characters up to the closing quote or an incomplete escape."""
+        out = []
+        raw = self.raw
+        i = self._pos
+        while i < len(raw):
+            ch = raw[i]
+            if ch == '"':
+                self._state = "done"
+                i += 1
+                break
+            if ch != "\\":
+                out.append(ch)
+                i += 1
+                continue
+
+            # Escape sequence: wait until it is complete before decoding
+            if i + 1 >= len(raw):
+                break
+            length = 6 if raw[i + 1] == "u" else 2
+            if length == 6 and raw[i + 2:i + 4].lower() in ("d8", "d9", "da", "db"):
+                length = 12  # UTF-16 surrogate pair
+            if i + length > len(raw):
+                break
+            try:
+                out.append(json.loads(f'"{raw[i:i + length]}"'))
+            except json.JSONDecodeError:
+                out.append(raw[i + 1:i + length])
+            i += length
+
+        self._pos = i
+        return "".join(out)
+
+
 class ResultSynthesizer(IResultSynthesizer):
     """
     Implementation of response synthesis using LLM.
@@ -103,7 +183,8 @@ Provide your synthesized answer in this JSON format:
         self,
         model_config: ModelConfig,
         llm_client: Optional[Any] = None,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        history_config: Optional[HistoryConfig] = None
     ):
         """
         Initialize ResultSynthesizer.
@@ -112,19 +193,18 @@ Provide your synthesized answer in this JSON format:
             model_config: Configuration for the LLM model
             llm_client: Optional custom LLM client (for testing/DI)
             session_id: Optional session ID for conversation memory
+            history_config: Optional policy bounding the history replayed per call
         """
         self.model_config = model_config
         self._llm_client = llm_client
         self.session_id = session_id
 
+        self._history_config = history_config
+
         # Create session ONCE during initialization (OpenAI best practice)
         self._session = None
         if session_id:
-            from agents import SQLiteSession
-            self._session = SQLiteSession(
-                session_id=f"{session_id}_synthesizer",
-                db_path="data/sessions/smartrouter.db"  # Persistent file-based storage
-            )
+            self._session = create_component_session(session_id, "synthesizer", history_config)
             logger.info(f"ResultSynthesizer: Created persistent session {session_id}_synthesizer")
 
     async def synthesize(
@@ -198,6 +278,95 @@ Provide your synthesized answer in this JSON format:
                 original_exception=e
             ) from e
 
+    async def synthesize_stream(
+        self,
+        responses: Dict[str, AgentResponse],
+        original_query: str
+    ) -> AsyncIterator[Union[str, SynthesizedResult]]:
+        """
+        Synthesize responses, streaming the answer as the LLM generates it.
+
+        Streams the decoded "answer" field of the synthesis JSON via
+        Runner.run_streamed(); the full output is parsed at the end exactly as
+        in synthesize(). Custom llm_clients are not streamed and yield the
+        answer in one piece.
+
+        Args:
+            responses: Dictionary of subquery_id -> AgentResponse
+            original_query: The original user query for context
+
+        Yields:
+            str answer deltas, then the final SynthesizedResult
+
+        Raises:
+            SynthesisException: If synthesis fails
+        """
+        try:
+            if not responses:
+                raise SynthesisException(
+                    "Cannot synthesize with zero responses",
+                    context={"query": original_query}
+                )
+
+            if len(responses) == 1 or self._llm_client:
+                result = await self.synthesize(responses, original_query)
+                yield result.answer
+                yield result
+                return
+
+            from agents import Runner
+            from openai.types.responses import ResponseTextDeltaEvent
+
+            formatted_responses = self._format_responses(responses)
+            streamer = _AnswerFieldStreamer()
+            streamed = ""
+
+            run = Runner.run_streamed(
+                self._build_synthesis_agent(),
+                input=f"Original Query: {original_query}\n\nResponses:\n{formatted_responses}",
+                session=session_for_request("synthesizer", self._session, self._history_config)
+            )
+            async for event in run.stream_events():
+                if event.type != "raw_response_event" or not isinstance(event.data, ResponseTextDeltaEvent):
+                    continue
+                delta = streamer.feed(event.data.delta or "")
+                if delta:
+                    streamed += delta
+                    yield delta
+
+            result = self._parse_synthesis(streamer.raw, responses)
+            if result.answer.startswith(streamed):
+                tail = result.answer[len(streamed):]
+                if tail:
+                    yield tail
+            else:
+                logger.warning("Streamed synthesis differs from parsed answer; final result is authoritative")
+
+            logger.info(
+                f"Streamed synthesis complete: confidence={result.confidence:.2f}, "
+                f"conflicts_resolved={len(result.conflicts_resolved)}"
+            )
+            yield result
+
+        except SynthesisException:
+            raise
+        except Exception as e:
+            raise SynthesisException(
+                f"Response synthesis failed: {str(e)}",
+                context={"query": original_query, "response_count": len(responses)},
+                original_exception=e
+            ) from e
+
+    def _build_synthesis_agent(self) -> Any:
+        """Return the openai-agents Agent used for synthesis (memoized by the LLM gateway)."""
+        return get_llm_gateway().get_agent(
+            name="ResultSynthesizer",
+            instructions=self.SYNTHESIS_PROMPT,
+            model=self.model_config.name,
+            temperature=self.model_config.temperature,
+            max_tokens=self.model_config.max_tokens,
+        )
+
     def _handle_single_response(
         self,
         responses: Dict[str, AgentResponse],
@@ -267,24 +436,16 @@ Provide your synthesized answer in this JSON format:
                 )
 
             # Use openai-agents SDK
-            from agents import Agent, Runner
-
-            agent = Agent(
-                name="ResultSynthesizer",
-                instructions=self.SYNTHESIS_PROMPT,
-                model=self.model_config.name,
-                model_settings=ModelSettings(
-                    temperature=self.model_config.temperature,
-                    max_tokens=self.model_config.max_tokens,
-                ),
-            )
-
-            # Use the persistent session created in __init__
-            result = await Runner.run(
-                agent,
-                input=f"Original Query: {original_query}\n\nResponses:\n{formatted_responses}",
-                session=self._session
-            )
+            from agents import Runner
+
+            # Use the persistent session (or that of the request's conversation)
+            async with get_llm_gateway().track("smartrouter.synthesizer", self.model_config.name) as call:
+                result = await Runner.run(
+                    self._build_synthesis_agent(),
+                    input=f"Original Query: {original_query}\n\nResponses:\n{formatted_responses}",
+                    session=session_for_request("synthesizer", self._session, self._history_config)
+                )
+                call.record_run_result(result)
             return str(result.final_output)
 
         except Exception as e:
@@ -15,8 +15,9 @@ Orchestration Flow:
 ------------------
 1. QueryInterpreter: Analyze and classify query
 2. QueryDecomposer: Break into subqueries (if complex)
+   (planning mode "combined": QueryPlanner does 1 and 2 in one LLM call)
 3. CapabilityRouter: Route subqueries to agents
-4. AsyncSubqueryDispatcher: Execute subqueries concurrently
+4. AsyncSubqueryDispatcher: Execute subqueries concurrently (in dependency order)
 5. ResponseAggregator: Collect and organize responses
 6. ResultSynthesizer: Merge responses into coherent answer
 7. LLMJudge: Evaluate quality and decide fallback
@@ -32,14 +33,19 @@ Usage:
 >>> print(result)
 """
 
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator, Callable
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
+import asyncio
 import logging
 import time
 from pathlib import Path
 
-from asdrp.orchestration.smartrouter.config_loader import SmartRouterConfig, SmartRouterConfigLoader
+from asdrp.orchestration.smartrouter.config_loader import (
+    SmartRouterConfig,
+    SmartRouterConfigLoader,
+    PlanCacheConfig,
+)
 
 # Import session memory types from openai-agents SDK
 try:
@@ -59,15 +65,28 @@ from asdrp.orchestration.smartrouter.interfaces import (
 from asdrp.orchestration.smartrouter.exceptions import SmartRouterException
 from asdrp.orchestration.smartrouter.query_interpreter import QueryInterpreter
 from asdrp.orchestration.smartrouter.query_decomposer import QueryDecomposer
+from asdrp.orchestration.smartrouter.query_planner import QueryPlanner
 from asdrp.orchestration.smartrouter.capability_router import CapabilityRouter
-from asdrp.orchestration.smartrouter.async_subquery_dispatcher import AsyncSubqueryDispatcher
+from asdrp.orchestration.smartrouter.async_subquery_dispatcher import (
+    AsyncSubqueryDispatcher,
+    critical_path,
+)
 from asdrp.orchestration.smartrouter.response_aggregator import ResponseAggregator
 from asdrp.orchestration.smartrouter.result_synthesizer import ResultSynthesizer
 from asdrp.orchestration.smartrouter.llm_judge import LLMJudge
 from asdrp.orchestration.smartrouter.fast_path_router import FastPathRouter
+from asdrp.orchestration.smartrouter.history_window import (
+    bound_session,
+    current_session_id,
+    request_session,
+)
+from asdrp.orchestration.smartrouter.cache import CachedPlan, get_plan_cache
+from asdrp.agents.execution_scheduler import AdmissionError, get_execution_scheduler
+from asdrp.agents.llm_gateway import get_llm_gateway
 from asdrp.orchestration.smartrouter.trace_capture import (
     TraceCapture,
     SmartRouterExecutionResult,
+    SmartRouterStreamEvent,
 )
 
 logger = logging.getLogger(__name__)
@@ -170,19 +189,56 @@ class SmartRouter:
         self.name = "SmartRouter"
         self.instructions = "You are SmartRouter - an advanced multi-agent orchestrator that intelligently routes complex queries to specialized agents."
 
+        # Bound the history replayed from long-lived sessions (internal
+        # components always, agent sessions only if configured)
+        history_config = getattr(config, "history", None)
+        self._agent_history_config = (
+            history_config if getattr(history_config, "apply_to_agent_sessions", False) else None
+        )
+        self.session = bound_session(self.session, self._agent_history_config)
+
         # Initialize components (use provided or create default)
         # Pass session_id to all LLM components for conversation memory
         self.interpreter = interpreter or QueryInterpreter(
             model_config=config.models.interpretation,
-            session_id=session_id
+            session_id=session_id,
+            history_config=history_config
         )
 
         self.decomposer = decomposer or QueryDecomposer(
             model_config=config.models.decomposition,
             decomp_config=config.decomposition,
-            session_id=session_id
+            session_id=session_id,
+            history_config=history_config
         )
 
+        # Combined planning: one LLM call serves both interpret() and decompose()
+        planning_mode = getattr(getattr(config, "planning", None), "mode", "separate")
+        if planning_mode == "combined" and interpreter is None and decomposer is None:
+            planner = QueryPlanner(
+                model_config=config.models.decomposition,
+                decomp_config=config.decomposition,
+                interpreter=self.interpreter,
+                decomposer=self.decomposer,
+                session_id=session_id,
+                history_config=history_config
+            )
+            self.interpreter = planner
+            self.decomposer = planner
+
+        # Plan cache: repeated queries skip interpretation and decomposition.
+        # Only for the default components; see _plan_cache_active() for
+        # conversations.
+        self._plan_cache_config = getattr(config, "plan_cache", None)
+        self.plan_cache = None
+        if (
+            isinstance(self._plan_cache_config, PlanCacheConfig)
+            and self._plan_cache_config.enabled
+            and interpreter is None
+            and decomposer is None
+        ):
+            self.plan_cache = get_plan_cache(self._plan_cache_config)
+
         self.router = capability_router or CapabilityRouter(
             capability_map=config.capabilities
         )
@@ -191,20 +247,23 @@ class SmartRouter:
             agent_factory=agent_factory,
             error_config=config.error_handling,
             session_id=session_id,
-            session=self.session  # Pass SmartRouter's session if available
+            session=self.session,  # Pass SmartRouter's session if available
+            history_config=self._agent_history_config
         )
 
         self.aggregator = aggregator or ResponseAggregator()
 
         self.synthesizer = synthesizer or ResultSynthesizer(
             model_config=config.models.synthesis,
-            session_id=session_id
+            session_id=session_id,
+            history_config=history_config
         )
 
         self.judge = judge or LLMJudge(
             model_config=config.models.evaluation,
             eval_config=config.evaluation,
-            session_id=session_id
+            session_id=session_id,
+            history_config=history_config
         )
 
         # Fast-path router for pre-classification (no LLM)
@@ -274,7 +333,8 @@ class SmartRouter:
     async def route_query(
         self,
         query: str,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None
     ) -> SmartRouterExecutionResult:
         """
         Main entry point: Route and execute a complex query with trace capture.
@@ -291,12 +351,16 @@ class SmartRouter:
         Args:
             query: User query text
             context: Optional additional context
+            session_id: Optional conversation of this request; lets one
+                long-lived router serve many sessions (overrides the
+                session_id given at construction)
 
         Returns:
             SmartRouterExecutionResult with answer and execution traces
 
         Raises:
             SmartRouterException: If routing fails critically
+            AdmissionError: If the execution scheduler shed every agent run
 
         Examples:
         ---------
@@ -305,9 +369,111 @@ class SmartRouter:
         The weather in Paris is currently...
         >>> print(result.agents_used)
         ['one']
+        >>> # Shared router, conversation bound per request
+        >>> result = await router.route_query("And tomorrow?", session_id="user_123")
+        """
+        with request_session(session_id):
+            return await self._route_with_trace(query, TraceCapture())
+
+    async def route_query_stream(
+        self,
+        query: str,
+        context: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None
+    ) -> AsyncIterator[SmartRouterStreamEvent]:
+        """
+        Streaming variant of route_query().
+
+        Runs the same pipeline and yields phase events from TraceCapture
+        (fast_path, interpretation, decomposition, routing, execution,
+        synthesis, evaluation) as they start and finish. Answer tokens are
+        streamed from the routed agent (simple queries, via
+        Runner.run_streamed) or from ResultSynthesizer (complex queries).
+        Once generated, the full answer is yielded as an "answer" event
+        (data: agents_used, phases) so callers can start checking it while it
+        is evaluated. Evaluation runs after the answer has been streamed; the
+        final "done" event carries the SmartRouterExecutionResult, whose
+        answer is authoritative (e.g. when the judge substitutes the fallback
+        message).
+
+        Args:
+            query: User query text
+            context: Optional additional context
+            session_id: Optional conversation of this request (see route_query)
+
+        Yields:
+            SmartRouterStreamEvent instances, ending with a "done" event
+
+        Examples:
+        ---------
+        >>> async for event in router.route_query_stream("Weather in Paris?"):
+        ...     if event.type == "token":
+        ...         print(event.content, end="")
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def on_phase(kind: str, phase_trace: Any) -> None:
+            queue.put_nowait(SmartRouterStreamEvent(
+                type=f"phase_{kind}",
+                phase=phase_trace.phase,
+                data=phase_trace.to_dict() if kind == "end" else {},
+            ))
+
+        def on_token(delta: str) -> None:
+            if delta:
+                queue.put_nowait(SmartRouterStreamEvent(type="token", content=delta))
+
+        trace_capture = TraceCapture(on_phase=on_phase)
+
+        def on_answer(answer: str, agents_used: List[str]) -> None:
+            queue.put_nowait(SmartRouterStreamEvent(
+                type="answer",
+                content=answer,
+                data={"agents_used": list(agents_used), "phases": trace_capture.get_traces()},
+            ))
+
+        # Run the pipeline as a task so phase timings are not skewed by a slow consumer
+        # (the task inherits the session bound here)
+        with request_session(session_id):
+            task = asyncio.create_task(
+                self._route_with_trace(
+                    query, trace_capture, token_sink=on_token, answer_sink=on_answer
+                )
+            )
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    break
+                yield event
+            yield SmartRouterStreamEvent(type="done", result=task.result())
+        finally:
+            if not task.done():
+                task.cancel()
+
+    async def _route_with_trace(
+        self,
+        query: str,
+        trace_capture: TraceCapture,
+        token_sink: Optional[Callable[[str], None]] = None,
+        answer_sink: Optional[Callable[[str, List[str]], None]] = None
+    ) -> SmartRouterExecutionResult:
+        """
+        Run the SmartRouter pipeline, recording phases into trace_capture.
+
+        Args:
+            query: User query text
+            trace_capture: TraceCapture instance for recording execution
+            token_sink: Optional callback receiving answer text deltas as they
+                are generated (enables streaming)
+            answer_sink: Optional callback receiving the answer and the agents
+                used as soon as the answer is generated (before evaluation)
+
+        Returns:
+            SmartRouterExecutionResult with answer and execution traces
         """
-        # Initialize trace capture
-        trace_capture = TraceCapture()
         agents_used: List[str] = []
         original_answer: Optional[str] = None  # Initialize to avoid UnboundLocalError
 
@@ -333,9 +499,11 @@ class SmartRouter:
 
                     # Route directly with fast-path intent (skip interpretation + evaluation)
                     answer, agent_id = await self._handle_simple_query_with_trace(
-                        fast_path_intent, trace_capture
+                        fast_path_intent, trace_capture, token_sink=token_sink
                     )
                     agents_used.append(agent_id)
+                    if answer_sink is not None:
+                        answer_sink(answer, agents_used)
 
                     # Determine final decision: chitchat if conversation/social domains, otherwise fast_path
                     is_chitchat = "conversation" in fast_path_intent.domains or "social" in fast_path_intent.domains
@@ -363,14 +531,40 @@ class SmartRouter:
                     })
 
             # Step 1: Interpret query (TRACE)
+            cached_plan: Optional[CachedPlan] = None
             with trace_capture.phase("interpretation"):
-                intent = await self.interpreter.interpret(query)
+                query_embedding = None
+                # Decided before interpretation, which adds the turn to the history
+                plan_cache_active = await self._plan_cache_active()
+                if plan_cache_active:
+                    query_embedding = await self._embed_for_plan_cache(query)
+                    cached_plan = self.plan_cache.get_plan(query, query_embedding)
+
+                if cached_plan is not None:
+                    intent = cached_plan.intent
+                    # Keep the conversation memory as if interpreted
+                    await self.interpreter.record_turn(query, intent)
+                else:
+                    intent = await self.interpreter.interpret(query)
+                    if (
+                        plan_cache_active
+                        and self._is_cacheable(intent)
+                        and intent.complexity == QueryComplexity.SIMPLE
+                    ):
+                        self.plan_cache.set_plan(query, intent, [], query_embedding)
+
                 trace_capture.record_data({
                     "intent": {
                         "complexity": intent.complexity.value,
                         "domains": intent.domains,
                         "requires_synthesis": intent.requires_synthesis,
-                    }
+                    },
+                    "plan_cache": (
+                        "disabled" if not plan_cache_active
+                        else "miss" if cached_plan is None
+                        else "hit" if cached_plan.exact
+                        else "neighbour"
+                    ),
                 })
             logger.debug(f"Query intent: {intent.complexity.value}, domains={intent.domains}")
 
@@ -380,11 +574,20 @@ class SmartRouter:
             # Step 2: Handle based on complexity
             if intent.complexity == QueryComplexity.SIMPLE:
                 # Simple query: route directly to single agent (TRACE)
-                answer, agent_id = await self._handle_simple_query_with_trace(intent, trace_capture)
+                answer, agent_id = await self._handle_simple_query_with_trace(
+                    intent, trace_capture, token_sink=token_sink
+                )
                 agents_used.append(agent_id)
             else:
                 # Complex query: full orchestration pipeline (TRACE)
-                answer = await self._handle_complex_query_with_trace(intent, trace_capture, agents_used)
+                answer = await self._handle_complex_query_with_trace(
+                    intent, trace_capture, agents_used, token_sink=token_sink,
+                    cached_subqueries=cached_plan.subqueries if cached_plan else None,
+                    query_embedding=query_embedding,
+                    cache_plan=plan_cache_active and self._is_cacheable(intent),
+                )
+            if answer_sink is not None:
+                answer_sink(answer, agents_used)
 
             # Step 3: Evaluate answer quality (skip for chitchat - always friendly and positive)
             if is_chitchat:
@@ -435,6 +638,9 @@ class SmartRouter:
                 original_answer=original_answer,
             )
 
+        except AdmissionError:
+            # Load was shed: report the overload (HTTP 503), not an answer
+            raise
         except SmartRouterException as e:
             logger.error(f"SmartRouter error: {e.message}", exc_info=True)
             return SmartRouterExecutionResult(
@@ -461,7 +667,8 @@ class SmartRouter:
     async def _handle_simple_query_with_trace(
         self,
         intent: QueryIntent,
-        trace_capture: TraceCapture
+        trace_capture: TraceCapture,
+        token_sink: Optional[Callable[[str], None]] = None
     ) -> Tuple[str, str]:
         """
         Handle simple query with direct agent routing and trace capture.
@@ -479,6 +686,8 @@ class SmartRouter:
         Args:
             intent: Query intent
             trace_capture: TraceCapture instance for recording execution
+            token_sink: Optional callback receiving answer deltas; when set the
+                agent is run with Runner.run_streamed()
 
         Returns:
             Tuple of (answer, agent_id)
@@ -621,6 +830,9 @@ class SmartRouter:
         execution_start = time.time()
 
         with trace_capture.phase("execution"):
+            # Conversation of the request being routed, if bound
+            request_session_id = current_session_id(self.session_id)
+
             # Use SmartRouter's session if available, otherwise use agent factory session
             if self.session is not None:
                 # SmartRouter has its own session - use it for all agents
@@ -630,25 +842,22 @@ class SmartRouter:
                     f"Using SmartRouter session for agent '{agent_id}' "
                     "(enables cross-agent context sharing)"
                 )
-            elif self.session_id:
+            elif request_session_id:
                 agent, session = await self.agent_factory.get_agent_with_session(
                     agent_id,
-                    session_id=self.session_id  # ✅ Shared session for cross-agent context
+                    session_id=request_session_id  # ✅ Shared session for cross-agent context
                 )
                 logger.debug(
-                    f"Using shared session '{self.session_id}' for agent '{agent_id}' "
+                    f"Using shared session '{request_session_id}' for agent '{agent_id}' "
                     "(enables cross-agent context sharing)"
                 )
             else:
                 agent = await self.agent_factory.get_agent(agent_id)
                 session = None
+            session = bound_session(session, self._agent_history_config)
 
-            from agents import Runner
-            result = await Runner.run(
-                starting_agent=agent,
-                input=intent.original_query,
-                session=session
-            )
+            async with get_execution_scheduler().slot(agent_id, session_id=request_session_id):
+                answer = await self._run_agent(agent, intent.original_query, session, token_sink)
 
             execution_end = time.time()
             execution_duration = execution_end - execution_start
@@ -666,7 +875,42 @@ class SmartRouter:
                 "concurrent": False,  # Single agent execution
             })
 
-        return (str(result.final_output), agent_id)
+        return (answer, agent_id)
+
+    @staticmethod
+    async def _run_agent(
+        agent: Any,
+        query: str,
+        session: Any,
+        token_sink: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """
+        Run an agent and return its final output as text.
+
+        With a token_sink, uses Runner.run_streamed() and forwards text deltas
+        from the model as they arrive.
+        """
+        from agents import Runner
+
+        if token_sink is None:
+            result = await Runner.run(
+                starting_agent=agent,
+                input=query,
+                session=session
+            )
+            return str(result.final_output)
+
+        from openai.types.responses import ResponseTextDeltaEvent
+
+        run = Runner.run_streamed(
+            starting_agent=agent,
+            input=query,
+            session=session
+        )
+        async for event in run.stream_events():
+            if event.type == "raw_response_event" and isinstance(event.data, ResponseTextDeltaEvent):
+                token_sink(event.data.delta)
+        return str(run.final_output)
 
     async def _handle_simple_query(self, intent: QueryIntent) -> str:
         """
@@ -692,7 +936,11 @@ class SmartRouter:
         self,
         intent: QueryIntent,
         trace_capture: TraceCapture,
-        agents_used: List[str]
+        agents_used: List[str],
+        token_sink: Optional[Callable[[str], None]] = None,
+        cached_subqueries: Optional[List[Subquery]] = None,
+        query_embedding: Optional[List[float]] = None,
+        cache_plan: bool = False
     ) -> str:
         """
         Handle complex query with full orchestration pipeline and trace capture.
@@ -707,6 +955,11 @@ class SmartRouter:
             intent: Query intent
             trace_capture: TraceCapture instance for recording execution
             agents_used: List to populate with agents used during execution
+            token_sink: Optional callback receiving answer deltas; when set the
+                synthesis is streamed via synthesize_stream()
+            cached_subqueries: Subqueries from the plan cache (skips decomposition)
+            query_embedding: Query embedding to store with a newly cached plan
+            cache_plan: Store the decomposed plan in the plan cache
 
         Returns:
             Synthesized answer string
@@ -718,7 +971,15 @@ class SmartRouter:
 
         # Step 1: Decompose query (TRACE)
         with trace_capture.phase("decomposition"):
-            subqueries = await self.decomposer.decompose(intent)
+            if cached_subqueries is not None:
+                subqueries = cached_subqueries
+                logger.info(f"Using {len(subqueries)} cached subqueries")
+            else:
+                subqueries = await self.decomposer.decompose(intent)
+                if cache_plan:
+                    self.plan_cache.set_plan(
+                        intent.original_query, intent, subqueries, query_embedding
+                    )
 
             if not subqueries:
                 # Decomposer returned empty - treat as simple
@@ -727,7 +988,9 @@ class SmartRouter:
                     "subquery_count": 0,
                     "fallback_to_simple": True,
                 })
-                answer, agent_id = await self._handle_simple_query_with_trace(intent, trace_capture)
+                answer, agent_id = await self._handle_simple_query_with_trace(
+                    intent, trace_capture, token_sink=token_sink
+                )
                 agents_used.append(agent_id)
                 return answer
 
@@ -794,8 +1057,19 @@ class SmartRouter:
                 "agent_executions": agent_executions,
                 "execution_duration": execution_duration,
                 "concurrent": len(agents_used) > 1,  # Flag for parallel execution
+                # Dependency-aware schedule: where multi-hop latency goes
+                "critical_path": critical_path(responses),
             })
 
+        # Every subquery was shed by the scheduler: fail fast instead of
+        # spending synthesis and evaluation calls on an empty answer
+        shed = [r for r in responses if (r.metadata or {}).get("shed")]
+        if responses and len(shed) == len(responses):
+            raise AdmissionError(
+                "Server is at capacity; please retry shortly",
+                retry_after=max(r.metadata.get("retry_after", 1.0) for r in shed),
+            )
+
         # Step 4: Aggregate responses
         aggregated = self.aggregator.aggregate(responses, subqueries)
 
@@ -808,10 +1082,26 @@ class SmartRouter:
 
         # Step 6: Synthesize responses (TRACE)
         with trace_capture.phase("synthesis"):
-            synthesized = await self.synthesizer.synthesize(
-                successful,
-                intent.original_query
-            )
+            if token_sink is None:
+                synthesized = await self.synthesizer.synthesize(
+                    successful,
+                    intent.original_query
+                )
+            else:
+                synthesized = None
+                async for item in self.synthesizer.synthesize_stream(
+                    successful,
+                    intent.original_query
+                ):
+                    if isinstance(item, str):
+                        token_sink(item)
+                    else:
+                        synthesized = item
+                if synthesized is None:
+                    raise SmartRouterException(
+                        "Synthesis stream ended without a result",
+                        context={"query": intent.original_query}
+                    )
 
             trace_capture.record_data({
                 "synthesized_from": len(responses),
@@ -846,6 +1136,40 @@ class SmartRouter:
         agents_used: List[str] = []
         return await self._handle_complex_query_with_trace(intent, trace_capture, agents_used)
 
+    async def _plan_cache_active(self) -> bool:
+        """Whether the plan cache applies to the request being routed."""
+        if self.plan_cache is None:
+            return False
+        if (
+            current_session_id(self.session_id) is None
+            or self._plan_cache_config.include_sessions
+        ):
+            return True
+        # Plans of a conversation may depend on its earlier turns, so only
+        # its first turn shares plans with other conversations
+        return not await self.interpreter.has_history()
+
+    def _is_cacheable(self, intent: QueryIntent) -> bool:
+        """Whether a plan built from this intent may be stored in the plan cache."""
+        # Heuristic fallbacks (LLM failure) would pin a poor plan for the TTL
+        reasoning = str(intent.metadata.get("reasoning", ""))
+        return not reasoning.startswith("Fallback heuristic")
+
+    async def _embed_for_plan_cache(self, query: str) -> Optional[List[float]]:
+        """Embed a query for plan cache neighbour lookups (None if not configured)."""
+        if self._plan_cache_config.similarity_threshold is None:
+            return None
+        try:
+            response = await get_llm_gateway().embeddings(
+                "smartrouter.plan_cache",
+                model=self._plan_cache_config.embedding_model,
+                input=query,
+            )
+            return response.data[0].embedding
+        except Exception as e:
+            logger.warning(f"Plan cache embedding failed, using exact lookup only: {e}")
+            return None
+
     def get_capabilities(self) -> Dict[str, List[str]]:
         """
         Get the capability map for debugging/introspection.
@@ -22,7 +22,7 @@ Usage:
 """
 
 import time
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 import logging
@@ -76,12 +76,19 @@ class TraceCapture:
     Thread-Safety: Not thread-safe by design (each request gets its own instance)
     """
 
-    def __init__(self):
-        """Initialize trace capture service."""
+    def __init__(self, on_phase: Optional[Callable[[str, PhaseTrace], None]] = None):
+        """
+        Initialize trace capture service.
+
+        Args:
+            on_phase: Optional listener called with ("start", trace) when a phase
+                begins and ("end", trace) when it finishes (used for streaming)
+        """
         self._traces: List[PhaseTrace] = []
         self._current_phase: Optional[PhaseTrace] = None
         self._start_time: float = time.time()
         self._agents_used: List[str] = []
+        self._on_phase = on_phase
 
     @contextmanager
     def phase(self, phase_name: str):
@@ -105,6 +112,7 @@ class TraceCapture:
         )
         self._current_phase = phase_trace
         self._traces.append(phase_trace)
+        self._notify("start", phase_trace)
 
         try:
             yield phase_trace
@@ -120,6 +128,16 @@ class TraceCapture:
             logger.debug(
                 f"Phase '{phase_name}' completed in {phase_trace.duration:.3f}s"
             )
+            self._notify("end", phase_trace)
+
+    def _notify(self, event: str, phase_trace: PhaseTrace) -> None:
+        """Forward a phase event to the listener; listener errors never affect execution."""
+        if self._on_phase is None:
+            return
+        try:
+            self._on_phase(event, phase_trace)
+        except Exception as e:
+            logger.warning(f"Phase listener failed for '{phase_trace.phase}' ({event}): {e}")
 
     def record_data(self, data: Dict[str, Any]) -> None:
         """
@@ -270,3 +288,24 @@ class SmartRouterExecutionResult:
         result = self.to_dict()
         del result["answer"]
         return result
+
+
+@dataclass
+class SmartRouterStreamEvent:
+    """
+    Incremental event from SmartRouter.route_query_stream().
+
+    Attributes:
+        type: "phase_start", "phase_end", "token", "answer" or "done"
+        phase: Phase name for phase events
+        content: Answer text delta for token events, full (pre-evaluation)
+            answer for the answer event
+        data: Phase trace dictionary for phase_end events; agents_used and
+            phases for the answer event
+        result: Complete SmartRouterExecutionResult for the done event
+    """
+    type: str
+    phase: Optional[str] = None
+    content: str = ""
+    data: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[SmartRouterExecutionResult] = None
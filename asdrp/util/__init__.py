@@ -10,8 +10,11 @@
 #############################################################################
 
 from asdrp.util.dict_utils import DictUtils
+from asdrp.util.lru_cache import CacheEntry, LRUCache
 
 __all__ = [
     'DictUtils',
+    'CacheEntry',
+    'LRUCache',
 ]
 
@@ -0,0 +1,181 @@
+#############################################################################
+# lru_cache.py
+#
+# Thread-safe in-memory LRU cache with optional TTL.
+#
+# Shared by the SmartRouter caches (routing decisions, plans) and the server
+# guardrails (hallucination verdicts). Entries live in process memory only.
+#
+# Design Principles:
+# - Thread-Safe: All operations hold a threading.Lock
+# - LRU Eviction: Least recently used entries are evicted past max_size
+# - TTL Support: Optional per-cache and per-entry time-to-live
+# - Observable: Exposes hit/miss/eviction metrics for monitoring
+#
+#############################################################################
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Dict, Optional
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """
+    Single cache entry with value and metadata.
+
+    Attributes:
+        value: Cached data
+        created_at: Timestamp when entry was created
+        accessed_at: Timestamp of last access
+        access_count: Number of times accessed
+        ttl_seconds: Time-to-live in seconds (None = no expiry)
+    """
+    value: Any
+    created_at: float = field(default_factory=time.time)
+    accessed_at: float = field(default_factory=time.time)
+    access_count: int = 0
+    ttl_seconds: Optional[float] = None
+
+    def is_expired(self) -> bool:
+        """Check if entry has expired based on TTL."""
+        if self.ttl_seconds is None:
+            return False
+        return (time.time() - self.created_at) > self.ttl_seconds
+
+    def access(self) -> Any:
+        """Mark entry as accessed and return value."""
+        self.accessed_at = time.time()
+        self.access_count += 1
+        return self.value
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache with optional TTL support.
+
+    This is a generic cache implementation that can be used for any data type.
+    Uses OrderedDict for O(1) access and LRU eviction.
+
+    Attributes:
+        max_size: Maximum number of entries
+        ttl_seconds: Default time-to-live for entries (None = no expiry)
+
+    Metrics:
+        hits: Number of cache hits
+        misses: Number of cache misses
+        evictions: Number of entries evicted due to size
+        expirations: Number of entries expired due to TTL
+    """
+
+    def __init__(self, max_size: int = 1000, ttl_seconds: Optional[float] = None):
+        """
+        Initialize LRU cache.
+
+        Args:
+            max_size: Maximum number of entries (default: 1000)
+            ttl_seconds: Time-to-live in seconds (None = no expiry)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = Lock()
+
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get value from cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if not found or expired
+        """
+        with self._lock:
+            if key not in self._cache:
+                self._misses += 1
+                return None
+
+            entry = self._cache[key]
+
+            # Check expiration
+            if entry.is_expired():
+                logger.debug(f"Cache expired: {key}")
+                del self._cache[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            # Move to end (most recently used)
+            self._cache.move_to_end(key)
+            self._hits += 1
+
+            return entry.access()
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Set value in cache.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl_seconds: Optional TTL override (uses default if None)
+        """
+        with self._lock:
+            # Use provided TTL or default
+            ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+
+            # Create entry
+            entry = CacheEntry(value=value, ttl_seconds=ttl)
+
+            # Update or add entry
+            if key in self._cache:
+                del self._cache[key]
+
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+
+            # Evict if over size
+            if len(self._cache) > self.max_size:
+                evicted_key = next(iter(self._cache))
+                del self._cache[evicted_key]
+                self._evictions += 1
+                logger.debug(f"Cache evicted: {evicted_key}")
+
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        with self._lock:
+            self._cache.clear()
+            logger.info("Cache cleared")
+
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get cache metrics.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, size, evictions, expirations
+        """
+        with self._lock:
+            total_requests = self._hits + self._misses
+            hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
+
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": hit_rate,
+                "size": len(self._cache),
+                "max_size": self.max_size,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
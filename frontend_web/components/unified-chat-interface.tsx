@@ -1286,7 +1286,14 @@ export function UnifiedChatInterface({
           case "done":
             // Finalize message with metadata
             const finalMetadata = { ...streamMetadata, ...chunk.metadata, mode: "stream" };
+            streamMetadata = finalMetadata;
+            // Orchestrators send the full answer on done when it differs from the
+            // streamed tokens (e.g. guardrail repair); it replaces the streamed text.
+            if (chunk.content) {
+              streamedContent = chunk.content;
+            }
             updateMessage(streamMessage.id, {
+              content: streamedContent,
               isFinal: true,
               metadata: finalMetadata,
             });
@@ -1310,6 +1317,18 @@ export function UnifiedChatInterface({
             }
             break;
 
+          case "guardrail":
+            // Async guardrail verdict trails "done"; a triggered verdict carries
+            // a safe repair that replaces the delivered answer.
+            if (chunk.content) {
+              streamedContent = chunk.content;
+              updateMessage(streamMessage.id, {
+                content: streamedContent,
+                metadata: { ...streamMetadata, ...chunk.metadata },
+              });
+            }
+            break;
+
           case "error":
             throw new Error(chunk.content || "Stream error");
         }
@@ -83,7 +83,7 @@ export interface SimulationResponse {
 /**
  * Chunk types for streaming responses
  */
-export type StreamChunkType = "metadata" | "token" | "step" | "done" | "error";
+export type StreamChunkType = "metadata" | "token" | "step" | "done" | "guardrail" | "error";
 
 /**
  * Single chunk in streaming response
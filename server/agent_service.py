@@ -6,7 +6,10 @@ the existing asdrp.agents infrastructure. Follows dependency inversion
 and single responsibility principles.
 """
 
+import asyncio
+import os
 import sys
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime, UTC
@@ -21,6 +24,7 @@ except Exception:
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from asdrp.agents.agent_factory import AgentFactory
+from asdrp.agents.execution_scheduler import AdmissionError, get_execution_scheduler
 from asdrp.agents.protocol import AgentProtocol, AgentException
 from asdrp.agents.config_loader import AgentConfigLoader
 
@@ -37,6 +41,7 @@ from server.models import (
 )
 
 from server.guardrails.hallucination import (
+    GuardrailConfig,
     check_ungrounded_hallucination,
     should_repair,
 )
@@ -68,6 +73,9 @@ class AgentService:
         self._factory = factory or AgentFactory.instance()
         self._config_loader = AgentConfigLoader()
 
+        # Shared SmartRouter, built on first use and rebuilt on config reload
+        self._smartrouter = None
+
         # Initialize MoE orchestrator if available
         self._moe = None
         try:
@@ -389,35 +397,38 @@ class AgentService:
         # For MCP-enabled agents: MCPServerStdio requires async context management.
         # We wrap Runner.run() in the MCP server context managers.
         try:
-            # Check if agent has MCP servers (be defensive: mocks/unknown types may not support len()).
-            mcp_servers = getattr(agent, 'mcp_servers', None)
-            if isinstance(mcp_servers, (list, tuple)) and len(mcp_servers) > 0:
-                # Agent has MCP servers - use async with context managers
-                # We need to enter all MCP server contexts before running
-                from contextlib import AsyncExitStack
-
-                async with AsyncExitStack() as stack:
-                    # Enter all MCP server contexts
-                    for mcp_server in mcp_servers:
-                        await stack.enter_async_context(mcp_server)
-
-                    # Now run the agent with connected MCP servers
+            # Hold a slot in the process-wide scheduler for the whole run so
+            # direct chats share the concurrency budget with orchestrators.
+            async with get_execution_scheduler().slot(agent_id, session_id=ensured_session_id):
+                # Check if agent has MCP servers (be defensive: mocks/unknown types may not support len()).
+                mcp_servers = getattr(agent, 'mcp_servers', None)
+                if isinstance(mcp_servers, (list, tuple)) and len(mcp_servers) > 0:
+                    # Agent has MCP servers - use async with context managers
+                    # We need to enter all MCP server contexts before running
+                    from contextlib import AsyncExitStack
+
+                    async with AsyncExitStack() as stack:
+                        # Enter all MCP server contexts
+                        for mcp_server in mcp_servers:
+                            await stack.enter_async_context(mcp_server)
+
+                        # Now run the agent with connected MCP servers
+                        run_result = await Runner.run(
+                            starting_agent=agent,
+                            input=request.input,
+                            context=request.context,
+                            max_turns=max(request.max_steps, 10),
+                            session=session,
+                        )
+                else:
+                    # No MCP servers - standard execution
                     run_result = await Runner.run(
                         starting_agent=agent,
                         input=request.input,
                         context=request.context,
-                        max_turns=max(request.max_steps, 10),
+                        max_turns=max(request.max_steps, 10),  # Ensure at least 10 turns
                         session=session,
                     )
-            else:
-                # No MCP servers - standard execution
-                run_result = await Runner.run(
-                    starting_agent=agent,
-                    input=request.input,
-                    context=request.context,
-                    max_turns=max(request.max_steps, 10),  # Ensure at least 10 turns
-                    session=session,
-                )
 
             # Build execution trace from run result
             trace = []
@@ -483,17 +494,14 @@ class AgentService:
                     extra_context={"mode": "chat"},
                 )
                 if verdict and should_repair(verdict):
-                    response.metadata["guardrails"] = {
-                        "hallucination": {
-                            "triggered": True,
-                            "risk": verdict.risk,
-                            "reason": verdict.reason,
-                        }
-                    }
+                    response.metadata["guardrails"] = self._guardrail_metadata(verdict)
                     response.response = verdict.safe_repair
 
             return response
 
+        except AdmissionError:
+            # Load shedding is reported as-is (HTTP 503), not as an agent failure
+            raise
         except Exception as e:
             raise AgentException(
                 f"Agent execution failed: {str(e)}",
@@ -609,84 +617,160 @@ class AgentService:
 
         Raises:
             AgentException: If SmartRouter execution fails
+            AdmissionError: If the execution scheduler shed the request
         """
         try:
-            # Import SmartRouter
-            from asdrp.orchestration.smartrouter.smartrouter import SmartRouter
-
             ensured_session_id = self._ensure_session_id("smartrouter", request)
-
-            # Create SmartRouter instance with session
-            router = SmartRouter.create(
-                agent_factory=self._factory,
-                session_id=ensured_session_id
-            )
+            router = self._get_smartrouter()
 
             # Execute query with trace capture
             result = await router.route_query(
                 query=request.input,
-                context=request.context
+                context=request.context,
+                session_id=ensured_session_id
             )
 
-            # Build response with trace metadata
-            response = SimulationResponse(
-                response=result.answer,
-                trace=[
-                    SimulationStep(
-                        agent_id="smartrouter",
-                        agent_name="SmartRouter",
-                        action="orchestrate",
-                        output=result.answer,
-                        timestamp=datetime.now(UTC).isoformat(),
-                    )
-                ],
-                metadata={
-                    "agent_id": "smartrouter",
-                    "agent_name": "SmartRouter",
-                    "orchestrator": "smartrouter",
-                    "mode": "real",
-                    "session_enabled": True,
-                    "session_id": ensured_session_id,
-                    "timestamp": datetime.now(UTC).isoformat(),
-                    # SmartRouter execution trace data for visualization
-                    "phases": result.traces,
-                    "total_time": result.total_time,
-                    "final_decision": result.final_decision,
-                    "agents_used": result.agents_used,
-                    "success": result.success,
-                },
+            response, guardrail_context = self._build_smartrouter_response(
+                result, ensured_session_id
             )
-
-            # Guardrail: detect off-topic / ungrounded hallucinations and repair if needed.
-            verdict = await check_ungrounded_hallucination(
-                query=request.input,
-                output=response.response,
-                session_id=ensured_session_id,
-                orchestrator="smartrouter",
-                extra_context={
-                    "agents_used": result.agents_used,
-                    "final_decision": result.final_decision,
-                    "phases": result.traces[:6] if isinstance(result.traces, list) else result.traces,
-                },
+            await self._apply_guardrail(
+                request, response, ensured_session_id, "smartrouter", guardrail_context
             )
-            if verdict and should_repair(verdict):
-                response.metadata["guardrails"] = {
-                    "hallucination": {
-                        "triggered": True,
-                        "risk": verdict.risk,
-                        "reason": verdict.reason,
-                    }
-                }
-                response.response = verdict.safe_repair
 
             return response
 
+        except AdmissionError:
+            # Load shedding is reported as-is (HTTP 503), not as an agent failure
+            raise
         except Exception as e:
             raise AgentException(
                 f"SmartRouter execution failed: {str(e)}",
                 agent_name="smartrouter"
             ) from e
 
+    def _get_smartrouter(self) -> Any:
+        """
+        Get the shared SmartRouter, creating it on first use.
+
+        The router is built once (config parsing, components, fast-path
+        patterns) and serves every session; each request binds its session
+        via route_query(session_id=...). reload_config() drops it so the next
+        request picks up the new configuration.
+        """
+        if self._smartrouter is None:
+            from asdrp.orchestration.smartrouter.smartrouter import SmartRouter
+
+            self._smartrouter = SmartRouter.create(agent_factory=self._factory)
+        return self._smartrouter
+
+    async def warm_up(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Initialize lazily built components before the first request.
+
+        Runs concurrently:
+        - agents: imports agent modules, builds the shared agent instances and
+          opens the first connection of each MCP pool they registered
+        - moe: expert and fast-path embeddings (read from the persistent
+          embedding store when available)
+        - smartrouter: the shared router, when it is the active orchestrator
+
+        A failed component is reported but not raised; it is then initialized
+        lazily on first use, as without warm-up.
+
+        Returns:
+            Mapping of component name to {"status": "ok" | "failed",
+            "duration_ms": ..., "error": ...} plus component stats
+        """
+        tasks = {"agents": self._warm_agents()}
+        if self._moe is not None:
+            tasks["moe"] = self._moe.warm_up()
+        if os.getenv("ORCHESTRATOR", "default") == "smartrouter":
+            tasks["smartrouter"] = self._warm_smartrouter()
+
+        async def timed(coro) -> Dict[str, Any]:
+            start = time.perf_counter()
+            try:
+                stats = await coro
+                result = {"status": "ok", **(stats or {})}
+            except Exception as e:
+                result = {"status": "failed", "error": str(e) or type(e).__name__}
+            result["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+            return result
+
+        results = await asyncio.gather(*(timed(coro) for coro in tasks.values()))
+        return dict(zip(tasks, results))
+
+    async def _warm_agents(self) -> Dict[str, Any]:
+        """Load agent modules and instances, then warm the MCP pools they use."""
+        from asdrp.agents.mcp import get_mcp_manager
+
+        # Module imports are blocking; keep them off the event loop
+        names = await asyncio.to_thread(self._factory.preload)
+        results = await asyncio.gather(
+            *(self._factory.get_agent(name) for name in names), return_exceptions=True
+        )
+        failed = {
+            name: str(result)
+            for name, result in zip(names, results)
+            if isinstance(result, Exception)
+        }
+        mcp_pools = await get_mcp_manager().warm_pools()
+        return {
+            "agents_loaded": len(names) - len(failed),
+            "agents_failed": failed,
+            "mcp_pools": mcp_pools,
+        }
+
+    async def _warm_smartrouter(self) -> Dict[str, Any]:
+        """Build the shared SmartRouter."""
+        self._get_smartrouter()
+        return {}
+
+    def _build_smartrouter_response(
+        self, result: Any, session_id: str
+    ) -> tuple[SimulationResponse, Dict[str, Any]]:
+        """
+        Build the SimulationResponse for a SmartRouter execution result.
+
+        Returns:
+            Tuple of (response with trace metadata, guardrail extra context)
+        """
+        # Build response with trace metadata
+        response = SimulationResponse(
+            response=result.answer,
+            trace=[
+                SimulationStep(
+                    agent_id="smartrouter",
+                    agent_name="SmartRouter",
+                    action="orchestrate",
+                    output=result.answer,
+                    timestamp=datetime.now(UTC).isoformat(),
+                )
+            ],
+            metadata={
+                "agent_id": "smartrouter",
+                "agent_name": "SmartRouter",
+                "orchestrator": "smartrouter",
+                "mode": "real",
+                "session_enabled": True,
+                "session_id": session_id,
+                "timestamp": datetime.now(UTC).isoformat(),
+                # SmartRouter execution trace data for visualization
+                "phases": result.traces,
+                "total_time": result.total_time,
+                "final_decision": result.final_decision,
+                "agents_used": result.agents_used,
+                "success": result.success,
+            },
+        )
+
+        guardrail_context = {
+            "agents_used": result.agents_used,
+            "final_decision": result.final_decision,
+            "phases": result.traces[:6] if isinstance(result.traces, list) else result.traces,
+        }
+        return response, guardrail_context
+
     async def _execute_moe(
         self, request: SimulationRequest
     ) -> SimulationResponse:
@@ -706,6 +790,7 @@ class AgentService:
 
         Raises:
             AgentException: If MoE execution fails or not available
+            AdmissionError: If the execution scheduler shed the request
         """
         if not self._moe:
             raise AgentException(
@@ -723,98 +808,18 @@ class AgentService:
                 context=request.context
             )
 
-            # Serialize MoE trace to dict for frontend visualization
-            from dataclasses import asdict, is_dataclass
-            trace_obj = getattr(result, "trace", None)
-            if is_dataclass(trace_obj):
-                trace_dict = asdict(trace_obj)
-            elif isinstance(trace_obj, dict):
-                trace_dict = trace_obj
-            else:
-                # Best-effort fallback for tests / mocks
-                trace_dict = {}
-
-            # Defensive normalization: MoETrace uses Optional fields that may be None.
-            # The frontend and guardrails expect arrays/dicts, not None.
-            if isinstance(trace_dict, dict):
-                if trace_dict.get("expert_details") is None:
-                    trace_dict["expert_details"] = []
-                if trace_dict.get("selected_experts") is None:
-                    trace_dict["selected_experts"] = []
-                if trace_dict.get("expert_results") is None:
-                    trace_dict["expert_results"] = []
-
-            def _trace_get(key: str, default=None):
-                if isinstance(trace_dict, dict) and key in trace_dict:
-                    v = trace_dict.get(key)
-                    return default if v is None else v
-                if trace_obj is not None and hasattr(trace_obj, key):
-                    v = getattr(trace_obj, key)
-                    return default if v is None else v
-                return default
-
-            selected_experts_safe = _trace_get("selected_experts", default=[])
-            expert_details_safe = _trace_get("expert_details", default=[])
-
-            # Build response with full trace metadata
-            response = SimulationResponse(
-                response=result.response,
-                trace=[
-                    SimulationStep(
-                        agent_id="moe",
-                        agent_name="MoE",
-                        action="orchestrate",
-                        output=result.response,
-                        timestamp=datetime.now(UTC).isoformat(),
-                    )
-                ],
-                metadata={
-                    "agent_id": "moe",
-                    "agent_name": "MoE",
-                    "orchestrator": "moe",
-                    "mode": "real",
-                    "session_enabled": True,
-                    "session_id": ensured_session_id,
-                    "timestamp": datetime.now(UTC).isoformat(),
-                    # MoE execution trace data for visualization
-                    "experts_used": result.experts_used,
-                    "latency_ms": float(_trace_get("latency_ms", default=0.0)),
-                    "cache_hit": bool(_trace_get("cache_hit", default=False)),
-                    "fallback": bool(_trace_get("fallback", default=False)),
-                    "request_id": str(_trace_get("request_id", default="")),
-                    # Full trace data for ReactFlow visualization
-                    "trace": trace_dict,
-                    "query": str(_trace_get("query", default=request.input)),
-                    "final_response": _trace_get("final_response", default=""),
-                    "selected_experts": selected_experts_safe,
-                    "expert_details": expert_details_safe,
-                },
+            response, guardrail_context = self._build_moe_response(
+                request, result, ensured_session_id
             )
-
-            verdict = await check_ungrounded_hallucination(
-                query=request.input,
-                output=response.response,
-                session_id=ensured_session_id,
-                orchestrator="moe",
-                extra_context={
-                    "selected_experts": selected_experts_safe,
-                    "expert_details": (expert_details_safe or [])[:6],
-                    "cache_hit": bool(_trace_get("cache_hit", default=False)),
-                    "fallback": bool(_trace_get("fallback", default=False)),
-                },
+            await self._apply_guardrail(
+                request, response, ensured_session_id, "moe", guardrail_context
             )
-            if verdict and should_repair(verdict):
-                response.metadata["guardrails"] = {
-                    "hallucination": {
-                        "triggered": True,
-                        "risk": verdict.risk,
-                        "reason": verdict.reason,
-                    }
-                }
-                response.response = verdict.safe_repair
 
             return response
 
+        except AdmissionError:
+            # Load shedding is reported as-is (HTTP 503), not as an agent failure
+            raise
         except Exception as e:
             error_id = uuid.uuid4().hex[:10]
             logger.exception(f"[MoE] execution failed (error_id={error_id})")
@@ -823,6 +828,209 @@ class AgentService:
                 agent_name="moe"
             ) from e
 
+    def _build_moe_response(
+        self, request: SimulationRequest, result: Any, session_id: str
+    ) -> tuple[SimulationResponse, Dict[str, Any]]:
+        """
+        Build the SimulationResponse for a MoE result.
+
+        Returns:
+            Tuple of (response with trace metadata, guardrail extra context)
+        """
+        # Serialize MoE trace to dict for frontend visualization
+        from dataclasses import asdict, is_dataclass
+        trace_obj = getattr(result, "trace", None)
+        if is_dataclass(trace_obj):
+            trace_dict = asdict(trace_obj)
+        elif isinstance(trace_obj, dict):
+            trace_dict = trace_obj
+        else:
+            # Best-effort fallback for tests / mocks
+            trace_dict = {}
+
+        # Defensive normalization: MoETrace uses Optional fields that may be None.
+        # The frontend and guardrails expect arrays/dicts, not None.
+        if isinstance(trace_dict, dict):
+            if trace_dict.get("expert_details") is None:
+                trace_dict["expert_details"] = []
+            if trace_dict.get("selected_experts") is None:
+                trace_dict["selected_experts"] = []
+            if trace_dict.get("expert_results") is None:
+                trace_dict["expert_results"] = []
+
+        def _trace_get(key: str, default=None):
+            if isinstance(trace_dict, dict) and key in trace_dict:
+                v = trace_dict.get(key)
+                return default if v is None else v
+            if trace_obj is not None and hasattr(trace_obj, key):
+                v = getattr(trace_obj, key)
+                return default if v is None else v
+            return default
+
+        selected_experts_safe = _trace_get("selected_experts", default=[])
+        expert_details_safe = _trace_get("expert_details", default=[])
+
+        # Build response with full trace metadata
+        response = SimulationResponse(
+            response=result.response,
+            trace=[
+                SimulationStep(
+                    agent_id="moe",
+                    agent_name="MoE",
+                    action="orchestrate",
+                    output=result.response,
+                    timestamp=datetime.now(UTC).isoformat(),
+                )
+            ],
+            metadata={
+                "agent_id": "moe",
+                "agent_name": "MoE",
+                "orchestrator": "moe",
+                "mode": "real",
+                "session_enabled": True,
+                "session_id": session_id,
+                "timestamp": datetime.now(UTC).isoformat(),
+                # MoE execution trace data for visualization
+                "experts_used": result.experts_used,
+                "latency_ms": float(_trace_get("latency_ms", default=0.0)),
+                "cache_hit": bool(_trace_get("cache_hit", default=False)),
+                "fallback": bool(_trace_get("fallback", default=False)),
+                "request_id": str(_trace_get("request_id", default="")),
+                # Full trace data for ReactFlow visualization
+                "trace": trace_dict,
+                "query": str(_trace_get("query", default=request.input)),
+                "final_response": _trace_get("final_response", default=""),
+                "selected_experts": selected_experts_safe,
+                "expert_details": expert_details_safe,
+            },
+        )
+
+        guardrail_context = {
+            "selected_experts": selected_experts_safe,
+            "expert_details": (expert_details_safe or [])[:6],
+            "cache_hit": bool(_trace_get("cache_hit", default=False)),
+            "fallback": bool(_trace_get("fallback", default=False)),
+        }
+        return response, guardrail_context
+
+    async def _apply_guardrail(
+        self,
+        request: SimulationRequest,
+        response: SimulationResponse,
+        session_id: str,
+        orchestrator: str,
+        guardrail_context: Dict[str, Any],
+    ) -> None:
+        """Run the ungrounded-hallucination guardrail and repair the response in place."""
+        # Guardrail: detect off-topic / ungrounded hallucinations and repair if needed.
+        verdict = await check_ungrounded_hallucination(
+            query=request.input,
+            output=response.response,
+            session_id=session_id,
+            orchestrator=orchestrator,
+            extra_context=guardrail_context,
+        )
+        if verdict and should_repair(verdict):
+            response.metadata["guardrails"] = self._guardrail_metadata(verdict)
+            response.response = verdict.safe_repair
+
+    def _start_guardrail_task(
+        self,
+        request: SimulationRequest,
+        output: str,
+        session_id: str,
+        orchestrator: str,
+        guardrail_context: Dict[str, Any],
+    ) -> Optional[asyncio.Task]:
+        """
+        Start the guardrail on `output` in the background when guardrails run
+        in async mode.
+
+        Returns None in blocking mode; the caller then applies the guardrail
+        before delivering the response.
+        """
+        config = GuardrailConfig.from_env()
+        if not (config.enabled and config.is_async):
+            return None
+        return asyncio.create_task(
+            check_ungrounded_hallucination(
+                query=request.input,
+                output=output,
+                session_id=session_id,
+                orchestrator=orchestrator,
+                extra_context=guardrail_context,
+                config=config,
+            )
+        )
+
+    def _guardrail_task_for_response(
+        self,
+        task: Optional[asyncio.Task],
+        checked_answer: Optional[str],
+        request: SimulationRequest,
+        response: SimulationResponse,
+        session_id: str,
+        orchestrator: str,
+        guardrail_context: Dict[str, Any],
+    ) -> Optional[asyncio.Task]:
+        """
+        Guardrail task for the delivered response of an orchestrator stream.
+
+        Keeps the task started on the orchestrator's "answer" event when it
+        checked the delivered text; otherwise (no early check, or the answer
+        was replaced, e.g. by the judge's fallback) checks the final answer.
+        """
+        if task is not None:
+            if response.response == checked_answer:
+                return task
+            task.cancel()
+        return self._start_guardrail_task(
+            request, response.response, session_id, orchestrator, guardrail_context
+        )
+
+    async def _guardrail_chunk(self, task: asyncio.Task, agent_id: str) -> StreamChunk:
+        """
+        Await a background guardrail check and build the trailing "guardrail" chunk.
+
+        When the guardrail triggers, `content` carries the safe repair that should
+        replace the delivered answer.
+        """
+        verdict = await task
+        if verdict and should_repair(verdict):
+            return StreamChunk(
+                type="guardrail",
+                content=verdict.safe_repair,
+                metadata={"agent_id": agent_id, "guardrails": self._guardrail_metadata(verdict)},
+            )
+        return StreamChunk(
+            type="guardrail",
+            metadata={"agent_id": agent_id, "guardrails": {"hallucination": {"triggered": False}}},
+        )
+
+    @staticmethod
+    def _guardrail_metadata(verdict: Any) -> Dict[str, Any]:
+        """Response metadata describing a triggered hallucination guardrail."""
+        return {
+            "hallucination": {
+                "triggered": True,
+                "risk": verdict.risk,
+                "reason": verdict.reason,
+            }
+        }
+
+    @staticmethod
+    def _describe_moe_event(event: Any) -> str:
+        """Human-readable label for a MoE stream stage event."""
+        data = event.data or {}
+        if event.type == "selection":
+            return f"Selected experts: {', '.join(data.get('experts', []))}"
+        if event.type == "expert_started":
+            return f"Running {data.get('agent_name') or data.get('expert_id')}"
+        if event.type == "expert_completed":
+            status = "completed" if data.get("success") else "failed"
+            return f"{data.get('expert_id')} {status}"
+        return event.type
+
     def get_agent_graph(self) -> AgentGraph:
         """
         Generate graph representation of agents for visualization.
@@ -915,10 +1123,19 @@ class AgentService:
         to provide real-time token-by-token streaming of the agent's response.
 
         Special cases:
-        - If agent_id is "smartrouter", streams SmartRouter orchestration.
-        - If agent_id is "moe", streams MoE orchestration.
-        Note: Orchestrators don't support token-level streaming yet, so they return
-        the complete answer at once.
+        - If agent_id is "smartrouter", streams SmartRouter phase events as "step"
+          chunks and the answer token by token.
+        - If agent_id is "moe", streams MoE stage events as "step" chunks and the
+          synthesized answer token by token.
+        Orchestrator "done" chunks carry the full answer in `content` when it
+        differs from the streamed tokens (fallback or guardrail repair). With
+        OPENAGENTS_GUARDRAILS_MODE=async the hallucination guardrail starts as
+        soon as the orchestrator has the final answer text (before the judge /
+        result caching) and runs while the answer is delivered; its verdict
+        follows "done" as a trailing
+        "guardrail" chunk whose `content` is the safe repair when triggered.
+        Direct agent runs hold an execution scheduler slot until the stream
+        ends; a shed run yields an "error" chunk with `retry_after` metadata.
 
         Args:
             agent_id: Agent identifier (or "smartrouter"/"moe" for orchestrators)
@@ -946,25 +1163,75 @@ class AgentService:
                 }
             )
 
-            # Execute SmartRouter
+            # Stream SmartRouter: phase events as steps, answer as tokens
+            guardrail_task = None
+            checked_answer = None
             try:
-                response = await self._execute_smartrouter(request)
-                # Stream the answer (all at once for now)
-                yield StreamChunk(
-                    type="token",
-                    content=response.response
-                )
-                # Send done with metadata
+                router = self._get_smartrouter()
+                streamed = ""
+                result = None
+                async for event in router.route_query_stream(
+                    query=request.input,
+                    context=request.context,
+                    session_id=ensured_session_id
+                ):
+                    if event.type == "token":
+                        if event.content:
+                            streamed += event.content
+                            yield StreamChunk(type="token", content=event.content)
+                    elif event.type == "answer":
+                        # Check the answer while the judge evaluates it and it is delivered
+                        checked_answer = event.content
+                        guardrail_task = self._start_guardrail_task(
+                            request, event.content, ensured_session_id, "smartrouter",
+                            {
+                                "agents_used": event.data.get("agents_used", []),
+                                "phases": event.data.get("phases", [])[:6],
+                            },
+                        )
+                    elif event.type == "done":
+                        result = event.result
+                        response, guardrail_context = self._build_smartrouter_response(
+                            result, ensured_session_id
+                        )
+                        guardrail_task = self._guardrail_task_for_response(
+                            guardrail_task, checked_answer, request, response,
+                            ensured_session_id, "smartrouter", guardrail_context
+                        )
+                    else:
+                        yield StreamChunk(
+                            type="step",
+                            content=f"{event.phase} {'started' if event.type == 'phase_start' else 'completed'}",
+                            metadata={"agent_id": "smartrouter", "stage": event.type, "phase": event.phase, **event.data}
+                        )
+
+                if result is None:
+                    raise RuntimeError("SmartRouter stream ended without a result")
+
+                if guardrail_task is None:
+                    await self._apply_guardrail(
+                        request, response, ensured_session_id, "smartrouter", guardrail_context
+                    )
+                # The done chunk carries the full answer only when it differs from the
+                # streamed tokens (judge fallback, guardrail repair).
                 yield StreamChunk(
                     type="done",
+                    content=response.response if response.response != streamed else None,
                     metadata=response.metadata
                 )
-            except AgentException as e:
+                # Async guardrail mode: the verdict trails the delivered answer.
+                if guardrail_task is not None:
+                    yield await self._guardrail_chunk(guardrail_task, "smartrouter")
+            except Exception as e:
                 yield StreamChunk(
                     type="error",
-                    content=str(e),
+                    content=f"SmartRouter execution failed: {str(e)}",
                     metadata={"agent_id": "smartrouter"}
                 )
+            finally:
+                # Client gone (or the stream failed): nobody reads the verdict
+                if guardrail_task is not None:
+                    guardrail_task.cancel()
             return
 
         # Handle MoE streaming (special case)
@@ -983,25 +1250,86 @@ class AgentService:
                 }
             )
 
-            # Execute MoE
-            try:
-                response = await self._execute_moe(request)
-                # Stream the answer (all at once for now)
+            if not self._moe:
                 yield StreamChunk(
-                    type="token",
-                    content=response.response
+                    type="error",
+                    content="MoE orchestrator not available. Check config/moe.yaml",
+                    metadata={"agent_id": "moe"}
                 )
-                # Send done with metadata
+                return
+
+            # Stream MoE: stage events as steps, synthesis as tokens
+            guardrail_task = None
+            checked_answer = None
+            try:
+                streamed = ""
+                result = None
+                async for event in self._moe.route_query_stream(
+                    query=request.input,
+                    session_id=ensured_session_id,
+                    context=request.context
+                ):
+                    if event.type == "token":
+                        if event.content:
+                            streamed += event.content
+                            yield StreamChunk(type="token", content=event.content)
+                    elif event.type == "answer":
+                        # Check the answer while the result is cached and delivered
+                        checked_answer = event.content
+                        guardrail_task = self._start_guardrail_task(
+                            request, event.content, ensured_session_id, "moe",
+                            {
+                                "selected_experts": event.data.get("selected_experts", []),
+                                "expert_details": event.data.get("expert_details", [])[:6],
+                                "cache_hit": False,
+                                "fallback": False,
+                            },
+                        )
+                    elif event.type == "done":
+                        result = event.result
+                        response, guardrail_context = self._build_moe_response(
+                            request, result, ensured_session_id
+                        )
+                        guardrail_task = self._guardrail_task_for_response(
+                            guardrail_task, checked_answer, request, response,
+                            ensured_session_id, "moe", guardrail_context
+                        )
+                    else:
+                        yield StreamChunk(
+                            type="step",
+                            content=self._describe_moe_event(event),
+                            metadata={"agent_id": "moe", "stage": event.type, **event.data}
+                        )
+
+                if result is None:
+                    raise RuntimeError("MoE stream ended without a result")
+
+                if guardrail_task is None:
+                    await self._apply_guardrail(
+                        request, response, ensured_session_id, "moe", guardrail_context
+                    )
+                # The done chunk carries the full answer only when it differs from the
+                # streamed tokens (guardrail repair, fallback after partial output).
                 yield StreamChunk(
                     type="done",
+                    content=response.response if response.response != streamed else None,
                     metadata=response.metadata
                 )
-            except AgentException as e:
+                # Async guardrail mode: the verdict trails the delivered answer.
+                if guardrail_task is not None:
+                    yield await self._guardrail_chunk(guardrail_task, "moe")
+            except Exception as e:
+                error_id = uuid.uuid4().hex[:10]
+                logger.exception(f"[MoE] streaming failed (error_id={error_id})")
                 yield StreamChunk(
                     type="error",
-                    content=str(e),
+                    content=f"MoE execution failed: {str(e)} (error_id={error_id})",
                     metadata={"agent_id": "moe"}
                 )
+            finally:
+                # Client gone (or the stream failed): nobody reads the verdict
+                if guardrail_task is not None:
+                    guardrail_task.cancel()
             return
 
         # Import Runner from agents library
@@ -1055,34 +1383,69 @@ class AgentService:
         # For MCP-enabled agents: MCPServerStdio requires async context management.
         # We wrap Runner.run_streamed() in the MCP server context managers.
         try:
-            # Check if agent has MCP servers (be defensive: mocks/unknown types may not support len()).
-            mcp_servers = getattr(agent, 'mcp_servers', None)
-            if isinstance(mcp_servers, (list, tuple)) and len(mcp_servers) > 0:
-                # Agent has MCP servers - use async with context managers
-                from contextlib import AsyncExitStack
-
-                async with AsyncExitStack() as stack:
-                    # Enter all MCP server contexts
-                    for mcp_server in mcp_servers:
-                        # Be defensive: tests may provide plain mocks; only enter real async context managers.
-                        if hasattr(mcp_server, "__aenter__") and hasattr(mcp_server, "__aexit__"):
-                            await stack.enter_async_context(mcp_server)
-
-                    # Now run the agent with connected MCP servers
-                    # Some tests patch Runner.run_streamed with a no-args async generator.
-                    # Try with kwargs first (real path), then fall back to no-args for compatibility.
+            # Same scheduler slot as chat_agent, held until the stream ends
+            async with get_execution_scheduler().slot(agent_id, session_id=ensured_session_id):
+                # Check if agent has MCP servers (be defensive: mocks/unknown types may not support len()).
+                mcp_servers = getattr(agent, 'mcp_servers', None)
+                if isinstance(mcp_servers, (list, tuple)) and len(mcp_servers) > 0:
+                    # Agent has MCP servers - use async with context managers
+                    from contextlib import AsyncExitStack
+
+                    async with AsyncExitStack() as stack:
+                        # Enter all MCP server contexts
+                        for mcp_server in mcp_servers:
+                            # Be defensive: tests may provide plain mocks; only enter real async context managers.
+                            if hasattr(mcp_server, "__aenter__") and hasattr(mcp_server, "__aexit__"):
+                                await stack.enter_async_context(mcp_server)
+
+                        # Now run the agent with connected MCP servers
+                        # Some tests patch Runner.run_streamed with a no-args async generator.
+                        # Try with kwargs first (real path), then fall back to no-args for compatibility.
+                        try:
+                            stream_iter = Runner.run_streamed(
+                                starting_agent=agent,
+                                input=request.input,
+                                context=request.context,
+                                max_turns=max(request.max_steps, 10),
+                                session=session,
+                            )
+                        except TypeError:
+                            stream_iter = Runner.run_streamed()
+
+                        async for chunk in stream_iter:
+                            # Stream tokens or steps as they arrive
+                            if isinstance(chunk, str) and chunk:
+                                yield StreamChunk(type="token", content=chunk)
+                            elif hasattr(chunk, 'content') and chunk.content:
+                                yield StreamChunk(
+                                    type="token",
+                                    content=str(chunk.content)
+                                )
+                            else:
+                                yield StreamChunk(
+                                    type="step",
+                                    content=str(chunk)
+                                )
+
+                        # Send done signal
+                        yield StreamChunk(
+                            type="done",
+                            metadata={"timestamp": datetime.now(UTC).isoformat()}
+                        )
+                else:
+                    # No MCP servers - standard streaming execution
                     try:
-                        stream_iter = Runner.run_streamed(
+                        stream_iter2 = Runner.run_streamed(
                             starting_agent=agent,
                             input=request.input,
                             context=request.context,
-                            max_turns=max(request.max_steps, 10),
+                            max_turns=max(request.max_steps, 10),  # Ensure at least 10 turns
                             session=session,
                         )
                     except TypeError:
-                        stream_iter = Runner.run_streamed()
+                        stream_iter2 = Runner.run_streamed()
 
-                    async for chunk in stream_iter:
+                    async for chunk in stream_iter2:
                         # Stream tokens or steps as they arrive
                         if isinstance(chunk, str) and chunk:
                             yield StreamChunk(type="token", content=chunk)
@@ -1102,40 +1465,14 @@ class AgentService:
                         type="done",
                         metadata={"timestamp": datetime.now(UTC).isoformat()}
                     )
-            else:
-                # No MCP servers - standard streaming execution
-                try:
-                    stream_iter2 = Runner.run_streamed(
-                        starting_agent=agent,
-                        input=request.input,
-                        context=request.context,
-                        max_turns=max(request.max_steps, 10),  # Ensure at least 10 turns
-                        session=session,
-                    )
-                except TypeError:
-                    stream_iter2 = Runner.run_streamed()
-
-                async for chunk in stream_iter2:
-                    # Stream tokens or steps as they arrive
-                    if isinstance(chunk, str) and chunk:
-                        yield StreamChunk(type="token", content=chunk)
-                    elif hasattr(chunk, 'content') and chunk.content:
-                        yield StreamChunk(
-                            type="token",
-                            content=str(chunk.content)
-                        )
-                    else:
-                        yield StreamChunk(
-                            type="step",
-                            content=str(chunk)
-                        )
-
-                # Send done signal
-                yield StreamChunk(
-                    type="done",
-                    metadata={"timestamp": datetime.now(UTC).isoformat()}
-                )
 
+        except AdmissionError as e:
+            # Headers are already sent, so shed load is reported in-stream
+            yield StreamChunk(
+                type="error",
+                content=str(e),
+                metadata={"agent_id": agent_id, "retry_after": e.retry_after}
+            )
         except Exception as e:
             yield StreamChunk(
                 type="error",
@@ -1146,5 +1483,7 @@ class AgentService:
     def reload_config(self) -> None:
         """Reload configuration from disk."""
         self._config_loader.reload_config()
-        # Clear agent factory cache if needed
+        # Cached agents were built from the old configuration
+        self._factory.clear_agent_cache()
         self._factory.clear_session_cache()
+        self._smartrouter = None
@@ -3,7 +3,8 @@ Hallucination / Relevance Guardrails for orchestrators.
 
 Goal:
 - Reduce ungrounded "off-topic" hallucinations (answer content unrelated to user query / session intent)
-- Keep latency impact minimal via strict timeouts and cheap models
+- Keep latency impact minimal via strict timeouts, cheap models, verdict caching and
+  (for streaming) running the check alongside response delivery
 - Be extensible for future orchestrators and additional guardrails
 
 This builds on the OpenAI Agents SDK guardrails concept:
@@ -14,11 +15,15 @@ from __future__ import annotations
 
 import os
 import asyncio
+import hashlib
+import json
 from dataclasses import dataclass
 from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
+from asdrp.util.lru_cache import LRUCache
+
 
 class HallucinationGuardrailVerdict(BaseModel):
     """
@@ -49,13 +54,56 @@ class GuardrailConfig:
     enabled: bool
     model: str
     timeout_s: float
+    # "blocking": verdict is applied before the response is returned.
+    # "async": streaming responses are delivered first and the verdict follows
+    # as a trailing "guardrail" stream event (non-streaming stays blocking).
+    mode: str = "blocking"
+
+    @property
+    def is_async(self) -> bool:
+        return self.mode == "async"
 
     @staticmethod
     def from_env() -> "GuardrailConfig":
         enabled = os.environ.get("OPENAGENTS_GUARDRAILS_ENABLED", "true").lower() in {"1", "true", "yes", "y"}
         model = os.environ.get("OPENAGENTS_GUARDRAILS_MODEL", "gpt-4.1-nano")
         timeout_ms = int(os.environ.get("OPENAGENTS_GUARDRAILS_TIMEOUT_MS", "200"))
-        return GuardrailConfig(enabled=enabled, model=model, timeout_s=max(0.05, timeout_ms / 1000.0))
+        mode = os.environ.get("OPENAGENTS_GUARDRAILS_MODE", "blocking").strip().lower()
+        if mode not in {"blocking", "async"}:
+            mode = "blocking"
+        return GuardrailConfig(
+            enabled=enabled, model=model, timeout_s=max(0.05, timeout_ms / 1000.0), mode=mode
+        )
+
+
+# Completed verdicts keyed by (model, query, output, grounding context), so
+# retries and repeated answers skip the model round trip. Timeouts are not cached.
+_verdict_cache = LRUCache(max_size=1024, ttl_seconds=3600)
+
+# Per-run trace values that do not change what an answer is grounded in
+_VOLATILE_CONTEXT_KEYS = frozenset({"duration", "latency_ms", "total_time", "timestamp", "request_id"})
+
+
+def _grounding_context(value: Any) -> Any:
+    """extra_context without per-run timings and ids (see _VOLATILE_CONTEXT_KEYS)."""
+    if isinstance(value, dict):
+        return {
+            k: _grounding_context(v) for k, v in value.items() if k not in _VOLATILE_CONTEXT_KEYS
+        }
+    if isinstance(value, (list, tuple)):
+        return [_grounding_context(v) for v in value]
+    return value
+
+
+def _verdict_cache_key(
+    model: str, query: str, output: str, extra_context: Optional[dict[str, Any]] = None
+) -> str:
+    # The verdict judges grounding in extra_context, so it is part of the key
+    context_json = json.dumps(_grounding_context(extra_context or {}), sort_keys=True, default=str)
+    output_hash = hashlib.sha256((output or "").encode("utf-8")).hexdigest()
+    query_hash = hashlib.sha256((query or "").strip().encode("utf-8")).hexdigest()
+    context_hash = hashlib.sha256(context_json.encode("utf-8")).hexdigest()
+    return f"{model}:{query_hash}:{output_hash}:{context_hash}"
 
 
 def _is_suspicious(query: str, output: str) -> bool:
@@ -108,6 +156,9 @@ async def check_ungrounded_hallucination(
     """
     Run a bounded-time hallucination/relevance check.
 
+    Verdicts are cached by (query, output, extra_context); a cached verdict is
+    returned without calling the model.
+
     Returns:
     - HallucinationGuardrailVerdict if it completes within timeout
     - None if disabled / not suspicious / SDK unavailable / timed out
@@ -119,6 +170,11 @@ async def check_ungrounded_hallucination(
     if not _is_suspicious(query, output):
         return None
 
+    cache_key = _verdict_cache_key(cfg.model, query, output, extra_context)
+    cached = _verdict_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     # Import agents SDK lazily (so server can still run in constrained envs/tests)
     try:
         from agents import Agent, Runner  # type: ignore
@@ -167,10 +223,11 @@ async def check_ungrounded_hallucination(
             timeout=cfg.timeout_s,
         )
         verdict = res.final_output
-        if isinstance(verdict, HallucinationGuardrailVerdict):
-            return verdict
-        # Defensive: if SDK returns dict-ish
-        return HallucinationGuardrailVerdict.model_validate(verdict)
+        if not isinstance(verdict, HallucinationGuardrailVerdict):
+            # Defensive: if SDK returns dict-ish
+            verdict = HallucinationGuardrailVerdict.model_validate(verdict)
+        _verdict_cache.set(cache_key, verdict)
+        return verdict
     except asyncio.TimeoutError:
         return None
     except Exception:
@@ -8,9 +8,10 @@ error handling. Follows REST API best practices and security guidelines.
 from dotenv import load_dotenv, find_dotenv
 load_dotenv(find_dotenv())
 
+import asyncio
 import os
 import sys
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime
 from pathlib import Path
 
@@ -36,20 +37,26 @@ from server.models import (
     HealthResponse,
     ErrorResponse,
     StreamChunk,
+    WarmupStatus,
 )
 from server.agent_service import AgentService
+from server.warmup import WarmupGate
 from server.auth import verify_api_key
+from asdrp.agents.execution_scheduler import AdmissionError
 from asdrp.agents.protocol import AgentException
 
 
 # Global service instance
 _agent_service: AgentService | None = None
 
+# Readiness of the running server (startup warm-up)
+_warmup = WarmupGate()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifecycle manager for the FastAPI app."""
-    global _agent_service
+    global _agent_service, _warmup
 
     # Startup: Initialize services
     print("🚀 Starting Multi-Agent Orchestration API...")
@@ -129,16 +136,36 @@ async def lifespan(app: FastAPI):
         print(f"⚠️  Warning: Failed to initialize Voice module: {e}")
         print("   Voice endpoints will return errors. Set ELEVENLABS_API_KEY to enable.")
 
+    # Warm up lazily built components (agents, MCP servers, embeddings,
+    # orchestrators) in the background; /health reports readiness separately
+    _warmup = WarmupGate()
+    warmup_task = None
+    if os.getenv("WARMUP_ENABLED", "true").lower() == "true":
+        warmup_task = asyncio.create_task(_warmup.run(_agent_service))
+        print("⏳ Warming up agents, embeddings and orchestrators in the background...")
+    else:
+        _warmup.skip()
+        print("ℹ️  Warm-up disabled (WARMUP_ENABLED=false)")
+
     yield
 
-    # Shutdown: Clean up MCP servers
+    # Shutdown: Clean up MCP servers and pooled HTTP clients
     print("👋 Shutting down...")
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup_task
     try:
         from asdrp.agents.mcp import get_mcp_manager
         mcp_manager = get_mcp_manager()
         await mcp_manager.shutdown_all()
     except Exception as e:
         print(f"⚠️  Error during MCP shutdown: {e}")
+    try:
+        from asdrp.actions.local.yelp_tools import YelpTools
+        await YelpTools.aclose()
+    except Exception as e:
+        print(f"⚠️  Error closing Yelp HTTP client: {e}")
 
 
 # Create FastAPI app
@@ -210,6 +237,20 @@ def get_service() -> AgentService:
     return _agent_service
 
 
+@app.exception_handler(AdmissionError)
+async def admission_error_handler(request, exc: AdmissionError):
+    """Report shed load as a retryable 503 instead of an agent error."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": str(max(1, int(exc.retry_after)))},
+        content=ErrorResponse(
+            detail=exc.message,
+            error_code="overloaded",
+            timestamp=datetime.utcnow().isoformat(),
+        ).model_dump(),
+    )
+
+
 @app.exception_handler(AgentException)
 async def agent_exception_handler(request, exc: AgentException):
     """Handle AgentException errors gracefully."""
@@ -240,7 +281,8 @@ async def health(service: AgentService = Depends(get_service)):
     """
     Health check endpoint.
 
-    Returns server health status including active orchestrator information.
+    Returns server health status (liveness) including active orchestrator
+    information, and whether startup warm-up has finished (readiness).
     """
     try:
         agents = service.list_agents()
@@ -249,7 +291,9 @@ async def health(service: AgentService = Depends(get_service)):
             status="healthy",
             agents_loaded=len(agents),
             version="0.1.0",
-            orchestrator=orchestrator
+            orchestrator=orchestrator,
+            ready=_warmup.ready,
+            warmup=_warmup.snapshot()
         )
     except Exception as e:
         orchestrator = os.getenv("ORCHESTRATOR", "default")
@@ -257,8 +301,33 @@ async def health(service: AgentService = Depends(get_service)):
             status="unhealthy",
             agents_loaded=0,
             version="0.1.0",
-            orchestrator=orchestrator
+            orchestrator=orchestrator,
+            ready=_warmup.ready,
+            warmup=_warmup.snapshot()
+        )
+
+
+@app.get(
+    "/health/ready",
+    response_model=WarmupStatus,
+    tags=["Health"],
+    responses={503: {"model": WarmupStatus}},
+)
+async def readiness():
+    """
+    Readiness check endpoint.
+
+    Returns 200 once startup warm-up has finished (components that failed to
+    warm up initialize on first use) and 503 while it is still running, so
+    load balancers can hold traffic until the first request will be fast.
+    """
+    snapshot = _warmup.snapshot()
+    if not snapshot.ready:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content=snapshot.model_dump(),
         )
+    return snapshot
 
 
 @app.get(
@@ -463,6 +532,8 @@ async def chat_agent(
     """
     try:
         return await service.chat_agent(agent_id, request)
+    except AdmissionError:
+        raise
     except AgentException as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -488,7 +559,9 @@ async def chat_agent_stream(
     - Real-time user feedback
 
     Response format: Server-Sent Events (SSE) with JSON chunks.
-    Each chunk has: {"type": "token"|"step"|"metadata"|"done"|"error", "content": "...", "metadata": {...}}
+    Each chunk has: {"type": "token"|"step"|"metadata"|"done"|"guardrail"|"error", "content": "...", "metadata": {...}}
+    Orchestrators in async guardrail mode send a trailing "guardrail" chunk after "done";
+    when triggered, its content is a safe repair that replaces the answer.
 
     Args:
         agent_id: Agent identifier (e.g., 'geo', 'finance', 'map')
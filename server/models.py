@@ -110,13 +110,24 @@ class ConfigResponse(BaseModel):
     last_modified: Optional[str] = None
 
 
+class WarmupStatus(BaseModel):
+    """Progress of the startup warm-up phase (readiness)."""
+
+    status: str = "pending"  # "pending", "warming", "ready", "degraded", "skipped"
+    ready: bool = False
+    duration_ms: Optional[float] = None
+    components: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+
+
 class HealthResponse(BaseModel):
     """Response model for health check."""
 
-    status: str
+    status: str  # Liveness: "healthy" or "unhealthy"
     agents_loaded: int
     version: str = "0.1.0"
     orchestrator: str = "default"  # Active orchestrator: "default" or "smartrouter"
+    ready: bool = False  # Readiness: startup warm-up finished
+    warmup: Optional[WarmupStatus] = None
 
 
 class ErrorResponse(BaseModel):
@@ -130,6 +141,6 @@ class ErrorResponse(BaseModel):
 class StreamChunk(BaseModel):
     """A chunk of streaming response data."""
 
-    type: str  # "token", "step", "metadata", "done"
+    type: str  # "token", "step", "metadata", "done", "guardrail", "error"
     content: Optional[str] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
@@ -0,0 +1,67 @@
+"""
+Startup warm-up and readiness gate.
+
+The first request after a (re)start used to pay for every lazily built
+component: agent module imports, MCP server subprocesses, MoE expert and
+fast-path embeddings and the SmartRouter. The lifespan runs
+AgentService.warm_up() in the background and this gate tracks it, so
+/health can report liveness immediately and readiness once warm.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from server.models import WarmupStatus
+
+
+class WarmupGate:
+    """
+    Tracks the warm-up phase of the running server.
+
+    The server is ready once warm-up has finished, including when some
+    components failed ("degraded": those initialize lazily on first use) or
+    warm-up was skipped.
+    """
+
+    READY_STATES = ("ready", "degraded", "skipped")
+
+    def __init__(self) -> None:
+        self.status = "pending"
+        self.components: Dict[str, Dict[str, Any]] = {}
+        self.duration_ms: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.status in self.READY_STATES
+
+    async def run(self, service: Any) -> None:
+        """Warm up the service's components and record the outcome."""
+        self.status = "warming"
+        start = time.perf_counter()
+        try:
+            self.components = await service.warm_up()
+        except Exception as e:
+            logger.warning(f"Warm-up failed: {e}")
+            self.components = {"service": {"status": "failed", "error": str(e)}}
+        self.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+
+        failed = [name for name, result in self.components.items() if result.get("status") != "ok"]
+        self.status = "degraded" if failed else "ready"
+        if failed:
+            logger.warning(f"Warm-up finished in {self.duration_ms:.0f}ms; failed: {', '.join(failed)}")
+        else:
+            logger.info(f"Warm-up finished in {self.duration_ms:.0f}ms")
+
+    def skip(self) -> None:
+        """Mark warm-up as disabled; components initialize on first use."""
+        self.status = "skipped"
+
+    def snapshot(self) -> WarmupStatus:
+        return WarmupStatus(
+            status=self.status,
+            ready=self.ready,
+            duration_ms=self.duration_ms,
+            components=self.components,
+        )
@@ -14,7 +14,7 @@
 
 import pytest
 import importlib
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import patch, MagicMock, AsyncMock, PropertyMock
 from typing import Dict, List
 
 from asdrp.actions.finance.finance_tools import FinanceTools
@@ -724,3 +724,126 @@ class TestFinanceToolsErrorHandling:
                 with pytest.raises(Exception, match="Failed to get ticker info"):
                     await FinanceTools.get_ticker_info("AAPL")
 
+
+
+class TestFinanceToolsDataLayer:
+    """Test the executor, ticker/dataset cache and batched downloads."""
+
+    @pytest.fixture
+    def finance(self):
+        """Freshly loaded finance_tools module (empty cache)."""
+        # Resolve by name: other test modules may replace sys.modules['asdrp']
+        return importlib.reload(importlib.import_module("asdrp.actions.finance.finance_tools"))
+
+    @pytest.mark.asyncio
+    async def test_datasets_cached_per_symbol(self, finance):
+        """Test that a repeated dataset is served from the cache with one Ticker."""
+        mock_ticker = MagicMock()
+        mock_ticker.info = {'longName': 'Apple Inc.'}
+
+        with patch.object(finance.yf, 'Ticker', return_value=mock_ticker) as ticker_cls:
+            first = await finance.FinanceTools.get_ticker_info("AAPL")
+            first['longName'] = 'changed'
+            second = await finance.FinanceTools.get_ticker_info("aapl")
+            await finance.FinanceTools.get_dividends("AAPL")
+
+        assert second == {'longName': 'Apple Inc.'}
+        ticker_cls.assert_called_once_with("AAPL")
+
+    @pytest.mark.asyncio
+    async def test_dataset_expiry(self, finance):
+        """Test that expired datasets are fetched again."""
+        mock_ticker = MagicMock()
+        mock_ticker.info = {'longName': 'Apple Inc.'}
+
+        with patch.object(finance.yf, 'Ticker', return_value=mock_ticker):
+            await finance.FinanceTools.get_ticker_info("AAPL")
+            with patch.dict('asdrp.actions.finance.market_data_cache.DATASET_TTL_SECONDS', {'info': 0}):
+                finance.FinanceTools._cache.set("AAPL", "info", {'longName': 'stale'})
+            mock_ticker.info = {'longName': 'Apple'}
+            result = await finance.FinanceTools.get_ticker_info("AAPL")
+
+        assert result == {'longName': 'Apple'}
+
+    @pytest.mark.asyncio
+    async def test_statements_fetched_concurrently_on_dedicated_pool(self, finance):
+        """Test that get_financials fetches its statements in parallel off the default executor."""
+        import threading
+        import pandas as pd
+
+        barrier = threading.Barrier(3, timeout=5)
+        threads = set()
+
+        def statement(self):
+            # Only passes if all three statements are being fetched at once
+            barrier.wait()
+            threads.add(threading.current_thread().name)
+            return pd.DataFrame({'2023': [1.0]})
+
+        class FakeTicker:
+            financials = property(statement)
+            balance_sheet = property(statement)
+            cashflow = property(statement)
+
+        with patch.object(finance.yf, 'Ticker', return_value=FakeTicker()):
+            result = await finance.FinanceTools.get_financials("AAPL")
+            # Shares the statement cache with the single-statement tools
+            income = await finance.FinanceTools.get_income_statement("AAPL")
+
+        assert result['cashflow'] == {0: {'2023': 1.0}}
+        assert income['income_stmt'] == result['income_stmt']
+        assert len(threads) == 3
+        assert all(name.startswith("yfinance") for name in threads)
+
+    @pytest.mark.asyncio
+    async def test_multi_symbol_history_uses_one_download(self, finance):
+        """Test that several symbols are fetched with a single yf.download call."""
+        import pandas as pd
+
+        dates = pd.to_datetime(["2024-01-02", "2024-01-03"])
+        columns = pd.MultiIndex.from_product([["AAPL", "MSFT"], ["Close", "Volume"]])
+        data = pd.DataFrame(
+            [[185.0, 100.0, 370.0, 50.0], [184.0, 110.0, None, None]],
+            index=dates, columns=columns
+        )
+
+        with patch.object(finance.yf, 'download', return_value=data) as download, \
+                patch.object(finance.yf, 'Ticker') as ticker_cls:
+            result = await finance.FinanceTools.get_historical_data("AAPL, MSFT", period="5d")
+            await finance.FinanceTools.get_historical_data("AAPL MSFT", period="5d")
+
+        download.assert_called_once()
+        assert download.call_args.args[0] == ["AAPL", "MSFT"]
+        ticker_cls.assert_not_called()
+        assert result['symbols'] == ["AAPL", "MSFT"]
+        assert len(result['data']['AAPL']) == 2
+        assert list(result['data']['MSFT'].values()) == [{'Close': 370.0, 'Volume': 50.0}]
+
+    @pytest.mark.asyncio
+    async def test_multi_symbol_info(self, finance):
+        """Test that info for several symbols is returned per symbol."""
+        def make_ticker(symbol):
+            ticker = MagicMock()
+            ticker.info = {'symbol': symbol}
+            return ticker
+
+        with patch.object(finance.yf, 'Ticker', side_effect=make_ticker):
+            result = await finance.FinanceTools.get_ticker_info("AAPL MSFT")
+
+        assert result == {'AAPL': {'symbol': 'AAPL'}, 'MSFT': {'symbol': 'MSFT'}}
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_not_cached(self, finance):
+        """Test that errors are not cached."""
+        mock_ticker = MagicMock()
+        type(mock_ticker).news = PropertyMock(side_effect=[RuntimeError("rate limited"), [{'id': '1'}]])
+
+        with patch.object(finance.yf, 'Ticker', return_value=mock_ticker):
+            with pytest.raises(Exception, match="Failed to get news"):
+                await finance.FinanceTools.get_news("AAPL")
+            assert await finance.FinanceTools.get_news("AAPL") == [{'id': '1'}]
+
+    def test_helpers_not_exposed_as_tools(self, finance):
+        """Test that the data layer helpers are not discovered as tools."""
+        assert not any(name.startswith('_') for name in finance.FinanceTools.spec_functions)
+        assert len(finance.FinanceTools.spec_functions) == 14
@@ -0,0 +1,13 @@
+"""Shared fixtures for geo action tests."""
+
+import pytest
+
+from asdrp.actions.geo import geocode_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_geocode_cache(monkeypatch):
+    """Give each test an empty in-memory geocode cache."""
+    cache = geocode_cache.GeocodeCache(":memory:")
+    monkeypatch.setattr(geocode_cache, "_shared_cache", cache)
+    return cache
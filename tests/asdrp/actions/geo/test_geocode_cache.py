@@ -0,0 +1,105 @@
+#############################################################################
+# test_geocode_cache.py
+#
+# Tests for the shared address -> coordinate cache
+#
+# Test Coverage:
+# - Get/set round trip and address normalization
+# - TTL expiry and purge
+# - Persistence across instances
+# - GeoTools and MapTools serving repeated lookups from the cache
+#
+#############################################################################
+
+import os
+import tempfile
+import time
+from unittest.mock import patch, MagicMock, AsyncMock
+
+import pytest
+
+from asdrp.actions.geo.geocode_cache import GeocodeCache, normalize_address
+
+
+class TestGeocodeCache:
+    """Test GeocodeCache storage behavior."""
+
+    def test_round_trip_is_normalized(self):
+        """Test that lookups ignore case and extra whitespace."""
+        cache = GeocodeCache(":memory:")
+        cache.set("517 Hayes St, San Francisco, CA", (37.7769, -122.4211))
+
+        assert cache.get("517  hayes st, SAN FRANCISCO, ca ") == (37.7769, -122.4211)
+        assert cache.get("200 Jackson St, San Francisco, CA") is None
+        assert cache.get_metrics()["hits"] == 1
+        assert cache.get_metrics()["misses"] == 1
+
+    def test_expired_entries_are_ignored_and_purged(self):
+        """Test that entries older than the TTL are not returned."""
+        cache = GeocodeCache(":memory:", ttl_seconds=0.01)
+        cache.set("Test Address", (1.0, 2.0))
+        time.sleep(0.02)
+
+        assert cache.get("Test Address") is None
+        assert cache.purge_expired() == 1
+
+    def test_persists_across_instances(self):
+        """Test that a file-backed cache survives reopening."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "geo", "geocode_cache.db")
+            GeocodeCache(db_path).set("Test Address", (1.0, 2.0))
+
+            assert GeocodeCache(db_path).get("Test Address") == (1.0, 2.0)
+
+    def test_normalize_address(self):
+        """Test address normalization."""
+        assert normalize_address("  1 Main St,  City. ") == "1 main st, city"
+
+
+class TestToolsUseSharedCache:
+    """Test that GeoTools and MapTools share cached coordinates."""
+
+    @pytest.mark.asyncio
+    async def test_geo_tools_caches_successful_lookup(self, isolated_geocode_cache):
+        """Test that a second GeoTools lookup does not hit the service."""
+        from asdrp.actions.geo.geo_tools import GeoTools
+
+        location = MagicMock(latitude=37.4221, longitude=-122.0841)
+        mock_loop = MagicMock()
+        mock_loop.run_in_executor = AsyncMock(return_value=location)
+
+        with patch('asdrp.actions.geo.geo_tools.asyncio.get_running_loop', return_value=mock_loop):
+            first = await GeoTools.get_coordinates_by_address("Test Address")
+            second = await GeoTools.get_coordinates_by_address("test address")
+
+        assert first == second == (37.4221, -122.0841)
+        assert mock_loop.run_in_executor.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_not_found_is_not_cached(self, isolated_geocode_cache):
+        """Test that (-1.0, -1.0) results are retried rather than cached."""
+        from asdrp.actions.geo.geo_tools import GeoTools
+
+        mock_loop = MagicMock()
+        mock_loop.run_in_executor = AsyncMock(return_value=None)
+
+        with patch('asdrp.actions.geo.geo_tools.asyncio.get_running_loop', return_value=mock_loop):
+            await GeoTools.get_coordinates_by_address("Nowhere")
+            await GeoTools.get_coordinates_by_address("Nowhere")
+
+        assert mock_loop.run_in_executor.call_count == 2
+        assert isolated_geocode_cache.get("Nowhere") is None
+
+    @pytest.mark.asyncio
+    async def test_map_tools_reads_geo_tools_entries(self, isolated_geocode_cache):
+        """Test that MapTools is served from coordinates cached by GeoTools."""
+        from asdrp.actions.geo.map_tools import MapTools
+
+        isolated_geocode_cache.set("Test Address", (37.0, -122.0))
+        mock_loop = MagicMock()
+        mock_loop.run_in_executor = AsyncMock()
+
+        with patch('asdrp.actions.geo.map_tools.asyncio.get_running_loop', return_value=mock_loop):
+            assert await MapTools.get_coordinates_by_address("Test Address") == (37.0, -122.0)
+
+        mock_loop.run_in_executor.assert_not_called()
@@ -5,8 +5,9 @@
 #
 # Test Coverage:
 # - ToolsMeta integration (spec_functions, tool_list)
-# - All public API methods with mocked responses
+# - All public API methods with mocked responses (httpx.MockTransport)
 # - Error handling (timeouts, HTTP errors, invalid inputs)
+# - Response caching, connection pooling and batch lookups
 # - Edge cases (empty results, missing data)
 # - Input validation
 #
@@ -14,10 +15,13 @@
 
 import pytest
 import os
+import asyncio
 import importlib
 from unittest.mock import patch, MagicMock, Mock
 from typing import Dict
 
+import httpx
+
 from asdrp.actions.local.yelp_tools import YelpTools
 from asdrp.actions.tools_meta import ToolsMeta
 
@@ -124,317 +128,356 @@ class TestYelpToolsInitialization:
                         return {}
 
 
+@pytest.fixture
+def yelp():
+    """
+    Fresh YelpTools whose HTTP calls are answered by a MockTransport.
+
+    Returns (YelpTools, api) where api.requests records every request and
+    api.responses maps a URL path to (status, JSON payload).
+    """
+    with patch.dict(os.environ, {'YELP_API_KEY': 'test_api_key_12345'}):
+        # Look the module up by name: some suites replace the top-level
+        # 'asdrp' package in sys.modules at collection time
+        yelp_module = importlib.reload(importlib.import_module("asdrp.actions.local.yelp_tools"))
+        YelpTools = yelp_module.YelpTools
+
+        api = Mock()
+        api.requests = []
+        api.responses = {}
+        api.error = None
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            api.requests.append(request)
+            if api.error is not None:
+                raise api.error
+            status, payload = api.responses.get(request.url.path, (200, {}))
+            return httpx.Response(status, json=payload)
+
+        YelpTools._transport = httpx.MockTransport(handler)
+        yield YelpTools, api
+
+
 class TestYelpToolsSearchBusinesses:
     """Test YelpTools.search_businesses method."""
-    
-    @patch.dict(os.environ, {'YELP_API_KEY': 'test_api_key_12345'})
-    @patch('asdrp.actions.local.yelp_tools.requests.get')
-    def test_search_businesses_success(self, mock_get):
+
+    @pytest.mark.asyncio
+    async def test_search_businesses_success(self, yelp):
         """Test successful business search."""
-        import importlib
-        import asdrp.actions.local.yelp_tools
-        importlib.reload(asdrp.actions.local.yelp_tools)
-        from asdrp.actions.local.yelp_tools import YelpTools
-        
-        # Mock successful response
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        YelpTools, api = yelp
+        api.responses["/v3/businesses/search"] = (200, {
             "businesses": [
                 {"id": "1", "name": "Test Restaurant", "rating": 4.5},
                 {"id": "2", "name": "Another Place", "rating": 4.0}
             ],
             "total": 2
-        }
-        mock_get.return_value = mock_response
-        
-        result = YelpTools.search_businesses("pizza", 37.7749, -122.4194)
-        
+        })
+
+        result = await YelpTools.search_businesses("pizza", 37.7749, -122.4194)
+
         # Verify API call
-        mock_get.assert_called_once()
-        call_args = mock_get.call_args
-        assert call_args[1]['headers'] == YelpTools.headers
-        assert call_args[1]['params']['term'] == "pizza"
-        assert call_args[1]['params']['latitude'] == 37.7749
-        assert call_args[1]['params']['longitude'] == -122.4194
-        
+        assert len(api.requests) == 1
+        request = api.requests[0]
+        assert request.headers["Authorization"] == YelpTools.headers["Authorization"]
+        assert request.url.params["term"] == "pizza"
+        assert request.url.params["latitude"] == "37.7749"
+        assert request.url.params["longitude"] == "-122.4194"
+        # Unset optional filters are not sent
+        assert "categories" not in request.url.params
+
         # Verify response
         assert result['total'] == 2
         assert len(result['businesses']) == 2
-    
-    @patch.dict(os.environ, {'YELP_API_KEY': 'test_api_key_12345'})
-    @patch('asdrp.actions.local.yelp_tools.requests.get')
-    def test_search_businesses_with_optional_params(self, mock_get):
+
+    @pytest.mark.asyncio
+    async def test_search_businesses_with_optional_params(self, yelp):
         """Test business search with optional parameters."""
-        import importlib
-        import asdrp.actions.local.yelp_tools
-        importlib.reload(asdrp.actions.local.yelp_tools)
-        from asdrp.actions.local.yelp_tools import YelpTools
-        
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"businesses": [], "total": 0}
-        mock_get.return_value = mock_response
-        
-        YelpTools.search_businesses(
+        YelpTools, api = yelp
+
+        await YelpTools.search_businesses(
             "coffee", 37.7749, -122.4194,
             categories="cafes", price="2", limit=10
         )
-        
-        call_args = mock_get.call_args
-        assert call_args[1]['params']['categories'] == "cafes"
-        assert call_args[1]['params']['price'] == "2"
-        assert call_args[1]['params']['limit'] == 10
-    
-    @patch.dict(os.environ, {'YELP_API_KEY': 'test_api_key_12345'})
-    @patch('asdrp.actions.local.yelp_tools.requests.get')
-    def test_search_businesses_timeout(self, mock_get):
+
+        params = api.requests[0].url.params
+        assert params['categories'] == "cafes"
+        assert params['price'] == "2"
+        assert params['limit'] == "10"
+
+    @pytest.mark.asyncio
+    async def test_search_businesses_timeout(self, yelp):
         """Test that timeout is properly set."""
-        import importlib
-        import asdrp.actions.local.yelp_tools
-        importlib.reload(asdrp.actions.local.yelp_tools)
-        from asdrp.actions.local.yelp_tools import YelpTools, TIMEOUT_SECONDS
-        
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"businesses": []}
-        mock_get.return_value = mock_response
-        
-        YelpTools.search_businesses("pizza", 37.7749, -122.4194)
-        
-        call_args = mock_get.call_args
-        assert call_args[1]['timeout'] == TIMEOUT_SECONDS
+        YelpTools, api = yelp
+        yelp_module = importlib.import_module("asdrp.actions.local.yelp_tools")
+
+        await YelpTools.search_businesses("pizza", 37.7749, -122.4194)
+
+        assert api.requests[0].extensions["timeout"]["read"] == yelp_module.TIMEOUT_SECONDS
 
 
 class TestYelpToolsSearchByPhone:
     """Test YelpTools.search_by_phone method."""
-    
-    @patch.dict(os.environ, {'YELP_API_KEY': 'test_api_key_12345'})
-    @patch('asdrp.actions.local.yelp_tools.requests.get')
-    def test_search_by_phone_success(self, mock_get):
+
+    @pytest.mark.asyncio
+    async def test_search_by_phone_success(self, yelp):
         """Test successful phone number search."""
-        import importlib
-        import asdrp.actions.local.yelp_tools
-        importlib.reload(asdrp.actions.local.yelp_tools)
-        from asdrp.actions.local.yelp_tools import YelpTools
-        
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        YelpTools, api = yelp
+        api.responses["/v3/businesses/search/phone"] = (200, {
             "businesses": [{"id": "1", "name": "Test Business", "phone": "+14155551234"}]
-        }
-        mock_get.return_value = mock_response
-        
-        result = YelpTools.search_by_phone("+14155551234")
-        
-        mock_get.assert_called_once()
-        call_args = mock_get.call_args
-        assert call_args[1]['params']['phone'] == "+14155551234"
+        })
+
+        result = await YelpTools.search_by_phone("+14155551234")
+
+        assert len(api.requests) == 1
+        assert api.requests[0].url.params['phone'] == "+14155551234"
         assert 'businesses' in result
 
 
 class TestYelpToolsMatchBusiness:
     """Test YelpTools.match_business method."""
-    
-    @patch.dict(os.environ, {'YELP_API_KEY': 'test_api_key_12345'})
-    @patch('asdrp.actions.local.yelp_tools.requests.get')
-    def test_match_business_success(self, mock_get):
+
+    @pytest.mark.asyncio
+    async def test_match_business_success(self, yelp):
         """Test successful business matching."""
-        import importlib
-        import asdrp.actions.local.yelp_tools
-        importlib.reload(asdrp.actions.local.yelp_tools)
-        from asdrp.actions.local.yelp_tools import YelpTools
-        
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        YelpTools, api = yelp
+        api.responses["/v3/businesses/matches"] = (200, {
             "businesses": [{"id": "match_1", "name": "Test Restaurant"}]
-        }
-        mock_get.return_value = mock_response
-        
-        result = YelpTools.match_business(
+        })
+
+        result = await YelpTools.match_business(
             "Test Restaurant", "123 Main St", "San Francisco", "CA", "US"
         )
-        
-        call_args = mock_get.call_args
-        assert call_args[1]['params']['name'] == "Test Restaurant"
-        assert call_args[1]['params']['address1'] == "123 Main St"
-        assert call_args[1]['params']['city'] == "San Francisco"
-        assert call_args[1]['params']['state'] == "CA"
-        assert call_args[1]['params']['country'] == "US"
+
+        params = api.requests[0].url.params
+        assert params['name'] == "Test Restaurant"
+        assert params['address1'] == "123 Main St"
+        assert params['city'] == "San Francisco"
+        assert params['state'] == "CA"
+        assert params['country'] == "US"
         assert 'businesses' in result
 
 
 class TestYelpToolsGetBusinessDetails:
     """Test YelpTools.get_business_details method."""
-    
-    @patch.dict(os.environ, {'YELP_API_KEY': 'test_api_key_12345'})
-    @patch('asdrp.actions.local.yelp_tools.requests.get')
-    def test_get_business_details_success(self, mock_get):
+
+    @pytest.mark.asyncio
+    async def test_get_business_details_success(self, yelp):
         """Test successful business details retrieval."""
-        import importlib
-        import asdrp.actions.local.yelp_tools
-        importlib.reload(asdrp.actions.local.yelp_tools)
-        from asdrp.actions.local.yelp_tools import YelpTools
-        
+        YelpTools, api = yelp
         business_id = "test_business_123"
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        api.responses[f"/v3/businesses/{business_id}"] = (200, {
             "id": business_id,
             "name": "Test Business",
             "rating": 4.5,
             "hours": [{"day": 0, "start": "0900", "end": "1700"}]
-        }
-        mock_get.return_value = mock_response
-        
-        result = YelpTools.get_business_details(business_id)
-        
+        })
+
+        result = await YelpTools.get_business_details(business_id)
+
         # Verify correct endpoint
-        call_args = mock_get.call_args
-        assert business_id in call_args[0][0]
+        assert api.requests[0].url.path == f"/v3/businesses/{business_id}"
         assert result['id'] == business_id
         assert 'rating' in result
 
 
 class TestYelpToolsGetBusinessEngagement:
     """Test YelpTools.get_business_engagement method."""
-    
-    @patch.dict(os.environ, {'YELP_API_KEY': 'test_api_key_12345'})
-    @patch('asdrp.actions.local.yelp_tools.requests.get')
-    def test_get_business_engagement_success(self, mock_get):
+
+    @pytest.mark.asyncio
+    async def test_get_business_engagement_success(self, yelp):
         """Test successful engagement metrics retrieval."""
-        import importlib
-        import asdrp.actions.local.yelp_tools
-        importlib.reload(asdrp.actions.local.yelp_tools)
-        from asdrp.actions.local.yelp_tools import YelpTools
-        
+        YelpTools, api = yelp
         business_ids = ["id1", "id2", "id3"]
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        api.responses["/v3/businesses/engagement"] = (200, {
             "businesses": [
                 {"id": "id1", "view_count": 1000},
                 {"id": "id2", "view_count": 2000}
             ]
-        }
-        mock_get.return_value = mock_response
-        
-        result = YelpTools.get_business_engagement(business_ids)
-        
-        call_args = mock_get.call_args
-        assert call_args[1]['params']['business_ids'] == ",".join(business_ids)
+        })
+
+        result = await YelpTools.get_business_engagement(business_ids)
+
+        assert api.requests[0].url.params['business_ids'] == ",".join(business_ids)
         assert 'businesses' in result
-    
-    @patch.dict(os.environ, {'YELP_API_KEY': 'test_api_key_12345'})
-    @patch('asdrp.actions.local.yelp_tools.requests.get')
-    def test_get_business_engagement_empty_list(self, mock_get):
+
+    @pytest.mark.asyncio
+    async def test_get_business_engagement_empty_list(self, yelp):
         """Test engagement retrieval with empty business ID list."""
-        import importlib
-        import asdrp.actions.local.yelp_tools
-        importlib.reload(asdrp.actions.local.yelp_tools)
-        from asdrp.actions.local.yelp_tools import YelpTools
-        
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"businesses": []}
-        mock_get.return_value = mock_response
-        
-        result = YelpTools.get_business_engagement([])
-        
-        call_args = mock_get.call_args
-        assert call_args[1]['params']['business_ids'] == ""
+        YelpTools, api = yelp
+        api.responses["/v3/businesses/engagement"] = (200, {"businesses": []})
+
+        await YelpTools.get_business_engagement([])
+
+        assert api.requests[0].url.params['business_ids'] == ""
 
 
 class TestYelpToolsGetBusinessReviews:
     """Test YelpTools.get_business_reviews method."""
-    
-    @patch.dict(os.environ, {'YELP_API_KEY': 'test_api_key_12345'})
-    @patch('asdrp.actions.local.yelp_tools.requests.get')
-    def test_get_business_reviews_success(self, mock_get):
+
+    @pytest.mark.asyncio
+    async def test_get_business_reviews_success(self, yelp):
         """Test successful reviews retrieval."""
-        import importlib
-        import asdrp.actions.local.yelp_tools
-        importlib.reload(asdrp.actions.local.yelp_tools)
-        from asdrp.actions.local.yelp_tools import YelpTools
-        
+        YelpTools, api = yelp
         business_id = "review_test_123"
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        api.responses[f"/v3/businesses/{business_id}/reviews"] = (200, {
             "reviews": [
                 {"id": "r1", "rating": 5, "text": "Great!"},
                 {"id": "r2", "rating": 4, "text": "Good"}
             ]
-        }
-        mock_get.return_value = mock_response
-        
-        result = YelpTools.get_business_reviews(business_id)
-        
-        call_args = mock_get.call_args
-        assert business_id in call_args[0][0]
-        assert 'reviews' in call_args[0][0]
+        })
+
+        result = await YelpTools.get_business_reviews(business_id)
+
+        path = api.requests[0].url.path
+        assert business_id in path
+        assert path.endswith('/reviews')
         assert 'reviews' in result
 
 
 class TestYelpToolsGetReviewHighlights:
     """Test YelpTools.get_review_highlights method."""
-    
-    @patch.dict(os.environ, {'YELP_API_KEY': 'test_api_key_12345'})
-    @patch('asdrp.actions.local.yelp_tools.requests.get')
-    def test_get_review_highlights_success(self, mock_get):
+
+    @pytest.mark.asyncio
+    async def test_get_review_highlights_success(self, yelp):
         """Test successful review highlights retrieval."""
-        import importlib
-        import asdrp.actions.local.yelp_tools
-        importlib.reload(asdrp.actions.local.yelp_tools)
-        from asdrp.actions.local.yelp_tools import YelpTools
-        
+        YelpTools, api = yelp
         business_id = "highlights_test_123"
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        api.responses[f"/v3/businesses/{business_id}/review_highlights"] = (200, {
             "highlights": [
                 {"text": "Great food", "sentiment": "positive"},
                 {"text": "Fast service", "sentiment": "positive"}
             ]
-        }
-        mock_get.return_value = mock_response
-        
-        result = YelpTools.get_review_highlights(business_id)
-        
-        call_args = mock_get.call_args
-        assert business_id in call_args[0][0]
-        assert 'review_highlights' in call_args[0][0]
+        })
+
+        result = await YelpTools.get_review_highlights(business_id)
+
+        path = api.requests[0].url.path
+        assert business_id in path
+        assert path.endswith('/review_highlights')
         assert 'highlights' in result
 
 
 class TestYelpToolsErrorHandling:
     """Test YelpTools error handling."""
-    
-    @patch.dict(os.environ, {'YELP_API_KEY': 'test_api_key_12345'})
-    @patch('asdrp.actions.local.yelp_tools.requests.get')
-    def test_http_error_handling(self, mock_get):
+
+    @pytest.mark.asyncio
+    async def test_http_error_handling(self, yelp):
         """Test handling of HTTP errors."""
-        import importlib
-        import asdrp.actions.local.yelp_tools
-        importlib.reload(asdrp.actions.local.yelp_tools)
-        from asdrp.actions.local.yelp_tools import YelpTools
-        import requests
-        
-        # Mock HTTP error response
-        mock_response = MagicMock()
-        mock_response.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
-        mock_response.json.return_value = {"error": {"code": "NOT_FOUND"}}
-        mock_get.return_value = mock_response
-        
+        YelpTools, api = yelp
+        api.responses["/v3/businesses/invalid_id"] = (404, {"error": {"code": "NOT_FOUND"}})
+
         # The method should return the JSON response even on error
         # (actual error handling would be done by the caller)
-        result = YelpTools.get_business_details("invalid_id")
+        result = await YelpTools.get_business_details("invalid_id")
         assert 'error' in result
-    
-    @patch.dict(os.environ, {'YELP_API_KEY': 'test_api_key_12345'})
-    @patch('asdrp.actions.local.yelp_tools.requests.get')
-    def test_timeout_handling(self, mock_get):
-        """Test that timeout is properly configured."""
-        import importlib
-        import asdrp.actions.local.yelp_tools
-        importlib.reload(asdrp.actions.local.yelp_tools)
-        from asdrp.actions.local.yelp_tools import YelpTools
-        import requests
-        
-        # Mock timeout exception
-        mock_get.side_effect = requests.Timeout("Request timed out")
-        
-        with pytest.raises(requests.Timeout):
-            YelpTools.search_businesses("pizza", 37.7749, -122.4194)
 
+        # Error responses are not cached
+        await YelpTools.get_business_details("invalid_id")
+        assert len(api.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout_handling(self, yelp):
+        """Test that timeouts propagate to the caller."""
+        YelpTools, api = yelp
+        api.error = httpx.ReadTimeout("Request timed out")
+
+        with pytest.raises(httpx.TimeoutException):
+            await YelpTools.search_businesses("pizza", 37.7749, -122.4194)
+
+
+class TestYelpToolsPoolingAndCaching:
+    """Test the pooled client, response cache and batch lookups."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_call_served_from_cache(self, yelp):
+        """Test that an identical call within the TTL skips the network."""
+        YelpTools, api = yelp
+        api.responses["/v3/businesses/b1"] = (200, {"id": "b1", "rating": 4.5})
+
+        first = await YelpTools.get_business_details("b1")
+        first["rating"] = 0
+        second = await YelpTools.get_business_details("b1")
+
+        assert len(api.requests) == 1
+        assert second == {"id": "b1", "rating": 4.5}
+
+    @pytest.mark.asyncio
+    async def test_cache_entries_expire(self, yelp, monkeypatch):
+        """Test that entries expire after the endpoint TTL."""
+        YelpTools, api = yelp
+        yelp_module = importlib.import_module("asdrp.actions.local.yelp_tools")
+
+        await YelpTools.search_businesses("pizza", 37.7749, -122.4194)
+        now = yelp_module.time.monotonic()
+        monkeypatch.setattr(
+            yelp_module.time, "monotonic",
+            lambda: now + yelp_module.CACHE_TTL_SECONDS["search"] + 1
+        )
+        await YelpTools.search_businesses("pizza", 37.7749, -122.4194)
+
+        assert len(api.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_client_is_shared(self, yelp):
+        """Test that calls reuse one pooled client."""
+        YelpTools, api = yelp
+
+        await YelpTools.get_business_details("b1")
+        client = YelpTools._client
+        await YelpTools.get_business_reviews("b1")
+
+        assert YelpTools._client is client
+        await YelpTools.aclose()
+        assert YelpTools._client is None
+
+    @pytest.mark.asyncio
+    async def test_client_of_previous_loop_is_closed(self, yelp):
+        """Test that rebinding to a new event loop closes the old loop's client."""
+        YelpTools, api = yelp
+
+        await YelpTools.get_business_details("b1")
+        first = YelpTools._client
+        # As if the client had been created by an earlier, finished event loop
+        previous_loop = asyncio.new_event_loop()
+        previous_loop.close()
+        YelpTools._client_loop = previous_loop
+        await YelpTools.get_business_details("b2")
+
+        assert first.is_closed
+        assert YelpTools._client is not first
+        assert not YelpTools._client.is_closed
+        await YelpTools.aclose()
+
+    @pytest.mark.asyncio
+    async def test_batch_details_and_reviews(self, yelp):
+        """Test batch lookups deduplicate IDs and report per-ID errors."""
+        YelpTools, api = yelp
+        api.responses["/v3/businesses/b1"] = (200, {"id": "b1"})
+        api.responses["/v3/businesses/b2"] = (200, {"id": "b2"})
+        api.responses["/v3/businesses/b1/reviews"] = (200, {"reviews": []})
+
+        details = await YelpTools.get_business_details_batch(["b1", "b2", "b1"])
+        reviews = await YelpTools.get_business_reviews_batch(["b1"])
+
+        assert details == {"b1": {"id": "b1"}, "b2": {"id": "b2"}}
+        assert reviews == {"b1": {"reviews": []}}
+        assert len(api.requests) == 3
+
+        api.error = httpx.ConnectError("unreachable")
+        failed = await YelpTools.get_business_details_batch(["b3"])
+        assert failed["b3"]["error"]["code"] == "ConnectError"
+
+    def test_tool_surface_unchanged(self, yelp):
+        """Test that batch and lifecycle helpers are not exposed as tools."""
+        YelpTools, _ = yelp
+
+        assert YelpTools.spec_functions == [
+            'get_business_details',
+            'get_business_engagement',
+            'get_business_reviews',
+            'get_review_highlights',
+            'match_business',
+            'search_businesses',
+            'search_by_phone',
+        ]
+        assert all(asyncio.iscoroutinefunction(getattr(YelpTools, name)) for name in YelpTools.spec_functions)
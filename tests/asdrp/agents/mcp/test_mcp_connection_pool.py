@@ -0,0 +1,249 @@
+#############################################################################
+# test_mcp_connection_pool.py
+#
+# Tests for pooled MCP connections (MCPServerPool, PooledMCPServer) and the
+# MCPServerManager pool registry.
+#
+# Test Coverage:
+# - Connection reuse across borrows (no respawn per run)
+# - Bounded pool size and waiting borrowers
+# - Health checks and max-idle recycling
+# - Per-context borrowing in PooledMCPServer
+# - Pool shutdown through MCPServerManager.shutdown_all
+#
+# Design Principles:
+# - Isolation: Fake MCP servers record connect/cleanup instead of spawning
+#
+#############################################################################
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from asdrp.agents.mcp.mcp_connection_pool import MCPServerPool, PooledMCPServer
+from asdrp.agents.mcp.mcp_server_manager import MCPServerManager
+
+
+class FakeMCPServer:
+    """Stand-in for MCPServerStdio that tracks its lifecycle."""
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.session = None
+        self.cleaned_up = False
+        self.ping_ok = True
+        self.calls = []
+        registry.append(self)
+
+    async def __aenter__(self):
+        self.session = SimpleNamespace(send_ping=self._ping)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.session = None
+        self.cleaned_up = True
+
+    async def _ping(self):
+        if not self.ping_ok:
+            raise ConnectionError("broken pipe")
+
+    async def list_tools(self, run_context=None, agent=None):
+        return ["yelp_agent"]
+
+    async def call_tool(self, tool_name, arguments):
+        self.calls.append((tool_name, arguments))
+        return {"server": id(self)}
+
+
+@pytest.fixture
+def servers():
+    return []
+
+
+@pytest.fixture
+def pool(servers):
+    return MCPServerPool("fake", lambda: FakeMCPServer(servers), max_size=2)
+
+
+class TestMCPServerPool:
+    """Test borrowing, bounding and recycling of pooled connections."""
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused_across_borrows(self, pool, servers):
+        for _ in range(3):
+            async with pool.connection() as server:
+                await server.call_tool("yelp_agent", {})
+
+        assert len(servers) == 1
+        assert servers[0].calls == [("yelp_agent", {})] * 3
+        assert pool.stats()["idle"] == 1
+
+    @pytest.mark.asyncio
+    async def test_pool_size_is_bounded(self, pool, servers):
+        first = await pool.acquire()
+        second = await pool.acquire()
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.01)
+
+        assert not waiter.done()
+        assert pool.stats()["in_use"] == 2
+
+        await pool.release(first)
+        third = await asyncio.wait_for(waiter, timeout=1.0)
+
+        assert third is first
+        assert len(servers) == 2
+        await pool.release(second)
+        await pool.release(third)
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_connection_is_replaced(self, pool, servers):
+        async with pool.connection():
+            pass
+        servers[0].ping_ok = False
+
+        async with pool.connection() as server:
+            assert server is servers[1]
+
+        assert servers[0].cleaned_up
+
+    @pytest.mark.asyncio
+    async def test_idle_connections_are_recycled(self, servers):
+        pool = MCPServerPool("fake", lambda: FakeMCPServer(servers), max_idle_seconds=0.01)
+        async with pool.connection():
+            pass
+        await asyncio.sleep(0.02)
+
+        async with pool.connection() as server:
+            assert server is servers[1]
+
+        assert servers[0].cleaned_up
+
+    @pytest.mark.asyncio
+    async def test_connect_failure_releases_slot(self):
+        class BrokenServer:
+            session = None
+
+            async def __aenter__(self):
+                raise RuntimeError("spawn failed")
+
+            async def __aexit__(self, *exc):
+                pass
+
+        pool = MCPServerPool("broken", BrokenServer, max_size=1)
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="spawn failed"):
+                await pool.acquire()
+
+        assert pool.stats()["in_use"] == 0
+
+    @pytest.mark.asyncio
+    async def test_close_tears_down_idle_connections(self, pool, servers):
+        async with pool.connection():
+            pass
+
+        await pool.close()
+
+        assert servers[0].cleaned_up
+        with pytest.raises(RuntimeError):
+            await pool.acquire()
+
+
+class TestPooledMCPServer:
+    """Test the MCPServer facade that agents list in mcp_servers."""
+
+    @pytest.mark.asyncio
+    async def test_context_borrows_and_returns_connection(self, pool, servers):
+        pooled = PooledMCPServer(pool)
+
+        async with pooled:
+            await pooled.call_tool("yelp_agent", {"query": "tacos"})
+            assert pool.stats()["in_use"] == 1
+        async with pooled:
+            assert await pooled.list_tools() == ["yelp_agent"]
+
+        assert len(servers) == 1
+        assert pool.stats() == {"name": "fake", "max_size": 2, "idle": 1, "in_use": 0, "closed": False}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_get_separate_sessions(self, pool, servers):
+        pooled = PooledMCPServer(pool)
+        entered = asyncio.Event()
+        seen = []
+
+        async def run(query):
+            async with pooled:
+                if len(seen) == 0:
+                    seen.append(await pooled.call_tool("yelp_agent", {"query": query}))
+                    await entered.wait()
+                else:
+                    seen.append(await pooled.call_tool("yelp_agent", {"query": query}))
+                    entered.set()
+
+        await asyncio.gather(run("a"), run("b"))
+
+        assert len({result["server"] for result in seen}) == 2
+
+    @pytest.mark.asyncio
+    async def test_calls_outside_context_borrow_per_call(self, pool, servers):
+        pooled = PooledMCPServer(pool)
+
+        await pooled.call_tool("yelp_agent", {})
+
+        assert servers[0].calls == [("yelp_agent", {})]
+        assert pool.stats()["in_use"] == 0
+
+
+class TestMCPServerManagerPools:
+    """Test the pool registry on MCPServerManager."""
+
+    @pytest.fixture(autouse=True)
+    def reset_singleton(self):
+        MCPServerManager._instance = None
+        yield
+        MCPServerManager._instance = None
+
+    def test_get_pool_returns_same_pool_per_key(self, servers):
+        manager = MCPServerManager.instance()
+        key = MCPServerManager.pool_key("YelpMCP", ["uv", "run", "mcp-yelp-agent"], "/app", {"YELP_API_KEY": "secret"})
+
+        pool = manager.get_pool(key, lambda: FakeMCPServer(servers), name="YelpMCP", max_size=3)
+
+        assert manager.get_pool(key, lambda: None) is pool
+        assert pool.max_size == 3
+        assert "secret" not in key
+        assert key != MCPServerManager.pool_key("YelpMCP", ["uv", "run", "mcp-yelp-agent"], "/app", {"YELP_API_KEY": "other"})
+
+    @pytest.mark.asyncio
+    async def test_shutdown_all_closes_pools(self, servers):
+        manager = MCPServerManager.instance()
+        pool = manager.get_pool("key", lambda: FakeMCPServer(servers))
+        async with pool.connection():
+            pass
+
+        await manager.shutdown_all()
+
+        assert servers[0].cleaned_up
+        assert manager.list_pools() == {}
+
+    @pytest.mark.asyncio
+    async def test_warm_pools_opens_one_connection_per_pool(self, servers):
+        manager = MCPServerManager.instance()
+        pool = manager.get_pool("key", lambda: FakeMCPServer(servers))
+
+        def broken():
+            raise ConnectionError("uv not found")
+
+        manager.get_pool("broken", broken)
+
+        warmed = await manager.warm_pools()
+        await manager.warm_pools()
+        async with pool.connection():
+            pass
+
+        assert warmed == {"key": None, "broken": "uv not found"}
+        assert len(servers) == 1
+        assert pool.stats()["idle"] == 1
+
@@ -56,6 +56,8 @@ from asdrp.agents.mcp.yelp_mcp_agent import (
     create_yelp_mcp_agent,
     DEFAULT_INSTRUCTIONS,
 )
+from asdrp.agents.mcp.mcp_connection_pool import PooledMCPServer
+from asdrp.agents.mcp.mcp_server_manager import get_mcp_manager
 
 
 class TestYelpMCPAgentCreation:
@@ -382,6 +384,7 @@ class TestYelpMCPAgentMCPIntegration:
 
             mock_mcp_instance = MagicMock()
             mock_mcp.return_value = mock_mcp_instance
+            get_mcp_manager()._pools.clear()
 
             agent = create_yelp_mcp_agent()
 
@@ -389,7 +392,12 @@ class TestYelpMCPAgentMCPIntegration:
             mock_agent_generic.assert_called_once()
             call_kwargs = mock_agent_generic.call_args[1]
             assert "mcp_servers" in call_kwargs
-            assert mock_mcp_instance in call_kwargs["mcp_servers"]
+            assert len(call_kwargs["mcp_servers"]) == 1
+            pooled = call_kwargs["mcp_servers"][0]
+            assert isinstance(pooled, PooledMCPServer)
+            assert pooled.name == "YelpMCP"
+            # New pooled connections are built from the same MCPServerStdio config
+            assert pooled.pool._server_factory() is mock_mcp_instance
 
 
 class TestYelpMCPAgentErrorHandling:
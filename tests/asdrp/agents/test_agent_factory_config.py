@@ -340,3 +340,103 @@ class TestConfigBackwardCompatibility:
         assert yelp_agent.name == "YelpAgent"
         assert one_agent.name == "OneAgent"
 
+
+
+class TestAgentInstanceCache:
+    """Test caching of agent instances in AgentFactory."""
+
+    @staticmethod
+    def _counting_factory(calls: list):
+        def create_agent(instructions: str, model_config=None):
+            calls.append(instructions)
+            agent = MagicMock()
+            agent.name = "GeoAgent"
+            agent.instructions = instructions
+            return agent
+        return create_agent
+
+    @pytest.mark.asyncio
+    async def test_same_inputs_return_cached_instance(self):
+        """Test that repeated calls with the same inputs reuse one agent."""
+        factory = AgentFactory()
+        calls = []
+        factory.register_agent("geo", self._counting_factory(calls))
+
+        agent1 = await factory.get_agent("geo", "Same instructions")
+        agent2 = await factory.get_agent("GEO ", "Same instructions")
+
+        assert agent1 is agent2
+        assert calls == ["Same instructions"]
+
+    @pytest.mark.asyncio
+    async def test_different_instructions_create_new_instance(self):
+        """Test that instructions are part of the cache key."""
+        factory = AgentFactory()
+        calls = []
+        factory.register_agent("geo", self._counting_factory(calls))
+
+        agent1 = await factory.get_agent("geo", "Instructions 1")
+        agent2 = await factory.get_agent("geo", "Instructions 2")
+
+        assert agent1 is not agent2
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_clear_agent_cache_forces_rebuild(self):
+        """Test that clear_agent_cache drops cached instances."""
+        factory = AgentFactory()
+        calls = []
+        factory.register_agent("geo", self._counting_factory(calls))
+
+        agent1 = await factory.get_agent("geo", "Test")
+        factory.clear_agent_cache("geo")
+        agent2 = await factory.get_agent("geo", "Test")
+        factory.clear_agent_cache()
+        agent3 = await factory.get_agent("geo", "Test")
+
+        assert agent1 is not agent2
+        assert agent2 is not agent3
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_register_agent_invalidates_cache(self):
+        """Test that re-registering an agent drops its cached instances."""
+        factory = AgentFactory()
+        first_calls, second_calls = [], []
+        factory.register_agent("geo", self._counting_factory(first_calls))
+        await factory.get_agent("geo", "Test")
+
+        factory.register_agent("geo", self._counting_factory(second_calls))
+        await factory.get_agent("geo", "Test")
+
+        assert first_calls == ["Test"]
+        assert second_calls == ["Test"]
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self):
+        """Test that the least recently used agent is evicted at capacity."""
+        factory = AgentFactory()
+        factory.AGENT_CACHE_MAX_SIZE = 2
+        calls = []
+        factory.register_agent("geo", self._counting_factory(calls))
+
+        agent_a = await factory.get_agent("geo", "A")
+        await factory.get_agent("geo", "B")
+        await factory.get_agent("geo", "C")
+
+        assert len(factory._agent_cache) == 2
+        assert await factory.get_agent("geo", "A") is not agent_a
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_not_cached_with_agent(self):
+        """Test that the shared agent is paired with per-request sessions."""
+        factory = AgentFactory()
+        calls = []
+        factory.register_agent("geo", self._counting_factory(calls))
+
+        agent1, session1 = await factory.get_agent_with_session("geo", "Test", session_id="s1")
+        agent2, session2 = await factory.get_agent_with_session("geo", "Test", session_id="s2")
+
+        assert agent1 is agent2
+        if session1 is not None:
+            assert session1 is not session2
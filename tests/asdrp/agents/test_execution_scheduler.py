@@ -0,0 +1,121 @@
+#############################################################################
+# test_execution_scheduler.py
+#
+# Tests for process-wide admission control of agent runs.
+#
+# Test Coverage:
+# - Global and per-agent concurrency limits
+# - Load shedding (queue full, wait deadline)
+# - Round-robin hand-off across sessions
+# - Cancellation while queued
+#
+#############################################################################
+
+import asyncio
+
+import pytest
+
+from asdrp.agents.execution_scheduler import AdmissionError, ExecutionScheduler
+
+
+class TestExecutionScheduler:
+    """Test ExecutionScheduler limits, queueing and shedding."""
+
+    @pytest.mark.asyncio
+    async def test_global_limit(self):
+        """Test that no more than max_concurrent runs are in flight."""
+        scheduler = ExecutionScheduler(max_concurrent=2, per_agent_limit=10)
+        peak = 0
+
+        async def run(i):
+            nonlocal peak
+            async with scheduler.slot(f"agent{i}"):
+                peak = max(peak, scheduler.stats()["active"])
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(run(i) for i in range(6)))
+
+        assert peak == 2
+        stats = scheduler.stats()
+        assert stats["active"] == 0
+        assert stats["admitted"] == 6
+
+    @pytest.mark.asyncio
+    async def test_per_agent_limit(self):
+        """Test that a busy agent does not block other agents."""
+        scheduler = ExecutionScheduler(max_concurrent=10, per_agent_limit=1)
+        await scheduler.acquire("map")
+
+        # A second map run has to wait, a geo run starts right away
+        waiting = asyncio.ensure_future(scheduler.acquire("map"))
+        await asyncio.sleep(0)
+        await asyncio.wait_for(scheduler.acquire("geo"), timeout=0.1)
+        assert not waiting.done()
+
+        scheduler.release("map")
+        await asyncio.wait_for(waiting, timeout=0.1)
+        assert scheduler.stats()["active_per_agent"] == {"map": 1, "geo": 1}
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self):
+        """Test that runs are shed immediately once the queue is full."""
+        scheduler = ExecutionScheduler(max_concurrent=1, max_queue=1)
+        await scheduler.acquire("a")
+        queued = asyncio.ensure_future(scheduler.acquire("b"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionError, match="at capacity"):
+            await scheduler.acquire("c")
+
+        assert scheduler.stats()["rejected"] == 1
+        queued.cancel()
+
+    @pytest.mark.asyncio
+    async def test_queue_deadline(self):
+        """Test that a queued run gives up after its wait deadline."""
+        scheduler = ExecutionScheduler(max_concurrent=1)
+        await scheduler.acquire("a")
+
+        with pytest.raises(AdmissionError, match="Timed out"):
+            await scheduler.acquire("b", timeout=0.01)
+
+        stats = scheduler.stats()
+        assert stats["timed_out"] == 1
+        assert stats["queued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_round_robin_across_sessions(self):
+        """Test that a session with many queued runs does not starve others."""
+        scheduler = ExecutionScheduler(max_concurrent=1, per_agent_limit=10)
+        await scheduler.acquire("agent")
+        order = []
+
+        async def run(session_id, label):
+            async with scheduler.slot("agent", session_id=session_id):
+                order.append(label)
+
+        tasks = [asyncio.ensure_future(run("busy", f"busy{i}")) for i in range(3)]
+        tasks.append(asyncio.ensure_future(run("quiet", "quiet")))
+        await asyncio.sleep(0)
+
+        scheduler.release("agent")
+        await asyncio.gather(*tasks)
+
+        assert order.index("quiet") == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        """Test that cancelling a queued run frees its queue position."""
+        scheduler = ExecutionScheduler(max_concurrent=1)
+        await scheduler.acquire("a")
+        waiting = asyncio.ensure_future(scheduler.acquire("b"))
+        await asyncio.sleep(0)
+
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+        assert scheduler.stats()["queued"] == 0
+        scheduler.release("a")
+        assert scheduler.stats()["active"] == 0
+
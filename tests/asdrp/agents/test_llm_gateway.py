@@ -0,0 +1,148 @@
+#############################################################################
+# test_llm_gateway.py
+#
+# Tests for the shared LLM gateway used by orchestrator-internal calls.
+#
+# Test Coverage:
+# - One pooled client per event loop and API key
+# - Coalescing of identical in-flight requests
+# - Jittered retries on retryable errors
+# - Per-caller timing, token and cost metrics
+# - Memoized SDK agents
+#
+#############################################################################
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+from asdrp.agents.llm_gateway import LLMGateway, estimate_cost
+
+
+class _FakeCompletions:
+    def __init__(self, delay=0.0, failures=0):
+        self.calls = 0
+        self.delay = delay
+        self.failures = failures
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.failures:
+            self.failures -= 1
+            request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+            raise openai.RateLimitError(
+                "rate limited", response=httpx.Response(429, request=request), body=None
+            )
+        return SimpleNamespace(
+            content=kwargs["messages"][0]["content"],
+            usage=SimpleNamespace(prompt_tokens=1000, completion_tokens=500),
+        )
+
+
+def _gateway_with(completions, **kwargs):
+    gateway = LLMGateway(backoff_base=0.001, **kwargs)
+    gateway.client = lambda api_key=None: SimpleNamespace(
+        chat=SimpleNamespace(completions=completions)
+    )
+    return gateway
+
+
+class TestLLMGateway:
+    """Test LLMGateway pooling, coalescing, retries and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_pooled_per_loop(self):
+        """Test that the same client is reused for the same API key."""
+        gateway = LLMGateway()
+
+        client = gateway.client("sk-test")
+
+        assert gateway.client("sk-test") is client
+        assert gateway.client("sk-other") is not client
+        assert client.max_retries == 0
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_are_coalesced(self):
+        """Test that concurrent identical calls share one upstream request."""
+        completions = _FakeCompletions(delay=0.01)
+        gateway = _gateway_with(completions)
+        messages = [{"role": "user", "content": "hi"}]
+
+        results = await asyncio.gather(*(
+            gateway.chat_completion("test", model="gpt-4.1-mini", messages=messages)
+            for _ in range(3)
+        ))
+
+        assert completions.calls == 1
+        assert all(r is results[0] for r in results)
+        assert gateway.stats()["test"]["coalesced"] == 2
+
+        await gateway.chat_completion("test", model="gpt-4.1-mini", messages=messages)
+        assert completions.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limits(self):
+        """Test that retryable errors are retried with backoff."""
+        completions = _FakeCompletions(failures=2)
+        gateway = _gateway_with(completions, max_retries=2)
+
+        response = await gateway.chat_completion(
+            "test", model="gpt-4.1-mini", messages=[{"role": "user", "content": "hi"}]
+        )
+
+        assert response.content == "hi"
+        assert completions.calls == 3
+        assert gateway.stats()["test"]["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        """Test that the error surfaces once retries are exhausted."""
+        gateway = _gateway_with(_FakeCompletions(failures=5), max_retries=1)
+
+        with pytest.raises(openai.RateLimitError):
+            await gateway.chat_completion(
+                "test", model="gpt-4.1-mini", messages=[{"role": "user", "content": "hi"}]
+            )
+
+        assert gateway.stats()["test"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_records_tokens_and_cost(self):
+        """Test that token usage and estimated cost are recorded per caller."""
+        gateway = _gateway_with(_FakeCompletions())
+        client = gateway.bind("moe.mixer")
+
+        await client.chat.completions.create(
+            model="gpt-4.1-mini", messages=[{"role": "user", "content": "hi"}]
+        )
+
+        stats = gateway.stats()["moe.mixer"]
+        assert stats["calls"] == 1
+        assert stats["prompt_tokens"] == 1000
+        assert stats["completion_tokens"] == 500
+        assert stats["cost_usd"] == pytest.approx(estimate_cost("gpt-4.1-mini", 1000, 500))
+
+    def test_agents_are_memoized(self):
+        """Test that identical agent configurations share one Agent."""
+        gateway = LLMGateway()
+
+        a = gateway.get_agent("Judge", "Evaluate.", "gpt-4.1-mini", 0.0, 100)
+
+        assert gateway.get_agent("Judge", "Evaluate.", "gpt-4.1-mini", 0.0, 100) is a
+        assert gateway.get_agent("Judge", "Evaluate.", "gpt-4.1-nano", 0.0, 100) is not a
+
+    @pytest.mark.asyncio
+    async def test_agents_run_on_pooled_client(self):
+        """Test that agents built in a loop use the gateway's connection pool."""
+        gateway = LLMGateway()
+
+        agent = gateway.get_agent("Judge", "Evaluate.", "gpt-4.1-mini", 0.0, 100)
+
+        assert agent.model.model == "gpt-4.1-mini"
+        assert agent.model._client._client is gateway.client()._client
+        assert agent.model._client.max_retries == gateway.max_retries
+        assert gateway.get_agent("Judge", "Evaluate.", "gpt-4.1-mini", 0.0, 100) is agent
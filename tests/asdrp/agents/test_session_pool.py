@@ -0,0 +1,165 @@
+#############################################################################
+# test_session_pool.py
+#
+# Tests for the bounded session cache and shared SQLite connections.
+#
+# Test Coverage:
+# - LRU eviction and closing of evicted sessions
+# - Idle-time (TTL) expiry
+# - Hit/miss/eviction metrics
+# - Shared WAL-mode connection per database file
+# - AgentFactory integration (bounded cache, stats, shared connections)
+#
+#############################################################################
+
+import os
+import tempfile
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from asdrp.agents.agent_factory import AgentFactory, SESSION_MEMORY_AVAILABLE
+from asdrp.agents.config_loader import SessionMemoryConfig
+from asdrp.agents.session_pool import (
+    SessionPool,
+    SharedConnectionRegistry,
+    SharedSQLiteSession,
+)
+
+
+class TestSessionPool:
+    """Test SessionPool eviction, expiry and metrics."""
+
+    def test_get_returns_cached_session(self):
+        """Test that a stored session is returned and counted as a hit."""
+        pool = SessionPool(max_size=2)
+        session = MagicMock()
+        pool.put("a", session)
+
+        assert pool.get("a") is session
+        assert pool.get("missing") is None
+        stats = pool.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_lru_eviction_closes_session(self):
+        """Test that the least recently used session is evicted and closed."""
+        pool = SessionPool(max_size=2)
+        a, b, c = MagicMock(), MagicMock(), MagicMock()
+        pool.put("a", a)
+        pool.put("b", b)
+        pool.get("a")  # "b" is now least recently used
+        pool.put("c", c)
+
+        assert "b" not in pool
+        assert "a" in pool and "c" in pool
+        b.close.assert_called_once()
+        a.close.assert_not_called()
+        assert pool.stats()["evictions"] == 1
+
+    def test_idle_sessions_expire(self):
+        """Test that sessions idle past the TTL are dropped and closed."""
+        pool = SessionPool(max_size=10, ttl_seconds=0.01)
+        session = MagicMock()
+        pool.put("a", session)
+        time.sleep(0.02)
+
+        assert pool.get("a") is None
+        session.close.assert_called_once()
+        assert pool.stats()["expirations"] == 1
+
+    def test_clear_closes_all_sessions(self):
+        """Test that clear() closes every cached session."""
+        pool = SessionPool()
+        sessions = [MagicMock() for _ in range(3)]
+        for i, session in enumerate(sessions):
+            pool.put(str(i), session)
+
+        pool.clear()
+
+        assert len(pool) == 0
+        for session in sessions:
+            session.close.assert_called_once()
+
+
+class TestSharedConnectionRegistry:
+    """Test shared connections per database file."""
+
+    def test_same_file_shares_connection(self):
+        """Test that one connection is opened per database file."""
+        registry = SharedConnectionRegistry()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "agent.db")
+            conn1, lock1 = registry.acquire(db_path)
+            conn2, lock2 = registry.acquire(db_path)
+
+            assert conn1 is conn2
+            assert lock1 is lock2
+            assert conn1.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert len(registry) == 1
+            registry.close_all()
+            assert len(registry) == 0
+
+
+@pytest.mark.skipif(not SESSION_MEMORY_AVAILABLE, reason="SQLiteSession not available")
+class TestSharedSQLiteSession:
+    """Test SharedSQLiteSession on a shared connection."""
+
+    @pytest.mark.asyncio
+    async def test_sessions_share_connection_and_keep_history_separate(self):
+        """Test that sessions on one file share a connection but not history."""
+        registry = SharedConnectionRegistry()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "agent.db")
+            s1 = SharedSQLiteSession("s1", db_path, registry)
+            s2 = SharedSQLiteSession("s2", db_path, registry)
+
+            await s1.add_items([{"role": "user", "content": "hello"}])
+            await s2.add_items([{"role": "user", "content": "bye"}])
+
+            assert s1._get_connection() is s2._get_connection()
+            assert [i["content"] for i in await s1.get_items()] == ["hello"]
+            assert [i["content"] for i in await s2.get_items()] == ["bye"]
+
+            # Closing one session leaves the shared connection usable
+            s1.close()
+            assert len(await s2.get_items()) == 1
+            registry.close_all()
+
+
+@pytest.mark.skipif(not SESSION_MEMORY_AVAILABLE, reason="SQLiteSession not available")
+class TestAgentFactorySessionPool:
+    """Test AgentFactory's bounded session cache."""
+
+    def test_session_cache_is_bounded(self):
+        """Test that the factory evicts sessions beyond its max size."""
+        factory = AgentFactory()
+        factory._session_cache.max_size = 2
+        try:
+            for i in range(5):
+                factory._create_session(
+                    SessionMemoryConfig(type="sqlite", session_id=f"s{i}", enabled=True),
+                    "test_agent",
+                )
+
+            stats = factory.session_cache_stats()
+            assert stats["size"] == 2
+            assert stats["evictions"] == 3
+        finally:
+            factory.clear_session_cache()
+
+    def test_file_sessions_share_connection(self):
+        """Test that file-based sessions for one database share a connection."""
+        factory = AgentFactory()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "agent.db")
+            try:
+                s1 = factory.get_persistent_session("geo", "conv-1", db_path=db_path)
+                s2 = factory.get_persistent_session("geo", "conv-2", db_path=db_path)
+
+                assert s1 is not s2
+                assert s1._get_connection() is s2._get_connection()
+                assert factory.session_cache_stats()["shared_connections"] == 1
+            finally:
+                factory.clear_session_cache()
@@ -1,9 +1,13 @@
 """Shared fixtures for MoE tests."""
 
+import asyncio
 import sys
 import pytest
 from unittest.mock import Mock, AsyncMock
 from pathlib import Path
+from typing import Callable, List, Optional
+
+import numpy as np
 
 # Ensure repo root is on sys.path so `import asdrp` works when running pytest
 # without installing the package.
@@ -24,6 +28,66 @@ from asdrp.orchestration.moe.config_loader import (
     MoECacheConfig,
 )
 from asdrp.agents.config_loader import ModelConfig
+from asdrp.orchestration.moe.embedding_providers import IEmbeddingProvider
+
+
+class FakeEmbeddingProvider(IEmbeddingProvider):
+    """
+    Configurable embedding provider that records what it is asked to embed.
+
+    Attributes:
+        calls: Texts passed to generate_embedding
+        batch_calls: Number of generate_batch_embeddings calls
+        embedded: Every text embedded, by either method
+    """
+
+    def __init__(
+        self,
+        embed: Optional[Callable[[str], np.ndarray]] = None,
+        batch_embed: Optional[Callable[[str], np.ndarray]] = None,
+        model: str = "test-model",
+        dimension: int = 3,
+        delay: float = 0.0,
+        fail: bool = False,
+    ):
+        """
+        Args:
+            embed: Vector for a text (default: [len(text), 1.0, 0.5])
+            batch_embed: Vector for a text embedded in a batch (default: embed)
+            model: Model name (CachedEmbeddingProvider keys its store by it)
+            dimension: Reported embedding dimension
+            delay: Seconds each call waits, yielding to the event loop
+            fail: Raise RuntimeError from every call
+        """
+        self._embed = embed or (lambda text: np.array([float(len(text)), 1.0, 0.5]))
+        self._batch_embed = batch_embed or self._embed
+        self._model = model
+        self._dimension = dimension
+        self._delay = delay
+        self._fail = fail
+        self.calls: List[str] = []
+        self.batch_calls = 0
+        self.embedded: List[str] = []
+
+    async def generate_embedding(self, text: str) -> np.ndarray:
+        self.calls.append(text)
+        await asyncio.sleep(self._delay)
+        if self._fail:
+            raise RuntimeError("embedding service down")
+        self.embedded.append(text)
+        return self._embed(text)
+
+    async def generate_batch_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        self.batch_calls += 1
+        await asyncio.sleep(self._delay)
+        if self._fail:
+            raise RuntimeError("embedding service down")
+        self.embedded.extend(texts)
+        return [self._batch_embed(text) for text in texts]
+
+    @property
+    def embedding_dimension(self) -> int:
+        return self._dimension
 
 
 @pytest.fixture
@@ -126,6 +190,12 @@ def mock_agent_factory():
     return factory
 
 
+@pytest.fixture
+def fake_embedding_provider():
+    """Factory for FakeEmbeddingProvider (takes its keyword arguments)."""
+    return FakeEmbeddingProvider
+
+
 @pytest.fixture
 def sample_query():
     """Sample query for testing."""
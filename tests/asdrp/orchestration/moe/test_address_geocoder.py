@@ -7,6 +7,8 @@ Tests follow SOLID principles:
 - Fail-Safe Design: Geocoder never crashes, always returns partial results
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock, AsyncMock
 
@@ -307,6 +309,85 @@ class TestExtractAndGeocode:
             assert markers == []
 
 
+class TestConcurrentGeocoding:
+    """Test concurrent batch geocoding with a total deadline."""
+
+    @pytest.mark.asyncio
+    async def test_geocode_accepts_tuple_results(self):
+        """Test that (lat, lng) tuples from GeoTools become markers."""
+        geocoder = AddressGeocoder()
+
+        venue_addresses = [
+            ("Souvla", "517 Hayes St, San Francisco, CA 94102"),
+            ("Nowhere", "Invalid Address"),
+        ]
+
+        with patch("asdrp.actions.geo.geo_tools.GeoTools.get_coordinates_by_address", new=AsyncMock()) as mock_geocode:
+            mock_geocode.side_effect = [(37.7769, -122.4211), (-1.0, -1.0)]
+
+            markers = await geocoder.geocode_addresses(venue_addresses)
+
+            assert markers == [{"lat": 37.7769, "lng": -122.4211, "title": "Souvla"}]
+
+    @pytest.mark.asyncio
+    async def test_geocode_runs_concurrently_with_bounded_parallelism(self):
+        """Test that addresses are geocoded in parallel up to max_concurrency."""
+        geocoder = AddressGeocoder(max_concurrency=3)
+        in_flight = 0
+        peak = 0
+
+        async def slow_geocode(address):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return (37.77, -122.42)
+
+        venue_addresses = [(f"R{i}", f"{i} Main St, San Francisco, CA") for i in range(9)]
+
+        with patch("asdrp.actions.geo.geo_tools.GeoTools.get_coordinates_by_address", new=slow_geocode):
+            markers = await geocoder.geocode_addresses(venue_addresses)
+
+        assert [m["title"] for m in markers] == [f"R{i}" for i in range(9)]
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_geocode_batch_deadline_returns_partial_results(self):
+        """Test that addresses still pending at the deadline are skipped."""
+        geocoder = AddressGeocoder(batch_timeout=0.1)
+
+        async def geocode(address):
+            if address.startswith("slow"):
+                await asyncio.sleep(5)
+            return (37.77, -122.42)
+
+        venue_addresses = [("Fast", "fast 1 Main St"), ("Slow", "slow 2 Main St")]
+
+        with patch("asdrp.actions.geo.geo_tools.GeoTools.get_coordinates_by_address", new=geocode):
+            markers = await asyncio.wait_for(geocoder.geocode_addresses(venue_addresses), timeout=2)
+
+        assert [m["title"] for m in markers] == ["Fast"]
+
+    @pytest.mark.asyncio
+    async def test_geocode_deduplicates_addresses(self):
+        """Test that a repeated address is geocoded once but kept per venue."""
+        geocoder = AddressGeocoder()
+
+        venue_addresses = [
+            ("Location", "517 Hayes St, San Francisco, CA"),
+            ("Souvla", "517 Hayes St, San Francisco, CA"),
+        ]
+
+        with patch("asdrp.actions.geo.geo_tools.GeoTools.get_coordinates_by_address", new=AsyncMock()) as mock_geocode:
+            mock_geocode.return_value = (37.7769, -122.4211)
+
+            markers = await geocoder.geocode_addresses(venue_addresses)
+
+            assert mock_geocode.await_count == 1
+            assert [m["title"] for m in markers] == ["Location", "Souvla"]
+
+
 if __name__ == "__main__":
     # Run with: pytest tests/asdrp/orchestration/moe/test_address_geocoder.py -v
     pytest.main([__file__, "-v"])
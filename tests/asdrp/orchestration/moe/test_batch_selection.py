@@ -0,0 +1,99 @@
+"""Tests for matrix-based expert/pattern scoring and SemanticSelector.select_batch."""
+
+import numpy as np
+import pytest
+
+from asdrp.orchestration.moe.embedding_providers import LocalEmbeddingProvider
+from asdrp.orchestration.moe.exceptions import ExpertSelectionException
+import asdrp.orchestration.moe.fast_path as fast_path_module
+from asdrp.orchestration.moe.fast_path import FastPathDetector
+from asdrp.orchestration.moe.semantic_selector import SemanticSelector
+
+QUERIES = [
+    "restaurants with good reviews",
+    "directions to the nearest places",
+    "search the web in realtime",
+    "zzzz",
+]
+
+
+@pytest.fixture
+def local_provider(fake_embedding_provider):
+    """Factory for counting providers backed by local embeddings."""
+    local = LocalEmbeddingProvider()
+
+    def embed(text):
+        return np.zeros(local.embedding_dimension) if text == "" else local.encode(text)
+
+    return lambda: fake_embedding_provider(embed=embed, dimension=local.embedding_dimension)
+
+
+class TestSelectBatch:
+    """Test SemanticSelector batch selection."""
+
+    @pytest.mark.asyncio
+    async def test_matches_single_selection(self, mock_moe_config, local_provider):
+        selector = SemanticSelector(mock_moe_config, embedding_provider=local_provider())
+
+        batch = await selector.select_batch(QUERIES, k=3, threshold=0.55)
+        single = [await selector.select(q, k=3, threshold=0.55) for q in QUERIES]
+
+        assert batch == single
+        assert batch[0][0] == "yelp"
+        assert batch[1][0] in ("geo", "map")
+
+    @pytest.mark.asyncio
+    async def test_one_provider_call_for_all_queries(self, mock_moe_config, local_provider):
+        provider = local_provider()
+        selector = SemanticSelector(mock_moe_config, embedding_provider=provider)
+
+        results = await selector.select_batch(QUERIES * 50)
+
+        assert len(results) == 200
+        assert provider.batch_calls == 2  # experts + queries
+        assert provider.calls == []
+        assert await selector.select_batch([]) == []
+
+    @pytest.mark.asyncio
+    async def test_zero_embedding_scores_zero(self, mock_moe_config, local_provider):
+        selector = SemanticSelector(mock_moe_config, embedding_provider=local_provider())
+        await selector.warm_up()
+
+        scores = selector._score_experts(np.zeros((1, LocalEmbeddingProvider().embedding_dimension)))
+
+        assert not scores.any()
+        assert await selector.select_batch([""], threshold=0.3) == [selector._get_fallback_experts(1)]
+
+    @pytest.mark.asyncio
+    async def test_provider_errors_are_wrapped(self, mock_moe_config, local_provider):
+        provider = local_provider()
+        selector = SemanticSelector(mock_moe_config, embedding_provider=provider)
+        await selector.warm_up()
+
+        async def short_batch(texts):
+            return []
+
+        provider.generate_batch_embeddings = short_batch
+        with pytest.raises(ExpertSelectionException):
+            await selector.select_batch(["pizza"])
+
+
+class TestFastPathMatrix:
+    """Test that fast-path matrix scoring matches the pure-Python path."""
+
+    @pytest.mark.asyncio
+    async def test_matrix_and_loop_agree(self, monkeypatch):
+        provider = LocalEmbeddingProvider()
+        detector = FastPathDetector(similarity_threshold=0.3, embedding_provider=provider)
+        await detector.warm_up()
+        query = provider.encode("hey there, how's it going today?")
+
+        match, similarity = detector._best_pattern(query)
+        assert detector._best_pattern(np.zeros_like(query)) == (None, 0.0)
+
+        detector._pattern_matrix = None
+        monkeypatch.setattr(fast_path_module, "np", None)
+        loop_match, loop_similarity = detector._best_pattern(query.tolist())
+
+        assert match["target_agent"] == loop_match["target_agent"] == "chitchat"
+        assert similarity == pytest.approx(loop_similarity, abs=1e-5)
@@ -0,0 +1,144 @@
+"""Tests for request coalescing and stale-while-revalidate in MoEOrchestrator."""
+
+import asyncio
+from dataclasses import replace
+from unittest.mock import Mock, AsyncMock
+
+import pytest
+
+from asdrp.orchestration.moe.cache import SemanticCache
+from asdrp.orchestration.moe.config_loader import MoECacheConfig
+from asdrp.orchestration.moe.expert_executor import ExpertResult
+from asdrp.orchestration.moe.orchestrator import MoEOrchestrator
+from asdrp.orchestration.moe.result_mixer import MixedResult
+
+
+def _make_orchestrator(mock_agent_factory, mock_moe_config, answers, delay=0.05, **policy):
+    """Orchestrator with an exact-match in-memory cache whose experts take `delay` seconds."""
+    config = replace(mock_moe_config, cache=MoECacheConfig(
+        enabled=True,
+        type="exact",
+        storage={"backend": "sqlite", "path": ":memory:"},
+        policy={"ttl": 3600, "max_entries": 100, **policy},
+    ))
+
+    selector = Mock()
+    selector.select = AsyncMock(return_value=["yelp"])
+
+    async def _execute(agents, query, context, timeout=None, primary_expert_id=None):
+        await asyncio.sleep(delay)
+        return [ExpertResult(expert_id="yelp", output="result", success=True, latency_ms=1.0)]
+
+    executor = Mock()
+    executor.execute_parallel = AsyncMock(side_effect=_execute)
+
+    mixer = Mock()
+    mixer.mix = AsyncMock(side_effect=[
+        MixedResult(content=answer, weights={"yelp": 1.0}, quality_score=1.0)
+        for answer in answers
+    ])
+
+    orchestrator = MoEOrchestrator(
+        agent_factory=mock_agent_factory,
+        expert_selector=selector,
+        expert_executor=executor,
+        result_mixer=mixer,
+        config=config,
+        cache=SemanticCache(config),
+    )
+    return orchestrator, executor
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_misses_share_one_computation(mock_agent_factory, mock_moe_config):
+    orchestrator, executor = _make_orchestrator(mock_agent_factory, mock_moe_config, ["Tony's Pizza"])
+
+    results = await asyncio.gather(*(
+        orchestrator.route_query(query) for query in ["Pizza near me", "pizza near me ", "pizza near me"]
+    ))
+
+    assert executor.execute_parallel.await_count == 1
+    assert [r.response for r in results] == ["Tony's Pizza"] * 3
+    leader, *followers = results
+    assert leader.trace.cache_status == "miss"
+    for follower in followers:
+        assert follower.trace.cache_status == "coalesced"
+        assert follower.trace.coalesced_with == leader.trace.request_id
+        assert follower.trace.request_id != leader.trace.request_id
+        assert follower.experts_used == ["yelp"]
+    assert orchestrator._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_different_context_is_not_coalesced(mock_agent_factory, mock_moe_config):
+    orchestrator, executor = _make_orchestrator(mock_agent_factory, mock_moe_config, ["SF", "NYC"])
+
+    await asyncio.gather(
+        orchestrator.route_query("pizza near me", context={"city": "SF"}),
+        orchestrator.route_query("pizza near me", context={"city": "NYC"}),
+    )
+
+    assert executor.execute_parallel.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_different_sessions_share_computation_and_record_turn(mock_agent_factory, mock_moe_config):
+    sessions = {}
+
+    async def get_agent(expert_id, session_id):
+        session = sessions.setdefault(session_id, Mock(add_items=AsyncMock()))
+        return Mock(), session
+
+    mock_agent_factory.get_agent_with_persistent_session = AsyncMock(side_effect=get_agent)
+    orchestrator, executor = _make_orchestrator(mock_agent_factory, mock_moe_config, ["Tony's Pizza"])
+
+    results = await asyncio.gather(*(
+        orchestrator.route_query("pizza near me", session_id=session_id)
+        for session_id in ["alice", "bob", "carol"]
+    ))
+
+    assert executor.execute_parallel.await_count == 1
+    assert [r.trace.cache_status for r in results] == ["miss", "coalesced", "coalesced"]
+    # The leader's experts recorded its turn; joiners get it added to their sessions
+    sessions["alice"].add_items.assert_not_awaited()
+    for joiner in ("bob", "carol"):
+        sessions[joiner].add_items.assert_awaited_once_with([
+            {"role": "user", "content": "pizza near me"},
+            {"role": "assistant", "content": "Tony's Pizza"},
+        ])
+
+
+@pytest.mark.asyncio
+async def test_fresh_hit_reports_freshness(mock_agent_factory, mock_moe_config):
+    orchestrator, executor = _make_orchestrator(mock_agent_factory, mock_moe_config, ["Tony's Pizza"])
+
+    await orchestrator.route_query("pizza near me")
+    result = await orchestrator.route_query("pizza near me")
+
+    assert executor.execute_parallel.await_count == 1
+    assert result.trace.cache_status == "hit"
+    assert result.trace.cache_ttl_s == 3600
+    assert result.trace.cache_age_s >= 0
+    assert result.trace.revalidating is False
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_served_while_refreshed_once(mock_agent_factory, mock_moe_config):
+    orchestrator, executor = _make_orchestrator(
+        mock_agent_factory, mock_moe_config, ["old answer", "new answer"], ttl=-1, stale_ttl=3600
+    )
+    await orchestrator.route_query("pizza near me")
+
+    stale = await asyncio.gather(*(orchestrator.route_query("pizza near me") for _ in range(3)))
+
+    # Served from cache immediately; one refresh runs in the background
+    assert [r.response for r in stale] == ["old answer"] * 3
+    assert all(r.trace.cache_status == "stale" and r.trace.revalidating for r in stale)
+    assert all(r.trace.cache_age_s >= 0 for r in stale)
+    assert len(orchestrator._inflight) == 1
+
+    await asyncio.gather(*orchestrator._inflight.values())
+
+    assert executor.execute_parallel.await_count == 2
+    refreshed = await orchestrator.route_query("pizza near me")
+    assert refreshed.response == "new answer"
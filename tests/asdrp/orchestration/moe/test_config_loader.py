@@ -194,3 +194,30 @@ tracing:
                 error_handling={},
                 tracing={}
             )
+
+    def test_embedding_provider_validation(self, mock_model_config):
+        """Test that only known embedding providers are accepted."""
+        with pytest.raises(ValueError, match="embedding_provider must be one of"):
+            MoEConfig(
+                enabled=True,
+                moe={"embedding_provider": "word2vec"},
+                models={"selection": mock_model_config, "mixing": mock_model_config},
+                experts={"test": ExpertGroupConfig(
+                    agents=["one"], capabilities=["test"], weight=1.0
+                )},
+                cache=MoECacheConfig(),
+                error_handling={},
+                tracing={}
+            )
+
+    def test_embedding_threshold_per_provider(self, mock_moe_config):
+        """Test that thresholds of the active provider override the moe settings."""
+        mock_moe_config.moe["embedding_thresholds"] = {"local": {"confidence_threshold": 0.06}}
+
+        assert mock_moe_config.embedding_provider == "openai"
+        assert mock_moe_config.embedding_threshold("confidence_threshold", 0.5) == 0.3
+        assert mock_moe_config.embedding_threshold("fast_path_threshold", 0.75) == 0.75
+
+        mock_moe_config.moe["embedding_provider"] = "local"
+        assert mock_moe_config.embedding_threshold("confidence_threshold", 0.5) == 0.06
+        assert mock_moe_config.embedding_threshold("fast_path_threshold", 0.75) == 0.75
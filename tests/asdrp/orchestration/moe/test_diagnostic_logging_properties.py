@@ -190,7 +190,7 @@ class TestExecutionLoggingProperties:
         # Create mock executor that simulates the execution scenario
         mock_executor = Mock()
         
-        async def mock_execute_with_logging(agents_with_sessions, query, context, timeout):
+        async def mock_execute_with_logging(agents_with_sessions, query, context, timeout, primary_expert_id=None):
             results = []
             
             for expert_id, agent, session in agents_with_sessions:
@@ -355,7 +355,7 @@ class TestExecutionLoggingProperties:
         
         mock_executor = Mock()
         
-        async def mock_execute_with_realistic_timing(agents_with_sessions, query, context, timeout):
+        async def mock_execute_with_realistic_timing(agents_with_sessions, query, context, timeout, primary_expert_id=None):
             results = []
             
             for expert_id, agent, session in agents_with_sessions:
@@ -0,0 +1,136 @@
+"""Tests for the persistent embedding store and the LRU embedding cache."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from asdrp.orchestration.moe.embedding_providers import CachedEmbeddingProvider
+from asdrp.orchestration.moe.embedding_store import EmbeddingStore, get_embedding_store
+
+
+class TestEmbeddingStore:
+    """Test EmbeddingStore."""
+
+    def test_round_trip_as_float32(self):
+        store = EmbeddingStore()
+        store.put_many("m", {"a": np.array([1.0, 2.0, 3.0]), "b": np.array([4.0, 5.0, 6.0])})
+
+        found = store.get_many("m", ["a", "b", "missing"])
+
+        assert set(found) == {"a", "b"}
+        assert found["a"].dtype == np.float32
+        np.testing.assert_array_equal(found["b"], [4.0, 5.0, 6.0])
+
+    def test_models_are_isolated(self):
+        store = EmbeddingStore()
+        store.put_many("model-a", {"key": np.ones(3)})
+
+        assert store.get_many("model-b", ["key"]) == {}
+        assert store.count("model-a") == 1
+        assert store.count("model-b") == 0
+
+    def test_evicts_least_recently_used(self):
+        store = EmbeddingStore(max_entries=2, touch_interval=0)
+        store.put_many("m", {"old": np.ones(3)})
+        store.put_many("m", {"newer": np.ones(3)})
+        store.get_many("m", ["old"])  # now the most recently used
+
+        store.put_many("m", {"newest": np.ones(3)})
+
+        assert set(store.get_many("m", ["old", "newer", "newest"])) == {"old", "newest"}
+        assert store.count() == 2
+
+    def test_full_store_evicts_without_counting_table(self):
+        store = EmbeddingStore(max_entries=2)
+        store.put_many("m", {"a": np.ones(3), "b": np.ones(3)})
+        statements = []
+        store._conn.set_trace_callback(statements.append)
+
+        for key in ("c", "d", "e"):
+            store.put_many("m", {key: np.ones(3)})
+
+        assert not any("COUNT(*)" in statement for statement in statements)
+        assert store._approx_count == 2
+        assert store.count() == 2
+
+    def test_recounts_periodically(self, tmp_path):
+        path = tmp_path / "embeddings.db"
+        store = EmbeddingStore(path, max_entries=2, recount_interval=0)
+        # Another process fills the store; the running count does not see it
+        EmbeddingStore(path).put_many("m", {"a": np.ones(3), "b": np.ones(3)})
+
+        store.put_many("m", {"c": np.ones(3)})
+
+        assert store.count() == 2
+        assert "c" in store.get_many("m", ["c"])
+
+    def test_shared_between_processes(self, tmp_path):
+        """Test that a second connection to the file (another worker) sees writes."""
+        path = tmp_path / "cache" / "embeddings.db"
+        EmbeddingStore(path).put_many("m", {"key": np.arange(4)})
+
+        other = EmbeddingStore(path)
+
+        np.testing.assert_array_equal(other.get_many("m", ["key"])["key"], [0, 1, 2, 3])
+        assert get_embedding_store(path) is get_embedding_store(str(path))
+
+
+class TestCachedEmbeddingProviderWithStore:
+    """Test CachedEmbeddingProvider in front of a persistent store."""
+
+    @pytest.mark.asyncio
+    async def test_new_process_reads_store_instead_of_provider(self, tmp_path, fake_embedding_provider):
+        path = tmp_path / "embeddings.db"
+        first = CachedEmbeddingProvider(fake_embedding_provider(), store=EmbeddingStore(path))
+        await first.generate_batch_embeddings(["hello", "pizza near me"])
+        await first.generate_embedding("weather")
+
+        base = fake_embedding_provider()
+        second = CachedEmbeddingProvider(base, store=EmbeddingStore(path))
+        batch = await second.generate_batch_embeddings(["hello", "pizza near me", "new text"])
+        single = await second.generate_embedding("weather")
+
+        assert base.embedded == ["new text"]
+        np.testing.assert_allclose(batch[1], [13.0, 1.0, 0.5])
+        np.testing.assert_allclose(single, [7.0, 1.0, 0.5])
+        stats = second.get_cache_stats()
+        assert stats["store_hits"] == 3
+        assert stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_other_model_is_not_served_from_store(self, tmp_path, fake_embedding_provider):
+        path = tmp_path / "embeddings.db"
+        await CachedEmbeddingProvider(
+            fake_embedding_provider(model="model-a"), store=EmbeddingStore(path)
+        ).generate_embedding("hello")
+
+        base = fake_embedding_provider(model="model-b")
+        await CachedEmbeddingProvider(base, store=EmbeddingStore(path)).generate_embedding("hello")
+
+        assert base.embedded == ["hello"]
+
+    @pytest.mark.asyncio
+    async def test_store_failure_falls_back_to_provider(self, fake_embedding_provider):
+        store = EmbeddingStore()
+        store.close()
+        base = fake_embedding_provider()
+        cached = CachedEmbeddingProvider(base, store=store)
+
+        embedding = await cached.generate_embedding("hello")
+
+        np.testing.assert_allclose(embedding, [5.0, 1.0, 0.5])
+        assert base.embedded == ["hello"]
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_is_lru(self, fake_embedding_provider):
+        base = fake_embedding_provider()
+        cached = CachedEmbeddingProvider(base, max_size=2, enable_logging=False)
+        await cached.generate_embedding("a")
+        await cached.generate_embedding("b")
+        await cached.generate_embedding("a")  # hit: "b" is now least recently used
+        await cached.generate_embedding("c")
+
+        await asyncio.gather(cached.generate_embedding("a"), cached.generate_embedding("c"))
+
+        assert base.embedded == ["a", "b", "c"]
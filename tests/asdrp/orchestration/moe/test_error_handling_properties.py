@@ -213,7 +213,7 @@ class TestBusinessAgentFallbackProperties:
         # Create mock executor that simulates the failure scenario
         mock_executor = Mock()
         
-        async def mock_execute_parallel(agents_with_sessions, query, context, timeout):
+        async def mock_execute_parallel(agents_with_sessions, query, context, timeout, primary_expert_id=None):
             results = []
             
             for expert_id, agent, session in agents_with_sessions:
@@ -341,7 +341,7 @@ class TestPartialSuccessHandlingProperties:
         # Create mock executor that simulates business success + map failure
         mock_executor = Mock()
         
-        async def mock_execute_partial_success(agents_with_sessions, query, context, timeout):
+        async def mock_execute_partial_success(agents_with_sessions, query, context, timeout, primary_expert_id=None):
             results = []
             
             for expert_id, agent, session in agents_with_sessions:
@@ -11,6 +11,7 @@ from asdrp.orchestration.moe.expert_executor import (
     ExpertResult,
 )
 from asdrp.orchestration.moe.exceptions import ExecutionException
+from asdrp.agents.execution_scheduler import ExecutionScheduler
 from asdrp.orchestration.moe.config_loader import MoEConfig, MoECacheConfig
 from asdrp.agents.config_loader import ModelConfig
 
@@ -1004,3 +1005,103 @@ class TestIntegrationScenarios:
         assert results[0].metadata["usage"]["prompt_tokens"] == 300
         assert results[0].metadata["usage"]["completion_tokens"] == 200
 
+
+
+class TestPartialResultsAndQuorum:
+    """Test partial-result preservation on timeout and the good-enough quorum."""
+
+    @staticmethod
+    def _executor_with_delays(config, delays):
+        executor = ParallelExecutor(config)
+
+        async def _fake_single(expert_id, agent, session, query, context):
+            await asyncio.sleep(delays[expert_id])
+            return ExpertResult(expert_id=expert_id, output=expert_id, success=True, latency_ms=1.0)
+
+        executor._execute_single = _fake_single
+        return executor
+
+    @pytest.mark.asyncio
+    async def test_timeout_keeps_completed_results(self, mock_moe_config):
+        """Test that only experts still running at the timeout are cut off."""
+        executor = self._executor_with_delays(mock_moe_config, {"yelp": 0.0, "map": 10.0})
+        agents = [(eid, Mock(), None) for eid in ("yelp", "map")]
+
+        results = await executor.execute_parallel(agents, "q", timeout=0.1)
+
+        assert [r.expert_id for r in results] == ["yelp", "map"]
+        assert results[0].success is True
+        assert results[0].output == "yelp"
+        assert results[0].cut_off is False
+        assert results[1].success is False
+        assert results[1].cut_off is True
+        assert results[1].error == "Overall timeout exceeded"
+
+    @pytest.mark.asyncio
+    async def test_quorum_stops_waiting_for_stragglers(self, mock_moe_config):
+        """Test that mixing can start once the top expert plus N others succeeded."""
+        mock_moe_config.moe["quorum_extra_experts"] = 1
+        executor = self._executor_with_delays(
+            mock_moe_config, {"top": 0.02, "other": 0.0, "slow": 10.0}
+        )
+        agents = [(eid, Mock(), None) for eid in ("top", "other", "slow")]
+
+        start = time.monotonic()
+        results = await executor.execute_parallel(agents, "q", timeout=5.0, primary_expert_id="top")
+
+        assert time.monotonic() - start < 1.0
+        assert [r.success for r in results] == [True, True, False]
+        assert results[2].cut_off is True
+        assert results[2].metadata == {"cut_off_reason": "quorum"}
+
+    @pytest.mark.asyncio
+    async def test_quorum_waits_for_top_expert(self, mock_moe_config):
+        """Test that the quorum is not met until the top-confidence expert returns."""
+        mock_moe_config.moe["quorum_extra_experts"] = 1
+        executor = self._executor_with_delays(
+            mock_moe_config, {"top": 0.05, "a": 0.0, "b": 0.0}
+        )
+        # The list order does not matter (map prioritization may reorder it)
+        agents = [(eid, Mock(), None) for eid in ("a", "b", "top")]
+
+        results = await executor.execute_parallel(agents, "q", timeout=5.0, primary_expert_id="top")
+
+        assert all(r.success for r in results)
+        assert not any(r.cut_off for r in results)
+
+    @pytest.mark.asyncio
+    async def test_no_quorum_without_primary_expert(self, mock_moe_config):
+        """Test that execution waits for every expert when no primary is given."""
+        mock_moe_config.moe["quorum_extra_experts"] = 1
+        executor = self._executor_with_delays(
+            mock_moe_config, {"top": 0.0, "other": 0.0, "slow": 0.05}
+        )
+        agents = [(eid, Mock(), None) for eid in ("top", "other", "slow")]
+
+        results = await executor.execute_parallel(agents, "q", timeout=5.0)
+
+        assert all(r.success for r in results)
+
+
+class TestParallelExecutorAdmission:
+    """Test that MoE experts run under the shared scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_shed_expert_is_reported_as_failure(self, mock_moe_config):
+        """Test that a shed expert becomes a failed result, not a crash."""
+        scheduler = ExecutionScheduler(max_concurrent=1, max_queue=0)
+        executor = ParallelExecutor(mock_moe_config, scheduler=scheduler)
+
+        async def slow_run(**kwargs):
+            await asyncio.sleep(0.05)
+            return Mock(final_output=kwargs["expert_id"])
+
+        executor._run_agent_with_mcp_support = slow_run
+        agents = [(eid, Mock(), None) for eid in ("geo", "map")]
+
+        results = await executor.execute_parallel(agents, "q", timeout=1.0)
+
+        assert [r.success for r in results] == [True, False]
+        assert [r.shed for r in results] == [False, True]
+        assert "at capacity" in results[1].error
+        assert scheduler.stats()["active"] == 0
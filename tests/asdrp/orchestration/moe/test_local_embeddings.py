@@ -0,0 +1,105 @@
+"""Tests for the offline LocalEmbeddingProvider and its routing thresholds."""
+
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from asdrp.orchestration.moe.cache import SemanticCache
+from asdrp.orchestration.moe.config_loader import MoEConfigLoader
+from asdrp.orchestration.moe.embedding_providers import LocalEmbeddingProvider
+from asdrp.orchestration.moe.fast_path import FastPathDetector
+from asdrp.orchestration.moe.semantic_selector import SemanticSelector
+
+CONFIG_PATH = Path(__file__).parents[4] / "config" / "moe.yaml"
+
+
+def _cosine(a, b) -> float:
+    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+
+class TestLocalEmbeddingProvider:
+    """Test LocalEmbeddingProvider."""
+
+    @pytest.mark.asyncio
+    async def test_unit_length_and_deterministic(self):
+        provider = LocalEmbeddingProvider(dimension=256)
+
+        first = await provider.generate_embedding("Pizza near me")
+        second = LocalEmbeddingProvider(dimension=256).encode("pizza NEAR me")
+
+        assert first.shape == (256,)
+        assert first.dtype == np.float32
+        assert np.linalg.norm(first) == pytest.approx(1.0, abs=1e-5)
+        np.testing.assert_array_equal(first, second)
+        assert provider.embedding_dimension == 256
+
+    @pytest.mark.asyncio
+    async def test_shared_word_pieces_are_closer(self):
+        provider = LocalEmbeddingProvider()
+        restaurant, restaurants, stocks = await provider.generate_batch_embeddings(
+            ["best restaurant", "restaurants nearby", "stock market"]
+        )
+
+        assert _cosine(restaurant, restaurants) > _cosine(restaurant, stocks) + 0.2
+
+    def test_empty_text_and_invalid_dimension(self):
+        assert not LocalEmbeddingProvider().encode("?!").any()
+        with pytest.raises(ValueError):
+            LocalEmbeddingProvider(dimension=0)
+
+
+class TestLocalRouting:
+    """Test semantic routing with the local provider and its calibrated thresholds."""
+
+    @pytest.fixture
+    def local_config(self):
+        config = MoEConfigLoader(CONFIG_PATH).load_config()
+        config.moe["embedding_provider"] = "local"
+        return config
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("query, agent", [
+        ("directions from san carlos to palo alto", "map"),
+        ("best pizza restaurants nearby", "yelp"),
+        ("TSLA stock price", "finance"),
+        ("explain quantum physics", "wiki"),
+        ("search the web for latest news on AI", "one"),
+    ])
+    async def test_selects_expert_without_api_key(self, local_config, monkeypatch, query, agent):
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        selector = SemanticSelector(local_config)
+
+        selected = await selector.select(
+            query, k=3, threshold=local_config.embedding_threshold("confidence_threshold", 0.5)
+        )
+
+        assert selected[0] == agent
+
+    @pytest.mark.asyncio
+    async def test_fast_path_uses_local_threshold(self, local_config, monkeypatch):
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        provider = SemanticSelector(local_config).embedding_provider
+        detector = FastPathDetector(
+            similarity_threshold=local_config.embedding_threshold("fast_path_threshold", 0.75),
+            embedding_provider=provider,
+        )
+
+        assert await detector.detect_fast_path("hey there, how's it going today?") == "chitchat"
+        assert await detector.detect_fast_path("good restaurants for a morning coffee") is None
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_uses_local_threshold(self, local_config, monkeypatch):
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        config = replace(local_config, cache=replace(
+            local_config.cache, storage={"backend": "sqlite", "path": ":memory:"}
+        ))
+        cache = SemanticCache(config, SemanticSelector(config).embedding_provider)
+        await cache.store("Find tacos in San Francisco", "Tacos El Farolito")
+
+        assert cache._similarity_threshold == local_config.embedding_threshold("similarity_threshold", 0.9)
+        assert (await cache.get("find me tacos in san francisco?"))["response"] == "Tacos El Farolito"
+        # Scores ~0.91 on the local scale: a different place, not a paraphrase
+        assert await cache.get("Find tacos in South San Francisco") is None
+        cache.close()
@@ -218,7 +218,7 @@ These restaurants offer excellent Greek cuisine with different price points and
         # Create mock executor with realistic outputs
         mock_executor = Mock()
         
-        async def mock_execute_realistic(agents_with_sessions, query, context, timeout):
+        async def mock_execute_realistic(agents_with_sessions, query, context, timeout, primary_expert_id=None):
             results = []
             
             for expert_id, agent, session in agents_with_sessions:
@@ -20,7 +20,7 @@ class _FakeChat:
 
 
 class _FakeAsyncOpenAI:
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, **kwargs):
         self.chat = _FakeChat()
 
 
@@ -9,6 +9,7 @@ from asdrp.orchestration.moe.orchestrator import (
     MoEResult,
     MoETrace,
 )
+from asdrp.agents.execution_scheduler import AdmissionError, ExecutionScheduler
 from asdrp.orchestration.moe.expert_executor import ExpertResult
 from asdrp.orchestration.moe.result_mixer import MixedResult
 
@@ -119,6 +120,27 @@ class TestMoEOrchestrator:
         mock_executor.execute_parallel.assert_called_once()
         mock_mixer.mix.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_quorum_anchored_on_top_scored_expert(
+        self,
+        orchestrator,
+        mock_selector,
+        mock_executor,
+        monkeypatch
+    ):
+        """Test the selector's top expert is the quorum's primary after map reordering."""
+        from asdrp.orchestration.moe import performance_monitor
+
+        # Metrics recorded by other tests must not reorder the experts
+        monkeypatch.setattr(performance_monitor, "_performance_monitor", performance_monitor.PerformanceMonitor())
+        mock_selector.select.return_value = ["map", "yelp"]
+
+        await orchestrator.route_query("Show pizza places on a map")
+
+        call = mock_executor.execute_parallel.await_args
+        assert [expert_id for expert_id, _, _ in call.args[0]] == ["yelp", "map"]
+        assert call.kwargs["primary_expert_id"] == "map"
+
     @pytest.mark.asyncio
     async def test_route_query_with_session(
         self,
@@ -237,6 +259,47 @@ class TestMoEOrchestrator:
             assert result.trace.error is not None
             assert "one" in result.experts_used  # Fallback agent
 
+    @pytest.mark.asyncio
+    async def test_route_query_raises_when_all_experts_shed(
+        self,
+        orchestrator,
+        sample_query,
+        mock_executor,
+        mock_mixer
+    ):
+        """Shed load is raised (HTTP 503) instead of running the fallback agent."""
+        mock_executor.execute_parallel = AsyncMock(return_value=[
+            ExpertResult(expert_id=eid, output="", success=False, latency_ms=0.0,
+                         error="Server is at capacity", shed=True)
+            for eid in ("one", "geo", "yelp")
+        ])
+
+        with patch("agents.Runner.run") as mock_run:
+            with pytest.raises(AdmissionError):
+                await orchestrator.route_query(sample_query)
+
+        mock_run.assert_not_called()
+        mock_mixer.mix.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_route_query_raises_when_fallback_is_shed(
+        self,
+        orchestrator,
+        sample_query,
+        mock_selector
+    ):
+        """The fallback agent runs inside a scheduler slot."""
+        mock_selector.select = AsyncMock(side_effect=Exception("Selection failed"))
+        scheduler = ExecutionScheduler(max_concurrent=1, max_queue=0)
+        await scheduler.acquire("busy")
+
+        with patch("asdrp.orchestration.moe.orchestrator.get_execution_scheduler", return_value=scheduler), \
+                patch("agents.Runner.run") as mock_run:
+            with pytest.raises(AdmissionError):
+                await orchestrator.route_query(sample_query)
+
+        mock_run.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_route_query_fallback_when_selector_returns_none(
         self,
@@ -0,0 +1,103 @@
+"""Tests for per-request query embedding sharing in the MoE pipeline."""
+
+from dataclasses import replace
+from unittest.mock import Mock, AsyncMock
+
+import numpy as np
+import pytest
+
+from asdrp.orchestration.moe.cache import SemanticCache
+from asdrp.orchestration.moe.config_loader import MoECacheConfig
+from asdrp.orchestration.moe.embedding_providers import QueryEmbeddingContext
+from asdrp.orchestration.moe.expert_executor import ExpertResult
+from asdrp.orchestration.moe.fast_path import FastPathDetector
+from asdrp.orchestration.moe.orchestrator import MoEOrchestrator
+from asdrp.orchestration.moe.result_mixer import MixedResult
+from asdrp.orchestration.moe.semantic_selector import SemanticSelector
+
+
+@pytest.fixture
+def counting_provider(fake_embedding_provider):
+    """Uncached provider whose fast-path patterns never match queries."""
+    def make(**kwargs):
+        return fake_embedding_provider(
+            embed=lambda text: np.array([1.0, float(len(text) % 7), 0.5]),
+            batch_embed=lambda text: np.array([0.0, 0.0, 1.0]),
+            **kwargs,
+        )
+    return make
+
+
+@pytest.mark.asyncio
+async def test_context_embeds_once(counting_provider):
+    provider = counting_provider()
+    ctx = QueryEmbeddingContext("pizza near me", provider)
+
+    first = await ctx.get_embedding()
+    second = await ctx.get_embedding()
+
+    assert first is second
+    assert provider.calls == ["pizza near me"]
+
+
+@pytest.mark.asyncio
+async def test_context_memoizes_failure(counting_provider):
+    provider = counting_provider(fail=True)
+    ctx = QueryEmbeddingContext("pizza near me", provider)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await ctx.get_embedding()
+
+    assert provider.calls == ["pizza near me"]
+
+
+@pytest.mark.asyncio
+async def test_fast_path_patterns_use_shared_provider_batch(monkeypatch, counting_provider):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    provider = counting_provider()
+    detector = FastPathDetector(embedding_provider=provider)
+
+    assert await detector.detect_fast_path("TSLA stock price today") is None
+    assert provider.batch_calls == 1
+    assert provider.calls == ["TSLA stock price today"]
+
+
+@pytest.mark.asyncio
+async def test_route_query_embeds_query_once(mock_moe_config, mock_agent_factory, tmp_path, counting_provider):
+    provider = counting_provider()
+    config = replace(
+        mock_moe_config,
+        cache=MoECacheConfig(
+            enabled=True,
+            type="semantic",
+            storage={"backend": "sqlite", "path": str(tmp_path / "cache.db")},
+            policy={"similarity_threshold": 0.99, "ttl": 3600, "max_entries": 100},
+        ),
+    )
+
+    executor = Mock()
+    executor.execute_parallel = AsyncMock(return_value=[
+        ExpertResult(expert_id="one", output="Web result", success=True, latency_ms=5.0)
+    ])
+    mixer = Mock()
+    mixer.mix = AsyncMock(return_value=MixedResult(
+        content="Synthesized", weights={"one": 1.0}, quality_score=0.9
+    ))
+
+    orchestrator = MoEOrchestrator(
+        agent_factory=mock_agent_factory,
+        expert_selector=SemanticSelector(config, embedding_provider=provider),
+        expert_executor=executor,
+        result_mixer=mixer,
+        config=config,
+        cache=SemanticCache(config, embedding_provider=provider),
+        fast_path_detector=FastPathDetector(embedding_provider=provider),
+        embedding_provider=provider,
+    )
+
+    query = "What is the weather and stock outlook for Tesla?"
+    result = await orchestrator.route_query(query)
+
+    assert result.response == "Synthesized"
+    assert provider.calls == [query]
@@ -48,7 +48,7 @@ def test_mixer_appends_missing_interactive_map_block_when_llm_omits(monkeypatch)
         ExpertResult(expert_id="geo", output="Text-only geo result", success=True, latency_ms=1.0),
     ]
 
-    async def _fake_llm_synthesis(_results, weights, query):
+    async def _fake_llm_synthesis(_results, weights, query, **_kwargs):
         # Simulate an LLM that forgets to include the json block.
         return MixedResult(content="Synthesized directions without map.", weights=weights, quality_score=0.5)
 
@@ -80,7 +80,7 @@ def test_mixer_does_not_duplicate_interactive_map_block(monkeypatch):
         ExpertResult(expert_id="geo", output="Other text", success=True, latency_ms=1.0),
     ]
 
-    async def _fake_llm_synthesis(_results, weights, query):
+    async def _fake_llm_synthesis(_results, weights, query, **_kwargs):
         # LLM already includes the block, mixer should not append it again.
         return MixedResult(content=f"Here you go:\n\n{expert_map_block}\n", weights=weights, quality_score=0.9)
 
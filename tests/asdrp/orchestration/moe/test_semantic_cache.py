@@ -0,0 +1,276 @@
+"""Tests for embedding-based lookup and storage in SemanticCache."""
+
+import asyncio
+import sqlite3
+from concurrent.futures import Future
+from dataclasses import replace
+from typing import List
+
+import numpy as np
+import pytest
+
+from asdrp.orchestration.moe.cache import SemanticCache, _DELETE, _PUT
+from asdrp.orchestration.moe.config_loader import MoECacheConfig
+from asdrp.orchestration.moe.embedding_providers import IEmbeddingProvider
+
+
+class _KeywordEmbeddingProvider(IEmbeddingProvider):
+    """Deterministic bag-of-keywords embeddings for paraphrase tests."""
+
+    VOCAB = ["pizza", "near", "me", "sf", "places", "stock", "tsla", "weather"]
+
+    def __init__(self):
+        self.calls: List[str] = []
+
+    async def generate_embedding(self, text: str) -> np.ndarray:
+        self.calls.append(text)
+        words = "".join(c if c.isalnum() else " " for c in text.lower()).split()
+        return np.array([float(w in words) for w in self.VOCAB])
+
+    async def generate_batch_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        return [await self.generate_embedding(t) for t in texts]
+
+    @property
+    def embedding_dimension(self) -> int:
+        return len(self.VOCAB)
+
+
+class _Result:
+    def __init__(self, response: str, experts_used: List[str]):
+        self.response = response
+        self.experts_used = experts_used
+
+
+def _make_config(mock_moe_config, tmp_path, **policy):
+    cache = MoECacheConfig(
+        enabled=True,
+        type="semantic",
+        storage={"backend": "sqlite", "path": str(tmp_path / "cache.db")},
+        policy={"similarity_threshold": 0.8, "ttl": 3600, "max_entries": 100, **policy},
+    )
+    return replace(mock_moe_config, cache=cache)
+
+
+@pytest.mark.asyncio
+async def test_paraphrased_query_is_semantic_hit(mock_moe_config, tmp_path):
+    cache = SemanticCache(_make_config(mock_moe_config, tmp_path), _KeywordEmbeddingProvider())
+
+    await cache.store("pizza near me in SF", _Result("Tony's Pizza", ["yelp"]))
+    cached = await cache.get("pizza places near me, SF")
+
+    assert cached is not None
+    assert cached["response"] == "Tony's Pizza"
+    assert cached["experts_used"] == ["yelp"]
+    assert cached["similarity"] >= 0.8
+
+
+@pytest.mark.asyncio
+async def test_unrelated_query_misses(mock_moe_config, tmp_path):
+    cache = SemanticCache(_make_config(mock_moe_config, tmp_path), _KeywordEmbeddingProvider())
+
+    await cache.store("pizza near me in SF", _Result("Tony's Pizza", ["yelp"]))
+
+    assert await cache.get("TSLA stock") is None
+
+
+@pytest.mark.asyncio
+async def test_exact_match_skips_embedding(mock_moe_config, tmp_path):
+    provider = _KeywordEmbeddingProvider()
+    cache = SemanticCache(_make_config(mock_moe_config, tmp_path), provider)
+
+    await cache.store("pizza near me", _Result("Tony's Pizza", ["yelp"]))
+    provider.calls.clear()
+
+    cached = await cache.get("  Pizza near me ")
+    assert cached["response"] == "Tony's Pizza"
+    assert provider.calls == []
+
+
+@pytest.mark.asyncio
+async def test_without_provider_falls_back_to_exact_match(mock_moe_config, tmp_path):
+    cache = SemanticCache(_make_config(mock_moe_config, tmp_path))
+
+    await cache.store("pizza near me in SF", _Result("Tony's Pizza", ["yelp"]))
+
+    assert await cache.get("pizza near me in SF") is not None
+    assert await cache.get("pizza places near me, SF") is None
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_do_not_match_semantically(mock_moe_config, tmp_path):
+    cache = SemanticCache(_make_config(mock_moe_config, tmp_path, ttl=-1), _KeywordEmbeddingProvider())
+
+    await cache.store("pizza near me in SF", _Result("Tony's Pizza", ["yelp"]))
+
+    assert await cache.get("pizza places near me, SF") is None
+
+
+@pytest.mark.asyncio
+async def test_index_is_loaded_from_existing_database(mock_moe_config, tmp_path):
+    config = _make_config(mock_moe_config, tmp_path)
+    await SemanticCache(config, _KeywordEmbeddingProvider()).store(
+        "pizza near me in SF", _Result("Tony's Pizza", ["yelp"])
+    )
+
+    reopened = SemanticCache(config, _KeywordEmbeddingProvider())
+    cached = await reopened.get("pizza places near me, SF")
+
+    assert cached is not None
+    assert cached["response"] == "Tony's Pizza"
+
+
+@pytest.mark.asyncio
+async def test_clear_empties_semantic_index(mock_moe_config, tmp_path):
+    cache = SemanticCache(_make_config(mock_moe_config, tmp_path), _KeywordEmbeddingProvider())
+
+    await cache.store("pizza near me in SF", _Result("Tony's Pizza", ["yelp"]))
+    assert await cache.get("pizza places near me, SF") is not None
+
+    await cache.clear()
+    assert await cache.get("pizza places near me, SF") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_stores_share_one_transaction(mock_moe_config, tmp_path):
+    cache = SemanticCache(_make_config(mock_moe_config, tmp_path))
+    batches = []
+    apply_batch = cache._apply_batch
+    cache._apply_batch = lambda batch: (batches.append(len(batch)), apply_batch(batch))
+
+    # Hold the writer back until every store is queued
+    with cache._write_lock:
+        tasks = [
+            asyncio.create_task(cache.store(f"query {i}", _Result(f"answer {i}", [])))
+            for i in range(50)
+        ]
+        await asyncio.sleep(0.05)
+    await asyncio.gather(*tasks)
+
+    assert sum(batches) == 50
+    assert len(batches) <= 2
+    assert (await cache.get("query 49"))["response"] == "answer 49"
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_database_opened_on_first_use(mock_moe_config, tmp_path):
+    config = _make_config(mock_moe_config, tmp_path)
+    config.cache.storage["path"] = str(tmp_path / "cache" / "semantic.db")
+    cache = SemanticCache(config)
+    assert not (tmp_path / "cache").exists()
+
+    assert await cache.get("pizza near me") is None
+    assert (tmp_path / "cache" / "semantic.db").exists()
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_max_entries_enforced_without_counting_table(mock_moe_config, tmp_path):
+    cache = SemanticCache(_make_config(mock_moe_config, tmp_path, max_entries=3))
+    statements = []
+    cache._ensure_database()
+    cache._write_conn.set_trace_callback(statements.append)
+
+    for i in range(5):
+        await cache.store(f"query {i}", _Result(f"answer {i}", []))
+
+    assert cache._count == 3
+    assert await cache.get("query 0") is None
+    assert await cache.get("query 4") is not None
+    assert not any("COUNT(*)" in statement for statement in statements)
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_sweeper_removes_expired_entries(mock_moe_config, tmp_path):
+    config = _make_config(mock_moe_config, tmp_path, ttl=-1, sweep_interval=0.05)
+    cache = SemanticCache(config, _KeywordEmbeddingProvider())
+
+    await cache.store("pizza near me in SF", _Result("Tony's Pizza", ["yelp"]))
+    await asyncio.sleep(0.2)
+
+    with sqlite3.connect(tmp_path / "cache.db") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0] == 0
+    assert cache._count == 0
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_in_memory_database(mock_moe_config, tmp_path):
+    config = _make_config(mock_moe_config, tmp_path)
+    config.cache.storage["path"] = ":memory:"
+    cache = SemanticCache(config, _KeywordEmbeddingProvider())
+
+    await cache.store("pizza near me in SF", _Result("Tony's Pizza", ["yelp"]))
+
+    assert (await cache.get("pizza places near me, SF"))["response"] == "Tony's Pizza"
+    await cache.clear()
+    assert await cache.get("pizza near me in SF") is None
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_within_stale_ttl_is_returned_stale(mock_moe_config, tmp_path):
+    config = _make_config(mock_moe_config, tmp_path, ttl=-1, stale_ttl=3600, sweep_interval=0.05)
+    cache = SemanticCache(config, _KeywordEmbeddingProvider())
+
+    await cache.store("pizza near me in SF", _Result("Tony's Pizza", ["yelp"]))
+    await asyncio.sleep(0.2)  # the sweeper keeps stale entries
+
+    exact = await cache.get("pizza near me in SF")
+    similar = await cache.get("pizza places near me, SF")
+
+    assert exact["response"] == "Tony's Pizza"
+    assert exact["stale"] is True
+    assert exact["ttl"] == -1
+    assert exact["age_s"] >= 0.2
+    assert similar["stale"] is True
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_fresh_entry_carries_freshness_metadata(mock_moe_config, tmp_path):
+    cache = SemanticCache(_make_config(mock_moe_config, tmp_path, stale_ttl=3600), _KeywordEmbeddingProvider())
+
+    await cache.store("pizza near me in SF", _Result("Tony's Pizza", ["yelp"]))
+    cached = await cache.get("pizza near me in SF")
+
+    assert cached["stale"] is False
+    assert cached["ttl"] == 3600
+    assert 0 <= cached["age_s"] < 60
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_expired_hit_does_not_delete_newer_entry(mock_moe_config, tmp_path):
+    cache = SemanticCache(_make_config(mock_moe_config, tmp_path, ttl=-1, sweep_interval=3600))
+    await cache.store("pizza near me", _Result("old answer", []))
+
+    # A fresh store commits before the expired read's background delete
+    fresh = cache._make_row("pizza near me", _Result("new answer", []))[:5] + (3600, None)
+    with cache._write_lock:
+        stored = cache._submit(_PUT, fresh)
+        assert await cache.get("pizza near me") is None
+    await asyncio.wrap_future(stored)
+    await asyncio.wrap_future(cache._submit(_DELETE, []))  # after the read's delete
+
+    assert (await cache.get("pizza near me"))["response"] == "new answer"
+    assert cache._count == 1
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_restores_count(mock_moe_config, tmp_path):
+    cache = SemanticCache(_make_config(mock_moe_config, tmp_path))
+    await cache.store("query 0", _Result("answer 0", []))
+
+    batch = [
+        (_PUT, cache._make_row("query 1", _Result("answer 1", [])), Future()),
+        (_PUT, ("malformed row",), Future()),
+    ]
+    cache._apply_batch(batch)
+
+    assert isinstance(batch[1][2].exception(), IndexError)
+    assert await cache.get("query 1") is None
+    assert cache._count == 1
+    cache.close()
@@ -0,0 +1,222 @@
+"""Tests for MoE token streaming (executor, mixer and orchestrator)."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock, AsyncMock
+
+import pytest
+
+from asdrp.orchestration.moe.config_loader import MoEConfigLoader
+from asdrp.orchestration.moe.expert_executor import ParallelExecutor, ExpertResult
+from asdrp.orchestration.moe.orchestrator import MoEOrchestrator, MoEResult
+from asdrp.orchestration.moe.result_mixer import WeightedMixer, MixedResult
+
+
+def _fake_stream_client(deltas, fail_after=None):
+    """AsyncOpenAI stand-in whose chat.completions.create(stream=True) yields `deltas`."""
+
+    async def _stream():
+        for i, delta in enumerate(deltas):
+            if fail_after is not None and i >= fail_after:
+                raise RuntimeError("stream interrupted")
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))],
+                usage=None,
+            )
+        yield SimpleNamespace(choices=[], usage=SimpleNamespace(total_tokens=42))
+
+    class _Completions:
+        async def create(self, *args, **kwargs):
+            assert kwargs.get("stream") is True
+            return _stream()
+
+    class _Client:
+        def __init__(self, api_key=None, **kwargs):
+            self.chat = SimpleNamespace(completions=_Completions())
+
+    return _Client
+
+
+async def _collect(agen):
+    return [item async for item in agen]
+
+
+@pytest.mark.asyncio
+async def test_execute_as_completed_yields_in_completion_order(mock_moe_config):
+    executor = ParallelExecutor(mock_moe_config)
+    delays = {"slow": 0.05, "fast": 0.0, "stuck": 10.0}
+
+    async def _fake_single(expert_id, agent, session, query, context):
+        await asyncio.sleep(delays[expert_id])
+        return ExpertResult(expert_id=expert_id, output=expert_id, success=True, latency_ms=1.0)
+
+    executor._execute_single = _fake_single
+    agents = [(eid, Mock(), None) for eid in ("slow", "fast", "stuck")]
+
+    results = await _collect(executor.execute_as_completed(agents, "q", timeout=0.2))
+
+    assert [r.expert_id for r in results] == ["fast", "slow", "stuck"]
+    assert results[2].success is False
+    assert results[2].error == "Overall timeout exceeded"
+
+
+def test_streamable_length_holds_open_json_block():
+    text = "Here you go.\n```json\n{\"type\": \"interactive_map\""
+    assert WeightedMixer._streamable_length(text) == text.index("```")
+    assert WeightedMixer._streamable_length("Partial fence ``") == len("Partial fence ")
+    closed = text + "}\n```\nDone"
+    assert WeightedMixer._streamable_length(closed) == len(closed)
+    code = "```python\nprint(1)"
+    assert WeightedMixer._streamable_length(code) == len(code)
+
+
+@pytest.mark.asyncio
+async def test_mix_stream_never_splits_json_block(monkeypatch):
+    import openai
+    block = '```json\n{"type": "interactive_map", "config": {"markers": []}}\n```'
+    deltas = ["Top picks:", " Tony's.\n", block[:9], block[9:30], block[30:-2], block[-2:], "\nEnjoy!"]
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(openai, "AsyncOpenAI", _fake_stream_client(deltas))
+
+    mixer = WeightedMixer(MoEConfigLoader().load_config())
+    results = [
+        ExpertResult(expert_id="yelp", output="Tony's Pizza", success=True, latency_ms=1),
+        ExpertResult(expert_id="chitchat", output="Enjoy!", success=True, latency_ms=1),
+    ]
+
+    items = await _collect(mixer.mix_stream(results, ["yelp", "chitchat"], "pizza spots"))
+    tokens, final = items[:-1], items[-1]
+
+    assert isinstance(final, MixedResult)
+    assert block in tokens
+    assert all("```" not in t or t == block for t in tokens)
+    assert "".join(tokens) == final.content
+    assert final.metadata["synthesis_tokens"] == 42
+
+
+@pytest.mark.asyncio
+async def test_mix_stream_falls_back_when_stream_fails_early(monkeypatch):
+    import openai
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(openai, "AsyncOpenAI", _fake_stream_client(["never"], fail_after=0))
+
+    mixer = WeightedMixer(MoEConfigLoader().load_config())
+    results = [
+        ExpertResult(expert_id="yelp", output="Expert output A", success=True, latency_ms=1),
+        ExpertResult(expert_id="map", output="Expert output B", success=True, latency_ms=1),
+    ]
+
+    items = await _collect(mixer.mix_stream(results, ["yelp", "map"], "q"))
+
+    assert items[-1].content in ("Expert output A", "Expert output B")
+    assert "".join(items[:-1]) == items[-1].content
+    assert items[-1].metadata["error"].startswith("synthesis_failed")
+
+
+def _streaming_orchestrator(config, factory, expert_results, mix_deltas):
+    selector = Mock()
+    selector.select = AsyncMock(return_value=[r.expert_id for r in expert_results])
+
+    async def _as_completed(agents_with_sessions, query, context=None, timeout=30.0):
+        for result in reversed(expert_results):
+            yield result
+
+    executor = Mock()
+    executor.execute_as_completed = _as_completed
+    mixer = Mock()
+    mixer.received = None
+
+    async def _mix_stream(results, expert_ids, query):
+        mixer.received = [r.expert_id for r in results]
+        for delta in mix_deltas:
+            yield delta
+        yield MixedResult(content="".join(mix_deltas), weights={}, quality_score=0.9)
+
+    mixer.mix_stream = _mix_stream
+    orchestrator = MoEOrchestrator(
+        agent_factory=factory,
+        expert_selector=selector,
+        expert_executor=executor,
+        result_mixer=mixer,
+        config=config,
+    )
+    return orchestrator, mixer
+
+
+@pytest.mark.asyncio
+async def test_route_query_stream_event_order(mock_moe_config, mock_agent_factory):
+    expert_results = [
+        ExpertResult(expert_id="one", output="A", success=True, latency_ms=5.0),
+        ExpertResult(expert_id="two", output="B", success=False, latency_ms=7.0, error="boom"),
+    ]
+    orchestrator, mixer = _streaming_orchestrator(
+        mock_moe_config, mock_agent_factory, expert_results, ["Hello", " world"]
+    )
+
+    events = await _collect(orchestrator.route_query_stream("What is up?"))
+    types = [e.type for e in events]
+
+    assert types == [
+        "selection",
+        "expert_started", "expert_started",
+        "expert_completed", "expert_completed",
+        "token", "token",
+        "answer",
+        "done",
+    ]
+    assert events[0].data["experts"] == ["one", "two"]
+    assert events[-2].content == "Hello world"
+    assert events[-2].data["selected_experts"] == ["one", "two"]
+    assert [e.data["expert_id"] for e in events if e.type == "expert_completed"] == ["two", "one"]
+    # Mixing sees results in selection order regardless of completion order
+    assert mixer.received == ["one", "two"]
+
+    result = events[-1].result
+    assert isinstance(result, MoEResult)
+    assert result.response == "Hello world"
+    statuses = {d.expert_id: d.status for d in result.trace.expert_details}
+    assert statuses == {"one": "completed", "two": "failed"}
+
+
+@pytest.mark.asyncio
+async def test_route_query_stream_falls_back_when_all_experts_fail(mock_moe_config, mock_agent_factory):
+    expert_results = [
+        ExpertResult(expert_id="one", output="", success=False, latency_ms=5.0, error="down"),
+    ]
+    orchestrator, _ = _streaming_orchestrator(
+        mock_moe_config, mock_agent_factory, expert_results, ["unused"]
+    )
+    fallback = MoEResult(response="Fallback answer", experts_used=["one"], trace=Mock())
+    orchestrator._handle_fallback = AsyncMock(return_value=fallback)
+
+    events = await _collect(orchestrator.route_query_stream("What is up?"))
+
+    assert [e.type for e in events][-2:] == ["token", "done"]
+    assert events[-2].content == "Fallback answer"
+    assert events[-1].result is fallback
+
+
+def test_synthesis_prompt_notes_cut_off_experts(mock_moe_config):
+    mixer = WeightedMixer(mock_moe_config)
+    results = [ExpertResult(expert_id="yelp", output="Tony's", success=True, latency_ms=1.0)]
+
+    prompt = mixer._build_synthesis_prompt(results, {"yelp": 1.0}, "pizza", ["map"])
+
+    assert "map did not respond in time" in prompt
+    assert "did not respond" not in mixer._build_synthesis_prompt(results, {"yelp": 1.0}, "pizza")
+
+
+@pytest.mark.asyncio
+async def test_mix_reports_cut_off_experts(mock_moe_config):
+    mixer = WeightedMixer(mock_moe_config)
+    mixer._auto_inject_map_via_geocoding = AsyncMock(side_effect=lambda content, *a: content)
+    results = [
+        ExpertResult(expert_id="yelp", output="Tony's", success=True, latency_ms=1.0),
+        ExpertResult(expert_id="map", output="", success=False, latency_ms=1.0,
+                     error="Overall timeout exceeded", cut_off=True),
+    ]
+
+    mixed = await mixer.mix(results, ["yelp", "map"], "pizza")
+
+    assert mixed.content.startswith("Tony's")
+    assert mixed.metadata["cut_off_experts"] == ["map"]
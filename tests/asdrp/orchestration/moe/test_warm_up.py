@@ -0,0 +1,94 @@
+"""Tests for MoE startup warm-up and the persistent embedding store."""
+
+import asyncio
+from dataclasses import replace
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from asdrp.orchestration.moe.config_loader import MoECacheConfig
+from asdrp.orchestration.moe.embedding_providers import CachedEmbeddingProvider
+from asdrp.orchestration.moe.embedding_store import EmbeddingStore, get_embedding_store
+from asdrp.orchestration.moe.fast_path import FastPathDetector
+from asdrp.orchestration.moe.orchestrator import MoEOrchestrator
+from asdrp.orchestration.moe.semantic_selector import SemanticSelector
+
+
+def _orchestrator(config, provider, factory):
+    return MoEOrchestrator(
+        agent_factory=factory,
+        expert_selector=SemanticSelector(config, embedding_provider=provider),
+        expert_executor=Mock(),
+        result_mixer=Mock(),
+        config=config,
+        fast_path_detector=FastPathDetector(embedding_provider=provider),
+        embedding_provider=provider,
+    )
+
+
+@pytest.fixture
+def store_config(mock_moe_config, tmp_path):
+    return replace(
+        mock_moe_config,
+        cache=MoECacheConfig(
+            enabled=False,
+            storage={"embeddings_path": str(tmp_path / "embeddings.db")},
+        ),
+    )
+
+
+class TestOrchestratorWarmUp:
+    """Test MoEOrchestrator.warm_up."""
+
+    @pytest.mark.asyncio
+    async def test_second_process_reads_embeddings_from_store(
+        self, tmp_path, mock_moe_config, mock_agent_factory, fake_embedding_provider
+    ):
+        path = tmp_path / "embeddings.db"
+        first_base = fake_embedding_provider(delay=0.01)
+        first = _orchestrator(
+            mock_moe_config,
+            CachedEmbeddingProvider(first_base, store=EmbeddingStore(path)),
+            mock_agent_factory,
+        )
+
+        stats = await first.warm_up()
+
+        assert first_base.batch_calls == 2  # experts + fast-path patterns
+        assert stats["embeddings_from_store"] == 0
+        assert stats["embeddings_computed"] > 0
+
+        second_base = fake_embedding_provider(delay=0.01)
+        second = _orchestrator(
+            mock_moe_config,
+            CachedEmbeddingProvider(second_base, store=EmbeddingStore(path)),
+            mock_agent_factory,
+        )
+        second_stats = await second.warm_up()
+
+        assert second_base.batch_calls == 0
+        assert second_stats == {
+            "embeddings_from_store": stats["embeddings_computed"],
+            "embeddings_computed": 0,
+        }
+        assert second._selector._expert_embeddings.keys() == first._selector._expert_embeddings.keys()
+
+    def test_default_provider_uses_configured_store(self, store_config, tmp_path, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+        selector = SemanticSelector(store_config)
+
+        assert selector.embedding_provider._store is get_embedding_store(tmp_path / "embeddings.db")
+
+    @pytest.mark.asyncio
+    async def test_request_during_warm_up_waits_for_embeddings(self, mock_moe_config, fake_embedding_provider):
+        provider = fake_embedding_provider(delay=0.01)
+        selector = SemanticSelector(mock_moe_config, embedding_provider=provider)
+        selector._get_fallback_experts = Mock(return_value=["fallback"])
+
+        _, selected = await asyncio.gather(selector.warm_up(), selector.select("pizza near me"))
+
+        assert provider.batch_calls == 1
+        assert selected and selected != ["fallback"]
+        selector._get_fallback_experts.assert_not_called()
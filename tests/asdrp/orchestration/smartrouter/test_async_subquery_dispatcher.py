@@ -7,7 +7,10 @@ Tests asynchronous subquery dispatch and execution.
 import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
-from asdrp.orchestration.smartrouter.async_subquery_dispatcher import AsyncSubqueryDispatcher
+from asdrp.orchestration.smartrouter.async_subquery_dispatcher import (
+    AsyncSubqueryDispatcher,
+    critical_path,
+)
 from asdrp.orchestration.smartrouter.interfaces import (
     Subquery,
     AgentResponse,
@@ -149,3 +152,127 @@ class TestAsyncSubqueryDispatcher:
         responses = await dispatcher.dispatch_all([])
         assert responses == []
 
+
+class TestDependencyScheduling:
+    """Test dependency-aware scheduling in dispatch_all."""
+
+    @pytest.fixture
+    def dispatcher(self):
+        """Create a dispatcher with a mock factory and no retries."""
+        factory = MagicMock()
+        factory.get_agent = AsyncMock(return_value=MagicMock())
+        return AsyncSubqueryDispatcher(
+            agent_factory=factory,
+            error_config=ErrorHandlingConfig(timeout=5.0, retries=0)
+        )
+
+    @staticmethod
+    def _subquery(sq_id, dependencies=()):
+        return Subquery(
+            id=sq_id,
+            text=f"Query {sq_id}",
+            capability_required="search",
+            dependencies=list(dependencies),
+            routing_pattern=RoutingPattern.DELEGATION,
+            metadata={}
+        )
+
+    @staticmethod
+    def _fake_runner(delays, inputs, fail=()):
+        """Runner.run replacement: sleeps per subquery and echoes its ID."""
+        async def run(starting_agent, input, session):
+            sq_id = input.split()[1]
+            inputs[sq_id] = input
+            await asyncio.sleep(delays.get(sq_id, 0.01))
+            if sq_id in fail:
+                raise RuntimeError(f"{sq_id} failed")
+            result = MagicMock()
+            result.final_output = f"answer {sq_id}"
+            result.usage = None
+            return result
+        return run
+
+    @pytest.mark.asyncio
+    async def test_dependents_start_when_their_own_dependencies_finish(self, dispatcher):
+        """Test that a branch does not wait for unrelated slow subqueries."""
+        # a (fast) -> b ; c (slow) is independent
+        batch = [
+            (self._subquery("a"), "geo"),
+            (self._subquery("b", ["a"]), "map"),
+            (self._subquery("c"), "finance"),
+        ]
+        inputs = {}
+        delays = {"a": 0.02, "b": 0.02, "c": 0.2}
+
+        with patch('asdrp.orchestration.smartrouter.async_subquery_dispatcher.Runner') as mock_runner:
+            mock_runner.run = AsyncMock(side_effect=self._fake_runner(delays, inputs))
+            responses = await dispatcher.dispatch_all(batch)
+
+        assert [r.subquery_id for r in responses] == ["a", "b", "c"]
+        assert all(r.success for r in responses)
+        schedules = {r.subquery_id: r.metadata["schedule"] for r in responses}
+        # b starts right after a, long before c finishes
+        assert schedules["b"]["started_at"] >= schedules["a"]["finished_at"]
+        assert schedules["b"]["finished_at"] < schedules["c"]["finished_at"]
+        assert schedules["b"]["waited_on"] == "a"
+        # b receives a's output as context; independent subqueries do not
+        assert "Context from earlier steps" in inputs["b"]
+        assert "answer a" in inputs["b"]
+        assert inputs["c"] == "Query c"
+
+    @pytest.mark.asyncio
+    async def test_failed_dependency_skips_dependents(self, dispatcher):
+        """Test that dependents of a failed subquery are not executed."""
+        batch = [
+            (self._subquery("a"), "geo"),
+            (self._subquery("b", ["a"]), "map"),
+        ]
+        inputs = {}
+
+        with patch('asdrp.orchestration.smartrouter.async_subquery_dispatcher.Runner') as mock_runner:
+            mock_runner.run = AsyncMock(side_effect=self._fake_runner({}, inputs, fail={"a"}))
+            responses = await dispatcher.dispatch_all(batch)
+
+        assert not responses[0].success
+        assert not responses[1].success
+        assert "Dependencies failed: a" in responses[1].error
+        assert "b" not in inputs
+
+    @pytest.mark.asyncio
+    async def test_cyclic_dependencies_rejected(self, dispatcher):
+        """Test that a cyclic batch fails fast instead of deadlocking."""
+        batch = [
+            (self._subquery("a", ["b"]), "geo"),
+            (self._subquery("b", ["a"]), "map"),
+        ]
+
+        with pytest.raises(DispatchException, match="Cyclic"):
+            await dispatcher.dispatch_all(batch)
+
+    @pytest.mark.asyncio
+    async def test_critical_path(self, dispatcher):
+        """Test that the critical path follows the chain that finished last."""
+        # a -> b -> d and c -> d, with c fast: the path is a, b, d
+        batch = [
+            (self._subquery("a"), "geo"),
+            (self._subquery("b", ["a"]), "map"),
+            (self._subquery("c"), "finance"),
+            (self._subquery("d", ["b", "c"]), "one"),
+        ]
+        inputs = {}
+
+        with patch('asdrp.orchestration.smartrouter.async_subquery_dispatcher.Runner') as mock_runner:
+            mock_runner.run = AsyncMock(side_effect=self._fake_runner({"c": 0.001}, inputs))
+            responses = await dispatcher.dispatch_all(batch)
+
+        result = critical_path(responses)
+        assert result["path"] == ["a", "b", "d"]
+        assert result["duration"] == responses[3].metadata["schedule"]["finished_at"]
+        assert [t["subquery_id"] for t in result["timeline"]] == ["a", "b", "c", "d"]
+
+    def test_critical_path_without_schedule(self):
+        """Test that responses from other dispatchers yield an empty path."""
+        response = AgentResponse(
+            subquery_id="a", agent_id="geo", content="x", success=True, error=None, metadata={}
+        )
+        assert critical_path([response]) == {"path": [], "duration": 0.0, "timeline": []}
@@ -8,11 +8,13 @@ Comprehensive test suite covering:
 - Performance metrics
 - Capability cache
 - Routing cache
+- Plan cache
 """
 
 import pytest
 import time
 from threading import Thread
+from unittest.mock import AsyncMock, MagicMock
 from asdrp.orchestration.smartrouter.cache import (
     LRUCache,
     CapabilityCache,
@@ -22,7 +24,34 @@ from asdrp.orchestration.smartrouter.cache import (
     get_capability_cache,
     get_routing_cache,
     get_performance_metrics,
+    PlanCache,
+    normalize_query,
 )
+from asdrp.orchestration.smartrouter.interfaces import (
+    QueryIntent,
+    QueryComplexity,
+    Subquery,
+    RoutingPattern,
+)
+
+
+def _intent(query, complexity=QueryComplexity.MODERATE):
+    return QueryIntent(
+        original_query=query,
+        complexity=complexity,
+        domains=["weather"],
+        requires_synthesis=True,
+        metadata={"reasoning": "Two cities", "llm_raw": "..."},
+    )
+
+
+def _subqueries():
+    return [
+        Subquery(id="sq1", text="Weather in Paris", capability_required="weather",
+                 dependencies=[], routing_pattern=RoutingPattern.DELEGATION, metadata={}),
+        Subquery(id="sq2", text="Weather in Berlin", capability_required="weather",
+                 dependencies=["sq1"], routing_pattern=RoutingPattern.DELEGATION, metadata={}),
+    ]
 
 
 class TestCacheEntry:
@@ -396,6 +425,193 @@ class TestPerformanceMetrics:
         assert all_stats["routing"]["avg"] == 0.1
 
 
+class TestPlanCache:
+    """Tests for PlanCache."""
+
+    def test_normalize_query(self):
+        """Test case, whitespace and trailing punctuation are ignored."""
+        assert normalize_query("  Weather in\tParis  and Berlin?! ") == "weather in paris and berlin"
+
+    def test_exact_hit_round_trip(self):
+        """Test a plan is returned for the normalized query with fresh objects."""
+        cache = PlanCache()
+        cache.set_plan("Weather in Paris and Berlin?", _intent("Weather in Paris and Berlin?"), _subqueries())
+
+        plan = cache.get_plan("weather in paris and berlin")
+
+        assert plan.exact
+        assert plan.intent.original_query == "weather in paris and berlin"
+        assert plan.intent.complexity == QueryComplexity.MODERATE
+        assert plan.intent.metadata == {"reasoning": "Two cities", "plan_cache_hit": True}
+        assert [sq.id for sq in plan.subqueries] == ["sq1", "sq2"]
+        assert plan.subqueries[1].dependencies == ["sq1"]
+        assert plan.subqueries[0].routing_pattern == RoutingPattern.DELEGATION
+        assert cache.get_plan("weather in paris and berlin").subqueries is not plan.subqueries
+
+    def test_miss_and_ttl(self):
+        """Test unknown and expired queries return None."""
+        cache = PlanCache(ttl_seconds=0.1)
+        cache.set_plan("hello", _intent("hello", QueryComplexity.SIMPLE), [])
+
+        assert cache.get_plan("goodbye") is None
+        assert cache.get_plan("hello").subqueries == []
+        time.sleep(0.15)
+        assert cache.get_plan("hello") is None
+
+    def test_neighbour_reuses_intent_only(self):
+        """Test an embedding neighbour reuses the intent but not the subqueries."""
+        cache = PlanCache(similarity_threshold=0.9)
+        cache.set_plan("weather in paris and berlin", _intent("q"), _subqueries(), embedding=[1.0, 0.0, 0.1])
+
+        plan = cache.get_plan("weather in rome and madrid", embedding=[1.0, 0.05, 0.1])
+        assert not plan.exact
+        assert plan.subqueries is None
+        assert plan.intent.original_query == "weather in rome and madrid"
+        assert cache.get_metrics()["neighbour_hits"] == 1
+
+        assert cache.get_plan("stock price of AAPL", embedding=[0.0, 1.0, 0.0]) is None
+
+    def test_sqlite_persistence(self, tmp_path):
+        """Test plans survive a new cache instance on the same database."""
+        db_path = str(tmp_path / "plans.db")
+        PlanCache(db_path=db_path).set_plan(
+            "weather in paris and berlin", _intent("q"), _subqueries(), embedding=[1.0, 0.0]
+        )
+
+        cache = PlanCache(db_path=db_path, similarity_threshold=0.9)
+        assert cache.get_metrics()["persistent"]
+        assert len(cache.get_plan("Weather in Paris and Berlin").subqueries) == 2
+        assert cache.get_plan("other", embedding=[1.0, 0.01]) is not None
+
+        cache.clear()
+        assert PlanCache(db_path=db_path).get_plan("weather in paris and berlin") is None
+
+
+class TestSmartRouterPlanCache:
+    """Tests for plan caching in SmartRouter."""
+
+    def _router(self, session_id=None, has_history=False):
+        from asdrp.orchestration.smartrouter.config_loader import SmartRouterConfigLoader
+        from asdrp.orchestration.smartrouter.smartrouter import SmartRouter
+
+        router = SmartRouter(SmartRouterConfigLoader().load_config(), MagicMock(), session_id=session_id)
+        router.plan_cache = PlanCache()
+        router.interpreter = MagicMock()
+        router.interpreter.interpret = AsyncMock(side_effect=_intent)
+        router.interpreter.has_history = AsyncMock(return_value=has_history)
+        router.interpreter.record_turn = AsyncMock()
+        router.decomposer = MagicMock()
+        router.decomposer.decompose = AsyncMock(return_value=_subqueries())
+        return router
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_skips_interpretation_and_decomposition(self):
+        """Test a repeated query reuses the cached intent and subqueries."""
+        router = self._router()
+        seen = []
+
+        async def dispatch(routed, *args, **kwargs):
+            seen.append([sq.id for sq, _ in routed])
+            raise RuntimeError("stop after decomposition")
+
+        router.dispatcher.dispatch_all = dispatch
+
+        query = "Compare the weather in Paris and Berlin"
+        for _ in range(2):
+            await router.route_query(query)
+
+        assert router.interpreter.interpret.await_count == 1
+        assert router.decomposer.decompose.await_count == 1
+        assert seen == [["sq1", "sq2"], ["sq1", "sq2"]]
+
+    @pytest.mark.asyncio
+    async def test_first_turns_of_conversations_share_plans(self):
+        """Test conversations without earlier turns reuse each other's plans."""
+        router = self._router()
+        router.dispatcher.dispatch_all = AsyncMock(side_effect=RuntimeError("stop"))
+
+        query = "Compare the weather in Paris and Berlin"
+        for session_id in ("conv-1", "conv-2"):
+            await router.route_query(query, session_id=session_id)
+
+        assert router.interpreter.interpret.await_count == 1
+        # The cached turn is still recorded in the second conversation
+        router.interpreter.record_turn.assert_awaited_once()
+        assert router.interpreter.record_turn.await_args.args[0] == query
+
+    @pytest.mark.asyncio
+    async def test_skipped_for_conversations_with_history(self):
+        """Test later turns of a conversation are interpreted in context, not cached."""
+        router = self._router(has_history=True)
+        router.dispatcher.dispatch_all = AsyncMock(side_effect=RuntimeError("stop"))
+
+        for _ in range(2):
+            await router.route_query("Compare the weather in Paris and Berlin", session_id="conv")
+
+        assert router.interpreter.interpret.await_count == 2
+        assert router.plan_cache.get_metrics()["size"] == 0
+
+
+    @pytest.mark.asyncio
+    async def test_combined_planning_with_bound_sessions(self, tmp_path, monkeypatch):
+        """Test the plan cache serves combined planning for session-bound requests."""
+        from types import SimpleNamespace
+
+        from agents import Runner
+        from asdrp.orchestration.smartrouter import history_window
+        from asdrp.orchestration.smartrouter.config_loader import (
+            PlanningConfig,
+            SmartRouterConfigLoader,
+        )
+        from asdrp.orchestration.smartrouter.query_planner import QueryPlanner
+        from asdrp.orchestration.smartrouter.smartrouter import SmartRouter
+
+        monkeypatch.setattr(history_window, "COMPONENT_SESSION_DB_PATH", str(tmp_path / "sessions.db"))
+        plan = (
+            '{"complexity": "MODERATE", "domains": ["search"], "requires_synthesis": true, '
+            '"reasoning": "Two cities", "subqueries": ['
+            '{"id": "sq1", "text": "Weather in Paris", "capability_required": "search", '
+            '"dependencies": [], "routing_pattern": "delegation"}, '
+            '{"id": "sq2", "text": "Weather in Berlin", "capability_required": "search", '
+            '"dependencies": [], "routing_pattern": "delegation"}]}'
+        )
+
+        async def run_planner(agent, input, session=None, **kwargs):
+            await session.add_items([
+                {"role": "user", "content": input},
+                {"role": "assistant", "content": plan},
+            ])
+            return SimpleNamespace(final_output=plan)
+
+        run = AsyncMock(side_effect=run_planner)
+        monkeypatch.setattr(Runner, "run", run)
+
+        config = SmartRouterConfigLoader().load_config()
+        config.planning = PlanningConfig(mode="combined")
+        router = SmartRouter(config, MagicMock())
+        assert isinstance(router.interpreter, QueryPlanner)
+        router.plan_cache = PlanCache()
+        router.fast_path_router.try_fast_path = MagicMock(return_value=None)
+        seen = []
+
+        async def dispatch(routed, *args, **kwargs):
+            seen.append([sq.id for sq, _ in routed])
+            raise RuntimeError("stop after decomposition")
+
+        router.dispatcher.dispatch_all = dispatch
+
+        query = "Compare the weather in Paris and Berlin"
+        for session_id in ("conv-1", "conv-2", "conv-2"):
+            await router.route_query(query, session_id=session_id)
+
+        # conv-2 is served from the cache, then its follow-up is planned in context
+        assert run.await_count == 2
+        assert seen == [["sq1", "sq2"]] * 3
+        with history_window.request_session("conv-2"):
+            items = await history_window.session_for_request("planner", None).get_items()
+        assert [item["role"] for item in items] == ["user", "assistant"] * 2
+
+
 class TestGlobalCaches:
     """Tests for global cache instances."""
 
@@ -15,6 +15,7 @@ from asdrp.orchestration.smartrouter.config_loader import (
     DecompositionConfig,
     EvaluationConfig,
     ErrorHandlingConfig,
+    HistoryConfig,
     SmartRouterConfig,
 )
 from asdrp.orchestration.smartrouter.exceptions import SmartRouterException
@@ -189,9 +190,27 @@ class TestSmartRouterConfigLoader:
             assert config.models.interpretation.name == "gpt-4.1-mini"
             assert config.decomposition.max_subqueries == 10
             assert "geo" in config.capabilities
+            # Missing history section falls back to defaults
+            assert config.history == HistoryConfig()
         finally:
             temp_path.unlink()
 
+    def test_parse_history_config(self):
+        """Test parsing and validation of the history section."""
+        loader = SmartRouterConfigLoader()
+        config = loader._parse_config({
+            "history": {"max_turns": 3, "summarize": False, "apply_to_agent_sessions": True}
+        })
+
+        assert config.history.max_turns == 3
+        assert config.history.summarize is False
+        assert config.history.apply_to_agent_sessions is True
+        assert config.history.max_tokens == HistoryConfig().max_tokens
+
+        config.history.max_turns = 0
+        with pytest.raises(SmartRouterException, match="max_turns"):
+            loader._validate_config(config)
+
     def test_load_agent_capabilities(self):
         """Test loading capabilities from open_agents.yaml."""
         loader = SmartRouterConfigLoader()
@@ -0,0 +1,255 @@
+"""
+Tests for the bounded conversation history of SmartRouter sessions
+
+Tests window selection (turn and token limits), the rolling summary kept
+next to the session, and how the policy is wired into SmartRouter.
+"""
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+from agents import SQLiteSession
+
+from asdrp.orchestration.smartrouter.config_loader import HistoryConfig
+from asdrp.orchestration.smartrouter.history_window import (
+    BoundedSession,
+    SessionSummaryStore,
+    SUMMARY_PREFIX,
+    bound_session,
+    current_session_id,
+    get_summary_store,
+    request_session,
+    select_window,
+    session_for_request,
+)
+
+
+def _turn(i, answer_size=10):
+    return [
+        {"role": "user", "content": f"question {i}"},
+        {"role": "assistant", "content": f"answer {i} " + "x" * answer_size},
+    ]
+
+
+def _turns(n, answer_size=10):
+    items = []
+    for i in range(n):
+        items.extend(_turn(i, answer_size))
+    return items
+
+
+class TestSelectWindow:
+    """Test window selection."""
+
+    def test_keeps_last_turns(self):
+        """Test that only the last max_turns turns are kept."""
+        items = _turns(5)
+        window, dropped = select_window(items, max_turns=2, max_tokens=10_000)
+
+        assert [i["content"] for i in window if i["role"] == "user"] == ["question 3", "question 4"]
+        assert dropped == items[:6]
+
+    def test_token_budget_drops_whole_turns(self):
+        """Test that whole turns are dropped until the window fits the budget."""
+        items = _turns(4, answer_size=400)  # ~100+ tokens per turn
+        window, dropped = select_window(items, max_turns=10, max_tokens=250)
+
+        assert len(window) == 4
+        assert window[0]["content"] == "question 2"
+        assert len(dropped) == 4
+
+    def test_latest_turn_always_kept(self):
+        """Test that the current turn is kept even if it exceeds the budget."""
+        items = _turns(2, answer_size=4000)
+        window, _ = select_window(items, max_turns=10, max_tokens=10)
+
+        assert window == items[2:]
+
+    def test_tool_items_stay_with_their_turn(self):
+        """Test that tool calls are not split from the turn they belong to."""
+        items = _turn(0) + [
+            {"role": "user", "content": "question 1"},
+            {"type": "function_call", "name": "geocode", "arguments": "{}", "call_id": "c1"},
+            {"type": "function_call_output", "call_id": "c1", "output": "37.4,-122.1"},
+            {"role": "assistant", "content": "answer 1"},
+        ]
+        window, dropped = select_window(items, max_turns=1, max_tokens=10_000)
+
+        assert len(window) == 4
+        assert dropped == items[:2]
+
+
+class TestBoundedSession:
+    """Test BoundedSession against a real SQLiteSession."""
+
+    @pytest.mark.asyncio
+    async def test_replays_bounded_window_but_stores_everything(self):
+        """Test that the prompt stays flat while the full history is kept."""
+        config = HistoryConfig(max_turns=2, summarize=False)
+        session = BoundedSession(SQLiteSession("conv"), config)
+
+        sizes = []
+        for i in range(6):
+            await session.add_items(_turn(i))
+            sizes.append(len(await session.get_items()))
+
+        assert sizes[-3:] == [4, 4, 4]
+        assert len(await session.wrapped.get_items()) == 12
+
+    @pytest.mark.asyncio
+    async def test_rolling_summary_is_updated_in_background(self):
+        """Test that dropped turns are summarized and prepended."""
+        calls = []
+
+        async def summarizer(previous, items):
+            calls.append((previous, [i["content"] for i in items]))
+            return f"summary of {len(items)} items"
+
+        store = SessionSummaryStore()
+        config = HistoryConfig(max_turns=1)
+        session = BoundedSession(SQLiteSession("conv"), config, summarizer=summarizer, summary_store=store)
+        await session.add_items(_turns(3))
+
+        # First read: no summary yet, update scheduled without blocking
+        first = await session.get_items()
+        assert first == _turn(2)
+        await session._summary_task
+
+        assert calls == [(None, ["question 0", "answer 0 xxxxxxxxxx", "question 1", "answer 1 xxxxxxxxxx"])]
+        second = await session.get_items()
+        assert second[0] == {"role": "system", "content": SUMMARY_PREFIX + "summary of 4 items"}
+        assert second[1:] == _turn(2)
+
+        # Only newly dropped turns are sent on the next update
+        await session.add_items(_turn(3))
+        await session.get_items()
+        await session._summary_task
+        assert calls[-1] == ("summary of 4 items", ["question 2", "answer 2 xxxxxxxxxx"])
+        assert store.get("conv") == ("summary of 2 items", 6)
+
+    @pytest.mark.asyncio
+    async def test_failed_summary_is_not_fatal(self):
+        """Test that a summarizer error leaves the window intact."""
+        async def summarizer(previous, items):
+            raise RuntimeError("model unavailable")
+
+        session = BoundedSession(
+            SQLiteSession("conv"), HistoryConfig(max_turns=1), summarizer=summarizer
+        )
+        await session.add_items(_turns(2))
+        await session.get_items()
+        await session._summary_task
+
+        assert await session.get_items() == _turn(1)
+
+    @pytest.mark.asyncio
+    async def test_clear_session_forgets_summary(self):
+        """Test that clearing the session also drops its summary."""
+        store = SessionSummaryStore()
+        store.set("conv", "old summary", 2)
+        session = BoundedSession(SQLiteSession("conv"), HistoryConfig(), summary_store=store)
+
+        await session.clear_session()
+
+        assert store.get("conv") == (None, 0)
+
+    def test_summary_store_shares_session_database(self):
+        """Test that summaries are stored in the session's database file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "smartrouter.db")
+            session = BoundedSession(SQLiteSession("conv", db_path), HistoryConfig())
+            session._store.set("conv", "summary", 2)
+
+            assert get_summary_store(db_path) is session._store
+            assert SessionSummaryStore(db_path).get("conv") == ("summary", 2)
+
+
+class TestHistoryWiring:
+    """Test how the history policy is applied."""
+
+    def test_bound_session_respects_config(self):
+        """Test that sessions are only wrapped for an enabled policy."""
+        session = SQLiteSession("conv")
+
+        assert bound_session(session, None) is session
+        assert bound_session(session, HistoryConfig(enabled=False)) is session
+        bounded = bound_session(session, HistoryConfig())
+        assert isinstance(bounded, BoundedSession)
+        assert bound_session(bounded, HistoryConfig()) is bounded
+
+    def test_components_use_bounded_sessions(self, tmp_path, monkeypatch):
+        """Test that SmartRouter's internal components replay a bounded window."""
+        from unittest.mock import MagicMock
+        from asdrp.orchestration.smartrouter.config_loader import SmartRouterConfigLoader
+        from asdrp.orchestration.smartrouter.smartrouter import SmartRouter
+
+        monkeypatch.chdir(tmp_path)
+        os.makedirs("data/sessions")
+        config = SmartRouterConfigLoader(
+            os.path.join(os.path.dirname(__file__), "../../../../config/smartrouter.yaml")
+        ).load_config()
+        router = SmartRouter(config, MagicMock(), session_id="conv")
+
+        for component in (router.interpreter, router.decomposer, router.synthesizer, router.judge):
+            assert isinstance(component._session, BoundedSession)
+            assert component._session.config.max_turns == config.history.max_turns
+        # Agent sessions are left alone unless apply_to_agent_sessions is set
+        assert router.dispatcher.history_config is None
+
+
+class TestRequestSession:
+    """Test binding a conversation per request to a shared router."""
+
+    def test_request_session_binding(self):
+        """Test that the bound session ID is visible only inside the block."""
+        assert current_session_id("default") == "default"
+        with request_session("conv"):
+            assert current_session_id("default") == "conv"
+            with request_session(None):
+                assert current_session_id() == "conv"
+        assert current_session_id() is None
+
+    @pytest.mark.asyncio
+    async def test_tasks_see_their_own_session(self):
+        """Test that concurrent requests resolve their own component sessions."""
+        async def resolve(session_id):
+            with request_session(session_id):
+                await asyncio.sleep(0)
+                return session_for_request("interpreter", None)
+
+        first, second, again = await asyncio.gather(resolve("a"), resolve("b"), resolve("a"))
+
+        assert first.session_id == "a_interpreter"
+        assert second.session_id == "b_interpreter"
+        assert again is first
+
+    def test_request_sessions_are_pooled_on_shared_connections(self, tmp_path, monkeypatch):
+        """Test that request sessions share a connection and are evicted from a bounded pool."""
+        from asdrp.agents.session_pool import SessionPool
+        from asdrp.orchestration.smartrouter import history_window
+
+        monkeypatch.setattr(history_window, "COMPONENT_SESSION_DB_PATH", str(tmp_path / "sessions.db"))
+        monkeypatch.setattr(history_window, "_request_sessions", SessionPool(max_size=1, ttl_seconds=None))
+
+        with request_session("a"):
+            first = session_for_request("planner", None)
+        with request_session("b"):
+            second = session_for_request("planner", None)
+        with request_session("a"):
+            again = session_for_request("planner", None)
+
+        assert first._shared_connection is second._shared_connection
+        assert again is not first
+        assert history_window._request_sessions.stats()["evictions"] == 2
+
+    def test_component_session_used_when_unbound(self):
+        """Test that components keep their own session outside a bound request."""
+        session = SQLiteSession("conv_judge")
+
+        assert session_for_request("judge", session) is session
+        with request_session("conv"):
+            assert session_for_request("judge", session) is session
+            bounded = session_for_request("judge", None, HistoryConfig())
+            assert isinstance(bounded, BoundedSession)
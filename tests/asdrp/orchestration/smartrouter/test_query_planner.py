@@ -0,0 +1,157 @@
+"""
+Tests for QueryPlanner
+
+Tests combined interpretation and decomposition in one LLM call.
+"""
+
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from asdrp.orchestration.smartrouter.query_planner import QueryPlanner, PLANNED_SUBQUERIES_KEY
+from asdrp.orchestration.smartrouter.query_decomposer import QueryDecomposer
+from asdrp.orchestration.smartrouter.interfaces import QueryComplexity
+from asdrp.orchestration.smartrouter.config_loader import (
+    ModelConfig,
+    DecompositionConfig,
+    SmartRouterConfigLoader,
+)
+
+
+PLAN = {
+    "complexity": "MODERATE",
+    "domains": ["finance", "geography"],
+    "requires_synthesis": True,
+    "reasoning": "Two independent questions",
+    "subqueries": [
+        {
+            "id": "sq1",
+            "text": "Stock price of AAPL",
+            "capability_required": "finance",
+            "dependencies": [],
+            "routing_pattern": "delegation"
+        },
+        {
+            "id": "sq2",
+            "text": "Address of Apple HQ",
+            "capability_required": "geocoding",
+            "dependencies": ["sq1"],
+            "routing_pattern": "delegation"
+        }
+    ]
+}
+
+
+class TestQueryPlanner:
+    """Test QueryPlanner class."""
+
+    @pytest.fixture
+    def model_config(self):
+        """Create a test model config."""
+        return ModelConfig(name="gpt-4.1-mini", temperature=0.2, max_tokens=1000)
+
+    @pytest.fixture
+    def decomp_config(self):
+        """Create a test decomposition config."""
+        return DecompositionConfig(max_subqueries=10, recursion_limit=3, fallback_threshold=0.4)
+
+    def _planner(self, model_config, decomp_config, response, decomposer=None):
+        mock_client = AsyncMock()
+        mock_client.generate.return_value = response
+        planner = QueryPlanner(
+            model_config=model_config,
+            decomp_config=decomp_config,
+            decomposer=decomposer,
+            llm_client=mock_client
+        )
+        return planner, mock_client
+
+    def test_prompt_asks_for_intent_and_subqueries(self):
+        """Test that the combined prompt covers both steps."""
+        prompt = QueryPlanner.PLANNING_PROMPT
+        assert "SIMPLE|MODERATE|COMPLEX" in prompt
+        assert "Available capabilities:" in prompt
+        assert '"subqueries"' in prompt
+        assert prompt.count("Respond ONLY") == 1
+
+    @pytest.mark.asyncio
+    async def test_one_llm_call_for_both_steps(self, model_config, decomp_config):
+        """Test that interpret() and decompose() share a single LLM call."""
+        planner, mock_client = self._planner(
+            model_config, decomp_config, f"```json\n{json.dumps(PLAN)}\n```"
+        )
+
+        intent = await planner.interpret("AAPL price and where is Apple HQ?")
+        subqueries = await planner.decompose(intent)
+
+        assert mock_client.generate.call_count == 1
+        assert intent.complexity == QueryComplexity.MODERATE
+        assert intent.domains == ["finance", "geography"]
+        assert [sq.id for sq in subqueries] == ["sq1", "sq2"]
+        assert subqueries[1].dependencies == ["sq1"]
+        assert subqueries[1].capability_required == "geocoding"
+
+    @pytest.mark.asyncio
+    async def test_simple_query_has_no_subqueries(self, model_config, decomp_config):
+        """Test that simple queries are not decomposed."""
+        plan = dict(PLAN, complexity="SIMPLE", domains=["finance"], subqueries=[])
+        planner, _ = self._planner(model_config, decomp_config, json.dumps(plan))
+
+        intent = await planner.interpret("AAPL price")
+
+        assert intent.complexity == QueryComplexity.SIMPLE
+        assert PLANNED_SUBQUERIES_KEY not in intent.metadata
+        assert await planner.decompose(intent) == []
+
+    @pytest.mark.asyncio
+    async def test_invalid_plan_falls_back_to_decomposer(self, model_config, decomp_config):
+        """Test that a cyclic plan is discarded and decomposed separately."""
+        plan = json.loads(json.dumps(PLAN))
+        plan["subqueries"][0]["dependencies"] = ["sq2"]
+        decomposer = MagicMock(spec=QueryDecomposer)
+        real_decomposer = QueryDecomposer(model_config=model_config, decomp_config=decomp_config)
+        decomposer._parse_decomposition.side_effect = real_decomposer._parse_decomposition
+        decomposer._validate_subqueries.side_effect = real_decomposer._validate_subqueries
+        decomposer.validate_dependencies.side_effect = real_decomposer.validate_dependencies
+        decomposer.decompose = AsyncMock(return_value=["fallback"])
+        planner, _ = self._planner(model_config, decomp_config, json.dumps(plan), decomposer=decomposer)
+
+        intent = await planner.interpret("AAPL price and where is Apple HQ?")
+
+        assert PLANNED_SUBQUERIES_KEY not in intent.metadata
+        assert await planner.decompose(intent) == ["fallback"]
+        decomposer.decompose.assert_awaited_once_with(intent)
+
+    @pytest.mark.asyncio
+    async def test_llm_failure_uses_heuristics(self, model_config, decomp_config):
+        """Test that an unparseable response falls back to heuristic interpretation."""
+        planner, _ = self._planner(model_config, decomp_config, "not json")
+
+        intent = await planner.interpret("What is the stock price of AAPL?")
+
+        assert intent.metadata["reasoning"].startswith("Fallback heuristic interpretation")
+
+
+class TestPlanningMode:
+    """Test selecting the planning mode in SmartRouter."""
+
+    def test_combined_mode_uses_planner(self):
+        """Test that planning mode "combined" serves both steps from QueryPlanner."""
+        from asdrp.orchestration.smartrouter.smartrouter import SmartRouter
+
+        config = SmartRouterConfigLoader().load_config()
+        config.planning.mode = "combined"
+        router = SmartRouter(config, MagicMock())
+
+        assert isinstance(router.interpreter, QueryPlanner)
+        assert router.decomposer is router.interpreter
+
+    def test_separate_mode_is_default(self):
+        """Test that the default pipeline keeps separate components."""
+        from asdrp.orchestration.smartrouter.smartrouter import SmartRouter
+
+        router = SmartRouter(SmartRouterConfigLoader().load_config(), MagicMock())
+
+        assert not isinstance(router.interpreter, QueryPlanner)
+        assert not isinstance(router.decomposer, QueryPlanner)
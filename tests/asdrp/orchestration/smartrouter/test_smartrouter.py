@@ -464,6 +464,38 @@ class TestSmartRouterComplexQuery:
         
         assert answer == router.config.evaluation.fallback_message
 
+    @pytest.mark.asyncio
+    async def test_route_query_raises_when_all_subqueries_shed(self, router):
+        """Test that shed load is raised instead of synthesized and judged."""
+        from asdrp.agents.execution_scheduler import AdmissionError
+
+        router.fast_path_router.try_fast_path = MagicMock(return_value=None)
+        router.interpreter.interpret = AsyncMock(return_value=QueryIntent(
+            original_query="Weather and TSLA price",
+            complexity=QueryComplexity.COMPLEX,
+            domains=["geocoding", "finance"],
+            requires_synthesis=True,
+            metadata={}
+        ))
+        router.decomposer.decompose = AsyncMock(return_value=[
+            Subquery(sq_id, text, capability, [], RoutingPattern.DELEGATION, {})
+            for sq_id, text, capability in (("sq1", "Weather?", "geocoding"), ("sq2", "TSLA?", "stocks"))
+        ])
+        router.dispatcher.dispatch_all = AsyncMock(return_value=[
+            AgentResponse(sq_id, agent_id, "", False, "Server is at capacity",
+                          {"shed": True, "retry_after": 2.0})
+            for sq_id, agent_id in (("sq1", "geo"), ("sq2", "finance"))
+        ])
+        router.synthesizer.synthesize = AsyncMock()
+        router.judge.evaluate = AsyncMock()
+
+        with pytest.raises(AdmissionError) as exc_info:
+            await router.route_query("Weather and TSLA price")
+
+        assert exc_info.value.retry_after == 2.0
+        router.synthesizer.synthesize.assert_not_called()
+        router.judge.evaluate.assert_not_called()
+
 
 class TestSmartRouterRouteQuery:
     """Test SmartRouter.route_query main entry point."""
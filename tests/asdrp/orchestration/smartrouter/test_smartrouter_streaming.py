@@ -0,0 +1,235 @@
+"""
+Tests for SmartRouter streaming (route_query_stream and synthesis streaming).
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from openai.types.responses import ResponseTextDeltaEvent
+
+from asdrp.orchestration.smartrouter.smartrouter import SmartRouter
+from asdrp.orchestration.smartrouter.config_loader import (
+    SmartRouterConfig,
+    ModelConfig,
+    ModelConfigs,
+    DecompositionConfig,
+    EvaluationConfig,
+    ErrorHandlingConfig,
+)
+from asdrp.orchestration.smartrouter.interfaces import (
+    QueryIntent,
+    QueryComplexity,
+    Subquery,
+    AgentResponse,
+    SynthesizedResult,
+    EvaluationResult,
+    RoutingPattern,
+)
+from asdrp.orchestration.smartrouter.result_synthesizer import (
+    ResultSynthesizer,
+    _AnswerFieldStreamer,
+)
+
+
+def _text_delta(delta: str):
+    return SimpleNamespace(
+        type="raw_response_event",
+        data=ResponseTextDeltaEvent.model_construct(delta=delta, type="response.output_text.delta"),
+    )
+
+
+def _streamed_run(deltas, final_output):
+    async def stream_events():
+        yield SimpleNamespace(type="agent_updated_stream_event", data=None)
+        for delta in deltas:
+            yield _text_delta(delta)
+
+    return SimpleNamespace(stream_events=stream_events, final_output=final_output)
+
+
+def _evaluation(should_fallback: bool = False) -> EvaluationResult:
+    score = 0.2 if should_fallback else 0.9
+    return EvaluationResult(
+        is_high_quality=not should_fallback,
+        completeness_score=score,
+        accuracy_score=score,
+        clarity_score=score,
+        issues=["incomplete"] if should_fallback else [],
+        should_fallback=should_fallback,
+        metadata={},
+    )
+
+
+@pytest.fixture
+def config():
+    return SmartRouterConfig(
+        models=ModelConfigs(
+            interpretation=ModelConfig("gpt-4.1-mini", 0.1, 500),
+            decomposition=ModelConfig("gpt-4.1-mini", 0.2, 1000),
+            synthesis=ModelConfig("gpt-4.1-mini", 0.3, 2000),
+            evaluation=ModelConfig("gpt-4.1-mini", 0.01, 500),
+        ),
+        decomposition=DecompositionConfig(10, 3, 0.4),
+        capabilities={"geo": ["geocoding"], "finance": ["finance"]},
+        evaluation=EvaluationConfig("Not enough info", 0.7, ["completeness"]),
+        error_handling=ErrorHandlingConfig(30.0, 2),
+        enabled=True,
+    )
+
+
+@pytest.fixture
+def complex_router(config):
+    query = "Where is Paris and what is the AAPL price?"
+    interpreter = MagicMock()
+    interpreter.interpret = AsyncMock(return_value=QueryIntent(
+        original_query=query,
+        complexity=QueryComplexity.COMPLEX,
+        domains=["geography", "finance"],
+        requires_synthesis=True,
+        metadata={},
+    ))
+    decomposer = MagicMock()
+    decomposer.decompose = AsyncMock(return_value=[
+        Subquery("sq1", "Where is Paris?", "geocoding", [], RoutingPattern.DELEGATION, {}),
+        Subquery("sq2", "AAPL price?", "finance", [], RoutingPattern.DELEGATION, {}),
+    ])
+    capability_router = MagicMock()
+    capability_router.route = MagicMock(side_effect=[
+        ("geo", RoutingPattern.DELEGATION),
+        ("finance", RoutingPattern.DELEGATION),
+    ])
+    dispatcher = MagicMock()
+    dispatcher.dispatch_all = AsyncMock(return_value=[
+        AgentResponse("sq1", "geo", "Paris is in France", True),
+        AgentResponse("sq2", "finance", "AAPL is $200", True),
+    ])
+
+    async def synthesize_stream(responses, original_query):
+        for delta in ("Paris is in France", "; AAPL is $200"):
+            yield delta
+        yield SynthesizedResult(
+            answer="Paris is in France; AAPL is $200",
+            sources=["geo", "finance"],
+            confidence=0.9,
+            conflicts_resolved=[],
+            metadata={},
+        )
+
+    synthesizer = MagicMock()
+    synthesizer.synthesize_stream = synthesize_stream
+    judge = MagicMock()
+    judge.evaluate = AsyncMock(return_value=_evaluation())
+
+    router = SmartRouter(
+        config,
+        MagicMock(),
+        interpreter=interpreter,
+        decomposer=decomposer,
+        capability_router=capability_router,
+        dispatcher=dispatcher,
+        synthesizer=synthesizer,
+        judge=judge,
+    )
+    router.fast_path_router.try_fast_path = MagicMock(return_value=None)
+    return router, query
+
+
+async def _collect(router, query):
+    return [event async for event in router.route_query_stream(query)]
+
+
+@pytest.mark.asyncio
+async def test_complex_query_streams_phases_then_synthesis_tokens(complex_router):
+    router, query = complex_router
+
+    events = await _collect(router, query)
+
+    ends = [e.phase for e in events if e.type == "phase_end"]
+    assert ends == ["fast_path", "interpretation", "decomposition", "routing", "execution", "synthesis", "evaluation"]
+
+    types = [e.type for e in events]
+    tokens = [e.content for e in events if e.type == "token"]
+    assert tokens == ["Paris is in France", "; AAPL is $200"]
+    # Tokens are delivered before the judge runs
+    evaluation_start = next(i for i, e in enumerate(events) if e.type == "phase_start" and e.phase == "evaluation")
+    assert max(i for i, t in enumerate(types) if t == "token") < evaluation_start
+    # So is the full answer, for checks that can overlap the judge
+    answer = next(i for i, e in enumerate(events) if e.type == "answer")
+    assert max(i for i, t in enumerate(types) if t == "token") < answer < evaluation_start
+    assert events[answer].content == "Paris is in France; AAPL is $200"
+    assert events[answer].data["agents_used"] == ["geo", "finance"]
+
+    done = events[-1]
+    assert done.type == "done"
+    assert done.result.answer == "".join(tokens)
+    assert done.result.final_decision == "synthesized"
+    assert [t["phase"] for t in done.result.traces] == ends
+
+
+@pytest.mark.asyncio
+async def test_judge_fallback_replaces_streamed_answer_in_result(complex_router):
+    router, query = complex_router
+    router.judge.evaluate = AsyncMock(return_value=_evaluation(should_fallback=True))
+
+    events = await _collect(router, query)
+
+    result = events[-1].result
+    assert result.final_decision == "fallback"
+    assert result.answer == "Not enough info"
+    assert result.original_answer == "Paris is in France; AAPL is $200"
+
+
+@pytest.mark.asyncio
+async def test_simple_query_streams_from_routed_agent(config):
+    router = SmartRouter(config, MagicMock())
+    router.fast_path_router.try_fast_path = MagicMock(return_value=None)
+    router.interpreter.interpret = AsyncMock(return_value=QueryIntent(
+        original_query="Where is Paris?",
+        complexity=QueryComplexity.SIMPLE,
+        domains=["geography"],
+        requires_synthesis=False,
+        metadata={},
+    ))
+    router.agent_factory.get_agent = AsyncMock(return_value=MagicMock(name="GeoAgent"))
+    router.judge.evaluate = AsyncMock(return_value=_evaluation())
+
+    with patch("agents.Runner.run_streamed", return_value=_streamed_run(["Paris ", "is in France"], "Paris is in France")) as run_streamed, \
+            patch("agents.Runner.run", new_callable=AsyncMock) as run:
+        events = await _collect(router, "Where is Paris?")
+
+    run.assert_not_called()
+    run_streamed.assert_called_once()
+    assert [e.content for e in events if e.type == "token"] == ["Paris ", "is in France"]
+    assert events[-1].result.answer == "Paris is in France"
+    assert events[-1].result.agents_used == ["geo"]
+
+
+def test_answer_field_streamer_decodes_json_answer_incrementally():
+    answer = 'Line "one"\n- café \\ done'
+    raw = "```json\n" + json.dumps({"answer": answer, "confidence": 0.9}) + "\n```"
+
+    streamer = _AnswerFieldStreamer()
+    decoded = "".join(streamer.feed(raw[i:i + 2]) for i in range(0, len(raw), 2))
+
+    assert decoded == answer
+    assert streamer.raw == raw
+
+
+@pytest.mark.asyncio
+async def test_synthesize_stream_yields_answer_deltas_and_parsed_result():
+    synthesizer = ResultSynthesizer(ModelConfig("gpt-4.1-mini", 0.3, 2000))
+    raw = json.dumps({"answer": "Merged answer", "conflicts_resolved": [], "confidence": 0.8})
+    responses = {
+        "sq1": AgentResponse("sq1", "geo", "A", True),
+        "sq2": AgentResponse("sq2", "finance", "B", True),
+    }
+
+    with patch("agents.Runner.run_streamed", return_value=_streamed_run([raw[:15], raw[15:25], raw[25:]], raw)):
+        items = [item async for item in synthesizer.synthesize_stream(responses, "q")]
+
+    assert "".join(items[:-1]) == "Merged answer"
+    assert isinstance(items[-1], SynthesizedResult)
+    assert items[-1].confidence == 0.8
+    assert sorted(items[-1].sources) == ["finance", "geo"]
@@ -0,0 +1,19 @@
+"""Shared fixtures for the whole test suite."""
+
+import pytest
+
+from asdrp.orchestration.moe.config_loader import MoEConfigLoader
+
+
+@pytest.fixture(autouse=True)
+def isolated_moe_cache(tmp_path, monkeypatch):
+    """Point MoE caches built from config/moe.yaml at tmp_path, not data/."""
+    load_config = MoEConfigLoader.load_config
+
+    def load_isolated(self):
+        config = load_config(self)
+        if config.cache.storage.get("path", ":memory:") != ":memory:":
+            config.cache.storage["path"] = str(tmp_path / "moe_cache" / "semantic.db")
+        return config
+
+    monkeypatch.setattr(MoEConfigLoader, "load_config", load_isolated)
@@ -192,3 +192,91 @@ agents:
 
         service._config_loader.reload_config.assert_called_once()
         mock_factory.clear_session_cache.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_chat_agent_streaming_holds_scheduler_slot(self, service, mock_factory):
+        """Test streamed direct runs take a scheduler slot and report shedding in-stream."""
+        from asdrp.agents.execution_scheduler import ExecutionScheduler
+
+        scheduler = ExecutionScheduler(max_concurrent=1, max_queue=0)
+        mock_factory.get_agent_with_session = AsyncMock(return_value=(Mock(name="geo", mcp_servers=None), None))
+        occupancy = []
+
+        def run_streamed(**kwargs):
+            async def stream():
+                occupancy.append(scheduler.stats()["active"])
+                yield "Paris"
+            return stream()
+
+        with patch("server.agent_service.get_execution_scheduler", return_value=scheduler), \
+                patch("server.agent_service.Runner.run_streamed", side_effect=run_streamed):
+            chunks = [c async for c in service.chat_agent_streaming("geo", SimulationRequest(input="Capital?"))]
+            assert [c.type for c in chunks] == ["metadata", "token", "done"]
+            assert occupancy == [1]
+            assert scheduler.stats()["active"] == 0
+
+            # The only slot is taken and nothing may queue: the run is shed
+            await scheduler.acquire("busy")
+            chunks = [c async for c in service.chat_agent_streaming("geo", SimulationRequest(input="Capital?"))]
+            scheduler.release("busy")
+
+        assert [c.type for c in chunks] == ["metadata", "error"]
+        assert chunks[-1].metadata["retry_after"] > 0
+        assert occupancy == [1]
+
+    @pytest.mark.asyncio
+    async def test_smartrouter_plan_cache_serves_new_conversations(self, service, tmp_path, monkeypatch):
+        """Test a query repeated by a new conversation reuses the cached plan."""
+        from types import SimpleNamespace
+
+        from agents import Runner
+        from asdrp.orchestration.smartrouter import history_window
+        from asdrp.orchestration.smartrouter.cache import PlanCache
+        from asdrp.orchestration.smartrouter.config_loader import SmartRouterConfigLoader
+        from asdrp.orchestration.smartrouter.interfaces import EvaluationResult
+        from asdrp.orchestration.smartrouter.smartrouter import SmartRouter
+
+        monkeypatch.setattr(history_window, "COMPONENT_SESSION_DB_PATH", str(tmp_path / "sessions.db"))
+        interpretation = (
+            '{"complexity": "SIMPLE", "domains": ["geography"], '
+            '"requires_synthesis": false, "reasoning": "Single lookup"}'
+        )
+
+        async def run_interpreter(agent, input, session=None, **kwargs):
+            await session.add_items([
+                {"role": "user", "content": input},
+                {"role": "assistant", "content": interpretation},
+            ])
+            return SimpleNamespace(final_output=interpretation)
+
+        run = AsyncMock(side_effect=run_interpreter)
+        monkeypatch.setattr(Runner, "run", run)
+
+        router = SmartRouter(SmartRouterConfigLoader().load_config(), service._factory)
+        router.plan_cache = PlanCache()
+        router.fast_path_router.try_fast_path = Mock(return_value=None)
+        router._handle_simple_query_with_trace = AsyncMock(return_value=("Paris", "geo"))
+        router.judge.evaluate = AsyncMock(return_value=EvaluationResult(
+            is_high_quality=True, completeness_score=1.0, accuracy_score=1.0,
+            clarity_score=1.0, issues=[], should_fallback=False, metadata={},
+        ))
+        service._smartrouter = router
+
+        def plan_cache_status(response):
+            phases = {p["phase"]: p["data"] for p in response.metadata["phases"]}
+            return phases["interpretation"]["plan_cache"]
+
+        query = "What is the capital of France?"
+        with patch("server.agent_service.check_ungrounded_hallucination", AsyncMock(return_value=None)):
+            first = await service._execute_smartrouter(SimulationRequest(input=query))
+            second = await service._execute_smartrouter(SimulationRequest(input=query))
+            follow_up = await service._execute_smartrouter(
+                SimulationRequest(input=query, session_id=second.metadata["session_id"])
+            )
+
+        assert first.metadata["session_id"] != second.metadata["session_id"]
+        assert plan_cache_status(first) == "miss"
+        assert plan_cache_status(second) == "hit"
+        # The cached turn is part of the second conversation's memory
+        assert plan_cache_status(follow_up) == "disabled"
+        assert run.await_count == 2
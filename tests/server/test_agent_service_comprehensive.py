@@ -465,6 +465,33 @@ class TestAgentServiceExecuteSmartRouter:
             
             assert response.metadata["session_id"] == "test_session"
 
+    @pytest.mark.asyncio
+    async def test_execute_smartrouter_reuses_router(self, service):
+        """Test one SmartRouter serves all sessions until the config is reloaded."""
+        mock_result = Mock()
+        mock_result.answer = "Answer"
+        mock_result.traces = []
+        mock_result.total_time = 1.0
+        mock_result.final_decision = "direct"
+        mock_result.agents_used = []
+        mock_result.success = True
+
+        with patch('asdrp.orchestration.smartrouter.smartrouter.SmartRouter') as mock_router_class:
+            mock_router = Mock()
+            mock_router.route_query = AsyncMock(return_value=mock_result)
+            mock_router_class.create.return_value = mock_router
+
+            await service._execute_smartrouter(SimulationRequest(input="Q1", session_id="s1"))
+            await service._execute_smartrouter(SimulationRequest(input="Q2", session_id="s2"))
+
+            mock_router_class.create.assert_called_once_with(agent_factory=service._factory)
+            sessions = [c.kwargs["session_id"] for c in mock_router.route_query.await_args_list]
+            assert sessions == ["s1", "s2"]
+
+            service.reload_config()
+            await service._execute_smartrouter(SimulationRequest(input="Q3", session_id="s1"))
+            assert mock_router_class.create.call_count == 2
+
     @pytest.mark.asyncio
     async def test_execute_smartrouter_error(self, service):
         """Test executing SmartRouter with error."""
@@ -710,14 +737,27 @@ class TestAgentServiceChatAgentStreaming:
         """Test streaming SmartRouter response."""
         request = SimulationRequest(input="Test query")
         
-        mock_response = SimulationResponse(
-            response="SmartRouter answer",
-            trace=[],
-            metadata={"orchestrator": "smartrouter"}
+        from types import SimpleNamespace
+
+        result = SimpleNamespace(
+            answer="SmartRouter answer",
+            traces=[],
+            total_time=0.1,
+            final_decision="direct",
+            agents_used=["geo"],
+            success=True,
         )
-        
-        with patch.object(service, '_execute_smartrouter', new_callable=AsyncMock) as mock_execute:
-            mock_execute.return_value = mock_response
+
+        async def route_query_stream(query, context=None, session_id=None):
+            yield SimpleNamespace(type="phase_end", phase="execution", content="", data={"phase": "execution"})
+            yield SimpleNamespace(type="token", phase=None, content="SmartRouter answer", data={})
+            yield SimpleNamespace(type="done", phase=None, content="", data={}, result=result)
+
+        router = Mock()
+        router.route_query_stream = route_query_stream
+
+        with patch.object(service, '_get_smartrouter', return_value=router), \
+                patch("server.agent_service.check_ungrounded_hallucination", new_callable=AsyncMock, return_value=None):
             
             chunks = []
             async for chunk in service.chat_agent_streaming("smartrouter", request):
@@ -726,6 +766,9 @@ class TestAgentServiceChatAgentStreaming:
             assert len(chunks) >= 3  # metadata, token, done
             assert chunks[0].type == "metadata"
             assert chunks[0].metadata["orchestrator"] == "smartrouter"
+            assert [c.type for c in chunks] == ["metadata", "step", "token", "done"]
+            assert chunks[-1].content is None
+            assert chunks[-1].metadata["final_decision"] == "direct"
 
     @pytest.mark.asyncio
     async def test_chat_agent_streaming_error(self, service, mock_factory):
@@ -788,3 +831,69 @@ class TestAgentServiceReloadConfig:
         service._config_loader.reload_config.assert_called_once()
         mock_factory.clear_session_cache.assert_called_once()
 
+
+
+class TestAgentServiceWarmUp:
+    """Test AgentService.warm_up method."""
+
+    @pytest.fixture
+    def mock_factory(self):
+        """Create mock factory with two loadable agents."""
+        factory = Mock()
+        factory.preload = Mock(return_value=["geo", "yelp"])
+
+        async def get_agent(name):
+            if name == "yelp":
+                raise AgentException("YELP_API_KEY is not set.", agent_name="yelp")
+            return Mock()
+
+        factory.get_agent = AsyncMock(side_effect=get_agent)
+        return factory
+
+    @pytest.fixture
+    def service(self, mock_factory):
+        """Create AgentService with a mocked MoE orchestrator."""
+        with patch("server.agent_service.AgentConfigLoader"):
+            service = AgentService(factory=mock_factory)
+        service._moe = Mock()
+        service._moe.warm_up = AsyncMock(return_value={"embeddings_from_store": 7, "embeddings_computed": 0})
+        return service
+
+    @pytest.mark.asyncio
+    async def test_warm_up_reports_each_component(self, service, mock_factory, monkeypatch):
+        """Test that agents, MoE and SmartRouter are warmed and reported separately."""
+        monkeypatch.setenv("ORCHESTRATOR", "smartrouter")
+        manager = Mock()
+        manager.warm_pools = AsyncMock(return_value={"YelpMCP:key": None})
+
+        with patch("asdrp.agents.mcp.get_mcp_manager", return_value=manager), \
+                patch.object(service, "_get_smartrouter") as get_router:
+            results = await service.warm_up()
+
+        assert results["agents"]["status"] == "ok"
+        assert results["agents"]["agents_loaded"] == 1
+        assert "yelp" in results["agents"]["agents_failed"]
+        assert results["agents"]["mcp_pools"] == {"YelpMCP:key": None}
+        assert results["moe"]["embeddings_from_store"] == 7
+        assert results["smartrouter"]["status"] == "ok"
+        get_router.assert_called_once()
+        assert all("duration_ms" in result for result in results.values())
+
+    @pytest.mark.asyncio
+    async def test_failed_component_does_not_stop_others(self, service, monkeypatch):
+        """Test that one failing component is reported without raising."""
+        monkeypatch.setenv("ORCHESTRATOR", "default")
+        service._moe.warm_up = AsyncMock(side_effect=RuntimeError("embeddings unavailable"))
+        manager = Mock()
+        manager.warm_pools = AsyncMock(return_value={})
+
+        with patch("asdrp.agents.mcp.get_mcp_manager", return_value=manager):
+            results = await service.warm_up()
+
+        assert set(results) == {"agents", "moe"}
+        assert results["moe"] == {
+            "status": "failed",
+            "error": "embeddings unavailable",
+            "duration_ms": results["moe"]["duration_ms"],
+        }
+        assert results["agents"]["status"] == "ok"
@@ -72,3 +72,211 @@ async def test_guardrail_repairs_smartrouter_response_when_triggered():
         assert resp.metadata["guardrails"]["hallucination"]["triggered"] is True
 
 
+
+
+def _moe_stream_service(answer: str):
+    """AgentService with a MoE stub that streams `answer` as one token."""
+    from types import SimpleNamespace
+
+    service = AgentService(factory=Mock())
+    result = SimpleNamespace(
+        response=answer,
+        experts_used=["one"],
+        trace={"request_id": "r1", "query": "q", "selected_experts": ["one"]},
+    )
+
+    async def route_query_stream(query, session_id=None, context=None):
+        yield SimpleNamespace(type="token", content=answer, data={}, result=None)
+        yield SimpleNamespace(type="done", content="", data={}, result=result)
+
+    service._moe = Mock()
+    service._moe.route_query_stream = route_query_stream
+    return service
+
+
+@pytest.mark.asyncio
+async def test_async_guardrail_verdict_trails_done_chunk(monkeypatch):
+    """In async mode the answer is delivered first and the repair follows as a guardrail chunk."""
+    import asyncio
+
+    monkeypatch.setenv("OPENAGENTS_GUARDRAILS_MODE", "async")
+    service = _moe_stream_service("Totally unrelated astronomy answer")
+    release = asyncio.Event()
+
+    async def slow_check(**kwargs):
+        await release.wait()
+        return Mock(risk="high", reason="off topic", safe_repair="Which restaurants?")
+
+    request = SimulationRequest(input="Tell me about restaurant pins in SF", session_id="s1")
+    with patch("server.agent_service.check_ungrounded_hallucination", new=slow_check), patch(
+        "server.agent_service.should_repair", return_value=True
+    ):
+        stream = service.chat_agent_streaming("moe", request)
+        chunks = []
+        async for chunk in stream:
+            chunks.append(chunk)
+            if chunk.type == "done":
+                # Done is delivered while the guardrail is still running
+                release.set()
+
+    assert [c.type for c in chunks] == ["metadata", "token", "done", "guardrail"]
+    assert chunks[2].content is None
+    assert "guardrails" not in chunks[2].metadata
+    assert chunks[3].content == "Which restaurants?"
+    assert chunks[3].metadata["guardrails"]["hallucination"]["triggered"] is True
+
+
+@pytest.mark.asyncio
+async def test_async_guardrail_starts_with_final_output_and_is_cancelled_on_disconnect(monkeypatch):
+    """The check starts when the answer is final and stops when the client goes away."""
+    import asyncio
+    from types import SimpleNamespace
+
+    monkeypatch.setenv("OPENAGENTS_GUARDRAILS_MODE", "async")
+    service = AgentService(factory=Mock())
+    started, cancelled = asyncio.Event(), asyncio.Event()
+    result = SimpleNamespace(response="Totally unrelated astronomy answer", experts_used=["one"], trace={})
+
+    async def route_query_stream(query, session_id=None, context=None):
+        yield SimpleNamespace(type="done", content="", data={}, result=result)
+        # Work after the final output (e.g. caching) overlaps the check
+        await asyncio.wait_for(started.wait(), timeout=1.0)
+
+    async def slow_check(**kwargs):
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    service._moe = Mock()
+    service._moe.route_query_stream = route_query_stream
+    with patch("server.agent_service.check_ungrounded_hallucination", new=slow_check):
+        stream = service.chat_agent_streaming("moe", SimulationRequest(input="restaurant pins in SF"))
+        async for chunk in stream:
+            if chunk.type == "done":
+                break
+        await stream.aclose()
+        await asyncio.wait_for(cancelled.wait(), timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_async_guardrail_starts_on_answer_before_evaluation(monkeypatch):
+    """The check starts on the orchestrator's answer event and overlaps the judge."""
+    import asyncio
+    from types import SimpleNamespace
+
+    monkeypatch.setenv("OPENAGENTS_GUARDRAILS_MODE", "async")
+    service = AgentService(factory=Mock())
+    started = asyncio.Event()
+    result = SimpleNamespace(
+        answer="Paris is in France", traces=[], total_time=1.0,
+        final_decision="direct", agents_used=["geo"], success=True,
+    )
+
+    async def route_query_stream(query, context=None, session_id=None):
+        yield SimpleNamespace(type="token", content="Paris is in France", data={}, result=None)
+        yield SimpleNamespace(type="answer", content="Paris is in France", data={"agents_used": ["geo"]}, result=None)
+        # The judge runs while the answer is checked
+        await asyncio.wait_for(started.wait(), timeout=1.0)
+        yield SimpleNamespace(type="done", content="", data={}, result=result)
+
+    async def check(**kwargs):
+        started.set()
+        return None
+
+    check = AsyncMock(side_effect=check)
+    service._smartrouter = Mock(route_query_stream=route_query_stream)
+    with patch("server.agent_service.check_ungrounded_hallucination", new=check):
+        chunks = [c async for c in service.chat_agent_streaming("smartrouter", SimulationRequest(input="Where is Paris?"))]
+
+    assert [c.type for c in chunks] == ["metadata", "token", "done", "guardrail"]
+    check.assert_awaited_once()
+    assert check.await_args.kwargs["output"] == "Paris is in France"
+    assert check.await_args.kwargs["extra_context"]["agents_used"] == ["geo"]
+
+
+@pytest.mark.asyncio
+async def test_async_guardrail_rechecks_replaced_answer(monkeypatch):
+    """When the final answer differs from the early one, the delivered answer is checked."""
+    from types import SimpleNamespace
+
+    monkeypatch.setenv("OPENAGENTS_GUARDRAILS_MODE", "async")
+    service = AgentService(factory=Mock())
+    result = SimpleNamespace(
+        answer="Not enough info", traces=[], total_time=1.0,
+        final_decision="fallback", agents_used=["geo"], success=True,
+    )
+
+    async def route_query_stream(query, context=None, session_id=None):
+        yield SimpleNamespace(type="answer", content="Paris is in Texas", data={"agents_used": ["geo"]}, result=None)
+        yield SimpleNamespace(type="done", content="", data={}, result=result)
+
+    service._smartrouter = Mock(route_query_stream=route_query_stream)
+    with patch("server.agent_service.check_ungrounded_hallucination", new_callable=AsyncMock) as check:
+        check.return_value = None
+        chunks = [c async for c in service.chat_agent_streaming("smartrouter", SimulationRequest(input="Where is Paris?"))]
+
+    assert chunks[-2].type == "done"
+    assert chunks[-2].content == "Not enough info"
+    assert check.call_args.kwargs["output"] == "Not enough info"
+
+
+@pytest.mark.asyncio
+async def test_async_guardrail_reports_untriggered_verdict(monkeypatch):
+    """A guardrail chunk without content is sent when no repair is needed."""
+    monkeypatch.setenv("OPENAGENTS_GUARDRAILS_MODE", "async")
+    service = _moe_stream_service("Restaurant pins in SF: Souvla, Kokkari")
+
+    with patch("server.agent_service.check_ungrounded_hallucination", new_callable=AsyncMock) as mock_check:
+        mock_check.return_value = None
+        chunks = [
+            c async for c in service.chat_agent_streaming("moe", SimulationRequest(input="restaurant pins in SF"))
+        ]
+
+    assert chunks[-1].type == "guardrail"
+    assert chunks[-1].content is None
+    assert chunks[-1].metadata["guardrails"]["hallucination"]["triggered"] is False
+
+
+@pytest.mark.asyncio
+async def test_guardrail_verdicts_are_cached_by_query_output_and_context():
+    """Repeated (query, output, context) triples reuse the cached verdict instead of calling the model."""
+    from server.guardrails import hallucination
+    from server.guardrails.hallucination import GuardrailConfig, HallucinationGuardrailVerdict
+
+    hallucination._verdict_cache.clear()
+    verdict = HallucinationGuardrailVerdict(
+        relevant=False, grounded_enough=False, risk="high", reason="off topic", safe_repair="Clarify?"
+    )
+    config = GuardrailConfig(enabled=True, model="test-model", timeout_s=1.0)
+    kwargs = dict(
+        query="Tell me about restaurant pins in SF",
+        output="by the way, unrelated astronomy facts",
+        session_id="s1",
+        orchestrator="moe",
+        config=config,
+    )
+
+    with patch("agents.Runner.run", new_callable=AsyncMock) as mock_run:
+        mock_run.return_value = Mock(final_output=verdict)
+        first = await hallucination.check_ungrounded_hallucination(**kwargs)
+        second = await hallucination.check_ungrounded_hallucination(**kwargs)
+        other = await hallucination.check_ungrounded_hallucination(
+            **{**kwargs, "output": "by the way, a different answer"}
+        )
+        # Same grounding with different timings reuses the verdict; other grounding does not
+        timed = await hallucination.check_ungrounded_hallucination(
+            **kwargs, extra_context={"phases": [{"phase": "routing", "duration": 0.4}]}
+        )
+        retimed = await hallucination.check_ungrounded_hallucination(
+            **kwargs, extra_context={"phases": [{"phase": "routing", "duration": 0.9}]}
+        )
+        regrounded = await hallucination.check_ungrounded_hallucination(
+            **kwargs, extra_context={"phases": [{"phase": "synthesis", "duration": 0.4}]}
+        )
+
+    assert first == second == other == timed == retimed == regrounded == verdict
+    assert mock_run.await_count == 4
+    hallucination._verdict_cache.clear()
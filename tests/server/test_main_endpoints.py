@@ -4,6 +4,7 @@ Tests for FastAPI endpoints in server/main.py
 Comprehensive test suite for all API endpoints following best practices.
 """
 
+import asyncio
 import pytest
 import os
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
@@ -316,6 +317,54 @@ class TestChatAgentEndpoint:
             assert response.status_code == 400
 
 
+class TestChatLoadShedding:
+    """Test that shed orchestrator runs surface as 503, not agent errors."""
+
+    def test_overloaded_moe_chat_returns_503(self, auth_header):
+        """Test an overloaded /chat through MoE returns 503 with Retry-After."""
+        from asdrp.agents.execution_scheduler import ExecutionScheduler
+        from asdrp.orchestration.moe.config_loader import MoEConfigLoader
+        from asdrp.orchestration.moe.expert_executor import ParallelExecutor
+        from asdrp.orchestration.moe.orchestrator import MoEOrchestrator
+        from server.agent_service import AgentService
+
+        # One global slot, already taken, and no queue: every run is shed
+        scheduler = ExecutionScheduler(max_concurrent=1, max_queue=0)
+        asyncio.run(scheduler.acquire("busy"))
+
+        factory = Mock()
+        factory.get_agent_with_persistent_session = AsyncMock(return_value=(Mock(mcp_servers=None), None))
+        selector = Mock()
+        selector.select = AsyncMock(return_value=["geo", "yelp"])
+        mixer = Mock()
+        mixer.mix = AsyncMock()
+        config = MoEConfigLoader().load_config()
+
+        with patch("server.agent_service.AgentConfigLoader"):
+            service = AgentService(factory=factory)
+        service._moe = MoEOrchestrator(
+            agent_factory=factory,
+            expert_selector=selector,
+            expert_executor=ParallelExecutor(config, scheduler=scheduler),
+            result_mixer=mixer,
+            config=config,
+        )
+
+        with patch("server.main._agent_service", service), \
+                patch("asdrp.orchestration.moe.orchestrator.get_execution_scheduler", return_value=scheduler):
+            response = TestClient(app).post(
+                "/agents/moe/chat",
+                headers=auth_header,
+                json={"input": "Find pizza near me"}
+            )
+
+        assert response.status_code == 503
+        assert response.json()["error_code"] == "overloaded"
+        assert int(response.headers["Retry-After"]) >= 1
+        mixer.mix.assert_not_called()
+        assert scheduler.stats()["rejected"] == 2
+
+
 class TestChatAgentStreamEndpoint:
     """Test chat agent streaming endpoint."""
 
@@ -162,8 +162,8 @@ class TestChatAgentStreaming:
         """Test streaming SmartRouter with error."""
         request = SimulationRequest(input="Test")
         
-        with patch.object(service, '_execute_smartrouter', new_callable=AsyncMock) as mock_execute:
-            mock_execute.side_effect = AgentException("SmartRouter error", agent_name="smartrouter")
+        with patch.object(service, '_get_smartrouter') as mock_create:
+            mock_create.side_effect = AgentException("SmartRouter error", agent_name="smartrouter")
             
             chunks = []
             async for chunk in service.chat_agent_streaming("smartrouter", request):
@@ -205,3 +205,40 @@ class TestChatAgentStreaming:
 
 
 
+
+    @pytest.mark.asyncio
+    async def test_streaming_moe_tokens_and_stage_steps(self, service):
+        """Test MoE streaming forwards stage events as steps and synthesis as tokens."""
+        from types import SimpleNamespace
+
+        def event(type, content="", data=None, result=None):
+            return SimpleNamespace(type=type, content=content, data=data or {}, result=result)
+
+        result = SimpleNamespace(
+            response="Hello world",
+            experts_used=["one"],
+            trace={"request_id": "r1", "query": "Test", "selected_experts": ["one"]},
+        )
+
+        async def route_query_stream(query, session_id=None, context=None):
+            yield event("selection", data={"experts": ["one"], "fallback": False})
+            yield event("expert_completed", data={"expert_id": "one", "success": True})
+            yield event("token", content="Hello")
+            yield event("token", content=" world")
+            yield event("done", result=result)
+
+        service._moe = Mock()
+        service._moe.route_query_stream = route_query_stream
+        request = SimulationRequest(input="Test")
+
+        with patch("server.agent_service.check_ungrounded_hallucination", new_callable=AsyncMock) as mock_guard:
+            mock_guard.return_value = None
+            chunks = [chunk async for chunk in service.chat_agent_streaming("moe", request)]
+
+        assert [c.type for c in chunks] == ["metadata", "step", "step", "token", "token", "done"]
+        assert chunks[1].metadata["stage"] == "selection"
+        assert "".join(c.content for c in chunks if c.type == "token") == "Hello world"
+        # Streamed text already matches the final answer, so done carries metadata only
+        assert chunks[-1].content is None
+        assert chunks[-1].metadata["selected_experts"] == ["one"]
+        mock_guard.assert_awaited_once()
@@ -0,0 +1,54 @@
+"""
+Tests for the startup warm-up readiness gate.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from server.warmup import WarmupGate
+
+
+class TestWarmupGate:
+    """Test WarmupGate state transitions."""
+
+    def test_not_ready_before_warm_up(self):
+        """Test that a fresh gate reports pending and not ready."""
+        gate = WarmupGate()
+
+        snapshot = gate.snapshot()
+        assert snapshot.status == "pending"
+        assert not snapshot.ready
+
+    @pytest.mark.asyncio
+    async def test_ready_after_successful_warm_up(self):
+        """Test that the gate opens once every component warmed up."""
+        service = Mock()
+        service.warm_up = AsyncMock(return_value={"agents": {"status": "ok", "duration_ms": 1.0}})
+        gate = WarmupGate()
+
+        await gate.run(service)
+
+        assert gate.ready
+        assert gate.status == "ready"
+        assert gate.snapshot().components["agents"]["status"] == "ok"
+        assert gate.duration_ms is not None
+
+    @pytest.mark.asyncio
+    async def test_degraded_is_still_ready(self):
+        """Test that failed components leave the server ready but degraded."""
+        service = Mock()
+        service.warm_up = AsyncMock(side_effect=RuntimeError("boom"))
+        gate = WarmupGate()
+
+        await gate.run(service)
+
+        assert gate.ready
+        assert gate.status == "degraded"
+        assert gate.components["service"]["error"] == "boom"
+
+    def test_skipped_is_ready(self):
+        """Test that disabling warm-up opens the gate immediately."""
+        gate = WarmupGate()
+        gate.skip()
+
+        assert gate.ready